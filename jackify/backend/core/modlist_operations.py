@@ -832,44 +832,57 @@ class ModlistInstallCLI:
                 self._current_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=False, env=clean_env, cwd=engine_dir)
                 proc = self._current_process
                 
+                # Record engine samples, phases and speeds for the performance report
+                from jackify.backend.handlers.performance_timeline import start_performance_timeline, close_active_timeline
+                from jackify.backend.handlers.engine_monitor import EnginePerformanceMonitor
+                from jackify.backend.handlers.progress_bus import ProgressEventBus, StatusLineThrottle
+                timeline = start_performance_timeline(self.context.get('modlist_name', ''), "cli")
+                # Only the timeline listens, so one frame per second is plenty
+                timeline_bus = ProgressEventBus(max_fps=1.0)
+                timeline_bus.subscribe(timeline.record_frame)
+                performance_monitor = EnginePerformanceMonitor(logger=self.logger, sample_interval=10.0)
+                performance_monitor.add_callback(timeline.record_metrics)
+                monitoring_started = performance_monitor.start_monitoring(proc.pid)
+                
                 # Read output in binary mode to properly handle carriage returns
-                buffer = b''
-                while True:
-                    chunk = proc.stdout.read(1)
-                    if not chunk:
-                        break
-                    buffer += chunk
+                from jackify.backend.handlers.subprocess_utils import iter_output_records
+                def write_status(text):
+                    print(text, end='')
+                    sys.stdout.flush()
+                status_lines = StatusLineThrottle(write_status)
+                try:
+                    for line, terminator in iter_output_records(proc.stdout):
+                        timeline_bus.process_line(line)
+                        if terminator == '\r':
+                            # Carriage return - progress update printed without newline,
+                            # rate-limited since each one overwrites the previous
+                            status_lines.status(line + terminator)
+                        else:
+                            status_lines.flush()
+                            print(line + terminator, end='')
+                    status_lines.flush()
                     
-                    # Process complete lines or carriage return updates
-                    if chunk == b'\n':
-                        # Complete line - decode and print
-                        line = buffer.decode('utf-8', errors='replace')
-                        print(line, end='')
-                        buffer = b''
-                    elif chunk == b'\r':
-                        # Carriage return - decode and print without newline
-                        line = buffer.decode('utf-8', errors='replace')
-                        print(line, end='')
-                        sys.stdout.flush()
-                        buffer = b''
-                
-                # Print any remaining buffer content
-                if buffer:
-                    line = buffer.decode('utf-8', errors='replace')
-                    print(line, end='')
-                
-                proc.wait()
+                    proc.wait()
+                finally:
+                    timeline_bus.close()
+                    if monitoring_started:
+                        performance_monitor.stop_monitoring()
+                    timeline.engine_finished(proc.returncode)
+                    self.logger.info(f"Performance timeline saved to {timeline.path}")
                 # Clear process reference after completion
                 self._current_process = None
                 if proc.returncode != 0:
                     print(f"{COLOR_ERROR}Jackify Install Engine exited with code {proc.returncode}.{COLOR_RESET}")
                     self.logger.error(f"Engine exited with code {proc.returncode}.")
+                    close_active_timeline()
                     return # Configuration phase failed
                 self.logger.info(f"Engine completed with code {proc.returncode}.")
             except Exception as e:
                 error_message = str(e)
                 print(f"{COLOR_ERROR}Error running Jackify Install Engine: {error_message}{COLOR_RESET}\n")
                 self.logger.error(f"Exception running engine: {error_message}", exc_info=True)
+                from jackify.backend.handlers.performance_timeline import close_active_timeline
+                close_active_timeline()
                 
                 # Check for file descriptor limit issues and attempt to handle them
                 try:
@@ -1449,98 +1462,27 @@ class ModlistInstallCLI:
 
     def get_all_modlists_from_engine(self, game_type=None):
         """
-        Call the Jackify engine with 'list-modlists' and return a list of modlist dicts.
-        Each dict should have at least 'id', 'game', 'download_size', 'install_size', 'total_size', and status flags.
-        
+        Return the modlists jackify-engine knows about as a list of dicts.
+        Each dict has 'id', 'name', 'game', 'download_size', 'install_size', 'total_size',
+        'machine_url' and the 'status_down'/'status_nsfw' flags.
+
+        Served from the shared modlist catalog, so repeated calls don't launch the engine.
+
         Args:
-            game_type (str, optional): Filter by game type (e.g., "Skyrim", "Fallout New Vegas")
+            game_type (str, optional): Filter by game category key (e.g. "skyrim") or game name
         """
-        import subprocess
-        import re
-        from pathlib import Path
-                    # COLOR_ERROR already imported at module level
-        engine_executable = get_jackify_engine_path()
-        engine_dir = os.path.dirname(engine_executable)
-        if not os.path.exists(engine_executable):
-            self.logger.error(f"jackify-install-engine not found at {engine_executable}")
-            print(f"{COLOR_ERROR}Error: jackify-install-engine not found at expected location.{COLOR_ERROR}")
-            return []
-        env = os.environ.copy()
-        env["DOTNET_SYSTEM_GLOBALIZATION_INVARIANT"] = "1"
-        command = [engine_executable, 'list-modlists', '--show-all-sizes', '--show-machine-url']
-        
-        # Add game filter if specified
-        if game_type:
-            command.extend(['--game', game_type])
+        from jackify.backend.services.modlist_catalog_service import get_modlist_catalog_service
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True, text=True, check=True,
-                env=env, cwd=engine_dir
-            )
-            lines = result.stdout.splitlines()
-            modlists = []
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('Loading') or line.startswith('Loaded'):
-                    continue
-                
-                # Parse new format: [STATUS] Modlist Name - Game - Download|Install|Total - MachineURL
-                # STATUS indicators: [DOWN], [NSFW], or both [DOWN] [NSFW]
-                
-                # Extract status indicators
-                status_down = '[DOWN]' in line
-                status_nsfw = '[NSFW]' in line
-                
-                # Remove status indicators to get clean line
-                clean_line = line.replace('[DOWN]', '').replace('[NSFW]', '').strip()
-                
-                # Split from right to handle modlist names with dashes
-                # Format: "NAME - GAME - SIZES - MACHINE_URL"
-                parts = clean_line.rsplit(' - ', 3)  # Split from right, max 3 splits = 4 parts
-                if len(parts) != 4:
-                    continue  # Skip malformed lines
-                
-                modlist_name = parts[0].strip()
-                game_name = parts[1].strip()
-                sizes_str = parts[2].strip()
-                machine_url = parts[3].strip()
-                
-                # Parse sizes: "Download|Install|Total" (e.g., "203GB|130GB|333GB")
-                size_parts = sizes_str.split('|')
-                if len(size_parts) != 3:
-                    continue  # Skip if sizes don't match expected format
-                
-                download_size = size_parts[0].strip()
-                install_size = size_parts[1].strip()
-                total_size = size_parts[2].strip()
-                
-                # Skip if any required data is missing
-                if not modlist_name or not game_name or not machine_url:
-                    continue
-                
-                modlists.append({
-                    'id': modlist_name,  # Use modlist name as ID for compatibility
-                    'name': modlist_name,
-                    'game': game_name,
-                    'download_size': download_size,
-                    'install_size': install_size, 
-                    'total_size': total_size,
-                    'machine_url': machine_url,  # Store machine URL for installation
-                    'status_down': status_down,
-                    'status_nsfw': status_nsfw
-                })
-            return modlists
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"list-modlists failed. Code: {e.returncode}")
-            if e.stdout: self.logger.error(f"Engine stdout:\n{e.stdout}")
-            if e.stderr: self.logger.error(f"Engine stderr:\n{e.stderr}")
-            print(f"{COLOR_ERROR}Failed to fetch modlist list. Engine error (Code: {e.returncode}).{COLOR_ERROR}")
-            return []
+            modlists = get_modlist_catalog_service().list_modlists(game_type=game_type)
         except Exception as e:
             self.logger.error(f"Unexpected error fetching modlists: {e}", exc_info=True)
-            print(f"{COLOR_ERROR}Unexpected error fetching modlists: {e}{COLOR_ERROR}")
+            print(f"{COLOR_ERROR}Unexpected error fetching modlists: {e}{COLOR_RESET}")
+            return []
+        if modlists is None:
+            self.logger.error("list-modlists failed and no cached modlist catalog is available")
+            print(f"{COLOR_ERROR}Failed to fetch modlist list from jackify-engine.{COLOR_RESET}")
             return []
+        return modlists
 
     def _display_summary(self):
         # REMOVE pass AND RESTORE THE METHOD BODY
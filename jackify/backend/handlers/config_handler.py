@@ -7,6 +7,7 @@ Handles application settings and configuration
 
 import os
 import sys
+import copy
 import json
 import logging
 import shutil
@@ -42,6 +43,9 @@ class ConfigHandler:
 
         self.config_dir = os.path.expanduser("~/.config/jackify")
         self.config_file = os.path.join(self.config_dir, "config.json")
+        # In-memory snapshot of config.json, invalidated when the file's stat changes
+        self._disk_snapshot = None
+        self._disk_snapshot_stat = None
         self.settings = {
             "version": "0.2.0",
             "last_selected_modlist": None,
@@ -201,25 +205,56 @@ class ConfigHandler:
             self.save_config()
             logger.info("Config migration completed")
 
+    def _config_file_stat(self):
+        """Return a cheap change signature for config.json, or None if it does not exist."""
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _get_disk_snapshot(self):
+        """
+        Return the saved values from config.json.
+        The parsed file is kept in memory and only re-read when its mtime, size
+        or inode changes, so repeated lookups cost a single stat() call.
+        """
+        file_stat = self._config_file_stat()
+        if self._disk_snapshot is not None and file_stat == self._disk_snapshot_stat:
+            return self._disk_snapshot
+        if file_stat is None:
+            saved_config = {}
+        else:
+            with open(self.config_file, 'r') as f:
+                saved_config = json.load(f)
+        self._disk_snapshot = saved_config
+        self._disk_snapshot_stat = file_stat
+        return saved_config
+
+    def _invalidate_disk_snapshot(self):
+        """Drop the cached config.json snapshot so the next lookup re-reads the file."""
+        self._disk_snapshot = None
+        self._disk_snapshot_stat = None
+
     def _read_config_from_disk(self):
         """
-        Read configuration directly from disk without caching.
+        Read configuration from disk, reusing the cached snapshot while
+        config.json is unchanged.
         Returns merged config (defaults + saved values).
         """
         try:
             config = self.settings.copy()  # Start with defaults
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    saved_config = json.load(f)
-                    config.update(saved_config)
+            config.update(self._get_disk_snapshot())
             return config
         except Exception as e:
             # Don't use logger here - can cause recursion if logger tries to access config
             print(f"Warning: Error reading configuration from disk: {e}", file=sys.stderr)
+            self._invalidate_disk_snapshot()
             return self.settings.copy()
 
     def reload_config(self):
         """Reload configuration from disk to pick up external changes"""
+        self._invalidate_disk_snapshot()
         self._load_config()
     
     def _create_config_dir(self):
@@ -236,6 +271,7 @@ class ConfigHandler:
             self._create_config_dir()
             with open(self.config_file, 'w') as f:
                 json.dump(self.settings, f, indent=2)
+            self._invalidate_disk_snapshot()
             logger.debug("Saved configuration to file")
             return True
         except Exception as e:
@@ -245,10 +281,21 @@ class ConfigHandler:
     def get(self, key, default=None):
         """
         Get a configuration value by key.
-        Always reads fresh from disk to avoid stale data.
+        Saved values win over in-memory ones; config.json is only re-parsed
+        when it changes on disk, so this is cheap enough for hot paths.
         """
-        config = self._read_config_from_disk()
-        return config.get(key, default)
+        try:
+            saved_config = self._get_disk_snapshot()
+        except Exception as e:
+            # Don't use logger here - can cause recursion if logger tries to access config
+            print(f"Warning: Error reading configuration from disk: {e}", file=sys.stderr)
+            self._invalidate_disk_snapshot()
+            saved_config = {}
+        if key in saved_config:
+            value = saved_config[key]
+            # Hand out copies of containers so callers can't mutate the snapshot
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        return self.settings.get(key, default)
     
     def set(self, key, value):
         """Set a configuration value"""
@@ -0,0 +1,137 @@
+"""
+Configuration Manifest
+
+Record of what the last successful modlist configuration did, so that
+re-running "Configure Existing Modlist" only redoes the steps whose inputs
+changed.
+
+Each step is stored with the inputs it ran with (AppID, Proton, resolution,
+wine components, paths, a fingerprint of the prefix registry values it set,
+...) and content hashes of the files it produced (ModOrganizer.ini,
+resolution INIs). A step is current when its inputs are unchanged and none
+of its output files were modified since. The manifest is only written after a configuration
+completes, so a failed run never marks anything as done.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from jackify.shared.paths import get_jackify_data_dir
+
+logger = logging.getLogger(__name__)
+
+# 2: the prefix step records system.reg/user.reg hashes
+# 3: ...replaced by a fingerprint of the registry values it sets
+MANIFEST_VERSION = 3
+
+
+def file_sha256(path: Union[str, Path]) -> Optional[str]:
+    """SHA-256 of a file's contents, or None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    """JSON round-trip so freshly computed inputs compare equal to loaded ones."""
+    return json.loads(json.dumps(value, sort_keys=True, default=str))
+
+
+class ConfigurationManifest:
+    """Per-modlist record of configured steps, stored in the Jackify data directory."""
+
+    def __init__(self, modlist_dir: Union[str, Path], steps: Optional[Dict[str, Dict]] = None):
+        self.modlist_dir = os.path.abspath(str(modlist_dir))
+        self.steps: Dict[str, Dict] = steps or {}
+
+    @staticmethod
+    def manifest_path(modlist_dir: Union[str, Path]) -> Path:
+        key = hashlib.sha1(os.path.abspath(str(modlist_dir)).encode("utf-8")).hexdigest()[:16]
+        return get_jackify_data_dir() / "configuration-manifests" / f"{key}.json"
+
+    @classmethod
+    def load(cls, modlist_dir: Union[str, Path]) -> "ConfigurationManifest":
+        """Load the manifest for a modlist (empty if missing, unreadable or outdated)."""
+        path = cls.manifest_path(modlist_dir)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(modlist_dir)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable configuration manifest {path}: {e}")
+            return cls(modlist_dir)
+
+        if data.get("version") != MANIFEST_VERSION or data.get("modlist_dir") != os.path.abspath(str(modlist_dir)):
+            logger.debug(f"Ignoring configuration manifest {path} (version or directory mismatch)")
+            return cls(modlist_dir)
+        return cls(modlist_dir, data.get("steps") or {})
+
+    def save(self) -> bool:
+        """Write the manifest atomically. Returns False (and logs) on failure."""
+        path = self.manifest_path(self.modlist_dir)
+        data = {
+            "version": MANIFEST_VERSION,
+            "modlist_dir": self.modlist_dir,
+            "written_at": time.time(),
+            "steps": self.steps,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to write configuration manifest {path}: {e}")
+            return False
+
+    @staticmethod
+    def clear(modlist_dir: Union[str, Path]):
+        """Forget the manifest so the next configuration redoes every step."""
+        try:
+            ConfigurationManifest.manifest_path(modlist_dir).unlink()
+        except FileNotFoundError:
+            pass
+
+    def get(self, step: str) -> Optional[Dict]:
+        return self.steps.get(step)
+
+    def outputs_unchanged(self, step: str) -> bool:
+        """True if the step was recorded and every file it produced still has the recorded hash."""
+        record = self.steps.get(step)
+        if record is None:
+            return False
+        return all(file_sha256(path) == digest for path, digest in record.get("outputs", {}).items())
+
+    def is_current(self, step: str, inputs: Dict[str, Any]) -> bool:
+        """True if the step last ran with the same inputs and its outputs are untouched."""
+        record = self.steps.get(step)
+        if record is None or record.get("inputs") != _normalize(inputs):
+            return False
+        return self.outputs_unchanged(step)
+
+    def record(self, step: str, inputs: Dict[str, Any], outputs: Iterable[Union[str, Path]] = (),
+               data: Optional[Dict[str, Any]] = None):
+        """
+        Record a step that just ran, hashing its output files as they are now.
+
+        ``data`` is kept alongside for the step's own use on the next run
+        (e.g. which INI files it edited).
+        """
+        self.steps[step] = {
+            "inputs": _normalize(inputs),
+            "outputs": {str(path): file_sha256(path) for path in outputs},
+            "data": _normalize(data or {}),
+        }
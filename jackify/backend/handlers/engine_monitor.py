@@ -3,6 +3,10 @@ Engine Performance Monitor
 
 Monitors the jackify-engine process for performance issues like CPU stalls,
 memory problems, and excessive I/O wait times.
+
+On Linux the engine and its child processes are sampled from /proc in one
+pass per tick (see proc_sampler); psutil is only used where /proc is not
+available.
 """
 
 import time
@@ -10,10 +14,13 @@ import threading
 import psutil
 import logging
 import os
+from collections import deque
 from typing import Optional, Dict, Any, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+from .proc_sampler import ProcessTreeSampler, ProcessGroupUsage, DEFAULT_HISTORY_SIZE
+
 
 class PerformanceState(Enum):
     NORMAL = "normal"
@@ -44,6 +51,11 @@ class PerformanceMetrics:
     magick_cpu_percent: float = 0.0
     magick_memory_mb: float = 0.0
     
+    # Engine plus all child processes, and the children grouped by executable
+    # type ('magick', '7z', 'texconv', ...); only filled by the /proc sampler
+    tree_cpu_percent: Optional[float] = None
+    process_groups: Dict[str, ProcessGroupUsage] = field(default_factory=dict)
+    
     
 class EnginePerformanceMonitor:
     """
@@ -60,7 +72,8 @@ class EnginePerformanceMonitor:
                  stall_threshold: float = 5.0,  # CPU below this % for stall_duration = stall
                  stall_duration: float = 120.0,  # seconds of low CPU = stall
                  memory_threshold: float = 85.0,  # % memory usage threshold
-                 sample_interval: float = 5.0):  # seconds between samples
+                 sample_interval: float = 5.0,  # seconds between samples
+                 history_size: int = DEFAULT_HISTORY_SIZE):  # samples kept in memory
         
         self.logger = logger or logging.getLogger(__name__)
         self.stall_threshold = stall_threshold
@@ -70,9 +83,11 @@ class EnginePerformanceMonitor:
         
         self._process: Optional[psutil.Process] = None
         self._parent_process: Optional[psutil.Process] = None
+        self._sampler: Optional[ProcessTreeSampler] = None
+        self._history_size = history_size
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
-        self._metrics_history: list[PerformanceMetrics] = []
+        self._metrics_history: deque[PerformanceMetrics] = deque(maxlen=history_size)
         self._callbacks: list[Callable[[PerformanceMetrics], None]] = []
         
         # Performance state tracking
@@ -95,6 +110,9 @@ class EnginePerformanceMonitor:
             except:
                 self._parent_process = None
                 
+            if ProcessTreeSampler.available():
+                self._sampler = ProcessTreeSampler(pid, history_size=self._history_size)
+                
             self._monitoring = True
             self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self._monitor_thread.start()
@@ -155,6 +173,10 @@ class EnginePerformanceMonitor:
             "likely_wrapper_issue": engine_avg_cpu > 20 and parent_avg_cpu > 50,
         }
         
+    def get_process_breakdown(self, last: Optional[int] = None) -> Dict[str, ProcessGroupUsage]:
+        """Average CPU/RSS per child process type over the last samples (empty without /proc)."""
+        return self._sampler.breakdown(last) if self._sampler else {}
+        
     def _monitor_loop(self):
         """Main monitoring loop."""
         while self._monitoring:
@@ -195,15 +217,60 @@ class EnginePerformanceMonitor:
                                       
                 time.sleep(self.sample_interval)
                 
-            except psutil.NoSuchProcess:
+            except (psutil.NoSuchProcess, ProcessLookupError):
                 self.logger.info("Monitored engine process terminated")
                 break
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
                 time.sleep(self.sample_interval)
                 
+    def _parent_usage(self):
+        """CPU % and RSS (MB) of the Python wrapper, for comparison."""
+        if self._parent_process:
+            try:
+                parent_cpu_percent = self._parent_process.cpu_percent()
+                parent_memory_info = self._parent_process.memory_info()
+                return parent_cpu_percent, parent_memory_info.rss / (1024 * 1024)
+            except:
+                pass
+        return None, None
+        
     def _collect_metrics(self) -> PerformanceMetrics:
         """Collect current performance metrics."""
+        if self._sampler:
+            return self._collect_proc_metrics()
+        return self._collect_psutil_metrics()
+        
+    def _collect_proc_metrics(self) -> PerformanceMetrics:
+        """Collect metrics for the engine tree from /proc in one pass."""
+        sample = self._sampler.sample()
+        parent_cpu_percent, parent_memory_mb = self._parent_usage()
+        magick = sample.groups.get('magick')
+        
+        # Children doing the work (texture conversion, extraction) is not a stall
+        state = self._determine_state(sample.tree_cpu_percent, sample.memory_percent, sample.timestamp)
+        
+        return PerformanceMetrics(
+            timestamp=sample.timestamp,
+            cpu_percent=sample.cpu_percent,
+            memory_percent=sample.memory_percent,
+            memory_mb=sample.memory_mb,
+            io_read_mb=sample.io_read_mb,
+            io_write_mb=sample.io_write_mb,
+            thread_count=sample.thread_count,
+            fd_count=sample.fd_count,
+            state=state,
+            parent_cpu_percent=parent_cpu_percent,
+            parent_memory_mb=parent_memory_mb,
+            engine_responsive=sample.tree_cpu_percent > self.stall_threshold or (sample.timestamp - self._low_cpu_start_time if self._low_cpu_start_time else 0) < self.stall_duration,
+            magick_cpu_percent=magick.cpu_percent if magick else 0.0,
+            magick_memory_mb=magick.memory_mb if magick else 0.0,
+            tree_cpu_percent=sample.tree_cpu_percent,
+            process_groups=sample.groups,
+        )
+        
+    def _collect_psutil_metrics(self) -> PerformanceMetrics:
+        """Collect metrics through psutil (platforms without /proc)."""
         now = time.time()
         
         # Get basic process info for engine
@@ -213,15 +280,7 @@ class EnginePerformanceMonitor:
         memory_percent = self._process.memory_percent()
         
         # Get parent process info for comparison
-        parent_cpu_percent = None
-        parent_memory_mb = None
-        if self._parent_process:
-            try:
-                parent_cpu_percent = self._parent_process.cpu_percent()
-                parent_memory_info = self._parent_process.memory_info()
-                parent_memory_mb = parent_memory_info.rss / (1024 * 1024)
-            except:
-                pass
+        parent_cpu_percent, parent_memory_mb = self._parent_usage()
         
         # Get I/O info
         try:
@@ -302,7 +361,12 @@ def create_debug_callback(logger: logging.Logger) -> Callable[[PerformanceMetric
     
     def debug_callback(metrics: PerformanceMetrics):
         parent_info = f", Python: {metrics.parent_cpu_percent:.1f}%" if metrics.parent_cpu_percent else ""
-        magick_info = f", Magick: {metrics.magick_cpu_percent:.1f}% CPU, {metrics.magick_memory_mb:.1f}MB RAM" if metrics.magick_cpu_percent or metrics.magick_memory_mb else ""
+        if metrics.process_groups:
+            magick_info = ", Children: " + ", ".join(
+                f"{name} x{group.processes} {group.cpu_percent:.1f}% CPU {group.memory_mb:.1f}MB"
+                for name, group in sorted(metrics.process_groups.items(), key=lambda item: item[1].cpu_percent, reverse=True))
+        else:
+            magick_info = f", Magick: {metrics.magick_cpu_percent:.1f}% CPU, {metrics.magick_memory_mb:.1f}MB RAM" if metrics.magick_cpu_percent or metrics.magick_memory_mb else ""
         logger.debug(f"Engine Performance: jackify-engine CPU={metrics.cpu_percent:.1f}%, "
                     f"Memory={metrics.memory_mb:.1f}MB ({metrics.memory_percent:.1f}%), "
                     f"Threads={metrics.thread_count}, FDs={metrics.fd_count}, "
@@ -17,6 +17,9 @@ import grp # To get group name
 import requests # Import requests
 import vdf # Import VDF library at the top level
 from jackify.shared.colors import COLOR_PROMPT, COLOR_RESET
+from .modlist_tree_index import invalidate_modlist_tree_index
+from . import ownership_auditor
+from .steam_library_index import get_steam_library_index
 
 # Initialize logger for the module
 logger = logging.getLogger(__name__)
@@ -656,19 +659,9 @@ class FileSystemHandler:
     def all_owned_by_user(path: Path) -> bool:
         """
         Returns True if all files and directories under 'path' are owned by the current user.
+        Stops at the first foreign-owned entry (or answers from the shared modlist tree index).
         """
-        uid = os.getuid()
-        gid = os.getgid()
-        for root, dirs, files in os.walk(path):
-            for name in dirs + files:
-                full_path = os.path.join(root, name)
-                try:
-                    stat = os.stat(full_path)
-                    if stat.st_uid != uid or stat.st_gid != gid:
-                        return False
-                except Exception:
-                    return False
-        return True
+        return ownership_auditor.all_owned_by_user(path)
 
     @staticmethod
     def set_ownership_and_permissions_sudo(path: Path, status_callback=None) -> bool:
@@ -712,16 +705,21 @@ class FileSystemHandler:
             print(f"Failed to {desc} after {max_retries} attempts. Aborting.")
             return False
 
-        # Run chown with retries
-        chown_command = ['sudo', 'chown', '-R', f'{user_name}:{group_name}', str(path)]
-        if not run_sudo_with_retries(chown_command, "change ownership"):
-            return False
-        print()
-        # Run chmod with retries
-        chmod_command = ['sudo', 'chmod', '-R', '755', str(path)]
-        if not run_sudo_with_retries(chmod_command, "set permissions"):
-            return False
+        # Only the offending subtrees are fixed, not the whole modlist
+        target_batches = ownership_auditor.ownership_fix_targets(path)
+        logger.info(f"Fixing ownership/permissions of {sum(len(b) for b in target_batches)} path(s) under {path}")
+        for targets in target_batches:
+            # Run chown with retries
+            chown_command = ['sudo', 'chown', '-R', f'{user_name}:{group_name}', '--', *targets]
+            if not run_sudo_with_retries(chown_command, "change ownership"):
+                return False
+            # Run chmod with retries
+            chmod_command = ['sudo', 'chmod', '-R', '755', '--', *targets]
+            if not run_sudo_with_retries(chmod_command, "set permissions"):
+                return False
         print()
+        # Ownership changed - later steps must not reuse the old scan
+        invalidate_modlist_tree_index(path)
         logger.info("Permissions set successfully.")
         return True
 
@@ -780,56 +778,11 @@ class FileSystemHandler:
         """
         logger.info("Detecting Steam library location...")
         
-        # Try finding libraryfolders.vdf in common Steam paths
-        possible_vdf_paths = [
-            Path.home() / ".steam/steam/config/libraryfolders.vdf",
-            Path.home() / ".local/share/Steam/config/libraryfolders.vdf",
-            Path.home() / ".steam/root/config/libraryfolders.vdf",
-            Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/config/libraryfolders.vdf"  # Flatpak
-        ]
-        
-        libraryfolders_vdf_path: Optional[Path] = None
-        for path_obj in possible_vdf_paths:
-            # Explicitly ensure path_obj is Path before checking is_file
-            current_path = Path(path_obj)
-            if current_path.is_file():
-                libraryfolders_vdf_path = current_path # Assign the confirmed Path object
-                logger.debug(f"Found libraryfolders.vdf at: {libraryfolders_vdf_path}")
-                break
-        
-        # Check AFTER loop - libraryfolders_vdf_path is now definitely Path or None
-        if not libraryfolders_vdf_path:
-            logger.warning("libraryfolders.vdf not found...")
-            # Proceed to default check below if vdf not found
-        else:
-            # Parse the VDF file to extract library paths
-            try:
-                # Try importing vdf here if not done globally
-                with open(libraryfolders_vdf_path, 'r') as f:
-                    data = vdf.load(f)
-                
-                # Look for library folders (indices are strings '0', '1', etc.)
-                libraries = data.get('libraryfolders', {}) 
-                
-                for key in libraries:
-                     if isinstance(libraries[key], dict) and 'path' in libraries[key]:
-                        lib_path_str = libraries[key]['path']
-                        if lib_path_str:
-                             # Check if this library path is valid
-                             potential_lib_path = Path(lib_path_str) / "steamapps/common"
-                             if potential_lib_path.is_dir():
-                                logger.info(f"Using Steam library path from vdf: {potential_lib_path}")
-                                return potential_lib_path # Return first valid Path object found
-                
-                logger.warning("No valid library paths found within libraryfolders.vdf.")
-                # Proceed to default check below if vdf parsing fails to find a valid path
-
-            except ImportError:
-                logger.error("Python 'vdf' library not found. Cannot parse libraryfolders.vdf.")
-                # Proceed to default check below
-            except Exception as e:
-                logger.error(f"Error parsing libraryfolders.vdf: {e}")
-                # Proceed to default check below
+        library_paths = get_steam_library_index().common_dirs()
+        if library_paths:
+            logger.info(f"Using Steam library path from vdf: {library_paths[0]}")
+            return library_paths[0]
+        logger.warning("No valid library paths found in libraryfolders.vdf.")
 
         # Fallback: Check default location if VDF parsing didn't yield a result
         default_path = Path.home() / ".steam/steam/steamapps/common"
@@ -849,21 +802,17 @@ class FileSystemHandler:
 
         logger.debug(f"Searching for compatdata directory for AppID: {appid}")
         
+        # Libraries listed in libraryfolders.vdf (shared, mtime-validated index)
+        vdf_compat_path = get_steam_library_index().compatdata(appid)
+        if vdf_compat_path:
+            logger.info(f"Found compatdata directory: {vdf_compat_path}")
+            return vdf_compat_path
+
         # Standard Steam locations
         possible_bases = [
             Path.home() / ".steam/steam/steamapps/compatdata",
             Path.home() / ".local/share/Steam/steamapps/compatdata",
         ]
-        
-        # Try to get library path from vdf to check there too
-        # Use type hint for clarity
-        steam_lib_common_path: Optional[Path] = FileSystemHandler.find_steam_library() 
-        if steam_lib_common_path:
-            # find_steam_library returns steamapps/common, go up two levels for library root
-            library_root = steam_lib_common_path.parent.parent 
-            vdf_compat_path = library_root / "steamapps/compatdata"
-            if vdf_compat_path.is_dir() and vdf_compat_path not in possible_bases:
-                possible_bases.insert(0, vdf_compat_path) # Prioritize library path from vdf
 
         for base_path in possible_bases:
             if not base_path.is_dir():
@@ -1392,7 +1392,7 @@ class InstallWabbajackHandler:
                 print(f"{COLOR_ERROR}Internal Error: Protontricks handler not available.{COLOR_RESET}")
                 return False
                 
-            all_shortcuts = self.protontricks_handler.list_non_steam_shortcuts()
+            all_shortcuts = self.protontricks_handler.list_non_steam_shortcuts(expect=self.shortcut_name)
             
             if not all_shortcuts:
                 self.logger.error("Protontricks listed no non-Steam shortcuts.")
@@ -12,6 +12,7 @@ import requests
 import atexit
 import signal
 import sys
+import hashlib
 
 # Import our modules
 from .path_handler import PathHandler
@@ -20,6 +21,11 @@ from .filesystem_handler import FileSystemHandler
 from .protontricks_handler import ProtontricksHandler
 from .shortcut_handler import ShortcutHandler
 from .resolution_handler import ResolutionHandler
+from .modlist_tree_index import invalidate_modlist_tree_index
+from .configuration_manifest import ConfigurationManifest
+from .prefix_template_store import PrefixTemplateStore
+from .wine_registry import RegistryEdits, read_values
+from .performance_timeline import mark_step, close_active_timeline
 
 # Import our safe VDF handler
 from .vdf_handler import VDFHandler
@@ -33,6 +39,21 @@ import logging
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Bump when _apply_universal_dotnet_fixes changes, so older prefix templates aren't reused
+UNIVERSAL_DOTNET_FIXES_VERSION = 1
+
+# Registry values the prefix steps set (value names, or None for the whole key).
+# Their fingerprint is recorded instead of whole-file hashes, which change
+# every time the game runs.
+PREFIX_REGISTRY_VALUES = (
+    ("HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides", None),
+    ("HKEY_CURRENT_USER\\Software\\Wine", ("Version", "ShowDotFiles")),
+    ("HKEY_LOCAL_MACHINE\\Software\\Microsoft\\.NETFramework", None),
+    ("HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion",
+     ("CurrentVersion", "CurrentBuild", "CurrentBuildNumber", "CurrentMajorVersionNumber",
+      "CurrentMinorVersionNumber", "CSDVersion", "ProductName")),
+)
+
 # Ensure terminal state is restored on exit, error, or interrupt
 def _restore_terminal():
     try:
@@ -571,6 +592,15 @@ class ModlistHandler:
             status_callback (callable, optional): A function to call with status updates during configuration.
             manual_steps_completed (bool): If True, skip the manual steps prompt (used for new modlist flow).
         """
+        try:
+            return self._run_configuration_steps(status_callback, manual_steps_completed)
+        finally:
+            # Configuration is the last thing an install records: end the last step
+            # and close the performance timeline, including on early returns
+            close_active_timeline()
+
+    def _run_configuration_steps(self, status_callback, manual_steps_completed):
+        """Body of _execute_configuration_steps (steps are recorded in the performance timeline)."""
         try:
             # Store status_callback for Configuration Summary
             self._current_status_callback = status_callback
@@ -582,11 +612,17 @@ class ModlistHandler:
                 self.logger.error("Cannot execute configuration steps: Missing required context (modlist_dir, appid, game_var, steamdeck status).")
                 print("Error: Missing required information to start configuration.")
                 return False
+
+            # Start the run with a fresh scan; steps below share it via get_modlist_tree_index()
+            invalidate_modlist_tree_index(self.modlist_dir)
+            # Steps whose inputs match the last successful configuration are skipped
+            manifest = ConfigurationManifest.load(self.modlist_dir)
         except Exception as e:
             self.logger.error(f"Exception in _execute_configuration_steps initialization: {e}", exc_info=True)
             return False
             
         # Step 1: Set protontricks permissions
+        mark_step("Step 1: Set protontricks permissions")
         if status_callback:
             # Reset timing for Prefix Configuration section
             from jackify.shared.timing import start_new_phase
@@ -604,6 +640,7 @@ class ModlistHandler:
         self.logger.info("Step 1: Setting Protontricks permissions... Done")
 
         # Step 2: Prompt user for manual steps and wait for compatdata
+        mark_step("Step 2: Manual steps and compatdata")
         skip_manual_prompt = False
         if not manual_steps_completed:
             # Check if Proton Experimental is already set and compatdata exists
@@ -661,121 +698,21 @@ class ModlistHandler:
                 print("───────────────────────────────────────────────────────────────────")
                 input(f"{COLOR_PROMPT}Once you have completed ALL the steps above, press Enter to continue...{COLOR_RESET}")
                 self.logger.info("User confirmed completion of manual steps.")
-        # Step 3: Download and apply curated user.reg.modlist and system.reg.modlist
-        if status_callback:
-            status_callback(f"{self._get_progress_timestamp()} Applying curated registry files for modlist configuration")
-        self.logger.info("Step 3: Downloading and applying curated user.reg.modlist and system.reg.modlist...")
-        try:
-            prefix_path_str = self.path_handler.find_compat_data(str(self.appid))
-            if not prefix_path_str or not os.path.isdir(prefix_path_str):
-                raise Exception("Could not determine Wine prefix path for this modlist. Please ensure you have launched the shortcut from Steam at least once.")
-            user_reg_url = "https://raw.githubusercontent.com/Omni-guides/Wabbajack-Modlist-Linux/refs/heads/main/files/user.reg.modlist"
-            user_reg_dest = Path(prefix_path_str) / "user.reg"
-            response = requests.get(user_reg_url, verify=True)
-            response.raise_for_status()
-            with open(user_reg_dest, "wb") as f:
-                f.write(response.content)
-            self.logger.info(f"Curated user.reg.modlist downloaded and applied to {user_reg_dest}")
-            system_reg_url = "https://raw.githubusercontent.com/Omni-guides/Wabbajack-Modlist-Linux/refs/heads/main/files/system.reg.modlist"
-            system_reg_dest = Path(prefix_path_str) / "system.reg"
-            response = requests.get(system_reg_url, verify=True)
-            response.raise_for_status()
-            with open(system_reg_dest, "wb") as f:
-                f.write(response.content)
-            self.logger.info(f"Curated system.reg.modlist downloaded and applied to {system_reg_dest}")
-        except Exception as e:
-            self.logger.error(f"Failed to download or apply curated user.reg.modlist or system.reg.modlist: {e}")
-            print(f"{COLOR_ERROR}Error: Failed to download or apply curated user.reg.modlist or system.reg.modlist. {e}{COLOR_RESET}")
-            return False
-        self.logger.info("Step 3: Curated user.reg.modlist and system.reg.modlist applied successfully.")
 
-        # Step 4: Install Wine Components
-        if status_callback:
-            status_callback(f"{self._get_progress_timestamp()} Installing Wine components (this may take a while)")
-        self.logger.info("Step 4: Installing Wine components (this may take a while)...")
-        
-        # Use canonical logic for all modlists/games
+        # Steps 3-4.6 and 14 only touch the Wine prefix; skip them if nothing about it changed
+        mark_step("Steps 3-4.6: Wine prefix registry and components")
         components = self.get_modlist_wine_components(self.game_name, self.game_var_full)
-        
-        # DISABLED: Special game wine component routing - now using registry injection approach
-        # special_game_type = self.detect_special_game_type(self.modlist_dir)
-        # if special_game_type == "fnv":
-        #     target_appid = "22380"  # Vanilla Fallout New Vegas AppID
-        # elif special_game_type == "enderal":
-        #     target_appid = "976620"  # Enderal: Forgotten Stories Special Edition AppID  
-        # else:
-        #     target_appid = self.appid  # Normal modlist AppID
-        
-        # All modlists now use their own AppID for wine components
-        target_appid = self.appid
-        
-        # Use user's preferred component installation method (respects settings toggle)
-        self.logger.debug(f"Getting WINEPREFIX for AppID {target_appid}...")
-        wineprefix = self.protontricks_handler.get_wine_prefix_path(target_appid)
-        if not wineprefix:
-            self.logger.error("Failed to get WINEPREFIX path for component installation.")
-            print("Error: Could not determine wine prefix location.")
-            return False
-        self.logger.debug(f"WINEPREFIX obtained: {wineprefix}")
-
-        # Use the winetricks handler which respects the user's toggle setting
-        try:
-            self.logger.info("Installing Wine components using user's preferred method...")
-            self.logger.debug(f"Calling winetricks_handler.install_wine_components with wineprefix={wineprefix}, game_var={self.game_var_full}, components={components}")
-            success = self.winetricks_handler.install_wine_components(wineprefix, self.game_var_full, specific_components=components, status_callback=status_callback)
-            if success:
-                self.logger.info("Wine component installation completed successfully")
-                if status_callback:
-                    status_callback(f"{self._get_progress_timestamp()} Wine components verified and installed successfully")
-            else:
-                self.logger.error("Wine component installation failed")
-                print("Error: Failed to install necessary Wine components.")
-                return False
-        except Exception as e:
-            self.logger.error(f"Wine component installation failed with exception: {e}")
-            print("Error: Failed to install necessary Wine components.")
-            return False
-        self.logger.info("Step 4: Installing Wine components... Done")
-
-        # Step 4.5: Apply universal dotnet4.x compatibility registry fixes AFTER wine components
-        # This ensures the fixes are not overwritten by component installation processes
-        if status_callback:
-            status_callback(f"{self._get_progress_timestamp()} Applying universal dotnet4.x compatibility fixes")
-        self.logger.info("Step 4.5: Applying universal dotnet4.x compatibility registry fixes...")
-        registry_success = False
-        try:
-            registry_success = self._apply_universal_dotnet_fixes()
-        except Exception as e:
-            error_msg = f"CRITICAL: Registry fixes failed - modlist may have .NET compatibility issues: {e}"
-            self.logger.error(error_msg)
-            if status_callback:
-                status_callback(f"{self._get_progress_timestamp()} ERROR: {error_msg}")
-            registry_success = False
-
-        if not registry_success:
-            failure_msg = "WARNING: Universal dotnet4.x registry fixes FAILED! This modlist may experience .NET Framework compatibility issues."
-            self.logger.error("=" * 80)
-            self.logger.error(failure_msg)
-            self.logger.error("Consider manually setting mscoree=native in winecfg if problems occur.")
-            self.logger.error("=" * 80)
+        prefix_inputs = self._prefix_step_inputs(components)
+        prefix_current = manifest.is_current("prefix", prefix_inputs)
+        if prefix_current:
+            self.logger.info("Steps 3-4.6: Wine prefix unchanged since last configuration, skipping registry and component setup.")
             if status_callback:
-                status_callback(f"{self._get_progress_timestamp()} {failure_msg}")
-            # Continue but user should be aware of potential issues
-
-        # Step 4.6: Enable dotfiles visibility for Wine prefix
-        if status_callback:
-            status_callback(f"{self._get_progress_timestamp()} Enabling dotfiles visibility")
-        self.logger.info("Step 4.6: Enabling dotfiles visibility in Wine prefix...")
-        try:
-            if self.protontricks_handler.enable_dotfiles(self.appid):
-                self.logger.info("Dotfiles visibility enabled successfully")
-            else:
-                self.logger.warning("Failed to enable dotfiles visibility (non-critical, continuing)")
-        except Exception as e:
-            self.logger.warning(f"Error enabling dotfiles visibility: {e} (non-critical, continuing)")
-        self.logger.info("Step 4.6: Enabling dotfiles visibility... Done")
+                status_callback(f"{self._get_progress_timestamp()} Wine prefix already configured, skipping registry and component setup")
+        elif not self._configure_wine_prefix(components, status_callback):
+            return False
 
         # Step 5: Ensure permissions of Modlist directory
+        mark_step("Step 5: Ensure permissions of Modlist directory")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Setting ownership and permissions for modlist directory")
         self.logger.info("Step 5: Setting ownership and permissions for modlist directory...")
@@ -788,6 +725,7 @@ class ModlistHandler:
         self.logger.info("Step 5: Setting ownership and permissions... Done")
 
         # Step 6: Backup ModOrganizer.ini
+        mark_step("Step 6: Backup ModOrganizer.ini")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Backing up ModOrganizer.ini")
         self.logger.info(f"Step 6: Backing up {self.modlist_ini}...")
@@ -801,6 +739,7 @@ class ModlistHandler:
         self.logger.info("Step 6: Backing up ModOrganizer.ini... Done")
 
         # Step 6.5: Handle symlinked downloads directory
+        mark_step("Step 6.5: Handle symlinked downloads directory")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Checking for symlinked downloads directory")
         self.logger.info("Step 6.5: Checking for symlinked downloads directory...")
@@ -809,6 +748,7 @@ class ModlistHandler:
         self.logger.info("Step 6.5: Checking for symlinked downloads directory... Done")
 
         # Step 7a: Detect Stock Game/Game Root path
+        mark_step("Step 7a: Detect Stock Game/Game Root path")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Detecting stock game path")
         # This method sets self.stock_game_path if found
@@ -818,6 +758,7 @@ class ModlistHandler:
             return False
 
         # Step 7b: Detect Steam Library Info (Needed for Step 8)
+        mark_step("Step 7b: Detect Steam Library Info")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Detecting Steam Library info")
         self.logger.info("Step 7b: Detecting Steam Library info...")
@@ -828,64 +769,29 @@ class ModlistHandler:
         self.logger.info("Step 7b: Detecting Steam Library info... Done")
 
         # Step 8: Update ModOrganizer.ini Paths (gamePath, Binary, workingDirectory)
+        mark_step("Step 8: Update ModOrganizer.ini Paths")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Updating ModOrganizer.ini paths")
         self.logger.info("Step 8: Updating gamePath, Binary, and workingDirectory paths in ModOrganizer.ini...")
         
-        # Update gamePath using replace_gamepath method
-        modlist_dir_path_obj = Path(self.modlist_dir)
-        modlist_ini_path_obj = Path(self.modlist_ini)
-        stock_game_path_obj = Path(self.stock_game_path) if self.stock_game_path else None
-        # Only call replace_gamepath if we have a valid stock game path
-        if stock_game_path_obj:
-            if not self.path_handler.replace_gamepath(
-                modlist_ini_path=modlist_ini_path_obj, 
-                new_game_path=stock_game_path_obj,
-                modlist_sdcard=self.modlist_sdcard
-            ):
-                self.logger.error("Failed to update gamePath in ModOrganizer.ini. Configuration aborted.")
-                print("Error: Failed to update game path in ModOrganizer.ini.")
-                return False  # Abort on failure
+        mo2_inputs = {
+            "modlist_dir": self.modlist_dir,
+            "modlist_ini": self.modlist_ini,
+            "stock_game_path": self.stock_game_path,
+            "steam_library": self.steam_library,
+            "modlist_sdcard": self.modlist_sdcard,
+            "engine_installed": getattr(self, 'engine_installed', False),
+        }
+        if manifest.is_current("mo2_ini", mo2_inputs):
+            self.logger.info("Step 8: ModOrganizer.ini unchanged since last configuration, skipping path updates.")
         else:
-            self.logger.info("No stock game path found, skipping gamePath update - edit_binary_working_paths will handle all path updates.")
-            self.logger.info("Using unified path manipulation to avoid duplicate processing.")
-        
-        # Conditionally update binary and working directory paths
-        # Skip for jackify-engine workflows since paths are already correct
-        # Exception: Always run for SD card installs to fix Z:/run/media/... to D:/... paths
-
-        # DEBUG: Add comprehensive logging to identify Steam Deck SD card path manipulation issues
-        engine_installed = getattr(self, 'engine_installed', False)
-        self.logger.debug(f"[SD_CARD_DEBUG] ModlistHandler instance: id={id(self)}")
-        self.logger.debug(f"[SD_CARD_DEBUG] engine_installed: {engine_installed}")
-        self.logger.debug(f"[SD_CARD_DEBUG] modlist_sdcard: {self.modlist_sdcard}")
-        self.logger.debug(f"[SD_CARD_DEBUG] steamdeck parameter passed to constructor: {getattr(self, 'steamdeck', 'NOT_SET')}")
-        self.logger.debug(f"[SD_CARD_DEBUG] Path manipulation condition: not {engine_installed} or {self.modlist_sdcard} = {not engine_installed or self.modlist_sdcard}")
-
-        if not getattr(self, 'engine_installed', False) or self.modlist_sdcard:
-            # Convert steamapps/common path to library root path
-            steam_libraries = None
-            if self.steam_library:
-                # self.steam_library is steamapps/common, need to go up 2 levels to get library root
-                steam_library_root = Path(self.steam_library).parent.parent
-                steam_libraries = [steam_library_root]
-                self.logger.debug(f"Using Steam library root: {steam_library_root}")
-            
-            if not self.path_handler.edit_binary_working_paths(
-                modlist_ini_path=modlist_ini_path_obj,
-                modlist_dir_path=modlist_dir_path_obj,
-                modlist_sdcard=self.modlist_sdcard,
-                steam_libraries=steam_libraries
-            ):
-                self.logger.error("Failed to update binary and working directory paths in ModOrganizer.ini. Configuration aborted.")
-                print("Error: Failed to update binary and working directory paths in ModOrganizer.ini.")
+            if not self._update_mo2_ini_paths():
                 return False  # Abort on failure
-        else:
-            self.logger.debug("[SD_CARD_DEBUG] Skipping path manipulation - jackify-engine already set correct paths in ModOrganizer.ini")
-            self.logger.debug(f"[SD_CARD_DEBUG] SKIPPED because: engine_installed={engine_installed} and modlist_sdcard={self.modlist_sdcard}")
+            manifest.record("mo2_ini", mo2_inputs, outputs=[self.modlist_ini])
         self.logger.info("Step 8: Updating ModOrganizer.ini paths... Done")
 
         # Step 9: Update Resolution Settings (if applicable)
+        mark_step("Step 9: Update Resolution Settings")
         if hasattr(self, 'selected_resolution') and self.selected_resolution:
             if status_callback:
                 status_callback(f"{self._get_progress_timestamp()} Updating resolution settings")
@@ -896,19 +802,46 @@ class ModlistHandler:
             if self.steam_library and self.game_var_full:
                 vanilla_game_dir = str(Path(self.steam_library) / "steamapps" / "common" / self.game_var_full)
 
-            if not ResolutionHandler.update_ini_resolution(
-                modlist_dir=self.modlist_dir,
-                game_var=self.game_var_full,
-                set_res=self.selected_resolution,
-                vanilla_game_dir=vanilla_game_dir
-            ):
-                self.logger.warning("Failed to update resolution settings in some INI files.")
-                print("Warning: Failed to update resolution settings.")
+            resolution_inputs = {
+                "resolution": self.selected_resolution,
+                "game": self.game_var_full,
+                "vanilla_game_dir": vanilla_game_dir,
+            }
+            if manifest.is_current("resolution", resolution_inputs):
+                self.logger.info("Step 9: Resolution INIs unchanged since last configuration, skipping.")
+            else:
+                ini_files = self._recorded_resolution_ini_files(manifest)
+                if ini_files is None:
+                    ini_files = ResolutionHandler.find_resolution_ini_files(
+                        self.modlist_dir, self.game_var_full, vanilla_game_dir
+                    )
+                if not ResolutionHandler.update_ini_resolution(
+                    modlist_dir=self.modlist_dir,
+                    game_var=self.game_var_full,
+                    set_res=self.selected_resolution,
+                    vanilla_game_dir=vanilla_game_dir,
+                    ini_files=ini_files
+                ):
+                    self.logger.warning("Failed to update resolution settings in some INI files.")
+                    print("Warning: Failed to update resolution settings.")
+                elif ini_files is not None:
+                    manifest.record(
+                        "resolution",
+                        resolution_inputs,
+                        outputs=[path for paths in ini_files.values() for path in paths],
+                        data={
+                            "game": self.game_var_full,
+                            "vanilla_game_dir": vanilla_game_dir,
+                            "profiles": self._list_profiles(),
+                            "files": {kind: [str(path) for path in paths] for kind, paths in ini_files.items()},
+                        }
+                    )
             self.logger.info("Step 9: Updating resolution in INI files... Done")
         else:
             self.logger.info("Step 9: Skipping resolution update (no resolution selected).")
 
         # Step 10: Create dxvk.conf (skip for special games using vanilla compatdata)
+        mark_step("Step 10: Create dxvk.conf")
         special_game_type = self.detect_special_game_type(self.modlist_dir)
         self.logger.debug(f"DXVK step - modlist_dir='{self.modlist_dir}', special_game_type='{special_game_type}'")
         
@@ -918,20 +851,42 @@ class ModlistHandler:
         self.logger.debug(f"nvse_loader.exe exists: {nvse_path.exists() if nvse_path else 'N/A'}")
         self.logger.debug(f"Enderal Launcher.exe exists: {enderal_path.exists() if enderal_path else 'N/A'}")
         
+        # Construct vanilla game directory path for fallback
+        vanilla_game_dir = None
+        if self.steam_library and self.game_var_full:
+            vanilla_game_dir = str(Path(self.steam_library) / "steamapps" / "common" / self.game_var_full)
+        dxvk_inputs = {
+            "modlist_dir": self.modlist_dir,
+            "modlist_sdcard": self.modlist_sdcard,
+            "steam_library": self.steam_library,
+            "basegame_sdcard": self.basegame_sdcard,
+            "game": self.game_var_full,
+            "vanilla_game_dir": vanilla_game_dir,
+            "stock_game_path": self.stock_game_path,
+        }
+        dxvk_current = (
+            not special_game_type
+            and manifest.is_current("dxvk", dxvk_inputs)
+            and self.path_handler.verify_dxvk_conf_exists(
+                modlist_dir=self.modlist_dir,
+                steam_library=str(self.steam_library) if self.steam_library else None,
+                game_var_full=self.game_var_full,
+                vanilla_game_dir=vanilla_game_dir,
+                stock_game_path=self.stock_game_path
+            )
+        )
+
         if special_game_type:
             self.logger.info(f"Step 10: Skipping dxvk.conf creation for {special_game_type.upper()} (uses vanilla compatdata)")
             if status_callback:
                 status_callback(f"{self._get_progress_timestamp()} Skipping dxvk.conf for {special_game_type.upper()} modlist")
+        elif dxvk_current:
+            self.logger.info("Step 10: dxvk.conf unchanged since last configuration, skipping.")
         else:
             if status_callback:
                 status_callback(f"{self._get_progress_timestamp()} Creating dxvk.conf file")
             self.logger.info("Step 10: Creating dxvk.conf file...")
             # Assuming create_dxvk_conf still uses string paths
-            # Construct vanilla game directory path for fallback
-            vanilla_game_dir = None
-            if self.steam_library and self.game_var_full:
-                vanilla_game_dir = str(Path(self.steam_library) / "steamapps" / "common" / self.game_var_full)
-                
             dxvk_created = self.path_handler.create_dxvk_conf(
                 modlist_dir=self.modlist_dir, 
                 modlist_sdcard=self.modlist_sdcard, 
@@ -951,9 +906,12 @@ class ModlistHandler:
             if not dxvk_created or not dxvk_verified:
                 self.logger.warning("DXVK configuration file is missing or incomplete after post-install steps.")
                 print("Warning: Failed to verify dxvk.conf file (required for AMD GPUs).")
+            else:
+                manifest.record("dxvk", dxvk_inputs)
             self.logger.info("Step 10: Creating dxvk.conf... Done")
 
         # Step 11a: Small Tasks - Delete Incompatible Plugins
+        mark_step("Step 11a: Delete Incompatible Plugins")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Deleting incompatible MO2 plugins")
         self.logger.info("Step 11a: Deleting incompatible MO2 plugins...")
@@ -987,6 +945,7 @@ class ModlistHandler:
 
 
         # Step 11b: Download Font
+        mark_step("Step 11b: Download Font")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Downloading required font")
         prefix_path_str = self.path_handler.find_compat_data(str(self.appid))
@@ -1008,6 +967,7 @@ class ModlistHandler:
             print("Warning: Could not determine Wine prefix path, skipping font download.")
 
         # Step 12: Modlist-specific steps
+        mark_step("Step 12: Modlist-specific steps")
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Checking for modlist-specific steps")
             status_callback("")  # Blank line after final Prefix Configuration step
@@ -1029,10 +989,303 @@ class ModlistHandler:
         self.logger.info("Configuration steps completed successfully.")
 
         # Step 14: Re-enforce Windows 10 mode after modlist-specific configurations (matches legacy script line 1333)
-        self._re_enforce_windows_10_mode()
-
+        mark_step("Step 14: Re-enforce Windows 10 mode")
+        if not prefix_current:
+            self._re_enforce_windows_10_mode()
+            # Let Wine flush the registry, so the recorded fingerprint matches the files it leaves behind
+            self._wait_for_wineserver()
+            # Re-read: restoring a prefix template replaces the pfx directory
+            manifest.record("prefix", self._prefix_step_inputs(components))
+
+        manifest.save()
         return True # Return True on success
 
+    def _update_mo2_ini_paths(self) -> bool:
+        """Step 8: rewrite gamePath, Binary and workingDirectory in ModOrganizer.ini."""
+        # Update gamePath using replace_gamepath method
+        modlist_dir_path_obj = Path(self.modlist_dir)
+        modlist_ini_path_obj = Path(self.modlist_ini)
+        stock_game_path_obj = Path(self.stock_game_path) if self.stock_game_path else None
+        # Only call replace_gamepath if we have a valid stock game path
+        if stock_game_path_obj:
+            if not self.path_handler.replace_gamepath(
+                modlist_ini_path=modlist_ini_path_obj, 
+                new_game_path=stock_game_path_obj,
+                modlist_sdcard=self.modlist_sdcard
+            ):
+                self.logger.error("Failed to update gamePath in ModOrganizer.ini. Configuration aborted.")
+                print("Error: Failed to update game path in ModOrganizer.ini.")
+                return False
+        else:
+            self.logger.info("No stock game path found, skipping gamePath update - edit_binary_working_paths will handle all path updates.")
+            self.logger.info("Using unified path manipulation to avoid duplicate processing.")
+        
+        # Conditionally update binary and working directory paths
+        # Skip for jackify-engine workflows since paths are already correct
+        # Exception: Always run for SD card installs to fix Z:/run/media/... to D:/... paths
+
+        # DEBUG: Add comprehensive logging to identify Steam Deck SD card path manipulation issues
+        engine_installed = getattr(self, 'engine_installed', False)
+        self.logger.debug(f"[SD_CARD_DEBUG] ModlistHandler instance: id={id(self)}")
+        self.logger.debug(f"[SD_CARD_DEBUG] engine_installed: {engine_installed}")
+        self.logger.debug(f"[SD_CARD_DEBUG] modlist_sdcard: {self.modlist_sdcard}")
+        self.logger.debug(f"[SD_CARD_DEBUG] steamdeck parameter passed to constructor: {getattr(self, 'steamdeck', 'NOT_SET')}")
+        self.logger.debug(f"[SD_CARD_DEBUG] Path manipulation condition: not {engine_installed} or {self.modlist_sdcard} = {not engine_installed or self.modlist_sdcard}")
+
+        if not getattr(self, 'engine_installed', False) or self.modlist_sdcard:
+            # Convert steamapps/common path to library root path
+            steam_libraries = None
+            if self.steam_library:
+                # self.steam_library is steamapps/common, need to go up 2 levels to get library root
+                steam_library_root = Path(self.steam_library).parent.parent
+                steam_libraries = [steam_library_root]
+                self.logger.debug(f"Using Steam library root: {steam_library_root}")
+            
+            if not self.path_handler.edit_binary_working_paths(
+                modlist_ini_path=modlist_ini_path_obj,
+                modlist_dir_path=modlist_dir_path_obj,
+                modlist_sdcard=self.modlist_sdcard,
+                steam_libraries=steam_libraries
+            ):
+                self.logger.error("Failed to update binary and working directory paths in ModOrganizer.ini. Configuration aborted.")
+                print("Error: Failed to update binary and working directory paths in ModOrganizer.ini.")
+                return False
+        else:
+            self.logger.debug("[SD_CARD_DEBUG] Skipping path manipulation - jackify-engine already set correct paths in ModOrganizer.ini")
+            self.logger.debug(f"[SD_CARD_DEBUG] SKIPPED because: engine_installed={engine_installed} and modlist_sdcard={self.modlist_sdcard}")
+        return True
+
+    def _list_profiles(self) -> list:
+        """Names of the MO2 profiles (new profiles bring new prefs INIs)."""
+        try:
+            return sorted(entry.name for entry in os.scandir(os.path.join(self.modlist_dir, "profiles")) if entry.is_dir())
+        except OSError:
+            return []
+
+    def _recorded_resolution_ini_files(self, manifest: ConfigurationManifest) -> Optional[Dict[str, List[Path]]]:
+        """
+        INI files edited by the last resolution update, if they can be reused without a scan:
+        same game and vanilla fallback, same MO2 profiles, and every file still exists.
+        """
+        record = manifest.get("resolution")
+        if not record:
+            return None
+        data = record.get("data", {})
+        vanilla_game_dir = None
+        if self.steam_library and self.game_var_full:
+            vanilla_game_dir = str(Path(self.steam_library) / "steamapps" / "common" / self.game_var_full)
+        if (data.get("game") != self.game_var_full or data.get("vanilla_game_dir") != vanilla_game_dir
+                or data.get("profiles") != self._list_profiles() or "files" not in data):
+            return None
+        ini_files = {kind: [Path(p) for p in paths] for kind, paths in data["files"].items()}
+        if not all(path.is_file() for paths in ini_files.values() for path in paths):
+            return None
+        self.logger.debug("Reusing resolution INI file list from the configuration manifest")
+        return ini_files
+
+    def _configure_wine_prefix(self, components, status_callback=None) -> bool:
+        """
+        Steps 3-4.6: curated registry files, Wine components, dotnet fixes and dotfiles.
+        Returns False if a step failed and configuration must abort.
+        """
+        # Step 3: Download and apply curated user.reg.modlist and system.reg.modlist
+        if status_callback:
+            status_callback(f"{self._get_progress_timestamp()} Applying curated registry files for modlist configuration")
+        self.logger.info("Step 3: Downloading and applying curated user.reg.modlist and system.reg.modlist...")
+        try:
+            prefix_path_str = self.path_handler.find_compat_data(str(self.appid))
+            if not prefix_path_str or not os.path.isdir(prefix_path_str):
+                raise Exception("Could not determine Wine prefix path for this modlist. Please ensure you have launched the shortcut from Steam at least once.")
+            user_reg_url = "https://raw.githubusercontent.com/Omni-guides/Wabbajack-Modlist-Linux/refs/heads/main/files/user.reg.modlist"
+            response = requests.get(user_reg_url, verify=True)
+            response.raise_for_status()
+            user_reg_content = response.content
+            system_reg_url = "https://raw.githubusercontent.com/Omni-guides/Wabbajack-Modlist-Linux/refs/heads/main/files/system.reg.modlist"
+            response = requests.get(system_reg_url, verify=True)
+            response.raise_for_status()
+            system_reg_content = response.content
+        except Exception as e:
+            self.logger.error(f"Failed to download or apply curated user.reg.modlist or system.reg.modlist: {e}")
+            print(f"{COLOR_ERROR}Error: Failed to download or apply curated user.reg.modlist or system.reg.modlist. {e}{COLOR_RESET}")
+            return False
+
+        # A freshly created prefix can be cloned from a template built with the same
+        # Proton, components and registry files instead of redoing steps 3-4.6
+        template_store = PrefixTemplateStore()
+        from ..handlers.config_handler import ConfigHandler
+        template_key = template_store.template_key(
+            prefix_path_str,
+            ConfigHandler().get_proton_path(),
+            components,
+            {
+                "user.reg": hashlib.sha256(user_reg_content).hexdigest(),
+                "system.reg": hashlib.sha256(system_reg_content).hexdigest(),
+                "dotnet_fixes": UNIVERSAL_DOTNET_FIXES_VERSION,
+            },
+        )
+        fresh_prefix = template_store.is_fresh_prefix(prefix_path_str)
+        if fresh_prefix and template_store.restore(template_key, prefix_path_str):
+            self.logger.info("Steps 3-4.6: Wine prefix cloned from a matching prefix template.")
+            if status_callback:
+                status_callback(f"{self._get_progress_timestamp()} Wine prefix cloned from a previously configured template")
+            return True
+
+        try:
+            user_reg_dest = Path(prefix_path_str) / "user.reg"
+            with open(user_reg_dest, "wb") as f:
+                f.write(user_reg_content)
+            self.logger.info(f"Curated user.reg.modlist downloaded and applied to {user_reg_dest}")
+            system_reg_dest = Path(prefix_path_str) / "system.reg"
+            with open(system_reg_dest, "wb") as f:
+                f.write(system_reg_content)
+            self.logger.info(f"Curated system.reg.modlist downloaded and applied to {system_reg_dest}")
+        except Exception as e:
+            self.logger.error(f"Failed to download or apply curated user.reg.modlist or system.reg.modlist: {e}")
+            print(f"{COLOR_ERROR}Error: Failed to download or apply curated user.reg.modlist or system.reg.modlist. {e}{COLOR_RESET}")
+            return False
+        self.logger.info("Step 3: Curated user.reg.modlist and system.reg.modlist applied successfully.")
+
+        # Step 4: Install Wine Components
+        if status_callback:
+            status_callback(f"{self._get_progress_timestamp()} Installing Wine components (this may take a while)")
+        self.logger.info("Step 4: Installing Wine components (this may take a while)...")
+        
+        # DISABLED: Special game wine component routing - now using registry injection approach
+        # special_game_type = self.detect_special_game_type(self.modlist_dir)
+        # if special_game_type == "fnv":
+        #     target_appid = "22380"  # Vanilla Fallout New Vegas AppID
+        # elif special_game_type == "enderal":
+        #     target_appid = "976620"  # Enderal: Forgotten Stories Special Edition AppID  
+        # else:
+        #     target_appid = self.appid  # Normal modlist AppID
+        
+        # All modlists now use their own AppID for wine components
+        target_appid = self.appid
+        
+        # Use user's preferred component installation method (respects settings toggle)
+        self.logger.debug(f"Getting WINEPREFIX for AppID {target_appid}...")
+        wineprefix = self.protontricks_handler.get_wine_prefix_path(target_appid)
+        if not wineprefix:
+            self.logger.error("Failed to get WINEPREFIX path for component installation.")
+            print("Error: Could not determine wine prefix location.")
+            return False
+        self.logger.debug(f"WINEPREFIX obtained: {wineprefix}")
+
+        # Use the winetricks handler which respects the user's toggle setting
+        try:
+            self.logger.info("Installing Wine components using user's preferred method...")
+            self.logger.debug(f"Calling winetricks_handler.install_wine_components with wineprefix={wineprefix}, game_var={self.game_var_full}, components={components}")
+            success = self.winetricks_handler.install_wine_components(wineprefix, self.game_var_full, specific_components=components, status_callback=status_callback)
+            if success:
+                self.logger.info("Wine component installation completed successfully")
+                if status_callback:
+                    status_callback(f"{self._get_progress_timestamp()} Wine components verified and installed successfully")
+            else:
+                self.logger.error("Wine component installation failed")
+                print("Error: Failed to install necessary Wine components.")
+                return False
+        except Exception as e:
+            self.logger.error(f"Wine component installation failed with exception: {e}")
+            print("Error: Failed to install necessary Wine components.")
+            return False
+        self.logger.info("Step 4: Installing Wine components... Done")
+
+        # Step 4.5: Apply universal dotnet4.x compatibility registry fixes AFTER wine components
+        # This ensures the fixes are not overwritten by component installation processes
+        if status_callback:
+            status_callback(f"{self._get_progress_timestamp()} Applying universal dotnet4.x compatibility fixes")
+        self.logger.info("Step 4.5: Applying universal dotnet4.x compatibility registry fixes...")
+        registry_success = False
+        try:
+            registry_success = self._apply_universal_dotnet_fixes()
+        except Exception as e:
+            error_msg = f"CRITICAL: Registry fixes failed - modlist may have .NET compatibility issues: {e}"
+            self.logger.error(error_msg)
+            if status_callback:
+                status_callback(f"{self._get_progress_timestamp()} ERROR: {error_msg}")
+            registry_success = False
+
+        if not registry_success:
+            failure_msg = "WARNING: Universal dotnet4.x registry fixes FAILED! This modlist may experience .NET Framework compatibility issues."
+            self.logger.error("=" * 80)
+            self.logger.error(failure_msg)
+            self.logger.error("Consider manually setting mscoree=native in winecfg if problems occur.")
+            self.logger.error("=" * 80)
+            if status_callback:
+                status_callback(f"{self._get_progress_timestamp()} {failure_msg}")
+            # Continue but user should be aware of potential issues
+
+        # Step 4.6: Enable dotfiles visibility for Wine prefix
+        if status_callback:
+            status_callback(f"{self._get_progress_timestamp()} Enabling dotfiles visibility")
+        self.logger.info("Step 4.6: Enabling dotfiles visibility in Wine prefix...")
+        try:
+            if self.protontricks_handler.enable_dotfiles(self.appid):
+                self.logger.info("Dotfiles visibility enabled successfully")
+            else:
+                self.logger.warning("Failed to enable dotfiles visibility (non-critical, continuing)")
+        except Exception as e:
+            self.logger.warning(f"Error enabling dotfiles visibility: {e} (non-critical, continuing)")
+        self.logger.info("Step 4.6: Enabling dotfiles visibility... Done")
+
+        # Keep this prefix as the template for later modlists with the same setup
+        if fresh_prefix and registry_success:
+            if status_callback:
+                status_callback(f"{self._get_progress_timestamp()} Saving Wine prefix template for future modlists")
+            self._wait_for_wineserver()
+            template_store.snapshot(template_key, prefix_path_str)
+
+        return True
+
+    def _wait_for_wineserver(self):
+        """Wait until no Wine process is running in this modlist's prefix."""
+        wine_binary = self._find_wine_binary_for_registry()
+        if not wine_binary:
+            return
+        wineserver_binary = os.path.join(os.path.dirname(wine_binary), 'wineserver')
+        if not os.path.exists(wineserver_binary):
+            return
+        env = os.environ.copy()
+        env['WINEPREFIX'] = os.path.join(str(self.compat_data_path), "pfx")
+        try:
+            subprocess.run([wineserver_binary, '-w'], env=env, timeout=60, capture_output=True)
+        except Exception as e:
+            self.logger.warning(f"Waiting for wineserver failed (non-critical): {e}")
+
+    def _prefix_step_inputs(self, components) -> dict:
+        """Everything the Wine prefix steps depend on, for the configuration manifest."""
+        prefix_path_str = self.path_handler.find_compat_data(str(self.appid))
+        prefix_id = None
+        if prefix_path_str:
+            try:
+                # A recreated prefix gets a new inode even at the same path
+                pfx_stat = os.stat(os.path.join(prefix_path_str, "pfx"))
+                prefix_id = [pfx_stat.st_dev, pfx_stat.st_ino]
+            except OSError:
+                pass
+        self._detect_proton_version()
+        return {
+            "appid": str(self.appid),
+            "prefix": prefix_path_str,
+            "prefix_id": prefix_id,
+            "proton": self.proton_ver,
+            "game": self.game_var_full,
+            "components": sorted(components),
+            "registry": self._prefix_registry_fingerprint(prefix_path_str),
+        }
+
+    def _prefix_registry_fingerprint(self, prefix_path_str: Optional[str]) -> Optional[str]:
+        """Hash of the registry values the prefix steps set, so changes made outside Jackify are noticed."""
+        if not prefix_path_str:
+            return None
+        try:
+            values = read_values(os.path.join(prefix_path_str, "pfx"), PREFIX_REGISTRY_VALUES)
+        except OSError as e:
+            self.logger.debug(f"Could not read prefix registry for the configuration manifest: {e}")
+            return None
+        encoded = json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
     def _detect_steam_library_info(self) -> bool:
         """Detects Steam Library path and whether it's on an SD card."""
         self.logger.debug("Detecting Steam Library path...")
@@ -1564,7 +1817,8 @@ class ModlistHandler:
         """
         Apply universal dotnet4.x compatibility registry fixes to ALL modlists.
         Now called AFTER wine component installation to prevent overwrites.
-        Includes wineserver shutdown/flush to ensure persistence.
+        Both fixes are written straight into the prefix's registry files in one
+        pass once its wineserver has exited; wine reg add is only the fallback.
         """
         try:
             prefix_path = os.path.join(str(self.compat_data_path), "pfx")
@@ -1574,107 +1828,37 @@ class ModlistHandler:
 
             self.logger.info("Applying universal dotnet4.x compatibility registry fixes (post-component installation)...")
 
-            # Find the appropriate Wine binary to use for registry operations
-            wine_binary = self._find_wine_binary_for_registry()
-            if not wine_binary:
-                self.logger.error("Could not find Wine binary for registry operations")
-                return False
-
-            # Find wineserver binary for flushing registry changes
-            wine_dir = os.path.dirname(wine_binary)
-            wineserver_binary = os.path.join(wine_dir, 'wineserver')
-            if not os.path.exists(wineserver_binary):
-                self.logger.warning(f"wineserver not found at {wineserver_binary}, registry flush may not work")
-                wineserver_binary = None
-
-            # Set environment for Wine registry operations
-            env = os.environ.copy()
-            env['WINEPREFIX'] = prefix_path
-            env['WINEDEBUG'] = '-all'  # Suppress Wine debug output
-
-            # Shutdown any running wineserver processes to ensure clean slate
-            if wineserver_binary:
-                self.logger.debug("Shutting down wineserver before applying registry fixes...")
-                try:
-                    subprocess.run([wineserver_binary, '-w'], env=env, timeout=30, capture_output=True)
-                    self.logger.debug("Wineserver shutdown complete")
-                except Exception as e:
-                    self.logger.warning(f"Wineserver shutdown failed (non-critical): {e}")
-
+            edits = RegistryEdits(prefix_path)
             # Registry fix 1: Set *mscoree=native DLL override (asterisk for full override)
             # This tells Wine to use native .NET runtime instead of Wine's implementation
-            self.logger.debug("Setting *mscoree=native DLL override...")
-            cmd1 = [
-                wine_binary, 'reg', 'add',
-                'HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides',
-                '/v', '*mscoree', '/t', 'REG_SZ', '/d', 'native', '/f'
-            ]
-
-            result1 = subprocess.run(cmd1, env=env, capture_output=True, text=True, errors='replace', timeout=30)
-            self.logger.info(f"*mscoree registry command result: returncode={result1.returncode}, stdout={result1.stdout[:200]}, stderr={result1.stderr[:200]}")
-            if result1.returncode == 0:
-                self.logger.info("Successfully applied *mscoree=native DLL override")
-            else:
-                self.logger.error(f"Failed to set *mscoree DLL override: returncode={result1.returncode}, stderr={result1.stderr}")
-
+            edits.dll_override('*mscoree', 'native')
             # Registry fix 2: Set OnlyUseLatestCLR=1
             # This prevents .NET version conflicts by using the latest CLR
-            self.logger.debug("Setting OnlyUseLatestCLR=1 registry entry...")
-            cmd2 = [
-                wine_binary, 'reg', 'add',
-                'HKEY_LOCAL_MACHINE\\Software\\Microsoft\\.NETFramework',
-                '/v', 'OnlyUseLatestCLR', '/t', 'REG_DWORD', '/d', '1', '/f'
-            ]
+            edits.set('HKEY_LOCAL_MACHINE\\Software\\Microsoft\\.NETFramework', 'OnlyUseLatestCLR', 1)
 
-            result2 = subprocess.run(cmd2, env=env, capture_output=True, text=True, errors='replace', timeout=30)
-            self.logger.info(f"OnlyUseLatestCLR registry command result: returncode={result2.returncode}, stdout={result2.stdout[:200]}, stderr={result2.stderr[:200]}")
-            if result2.returncode == 0:
-                self.logger.info("Successfully applied OnlyUseLatestCLR=1 registry entry")
-            else:
-                self.logger.error(f"Failed to set OnlyUseLatestCLR: returncode={result2.returncode}, stderr={result2.stderr}")
+            # A wineserver left over from component installation would overwrite the files on exit
+            self.logger.debug("Waiting for wineserver to exit before applying registry fixes...")
+            self._wait_for_wineserver()
 
-            # Force wineserver to flush registry changes to disk
-            if wineserver_binary:
+            # Only needed if the files can't be edited directly
+            wine_binary = self._find_wine_binary_for_registry()
+            env = os.environ.copy()
+            env['WINEPREFIX'] = prefix_path
+            env['WINEDEBUG'] = '-all'  # Suppress Wine debug output
+
+            if not edits.apply(wine_binary=wine_binary, env=env):
+                self.logger.error("Failed to apply dotnet4.x registry fixes")
+                return False
+            if wine_binary and not edits.verify():
+                # Changes made through wine reg add reach the files when the wineserver exits
                 self.logger.debug("Flushing registry changes to disk via wineserver shutdown...")
-                try:
-                    subprocess.run([wineserver_binary, '-w'], env=env, timeout=30, capture_output=True)
-                    self.logger.debug("Registry changes flushed to disk")
-                except Exception as e:
-                    self.logger.warning(f"Registry flush failed (non-critical): {e}")
+                self._wait_for_wineserver()
 
             # VERIFICATION: Confirm the registry entries persisted
             self.logger.info("Verifying registry entries were applied and persisted...")
-            verification_passed = True
-
-            # Verify *mscoree=native
-            verify_cmd1 = [
-                wine_binary, 'reg', 'query',
-                'HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides',
-                '/v', '*mscoree'
-            ]
-            verify_result1 = subprocess.run(verify_cmd1, env=env, capture_output=True, text=True, errors='replace', timeout=30)
-            if verify_result1.returncode == 0 and 'native' in verify_result1.stdout:
-                self.logger.info("VERIFIED: *mscoree=native is set correctly")
-            else:
-                self.logger.error(f"VERIFICATION FAILED: *mscoree=native not found in registry. Query output: {verify_result1.stdout}")
-                verification_passed = False
-
-            # Verify OnlyUseLatestCLR=1
-            verify_cmd2 = [
-                wine_binary, 'reg', 'query',
-                'HKEY_LOCAL_MACHINE\\Software\\Microsoft\\.NETFramework',
-                '/v', 'OnlyUseLatestCLR'
-            ]
-            verify_result2 = subprocess.run(verify_cmd2, env=env, capture_output=True, text=True, errors='replace', timeout=30)
-            if verify_result2.returncode == 0 and ('0x1' in verify_result2.stdout or 'REG_DWORD' in verify_result2.stdout):
-                self.logger.info("VERIFIED: OnlyUseLatestCLR=1 is set correctly")
-            else:
-                self.logger.error(f"VERIFICATION FAILED: OnlyUseLatestCLR=1 not found in registry. Query output: {verify_result2.stdout}")
-                verification_passed = False
-
-            # Both fixes applied and verified
-            if result1.returncode == 0 and result2.returncode == 0 and verification_passed:
-                self.logger.info("Universal dotnet4.x compatibility fixes applied, flushed, and verified successfully")
+            if edits.verify():
+                self.logger.info("VERIFIED: *mscoree=native and OnlyUseLatestCLR=1 are set correctly")
+                self.logger.info("Universal dotnet4.x compatibility fixes applied and verified successfully")
                 return True
             else:
                 self.logger.error("Registry fixes failed verification - fixes may not persist across prefix restarts")
@@ -1744,29 +1928,10 @@ class ModlistHandler:
         Returns:
             Path to wine binary if found, None otherwise
         """
+        # The (depth-limited) search result is kept in the Proton inventory
+        from .proton_inventory import get_proton_inventory
         try:
-            if not proton_path.exists() or not proton_path.is_dir():
-                return None
-
-            # Search for 'wine' executable (not 'wine64' or 'wine-preloader')
-            # Limit search depth to avoid scanning entire filesystem
-            max_depth = 5
-            for root, dirs, files in os.walk(proton_path, followlinks=False):
-                # Calculate depth relative to proton_path
-                depth = len(Path(root).relative_to(proton_path).parts)
-                if depth > max_depth:
-                    dirs.clear()  # Don't descend further
-                    continue
-                
-                # Check if 'wine' is in this directory
-                if 'wine' in files:
-                    wine_path = Path(root) / 'wine'
-                    # Verify it's actually an executable file
-                    if wine_path.is_file() and os.access(wine_path, os.X_OK):
-                        self.logger.debug(f"Found wine binary at: {wine_path}")
-                        return str(wine_path)
-
-            return None
+            return get_proton_inventory().wine_binary(proton_path)
         except Exception as e:
             self.logger.debug(f"Error during recursive wine search in {proton_path}: {e}")
             return None
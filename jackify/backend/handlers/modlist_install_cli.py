@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional, Dict, List, Any, Union
 from .protontricks_handler import ProtontricksHandler
 from .shortcut_handler import ShortcutHandler
+from .modlist_tree_index import get_modlist_tree_index
 from .menu_handler import MenuHandler, ModlistMenuHandler
 from .ui_colors import COLOR_PROMPT, COLOR_INFO, COLOR_ERROR, COLOR_RESET, COLOR_SUCCESS, COLOR_WARNING, COLOR_SELECTION
 # Standard logging (no file handler) - LoggingHandler import removed
@@ -135,80 +136,13 @@ class ModlistInstallCLI:
                 self.context['modlist_source_type'] = 'online_list'
                 print(f"\n{COLOR_INFO}Fetching available modlists... This may take a moment.{COLOR_RESET}")
                 try:
-                    env = os.environ.copy()
-                    env["DOTNET_SYSTEM_GLOBALIZATION_INVARIANT"] = "1"
-                    self.logger.info("Setting DOTNET_SYSTEM_GLOBALIZATION_INVARIANT=1 for jackify-engine process.")
+                    # Shared catalog: one engine fetch serves every category below
+                    raw_modlists_from_engine = self.get_all_modlists_from_engine()
                     
-                    # Use the engine path from the helper function, but the command structure from restored.
-                    engine_executable_path_for_subprocess = get_jackify_engine_path() 
-                    command = [engine_executable_path_for_subprocess, 'list-modlists', '--show-all-sizes', '--show-machine-url']
-                    self.logger.info(f"Executing command: {' '.join(command)} in CWD: {engine_dir}")
-
-                    # check=True as in restored logic
-                    result = subprocess.run(
-                        command,
-                        capture_output=True, text=True, check=True, 
-                        env=env, cwd=engine_dir
-                    )
-                    
-                    # self.logger.debug(f"Engine stdout (raw):\n{result.stdout}") # COMMENTED OUT - too verbose
-
-                    lines = result.stdout.splitlines()
-                    
-                    # Parse new format: [STATUS] Modlist Name - Game - Download|Install|Total - MachineURL
-                    # STATUS indicators: [DOWN], [NSFW], or both [DOWN] [NSFW]
-                    raw_modlists_from_engine = []
-                    for line in lines:
-                        line = line.strip()
-                        if not line or line.startswith('Loading') or line.startswith('Loaded'):
-                            continue
-                        
-                        # Extract status indicators
-                        status_down = '[DOWN]' in line
-                        status_nsfw = '[NSFW]' in line
-                        
-                        # Remove status indicators to get clean line
-                        clean_line = line.replace('[DOWN]', '').replace('[NSFW]', '').strip()
-                        
-                        # Split on ' - ' to get: [Modlist Name, Game, Sizes, MachineURL]
-                        parts = clean_line.split(' - ')
-                        if len(parts) != 4:
-                            continue  # Skip malformed lines
-                        
-                        modlist_name = parts[0].strip()
-                        game_name = parts[1].strip()
-                        sizes_str = parts[2].strip()
-                        machine_url = parts[3].strip()
-                        
-                        # Parse sizes: "Download|Install|Total" (e.g., "203GB|130GB|333GB")
-                        size_parts = sizes_str.split('|')
-                        if len(size_parts) != 3:
-                            continue  # Skip if sizes don't match expected format
-                        
-                        download_size = size_parts[0].strip()
-                        install_size = size_parts[1].strip()
-                        total_size = size_parts[2].strip()
-                        
-                        # Skip if any required data is missing
-                        if not modlist_name or not game_name or not machine_url:
-                            continue
-                        
-                        raw_modlists_from_engine.append({
-                            'id': modlist_name,  # Use modlist name as ID for compatibility
-                            'name': modlist_name,
-                            'game': game_name,
-                            'download_size': download_size,
-                            'install_size': install_size,
-                            'total_size': total_size,
-                            'machine_url': machine_url,  # Store machine URL for installation
-                            'status_down': status_down,
-                            'status_nsfw': status_nsfw
-                        })
-                    
-                    self.logger.info(f"Scraped {len(raw_modlists_from_engine)} modlists after revised regex and filtering logic.")
+                    self.logger.info(f"Loaded {len(raw_modlists_from_engine)} modlists from the modlist catalog.")
 
                     if not raw_modlists_from_engine:
-                        print(f"{COLOR_WARNING}No modlists found after applying revised regex and filtering logic.{COLOR_RESET}")
+                        print(f"{COLOR_WARNING}No modlists found in the modlist catalog.{COLOR_RESET}")
                         return None
 
                     # EXACT game_type_map and grouping logic from restored file
@@ -301,16 +235,6 @@ class ModlistInstallCLI:
                         if selected_modlist_info:
                             break 
                 
-                except subprocess.CalledProcessError as e:
-                    self.logger.error(f"list-modlists failed. Code: {e.returncode}")
-                    if e.stdout: self.logger.error(f"Engine stdout:\n{e.stdout}")
-                    if e.stderr: self.logger.error(f"Engine stderr:\n{e.stderr}")
-                    print(f"{COLOR_ERROR}Failed to fetch modlist list. Engine error (Code: {e.returncode}).{COLOR_RESET}")
-                    return None
-                except FileNotFoundError: 
-                    self.logger.error(f"Engine not found: {engine_executable_path_for_subprocess}")
-                    print(f"{COLOR_ERROR}Critical error: jackify-install-engine not found.{COLOR_RESET}")
-                    return None
                 except Exception as e:
                     self.logger.error(f"Unexpected error fetching modlists: {e}", exc_info=True)
                     print(f"{COLOR_ERROR}Unexpected error fetching modlists: {e}{COLOR_RESET}")
@@ -722,7 +646,8 @@ class ModlistInstallCLI:
                     self.logger.warning(f"File descriptor limit: {message}")
                 
                 # Use cleaned environment to prevent AppImage variable inheritance
-                from jackify.backend.handlers.subprocess_utils import get_clean_subprocess_env
+                from jackify.backend.handlers.subprocess_utils import get_clean_subprocess_env, iter_output_records
+                from jackify.backend.handlers.progress_bus import StatusLineThrottle
                 clean_env = get_clean_subprocess_env()
                 proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=False, env=clean_env, cwd=engine_dir)
                 
@@ -758,6 +683,15 @@ class ModlistInstallCLI:
                     
                 performance_monitor.add_callback(create_stall_alert_callback(self.logger, stall_alert))
                 
+                # Keep samples, phases and speeds for the performance report
+                from .performance_timeline import start_performance_timeline, close_active_timeline
+                from .progress_bus import ProgressEventBus
+                timeline = start_performance_timeline(self.context.get('modlist_name', ''), "cli")
+                performance_monitor.add_callback(timeline.record_metrics)
+                # Only the timeline listens, so one frame per second is plenty
+                timeline_bus = ProgressEventBus(max_fps=1.0)
+                timeline_bus.subscribe(timeline.record_frame)
+                
                 # Start monitoring
                 monitoring_started = performance_monitor.start_monitoring(proc.pid)
                 if monitoring_started:
@@ -767,49 +701,46 @@ class ModlistInstallCLI:
                 
                 try:
                     # Read output in binary mode to properly handle carriage returns
-                    buffer = b''
                     last_progress_time = time.time()
+                    # Redrawing the \r status line is terminal-bound; cap it like the GUI progress bus
+                    status_lines = StatusLineThrottle(self._write_status)
                     
-                    while True:
-                        chunk = proc.stdout.read(1)
-                        if not chunk:
+                    for line, terminator in iter_output_records(proc.stdout):
+                        if not terminator:
+                            # Print any remaining unterminated content
+                            status_lines.flush()
+                            print(line, end='')
                             break
-                        buffer += chunk
-                        
-                        # Process complete lines or carriage return updates
-                        if chunk == b'\n':
-                            # Complete line - decode and print
-                            line = buffer.decode('utf-8', errors='replace')
-                            # Enhance Nexus download errors with modlist context
-                            enhanced_line = self._enhance_nexus_error(line)
-                            print(enhanced_line, end='')
-                            buffer = b''
-                            last_progress_time = time.time()
-                        elif chunk == b'\r':
-                            # Carriage return - decode and print without newline
-                            line = buffer.decode('utf-8', errors='replace')
+
+                        timeline_bus.process_line(line)
+
+                        if terminator == '\r':
+                            # Carriage return - progress update printed without newline.
+                            # A skipped update is printed before the next other output;
+                            # Nexus errors are never held back.
+                            record = line + terminator
+                            enhanced_line = self._enhance_nexus_error(record)
+                            status_lines.status(enhanced_line, force=enhanced_line != record)
+                        else:
+                            status_lines.flush()
                             # Enhance Nexus download errors with modlist context
-                            enhanced_line = self._enhance_nexus_error(line)
+                            enhanced_line = self._enhance_nexus_error(line + terminator)
                             print(enhanced_line, end='')
-                            sys.stdout.flush()
-                            buffer = b''
-                            last_progress_time = time.time()
                             
                         # Check for timeout (no output for too long)
                         current_time = time.time()
                         if current_time - last_progress_time > 300:  # 5 minutes no output
                             self.logger.warning("No output from engine for 5 minutes - possible stall")
-                            last_progress_time = current_time  # Reset to avoid spam
-                    
-                    # Print any remaining buffer content
-                    if buffer:
-                        line = buffer.decode('utf-8', errors='replace')
-                        print(line, end='')
+                        last_progress_time = current_time
                     
+                    status_lines.flush()
                     proc.wait()
                     
                 finally:
+                    timeline_bus.close()
                     # Stop performance monitoring and get summary
+                    timeline.engine_finished(proc.returncode)
+                    self.logger.info(f"Performance timeline saved to {timeline.path}")
                     if monitoring_started:
                         performance_monitor.stop_monitoring()
                         summary = performance_monitor.get_metrics_summary()
@@ -826,11 +757,14 @@ class ModlistInstallCLI:
                 if proc.returncode != 0:
                     print(f"{COLOR_ERROR}Jackify Install Engine exited with code {proc.returncode}.{COLOR_RESET}")
                     self.logger.error(f"Engine exited with code {proc.returncode}.")
+                    close_active_timeline()
                     return # Configuration phase failed
                 self.logger.info(f"Engine completed with code {proc.returncode}.")
             except Exception as e:
                 print(f"{COLOR_ERROR}Error running Jackify Install Engine: {e}{COLOR_RESET}\n")
                 self.logger.error(f"Exception running engine: {e}", exc_info=True)
+                from .performance_timeline import close_active_timeline
+                close_active_timeline()
                 return # Configuration phase failed
             finally:
                 # Restore original environment state
@@ -1038,98 +972,27 @@ class ModlistInstallCLI:
 
     def get_all_modlists_from_engine(self, game_type=None):
         """
-        Call the Jackify engine with 'list-modlists' and return a list of modlist dicts.
-        Each dict should have at least 'id', 'game', 'download_size', 'install_size', 'total_size', and status flags.
-        
+        Return the modlists jackify-engine knows about as a list of dicts.
+        Each dict has 'id', 'name', 'game', 'download_size', 'install_size', 'total_size',
+        'machine_url' and the 'status_down'/'status_nsfw' flags.
+
+        Served from the shared modlist catalog, so repeated calls don't launch the engine.
+
         Args:
-            game_type (str, optional): Filter by game type (e.g., "Skyrim", "Fallout New Vegas")
+            game_type (str, optional): Filter by game category key (e.g. "skyrim") or game name
         """
-        import subprocess
-        import re
-        from pathlib import Path
-                    # COLOR_ERROR already imported at module level
-        engine_executable = get_jackify_engine_path()
-        engine_dir = os.path.dirname(engine_executable)
-        if not os.path.exists(engine_executable):
-            self.logger.error(f"jackify-install-engine not found at {engine_executable}")
-            print(f"{COLOR_ERROR}Error: jackify-install-engine not found at expected location.{COLOR_ERROR}")
-            return []
-        env = os.environ.copy()
-        env["DOTNET_SYSTEM_GLOBALIZATION_INVARIANT"] = "1"
-        command = [engine_executable, 'list-modlists', '--show-all-sizes', '--show-machine-url']
-        
-        # Add game filter if specified
-        if game_type:
-            command.extend(['--game', game_type])
+        from jackify.backend.services.modlist_catalog_service import get_modlist_catalog_service
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True, text=True, check=True,
-                env=env, cwd=engine_dir
-            )
-            lines = result.stdout.splitlines()
-            modlists = []
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('Loading') or line.startswith('Loaded'):
-                    continue
-                
-                # Parse the new format: [STATUS] Modlist Name - Game - Download|Install|Total - MachineURL
-                # STATUS indicators: [DOWN], [NSFW], or both [DOWN] [NSFW]
-                
-                # Extract status indicators
-                status_down = '[DOWN]' in line
-                status_nsfw = '[NSFW]' in line
-                
-                # Remove status indicators to get clean line
-                clean_line = line.replace('[DOWN]', '').replace('[NSFW]', '').strip()
-                
-                # Split from right to handle modlist names with dashes
-                # Format: "NAME - GAME - SIZES - MACHINE_URL"
-                parts = clean_line.rsplit(' - ', 3)  # Split from right, max 3 splits = 4 parts
-                if len(parts) != 4:
-                    continue  # Skip malformed lines
-                
-                modlist_name = parts[0].strip()
-                game_name = parts[1].strip()
-                sizes_str = parts[2].strip()
-                machine_url = parts[3].strip()
-                
-                # Parse sizes: "Download|Install|Total" (e.g., "203GB|130GB|333GB")
-                size_parts = sizes_str.split('|')
-                if len(size_parts) != 3:
-                    continue  # Skip if sizes don't match expected format
-                
-                download_size = size_parts[0].strip()
-                install_size = size_parts[1].strip()
-                total_size = size_parts[2].strip()
-                
-                # Skip if any required data is missing
-                if not modlist_name or not game_name or not machine_url:
-                    continue
-                
-                modlists.append({
-                    'id': modlist_name,  # Use modlist name as ID for compatibility
-                    'name': modlist_name,
-                    'game': game_name,
-                    'download_size': download_size,
-                    'install_size': install_size, 
-                    'total_size': total_size,
-                    'machine_url': machine_url,  # Store machine URL for installation
-                    'status_down': status_down,
-                    'status_nsfw': status_nsfw
-                })
-            return modlists
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"list-modlists failed. Code: {e.returncode}")
-            if e.stdout: self.logger.error(f"Engine stdout:\n{e.stdout}")
-            if e.stderr: self.logger.error(f"Engine stderr:\n{e.stderr}")
-            print(f"{COLOR_ERROR}Failed to fetch modlist list. Engine error (Code: {e.returncode}).{COLOR_ERROR}")
-            return []
+            modlists = get_modlist_catalog_service().list_modlists(game_type=game_type)
         except Exception as e:
             self.logger.error(f"Unexpected error fetching modlists: {e}", exc_info=True)
-            print(f"{COLOR_ERROR}Unexpected error fetching modlists: {e}{COLOR_ERROR}")
+            print(f"{COLOR_ERROR}Unexpected error fetching modlists: {e}{COLOR_RESET}")
+            return []
+        if modlists is None:
+            self.logger.error("list-modlists failed and no cached modlist catalog is available")
+            print(f"{COLOR_ERROR}Failed to fetch modlist list from jackify-engine.{COLOR_RESET}")
             return []
+        return modlists
 
     def _display_summary(self):
         # REMOVE pass AND RESTORE THE METHOD BODY
@@ -1176,6 +1039,11 @@ class ModlistInstallCLI:
         print(auth_display)
         print(f"{COLOR_INFO}----------------------------------------{COLOR_RESET}")
 
+    @staticmethod
+    def _write_status(text: str):
+        print(text, end='')
+        sys.stdout.flush()
+
     def _enhance_nexus_error(self, line: str) -> str:
         """
         Enhance Nexus download error messages by adding the mod URL for easier troubleshooting.
@@ -1264,6 +1132,7 @@ class ModlistInstallCLI:
             from pathlib import Path
 
             install_path = Path(install_dir)
+            tree_index = None
 
             # Search for TTW indicators in common locations
             search_paths = [
@@ -1285,7 +1154,9 @@ class ModlistInstallCLI:
                     folder_name_lower = folder.name.lower()
                     if all(keyword in folder_name_lower for keyword in ['tale', 'two', 'wastelands']):
                         # Verify it has the TTW ESM file
-                        for file in folder.rglob('*.esm'):
+                        if tree_index is None:
+                            tree_index = get_modlist_tree_index(install_path)
+                        for file in tree_index.with_extension('.esm', under=folder):
                             if 'taleoftwowastelands' in file.name.lower():
                                 self.logger.info(f"Found existing TTW installation: {file}")
                                 return True
@@ -0,0 +1,209 @@
+"""
+Modlist Tree Index
+
+One-pass scan of an installed modlist directory. Several post-install steps
+need to find files by name (resolution INIs), by extension (TTW ESMs) or to
+know whether everything is owned by the current user; on a large Wabbajack
+install each separate ``rglob``/``os.walk`` costs minutes on an SD card.
+
+The scan uses ``os.scandir`` with ``lstat`` per entry and is split into one
+job per top-level folder (one per ``mods/`` subfolder), run on a thread pool.
+The resulting index is cached per directory and shared by all consumers until
+it is invalidated (start of a configuration run, or after ownership changes).
+"""
+
+import logging
+import os
+import stat
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MODS_DIR_NAME = "mods"
+
+
+class _ScanResult:
+    """Partial index produced by one scan job."""
+
+    __slots__ = ("by_name", "by_extension", "foreign_owned", "files", "dirs")
+
+    def __init__(self):
+        self.by_name: Dict[str, List[str]] = defaultdict(list)
+        self.by_extension: Dict[str, List[str]] = defaultdict(list)
+        self.foreign_owned: List[str] = []
+        self.files = 0
+        self.dirs = 0
+
+
+class ModlistTreeIndex:
+    """
+    Compact index of every entry under a directory tree.
+
+    - ``by_name``: basename -> paths of non-directory entries (case-sensitive)
+    - ``by_extension``: lowercase extension (with dot) -> paths
+    - ``foreign_owned``: entries whose uid/gid differ from the current user,
+      or that could not be stat'ed
+
+    Paths are stored as strings; lookups return ``Path`` objects. Symlinks are
+    recorded but never followed.
+    """
+
+    def __init__(self, root: Union[str, Path], uid: int, gid: int):
+        self.root = Path(root)
+        self.uid = uid
+        self.gid = gid
+        self.by_name: Dict[str, List[str]] = {}
+        self.by_extension: Dict[str, List[str]] = {}
+        self.foreign_owned: List[str] = []
+        self.files_scanned = 0
+        self.dirs_scanned = 0
+        self.build_seconds = 0.0
+
+    @classmethod
+    def build(cls, root: Union[str, Path], max_workers: Optional[int] = None) -> "ModlistTreeIndex":
+        """Scan ``root`` and return its index (empty if ``root`` is not a directory)."""
+        index = cls(root, os.getuid(), os.getgid())
+        start = time.monotonic()
+        root_str = str(index.root)
+        if not os.path.isdir(root_str):
+            logger.debug(f"Tree index: {root_str} is not a directory, index is empty")
+            return index
+
+        # Direct children of the root (and of mods/) are scanned here so that the
+        # per-folder jobs are roughly even in size
+        head = _ScanResult()
+        subtrees = []
+        for dir_path in index._scan_dir(root_str, head):
+            if os.path.basename(dir_path) == MODS_DIR_NAME:
+                subtrees.extend(index._scan_dir(dir_path, head))
+            else:
+                subtrees.append(dir_path)
+
+        results = [head]
+        if subtrees:
+            if max_workers is None:
+                max_workers = min(8, (os.cpu_count() or 2) + 2)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tree-index") as pool:
+                results.extend(pool.map(index._scan_subtree, subtrees))
+
+        index._merge(results)
+        index.build_seconds = time.monotonic() - start
+        logger.info(
+            f"Indexed {root_str}: {index.files_scanned} files, {index.dirs_scanned} directories, "
+            f"{len(index.foreign_owned)} ownership anomalies in {index.build_seconds:.2f}s"
+        )
+        return index
+
+    def _scan_dir(self, dir_path: str, result: _ScanResult) -> List[str]:
+        """Record the entries of one directory; return its subdirectories."""
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug(f"Tree index: cannot read {dir_path}: {e}")
+            return subdirs
+
+        uid, gid = self.uid, self.gid
+        for entry in entries:
+            path = entry.path
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                result.foreign_owned.append(path)
+                continue
+            if st.st_uid != uid or st.st_gid != gid:
+                result.foreign_owned.append(path)
+            if stat.S_ISDIR(st.st_mode):
+                result.dirs += 1
+                subdirs.append(path)
+            else:
+                result.files += 1
+                name = entry.name
+                result.by_name[name].append(path)
+                result.by_extension[os.path.splitext(name)[1].lower()].append(path)
+        return subdirs
+
+    def _scan_subtree(self, top: str) -> _ScanResult:
+        """Depth-first scan of one subtree (runs on a worker thread)."""
+        result = _ScanResult()
+        stack = [top]
+        while stack:
+            stack.extend(self._scan_dir(stack.pop(), result))
+        return result
+
+    def _merge(self, results: Iterable[_ScanResult]):
+        by_name: Dict[str, List[str]] = defaultdict(list)
+        by_extension: Dict[str, List[str]] = defaultdict(list)
+        for result in results:
+            for name, paths in result.by_name.items():
+                by_name[name].extend(paths)
+            for ext, paths in result.by_extension.items():
+                by_extension[ext].extend(paths)
+            self.foreign_owned.extend(result.foreign_owned)
+            self.files_scanned += result.files
+            self.dirs_scanned += result.dirs
+        self.by_name = dict(by_name)
+        self.by_extension = dict(by_extension)
+
+    def find(self, name: str, under: Optional[Union[str, Path]] = None) -> List[Path]:
+        """Paths of entries named exactly ``name``, optionally only below ``under``."""
+        return self._filter(self.by_name.get(name, ()), under)
+
+    def with_extension(self, extension: str, under: Optional[Union[str, Path]] = None) -> List[Path]:
+        """Paths of entries with ``extension`` (e.g. ``".esm"``, case-insensitive)."""
+        return self._filter(self.by_extension.get(extension.lower(), ()), under)
+
+    @staticmethod
+    def _filter(paths: Iterable[str], under: Optional[Union[str, Path]]) -> List[Path]:
+        if under is None:
+            return [Path(p) for p in paths]
+        prefix = os.path.abspath(str(under)).rstrip(os.sep) + os.sep
+        return [Path(p) for p in paths if p.startswith(prefix)]
+
+    @property
+    def all_owned_by_user(self) -> bool:
+        return not self.foreign_owned
+
+
+_index_cache: Dict[Tuple[str, int], ModlistTreeIndex] = {}
+_index_lock = threading.Lock()
+
+
+def _cache_key(root: Union[str, Path]) -> Tuple[str, int]:
+    return os.path.abspath(str(root)), os.getuid()
+
+
+def get_modlist_tree_index(root: Union[str, Path], refresh: bool = False) -> ModlistTreeIndex:
+    """
+    Shared index for ``root``, scanning it on first use.
+
+    Concurrent callers for the same directory wait for a single scan.
+    """
+    key = _cache_key(root)
+    with _index_lock:
+        index = None if refresh else _index_cache.get(key)
+        if index is None:
+            index = ModlistTreeIndex.build(key[0])
+            _index_cache[key] = index
+        return index
+
+
+def peek_modlist_tree_index(root: Union[str, Path]) -> Optional[ModlistTreeIndex]:
+    """Cached index for ``root`` if one has been built, without scanning."""
+    with _index_lock:
+        return _index_cache.get(_cache_key(root))
+
+
+def invalidate_modlist_tree_index(root: Optional[Union[str, Path]] = None):
+    """Drop the cached index for ``root`` (or all cached indexes)."""
+    with _index_lock:
+        if root is None:
+            _index_cache.clear()
+        else:
+            _index_cache.pop(_cache_key(root), None)
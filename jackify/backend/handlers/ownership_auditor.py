@@ -0,0 +1,153 @@
+"""
+Ownership Auditor
+
+Checks whether everything under a modlist directory is owned by the current
+user, so the sudo chown/chmod step can be skipped - or limited to the exact
+paths that need it instead of ``chown -R`` over the whole install.
+
+The tree is split per top-level folder (one per ``mods/`` subfolder) and
+walked with ``os.scandir`` + ``DirEntry.stat(follow_symlinks=False)`` on a
+thread pool. In ``stop_on_first`` mode every worker stops as soon as any of
+them finds a foreign-owned entry.
+"""
+
+import logging
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .modlist_tree_index import MODS_DIR_NAME, peek_modlist_tree_index
+
+logger = logging.getLogger(__name__)
+
+# Beyond this many offending subtrees a single recursive chown of the root is cheaper
+MAX_TARGETED_PATHS = 500
+# Paths per sudo chown/chmod invocation (keeps the command line bounded)
+PATHS_PER_COMMAND = 100
+
+
+def collapse_subtrees(paths: List[str]) -> List[str]:
+    """Drop paths that lie inside another listed path (a recursive chown covers them)."""
+    collapsed: List[str] = []
+    for path in sorted(paths):
+        if collapsed and path.startswith(collapsed[-1] + os.sep):
+            continue
+        collapsed.append(path)
+    return collapsed
+
+
+class OwnershipAuditor:
+    """
+    Parallel uid/gid audit of a directory tree.
+
+    ``offending`` holds the foreign-owned (or unreadable) entries found; a
+    foreign-owned directory is reported as a whole and not descended into.
+    """
+
+    def __init__(self, root: Union[str, Path], max_workers: Optional[int] = None):
+        self.root = os.path.abspath(str(root))
+        self.uid = os.getuid()
+        self.gid = os.getgid()
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 2) + 2)
+        self.offending: List[str] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._stop_on_first = False
+
+    def audit(self, stop_on_first: bool = False) -> List[str]:
+        """Walk the tree and return the offending subtrees (collapsed)."""
+        self.offending = []
+        self._stop.clear()
+        self._stop_on_first = stop_on_first
+        if not os.path.isdir(self.root):
+            return []
+
+        subtrees = []
+        for dir_path in self._check_dir(self.root):
+            if os.path.basename(dir_path) == MODS_DIR_NAME:
+                subtrees.extend(self._check_dir(dir_path))
+            else:
+                subtrees.append(dir_path)
+
+        if subtrees and not self._stop.is_set():
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ownership-audit") as pool:
+                list(pool.map(self._walk, subtrees))
+
+        self.offending = collapse_subtrees(self.offending)
+        return self.offending
+
+    def all_owned_by_user(self) -> bool:
+        """True if no foreign-owned entry exists (stops at the first one found)."""
+        return not self.audit(stop_on_first=True)
+
+    def _report(self, path: str):
+        with self._lock:
+            self.offending.append(path)
+        if self._stop_on_first:
+            self._stop.set()
+
+    def _check_dir(self, dir_path: str) -> List[str]:
+        """Check the entries of one directory; return the subdirectories to descend into."""
+        subdirs: List[str] = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if self._stop.is_set():
+                        return []
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        self._report(entry.path)
+                        continue
+                    if st.st_uid != self.uid or st.st_gid != self.gid:
+                        self._report(entry.path)
+                    elif stat.S_ISDIR(st.st_mode):
+                        subdirs.append(entry.path)
+        except OSError as e:
+            # Unreadable directory: its contents can't be audited, so it needs fixing too
+            logger.debug(f"Ownership audit: cannot read {dir_path}: {e}")
+            self._report(dir_path)
+        return subdirs
+
+    def _walk(self, top: str):
+        stack = [top]
+        while stack and not self._stop.is_set():
+            stack.extend(self._check_dir(stack.pop()))
+
+
+def all_owned_by_user(path: Union[str, Path]) -> bool:
+    """
+    True if everything under ``path`` is owned by the current user.
+
+    Answers from the shared modlist tree index when one has already been
+    built, otherwise runs an early-exit audit.
+    """
+    index = peek_modlist_tree_index(path)
+    if index is not None:
+        return index.all_owned_by_user
+    return OwnershipAuditor(path).all_owned_by_user()
+
+
+def find_offending_subtrees(path: Union[str, Path]) -> List[str]:
+    """Collapsed list of paths under ``path`` that need chown/chmod."""
+    index = peek_modlist_tree_index(path)
+    if index is not None:
+        return collapse_subtrees(index.foreign_owned)
+    return OwnershipAuditor(path).audit()
+
+
+def ownership_fix_targets(path: Union[str, Path]) -> List[List[str]]:
+    """
+    Batches of paths to pass to ``chown -R``/``chmod -R`` for ``path``.
+
+    Only the offending subtrees are targeted; if there are too many of them
+    the whole directory is returned as a single target instead.
+    """
+    targets = find_offending_subtrees(path)
+    if len(targets) > MAX_TARGETED_PATHS:
+        logger.info(f"{len(targets)} paths under {path} need fixing; targeting the whole directory")
+        targets = [os.path.abspath(str(path))]
+    return [targets[i:i + PATHS_PER_COMMAND] for i in range(0, len(targets), PATHS_PER_COMMAND)]
@@ -14,6 +14,8 @@ from typing import Optional, Union, Dict, Any, List, Tuple
 from datetime import datetime
 import vdf
 
+from .steam_library_index import get_steam_library_index
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -510,63 +512,29 @@ class PathHandler:
                         # Continue anyway, as we're only reading the file
                         pass
         
-        libraryfolders_vdf_path_obj = None  # Will hold the Path object
-        found_path_str = None
-        for path_str in libraryfolders_vdf_paths:
-            if os.path.exists(path_str):
-                found_path_str = path_str # Keep the string path for logging/opening
-                libraryfolders_vdf_path_obj = Path(path_str) # Convert to Path object here
-                logger.debug(f"Found libraryfolders.vdf at: {path_str}")
-                break
-        
-        # Check using the Path object's is_file() method
-        if not libraryfolders_vdf_path_obj or not libraryfolders_vdf_path_obj.is_file():
-             logger.warning("libraryfolders.vdf not found or is not a file. Cannot automatically detect Steam Library.")
-             return None
-        
-        # Parse the VDF file to extract library paths
-        library_paths = []
-        try:
-            # Open using the original string path is fine, or use the Path object
-            with open(found_path_str, 'r') as f: # Or use libraryfolders_vdf_path_obj
-                content = f.read()
-                
-                # Use regex to find all path entries
-                path_matches = re.finditer(r'"path"\s*"([^"]+)"', content)
-                for match in path_matches:
-                    library_path_str = match.group(1).replace('\\\\', '\\') # Fix potential double escapes
-                    common_path = os.path.join(library_path_str, "steamapps", "common")
-                    if os.path.isdir(common_path): # Verify the common path exists
-                        library_paths.append(Path(common_path))
-                        logger.debug(f"Found potential common path: {common_path}")
-                    else:
-                        logger.debug(f"Skipping non-existent common path derived from VDF: {common_path}")
-            
-            logger.debug(f"Found {len(library_paths)} valid library common paths from VDF.")
-            
-            # Return the first valid path found
-            if library_paths:
-                logger.info(f"Using Steam library common path: {library_paths[0]}")
-                return library_paths[0]
-            
-            # If no valid paths found in VDF, try the default structure
-            logger.debug("No valid common paths found in VDF, checking default location...")
-            default_common_path = Path.home() / ".steam/steam/steamapps/common"
-            if default_common_path.is_dir():
-                logger.info(f"Using default Steam library common path: {default_common_path}")
-                return default_common_path
-            
-            default_common_path_local = Path.home() / ".local/share/Steam/steamapps/common"
-            if default_common_path_local.is_dir():
-                 logger.info(f"Using default local Steam library common path: {default_common_path_local}")
-                 return default_common_path_local
-            
-            logger.error("No valid Steam library common path found in VDF or default locations.")
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error parsing libraryfolders.vdf or finding Steam library: {e}", exc_info=True)
-            return None
+        # Library paths come from the shared index (parsed once, revalidated by mtime)
+        library_paths = get_steam_library_index().common_dirs()
+        logger.debug(f"Found {len(library_paths)} valid library common paths from VDF.")
+
+        # Return the first valid path found
+        if library_paths:
+            logger.info(f"Using Steam library common path: {library_paths[0]}")
+            return library_paths[0]
+
+        # If no valid paths found in VDF, try the default structure
+        logger.debug("No valid common paths found in VDF, checking default location...")
+        default_common_path = Path.home() / ".steam/steam/steamapps/common"
+        if default_common_path.is_dir():
+            logger.info(f"Using default Steam library common path: {default_common_path}")
+            return default_common_path
+
+        default_common_path_local = Path.home() / ".local/share/Steam/steamapps/common"
+        if default_common_path_local.is_dir():
+             logger.info(f"Using default local Steam library common path: {default_common_path_local}")
+             return default_common_path_local
+
+        logger.error("No valid Steam library common path found in VDF or default locations.")
+        return None
     
     @staticmethod
     def find_compat_data(appid: str) -> Optional[Path]:
@@ -584,23 +552,14 @@ class PathHandler:
         logger.debug(f"Searching for compatdata directory for AppID: {appid}")
         
         # Use libraryfolders.vdf to find all Steam library paths, when available
-        library_paths = PathHandler.get_all_steam_library_paths()
+        index = get_steam_library_index()
+        library_paths = index.library_paths()
         if library_paths:
-            logger.debug(f"Checking compatdata in {len(library_paths)} Steam libraries")
-            
-            # Check each Steam library's compatdata directory
-            for library_path in library_paths:
-                compatdata_base = library_path / "steamapps" / "compatdata"
-                if not compatdata_base.is_dir():
-                    logger.debug(f"Compatdata directory does not exist: {compatdata_base}")
-                    continue
-                    
-                potential_path = compatdata_base / appid
-                if potential_path.is_dir():
-                    logger.info(f"Found compatdata directory: {potential_path}")
-                    return potential_path
-                else:
-                    logger.debug(f"Compatdata for AppID {appid} not found in {compatdata_base}")
+            potential_path = index.compatdata(appid)
+            if potential_path:
+                logger.info(f"Found compatdata directory: {potential_path}")
+                return potential_path
+            logger.debug(f"Compatdata for AppID {appid} not found in {len(library_paths)} Steam libraries")
         
         # Check fallback locations only if we didn't find valid libraries
         # If we have valid libraries from libraryfolders.vdf, we should NOT fall back to wrong locations
@@ -684,18 +643,7 @@ class PathHandler:
             if not os.path.exists(libraryfolders_path):
                 return None
 
-            with open(libraryfolders_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parse the VDF content
-            libraries = {}
-            current_library = None
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('"path"'):
-                    current_library = line.split('"')[3].replace('\\\\', '\\')
-                elif line.startswith('"apps"') and current_library:
-                    libraries[current_library] = True
+            libraries = get_steam_library_index().libraries_in(libraryfolders_path)
 
             # Return the first library path that exists
             for library_path in libraries:
@@ -710,38 +658,7 @@ class PathHandler:
     @staticmethod
     def get_all_steam_library_paths() -> List[Path]:
         """Finds all Steam library paths listed in all known libraryfolders.vdf files (including Flatpak)."""
-        logger.info("[DEBUG] Searching for all Steam libraryfolders.vdf files...")
-        vdf_paths = [
-            Path.home() / ".steam/steam/config/libraryfolders.vdf",
-            Path.home() / ".local/share/Steam/config/libraryfolders.vdf",
-            Path.home() / ".steam/root/config/libraryfolders.vdf",
-            Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/config/libraryfolders.vdf",  # Flatpak
-        ]
-        library_paths = set()
-        for vdf_path in vdf_paths:
-            if vdf_path.is_file():
-                logger.info(f"[DEBUG] Parsing libraryfolders.vdf: {vdf_path}")
-                try:
-                    with open(vdf_path, 'r', encoding='utf-8') as f:
-                        data = vdf.load(f)
-                        # libraryfolders.vdf structure: libraryfolders -> "0", "1", etc. -> "path"
-                        libraryfolders = data.get('libraryfolders', {})
-                        for key, lib_data in libraryfolders.items():
-                            if isinstance(lib_data, dict) and 'path' in lib_data:
-                                lib_path = Path(lib_data['path'])
-                                # Resolve symlinks for consistency (mmcblk0p1 -> deck/UUID)
-                                try:
-                                    resolved_path = lib_path.resolve()
-                                    library_paths.add(resolved_path)
-                                    logger.debug(f"[DEBUG] Found library path: {resolved_path}")
-                                except (OSError, RuntimeError) as resolve_err:
-                                    # If resolve fails, use original path
-                                    logger.warning(f"[DEBUG] Could not resolve {lib_path}, using as-is: {resolve_err}")
-                                    library_paths.add(lib_path)
-                except Exception as e:
-                    logger.error(f"[DEBUG] Failed to parse {vdf_path}: {e}")
-        logger.info(f"[DEBUG] All detected Steam libraries: {library_paths}")
-        return list(library_paths)
+        return get_steam_library_index().library_paths()
 
     # Moved _find_shortcuts_vdf here from ShortcutHandler
     def _find_shortcuts_vdf(self) -> Optional[str]:
@@ -0,0 +1,499 @@
+"""
+Performance Timeline
+
+Append-only record of where an install spends its time, one JSON-lines file
+per install under ``<Jackify data dir>/performance``. It combines:
+
+- EnginePerformanceMonitor samples (CPU, RSS, I/O counters, threads, FDs,
+  child process usage by type), via :meth:`PerformanceTimeline.record_metrics`
+- phase changes and aggregate speeds from ProgressEventBus frames, via
+  :meth:`PerformanceTimeline.record_frame`
+- Jackify-side configuration steps, via :func:`mark_step`
+
+Each record is a single compact JSON object written and flushed as it
+happens, so a crashed or killed install still leaves a usable timeline.
+:func:`build_performance_report` turns a timeline back into time per phase,
+CPU-bound / I/O-bound / network-bound periods and stalls.
+"""
+
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from jackify.shared.paths import get_jackify_data_dir
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_VERSION = 1
+TIMELINE_DIRNAME = "performance"
+# Older timelines are deleted when a new one starts
+MAX_TIMELINES = 20
+# Aggregate speeds are recorded at most this often (seconds)
+SPEED_RECORD_INTERVAL = 5.0
+
+# Sample classification thresholds
+CPU_BOUND_PERCENT = 90.0      # at least one core's worth of CPU across the engine tree
+IO_BOUND_MBPS = 20.0          # disk read + write by the engine
+STALL_CPU_PERCENT = 5.0
+STALL_IO_MBPS = 0.5
+# A download speed older than this no longer counts as network activity
+SPEED_FRESH_SECONDS = 30.0
+# Shortest stall listed individually in the report
+MIN_REPORTED_STALL = 30.0
+
+PathLike = Union[str, Path]
+
+
+def _round(value: Optional[float], digits: int = 1) -> Optional[float]:
+    return None if value is None else round(float(value), digits)
+
+
+def _slug(name: str) -> str:
+    slug = re.sub(r'[^A-Za-z0-9._-]+', '-', name or "install").strip('-')
+    return slug[:60] or "install"
+
+
+def timeline_dir() -> Path:
+    return get_jackify_data_dir() / TIMELINE_DIRNAME
+
+
+class PerformanceTimeline:
+    """Writer for one install's timeline file."""
+
+    def __init__(self, path: PathLike, modlist_name: str = "", source: str = ""):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+        self._last_phase: Optional[str] = None
+        self._last_speeds: Dict[str, int] = {}
+        self._last_speed_time = 0.0
+        self._step_open = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Performance timeline disabled, could not open {self.path}: {e}")
+        self._write({"k": "start", "v": TIMELINE_VERSION, "modlist": modlist_name,
+                     "source": source, "cpus": os.cpu_count() or 1})
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    def _write(self, record: Dict[str, Any], timestamp: Optional[float] = None):
+        record = {"t": round(timestamp if timestamp is not None else time.time(), 3), **record}
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(line)
+                self._file.flush()
+            except (OSError, ValueError) as e:
+                logger.warning(f"Stopped writing performance timeline {self.path}: {e}")
+                self._file = None
+
+    def record_metrics(self, metrics):
+        """EnginePerformanceMonitor callback: store one sample."""
+        record = {
+            "k": "s",
+            "cpu": _round(metrics.cpu_percent),
+            "rss": _round(metrics.memory_mb),
+            "rd": _round(metrics.io_read_mb, 2),
+            "wr": _round(metrics.io_write_mb, 2),
+            "thr": metrics.thread_count,
+            "fd": metrics.fd_count,
+            "mcpu": _round(metrics.magick_cpu_percent),
+            "mrss": _round(metrics.magick_memory_mb),
+            "pcpu": _round(metrics.parent_cpu_percent),
+            "st": metrics.state.value,
+        }
+        if metrics.tree_cpu_percent is not None:
+            record["tcpu"] = _round(metrics.tree_cpu_percent)
+        if metrics.process_groups:
+            # name -> [CPU %, RSS MB, live processes]
+            record["grp"] = {name: [_round(group.cpu_percent), _round(group.memory_mb), group.processes]
+                             for name, group in metrics.process_groups.items()}
+        self._write(record, metrics.timestamp)
+
+    def record_frame(self, frame):
+        """ProgressEventBus subscriber: store phase changes and (throttled) speed changes."""
+        state = frame.state
+        # Status lines rename the section constantly ("Downloading Mod Archives",
+        # "Downloading", ...); only a change of phase starts a new span
+        phase = state.phase.value if state.phase else None
+        if phase != self._last_phase:
+            self._last_phase = phase
+            self._write({"k": "p", "phase": phase, "name": state.phase_name or ""})
+        speeds = {op: int(speed) for op, speed in state.speeds.items()}
+        now = time.time()
+        if speeds != self._last_speeds and now - self._last_speed_time >= SPEED_RECORD_INTERVAL:
+            self._last_speeds = speeds
+            self._last_speed_time = now
+            self._write({"k": "v", "speeds": speeds})
+
+    def mark_step(self, name: str):
+        """Start a Jackify-side step; the previous step (if any) ends here."""
+        self._step_open = True
+        self._write({"k": "step", "name": name})
+
+    def end_steps(self):
+        if self._step_open:
+            self._step_open = False
+            self._write({"k": "step_end"})
+
+    def engine_finished(self, returncode: Optional[int]):
+        self._write({"k": "engine_end", "rc": returncode})
+
+    def close(self):
+        self.end_steps()
+        self._write({"k": "end"})
+        with self._lock:
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except OSError:
+                    pass
+                self._file = None
+
+
+_active: Optional[PerformanceTimeline] = None
+_active_lock = threading.Lock()
+
+
+def _prune_timelines(directory: Path):
+    try:
+        timelines = sorted(directory.glob("*.jsonl"), key=lambda p: p.stat().st_mtime)
+    except OSError:
+        return
+    for old in timelines[:max(0, len(timelines) - MAX_TIMELINES + 1)]:
+        try:
+            old.unlink()
+        except OSError:
+            pass
+
+
+def start_performance_timeline(modlist_name: str, source: str) -> PerformanceTimeline:
+    """
+    Open a new timeline and make it the active one.
+
+    The previous active timeline is closed. Configuration steps that run
+    after the engine (possibly on another thread) record into whichever
+    timeline is active.
+    """
+    global _active
+    directory = timeline_dir()
+    _prune_timelines(directory)
+    path = directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{_slug(modlist_name)}.jsonl"
+    timeline = PerformanceTimeline(path, modlist_name, source)
+    with _active_lock:
+        previous, _active = _active, timeline
+    if previous is not None:
+        previous.close()
+    logger.info(f"Recording performance timeline to {path}")
+    return timeline
+
+
+def close_active_timeline():
+    """Close the active timeline (writing its ``end`` record), if any."""
+    global _active
+    with _active_lock:
+        timeline, _active = _active, None
+    if timeline is not None:
+        timeline.close()
+
+
+atexit.register(close_active_timeline)
+
+
+def get_active_timeline() -> Optional[PerformanceTimeline]:
+    with _active_lock:
+        return _active
+
+
+def mark_step(name: str):
+    """Record the start of a Jackify-side step in the active timeline (no-op without one)."""
+    timeline = get_active_timeline()
+    if timeline is not None:
+        timeline.mark_step(name)
+
+
+def list_timelines() -> List[Path]:
+    """Recorded timelines, newest first."""
+    try:
+        return sorted(timeline_dir().glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
+    except OSError:
+        return []
+
+
+def read_timeline(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """Records in a timeline file, skipping a truncated last line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "t" in record:
+                yield record
+
+
+# --- Report ------------------------------------------------------------------
+
+@dataclass
+class PerformancePeriod:
+    """Consecutive samples with the same classification"""
+    kind: str   # 'cpu', 'io', 'network', 'stalled', 'mixed'
+    start: float
+    end: float
+    phase: str = ""
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class PerformanceReport:
+    """Summary of one install's timeline"""
+    modlist_name: str
+    started: float
+    finished: float
+    engine_duration: Optional[float] = None
+    engine_returncode: Optional[int] = None
+    # (label, seconds) in first-seen order
+    phases: List[Tuple[str, float]] = field(default_factory=list)
+    # kind -> seconds
+    time_by_kind: Dict[str, float] = field(default_factory=dict)
+    # phase label -> kind -> seconds
+    phase_kinds: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    stalls: List[PerformancePeriod] = field(default_factory=list)
+    steps: List[Tuple[str, float]] = field(default_factory=list)
+    peak_memory_mb: float = 0.0
+    total_read_mb: float = 0.0
+    total_written_mb: float = 0.0
+    avg_speeds: Dict[str, float] = field(default_factory=dict)
+    # child type -> (CPU seconds, peak RSS MB, peak live processes)
+    child_usage: Dict[str, Tuple[float, float, int]] = field(default_factory=dict)
+    samples: int = 0
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.finished - self.started)
+
+
+_PHASE_LABELS = {
+    "initialization": "Initialization",
+    "download": "Downloading",
+    "extract": "Extracting",
+    "validate": "Validating",
+    "install": "Installing",
+    "finalize": "Finalizing",
+}
+
+
+def _phase_label(record: Dict[str, Any]) -> str:
+    phase = record.get("phase") or "unknown"
+    return _PHASE_LABELS.get(phase) or record.get("name") or phase.capitalize()
+
+
+def _classify(sample: Dict[str, Any], io_mbps: float, downloading: bool) -> str:
+    cpu = sample.get("tcpu")
+    if cpu is None:
+        cpu = (sample.get("cpu") or 0.0) + (sample.get("mcpu") or 0.0)
+    if sample.get("st") == "stalled" or (cpu < STALL_CPU_PERCENT and io_mbps < STALL_IO_MBPS and not downloading):
+        return "stalled"
+    if cpu >= CPU_BOUND_PERCENT:
+        return "cpu"
+    if io_mbps >= IO_BOUND_MBPS:
+        return "io"
+    if downloading:
+        return "network"
+    return "mixed"
+
+
+def build_performance_report(records: List[Dict[str, Any]]) -> Optional[PerformanceReport]:
+    """Summarise timeline records (as returned by :func:`read_timeline`)."""
+    if not records:
+        return None
+    records = sorted(records, key=lambda r: r["t"])
+    start = next((r for r in records if r.get("k") == "start"), records[0])
+    report = PerformanceReport(modlist_name=start.get("modlist", ""), started=records[0]["t"], finished=records[-1]["t"])
+
+    phase_totals: Dict[str, float] = {}
+    current_phase: Optional[str] = None
+    phase_since = None
+    step_name: Optional[str] = None
+    step_since = None
+    engine_start = None
+    engine_end = None
+    previous_sample = None
+    last_download = (None, 0.0)  # (timestamp, bytes/s)
+    speed_sums: Dict[str, List[float]] = {}
+    period: Optional[PerformancePeriod] = None
+    periods: List[PerformancePeriod] = []
+
+    def close_phase(now):
+        if current_phase is not None and phase_since is not None:
+            phase_totals[current_phase] = phase_totals.get(current_phase, 0.0) + (now - phase_since)
+
+    def close_step(now):
+        if step_name is not None and step_since is not None:
+            report.steps.append((step_name, now - step_since))
+
+    for record in records:
+        kind, now = record.get("k"), record["t"]
+        if kind == "p":
+            close_phase(now)
+            current_phase, phase_since = _phase_label(record), now
+            phase_totals.setdefault(current_phase, 0.0)
+            if engine_start is None:
+                engine_start = now
+        elif kind == "v":
+            speeds = record.get("speeds") or {}
+            last_download = (now, float(speeds.get("download", 0) or 0))
+            for op, speed in speeds.items():
+                if speed:
+                    speed_sums.setdefault(op, []).append(float(speed))
+        elif kind == "s":
+            if engine_start is None:
+                engine_start = now
+            report.samples += 1
+            report.peak_memory_mb = max(report.peak_memory_mb, record.get("rss") or 0.0)
+            if previous_sample is not None:
+                dt = now - previous_sample["t"]
+                if dt > 0:
+                    read = max(0.0, (record.get("rd") or 0.0) - (previous_sample.get("rd") or 0.0))
+                    written = max(0.0, (record.get("wr") or 0.0) - (previous_sample.get("wr") or 0.0))
+                    report.total_read_mb += read
+                    report.total_written_mb += written
+                    downloading = (last_download[0] is not None and last_download[1] > 0
+                                   and now - last_download[0] <= SPEED_FRESH_SECONDS)
+                    sample_kind = _classify(record, (read + written) / dt, downloading)
+                    report.time_by_kind[sample_kind] = report.time_by_kind.get(sample_kind, 0.0) + dt
+                    for name, (cpu, rss, count) in (record.get("grp") or {}).items():
+                        cpu_seconds, peak_rss, peak_count = report.child_usage.get(name, (0.0, 0.0, 0))
+                        report.child_usage[name] = (cpu_seconds + (cpu or 0.0) / 100 * dt,
+                                                    max(peak_rss, rss or 0.0), max(peak_count, count or 0))
+                    label = current_phase or "Unknown"
+                    by_kind = report.phase_kinds.setdefault(label, {})
+                    by_kind[sample_kind] = by_kind.get(sample_kind, 0.0) + dt
+                    if period is not None and period.kind == sample_kind and period.phase == label:
+                        period.end = now
+                    else:
+                        period = PerformancePeriod(sample_kind, previous_sample["t"], now, label)
+                        periods.append(period)
+            previous_sample = record
+        elif kind == "engine_end":
+            close_phase(now)
+            current_phase = None
+            engine_end = now
+            report.engine_returncode = record.get("rc")
+        elif kind == "step":
+            close_step(now)
+            step_name, step_since = record.get("name", ""), now
+        elif kind == "step_end":
+            close_step(now)
+            step_name = None
+
+    close_phase(report.finished)
+    close_step(report.finished)
+    report.phases = list(phase_totals.items())
+    report.stalls = [p for p in periods if p.kind == "stalled" and p.duration >= MIN_REPORTED_STALL]
+    report.avg_speeds = {op: sum(values) / len(values) for op, values in speed_sums.items()}
+    if engine_start is not None:
+        report.engine_duration = (engine_end or report.finished) - engine_start
+    return report
+
+
+def load_performance_report(path: PathLike) -> Optional[PerformanceReport]:
+    try:
+        return build_performance_report(list(read_timeline(path)))
+    except OSError as e:
+        logger.error(f"Could not read performance timeline {path}: {e}")
+        return None
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    return f"{seconds // 3600:d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
+
+
+def _format_rate(bytes_per_second: float) -> str:
+    for unit in ("B/s", "KB/s", "MB/s", "GB/s"):
+        if bytes_per_second < 1024 or unit == "GB/s":
+            return f"{bytes_per_second:.1f} {unit}"
+        bytes_per_second /= 1024
+    return ""
+
+
+_KIND_LABELS = {
+    "cpu": "CPU-bound",
+    "io": "Disk I/O-bound",
+    "network": "Network-bound",
+    "stalled": "Stalled",
+    "mixed": "Mixed/light load",
+}
+
+
+def format_performance_report(report: PerformanceReport) -> str:
+    """Plain-text report for the CLI and the GUI log."""
+    lines = [f"Performance report: {report.modlist_name or 'install'}",
+             f"  Total time: {_format_duration(report.duration)}"]
+    if report.engine_duration is not None:
+        result = "" if report.engine_returncode is None else f" (exit code {report.engine_returncode})"
+        lines.append(f"  Engine time: {_format_duration(report.engine_duration)}{result}")
+
+    if report.phases:
+        lines.append("")
+        lines.append("Time per phase:")
+        for label, seconds in report.phases:
+            share = (seconds / report.engine_duration * 100) if report.engine_duration else 0.0
+            kinds = report.phase_kinds.get(label, {})
+            dominant = max(kinds.items(), key=lambda item: item[1])[0] if kinds else None
+            suffix = f", mostly {_KIND_LABELS[dominant].lower()}" if dominant else ""
+            lines.append(f"  {label:<32} {_format_duration(seconds):>9}  {share:5.1f}%{suffix}")
+
+    sampled = sum(report.time_by_kind.values())
+    if sampled:
+        lines.append("")
+        lines.append(f"Engine load ({report.samples} samples):")
+        for kind in ("cpu", "io", "network", "mixed", "stalled"):
+            seconds = report.time_by_kind.get(kind, 0.0)
+            if seconds:
+                lines.append(f"  {_KIND_LABELS[kind]:<32} {_format_duration(seconds):>9}  {seconds / sampled * 100:5.1f}%")
+        lines.append(f"  Peak engine memory: {report.peak_memory_mb:.0f} MB, "
+                     f"read {report.total_read_mb / 1024:.1f} GB, written {report.total_written_mb / 1024:.1f} GB")
+
+    if report.avg_speeds:
+        lines.append("  Average speeds: " + ", ".join(
+            f"{op} {_format_rate(speed)}" for op, speed in sorted(report.avg_speeds.items())))
+
+    if report.child_usage:
+        lines.append("")
+        lines.append("Child processes (CPU time, peak memory, peak count):")
+        for name, (cpu_seconds, peak_rss, peak_count) in sorted(
+                report.child_usage.items(), key=lambda item: item[1][0], reverse=True):
+            lines.append(f"  {name:<32} {_format_duration(cpu_seconds):>9}  {peak_rss:8.0f} MB  x{peak_count}")
+
+    if report.stalls:
+        lines.append("")
+        lines.append(f"Stalls of {MIN_REPORTED_STALL:.0f}s or more:")
+        for stall in report.stalls:
+            offset = _format_duration(stall.start - report.started)
+            lines.append(f"  +{offset}  {_format_duration(stall.duration)}  during {stall.phase}")
+
+    if report.steps:
+        lines.append("")
+        lines.append("Configuration steps:")
+        for name, seconds in sorted(report.steps, key=lambda step: step[1], reverse=True):
+            lines.append(f"  {name:<48} {_format_duration(seconds):>9}")
+
+    return "\n".join(lines)
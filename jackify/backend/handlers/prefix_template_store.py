@@ -0,0 +1,250 @@
+"""
+Prefix Template Store
+
+Snapshots of fully configured Wine prefixes (curated registry, Wine
+components, dotnet fixes), keyed by what went into them: the Proton that
+created the prefix, the Proton used for component installation, the
+component set and the registry fix set.
+
+The first modlist configured with a given key builds its prefix the normal
+way and is snapshotted; later modlists with the same key get a copy of the
+template in ``compatdata/<appid>`` instead of re-running winetricks. Copies
+use ``cp -a --reflink=auto`` (copy-on-write where the filesystem supports it,
+hard links inside the tree preserved), and any absolute compatdata path the
+registry recorded is rewritten for the new AppID.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from jackify.shared.paths import get_jackify_data_dir
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_FORMAT_VERSION = 1
+# Templates are several hundred MB each; keep the most recently used ones
+MAX_TEMPLATES = 2
+METADATA_FILENAME = "template.json"
+REGISTRY_FILES = ("user.reg", "system.reg", "userdef.reg")
+# Per-prefix runtime files that must not be carried over
+SKIPPED_ENTRIES = ("pfx.lock",)
+
+
+def _proton_version(proton_dir: Optional[Union[str, Path]]) -> Optional[str]:
+    """Contents of a Proton install's (or prefix's) ``version`` file."""
+    if not proton_dir:
+        return None
+    try:
+        with open(os.path.join(os.path.realpath(str(proton_dir)), "version"), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _copy_tree(src: Path, dst: Path) -> bool:
+    """Copy a directory tree, reflinking where possible and keeping symlinks/hard links."""
+    try:
+        result = subprocess.run(["cp", "-a", "--reflink=auto", "--", str(src), str(dst)],
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            return True
+        logger.debug(f"cp -a failed ({result.stderr.strip()}), falling back to copytree")
+    except OSError as e:
+        logger.debug(f"cp not usable ({e}), falling back to copytree")
+    shutil.rmtree(dst, ignore_errors=True)
+    try:
+        shutil.copytree(src, dst, symlinks=True)
+        return True
+    except (OSError, shutil.Error) as e:
+        logger.warning(f"Failed to copy {src} to {dst}: {e}")
+        shutil.rmtree(dst, ignore_errors=True)
+        return False
+
+
+def _registry_path_forms(path: str) -> Iterable[bytes]:
+    """How an absolute Unix path can appear inside a Wine .reg file."""
+    path = path.rstrip("/")
+    escaped = path.replace("/", "\\\\")
+    for form in (path, f"Z:{escaped}", f"z:{escaped}"):
+        yield form.encode("utf-8")
+
+
+class PrefixTemplateStore:
+    """Template prefixes stored under the Jackify data directory."""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        self.root = Path(root) if root else get_jackify_data_dir() / "prefix-templates"
+
+    @staticmethod
+    def template_key(compatdata_path: Union[str, Path], install_proton_path: Optional[str],
+                     components: Iterable[str], registry_fixes: Dict[str, Any]) -> Dict[str, Any]:
+        """Inputs identifying a template; the prefix must already have been created by Proton."""
+        return {
+            "format": TEMPLATE_FORMAT_VERSION,
+            "prefix_proton": _proton_version(compatdata_path),
+            "install_proton": _proton_version(install_proton_path),
+            "components": sorted(components),
+            "registry_fixes": registry_fixes,
+        }
+
+    @staticmethod
+    def _key_id(key: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def is_usable_key(key: Dict[str, Any]) -> bool:
+        """A key without both Proton versions can't tell templates apart safely."""
+        return bool(key.get("prefix_proton") and key.get("install_proton"))
+
+    @staticmethod
+    def is_fresh_prefix(compatdata_path: Union[str, Path]) -> bool:
+        """True for a prefix Proton just created: nothing has been installed into it yet."""
+        pfx = Path(compatdata_path) / "pfx"
+        return (pfx / "system.reg").is_file() and not (pfx / "winetricks.log").exists()
+
+    def _template_dir(self, key: Dict[str, Any]) -> Path:
+        return self.root / self._key_id(key)
+
+    def _read_metadata(self, template_dir: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(template_dir / METADATA_FILENAME, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_metadata(self, template_dir: Path, metadata: Dict[str, Any]):
+        tmp_path = template_dir / (METADATA_FILENAME + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, template_dir / METADATA_FILENAME)
+
+    def has_template(self, key: Dict[str, Any]) -> bool:
+        metadata = self._read_metadata(self._template_dir(key))
+        return bool(metadata) and metadata.get("key") == json.loads(json.dumps(key, sort_keys=True))
+
+    def snapshot(self, key: Dict[str, Any], compatdata_path: Union[str, Path]) -> bool:
+        """Store a configured prefix as the template for ``key``. Wine must not be running in it."""
+        if not self.is_usable_key(key):
+            logger.debug("Not snapshotting prefix: Proton versions unknown")
+            return False
+        src = Path(compatdata_path)
+        template_dir = self._template_dir(key)
+        staging = template_dir.with_name(template_dir.name + ".staging")
+        start = time.monotonic()
+        try:
+            shutil.rmtree(staging, ignore_errors=True)
+            self.root.mkdir(parents=True, exist_ok=True)
+            if not _copy_tree(src, staging):
+                raise OSError(f"could not copy {src}")
+            for name in SKIPPED_ENTRIES:
+                try:
+                    os.remove(staging / name)
+                except FileNotFoundError:
+                    pass
+            self._write_metadata(staging, {
+                "key": key,
+                "source_compatdata": os.path.abspath(str(src)),
+                "created": time.time(),
+                "last_used": time.time(),
+            })
+            shutil.rmtree(template_dir, ignore_errors=True)
+            os.replace(staging, template_dir)
+        except OSError as e:
+            logger.warning(f"Failed to snapshot prefix template from {src}: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+        logger.info(f"Saved prefix template {template_dir.name} from {src} in {time.monotonic() - start:.1f}s")
+        self._prune(keep=template_dir)
+        return True
+
+    def restore(self, key: Dict[str, Any], compatdata_path: Union[str, Path]) -> bool:
+        """
+        Replace the prefix in ``compatdata_path`` with a copy of the template.
+
+        The existing ``pfx`` is only removed once the copy is complete.
+        """
+        if not self.is_usable_key(key) or not self.has_template(key):
+            return False
+        template_dir = self._template_dir(key)
+        metadata = self._read_metadata(template_dir) or {}
+        target = Path(compatdata_path)
+        incoming = target / "pfx.jackify-template"
+        previous = target / "pfx.jackify-previous"
+        start = time.monotonic()
+
+        shutil.rmtree(incoming, ignore_errors=True)
+        if not _copy_tree(template_dir / "pfx", incoming):
+            return False
+        self._patch_registry_paths(incoming, metadata.get("source_compatdata"), os.path.abspath(str(target)))
+
+        try:
+            shutil.rmtree(previous, ignore_errors=True)
+            os.rename(target / "pfx", previous)
+            os.rename(incoming, target / "pfx")
+        except OSError as e:
+            logger.warning(f"Failed to swap in prefix template: {e}")
+            if previous.exists() and not (target / "pfx").exists():
+                os.rename(previous, target / "pfx")
+            shutil.rmtree(incoming, ignore_errors=True)
+            return False
+        shutil.rmtree(previous, ignore_errors=True)
+
+        # Proton's bookkeeping files belong with the prefix contents
+        for entry in template_dir.iterdir():
+            if entry.name not in ("pfx", METADATA_FILENAME) and entry.is_file():
+                try:
+                    shutil.copy2(entry, target / entry.name)
+                except OSError as e:
+                    logger.debug(f"Could not copy {entry.name} from template: {e}")
+
+        metadata["last_used"] = time.time()
+        try:
+            self._write_metadata(template_dir, metadata)
+        except OSError:
+            pass
+        logger.info(f"Restored prefix template {template_dir.name} into {target} in {time.monotonic() - start:.1f}s")
+        return True
+
+    @staticmethod
+    def _patch_registry_paths(pfx: Path, old_compatdata: Optional[str], new_compatdata: str):
+        """Rewrite absolute references to the template's source compatdata directory."""
+        if not old_compatdata or old_compatdata == new_compatdata:
+            return
+        replacements = list(zip(_registry_path_forms(old_compatdata), _registry_path_forms(new_compatdata)))
+        for name in REGISTRY_FILES:
+            reg_path = pfx / name
+            try:
+                data = reg_path.read_bytes()
+            except OSError:
+                continue
+            patched = data
+            for old, new in replacements:
+                patched = patched.replace(old, new)
+            if patched != data:
+                reg_path.write_bytes(patched)
+                logger.debug(f"Patched compatdata paths in {reg_path}")
+
+    def _prune(self, keep: Path):
+        """Drop the least recently used templates beyond ``MAX_TEMPLATES``."""
+        templates = []
+        for entry in self.root.iterdir():
+            if not entry.is_dir():
+                continue
+            if entry.name.endswith(".staging"):
+                if entry != keep:
+                    shutil.rmtree(entry, ignore_errors=True)
+                continue
+            metadata = self._read_metadata(entry) or {}
+            templates.append((metadata.get("last_used", 0), entry))
+        templates.sort(reverse=True)
+        for _, entry in templates[MAX_TEMPLATES:]:
+            if entry != keep:
+                logger.info(f"Removing old prefix template {entry.name}")
+                shutil.rmtree(entry, ignore_errors=True)
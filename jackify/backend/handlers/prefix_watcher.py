@@ -0,0 +1,207 @@
+"""
+Prefix Watcher
+
+Event-driven waits for Proton prefix creation. Instead of sleeping for fixed
+intervals, callers wait on a condition and are woken by inotify events on the
+relevant directories (``compatdata``, the prefix, ``pfx/``, the prefix's
+wineserver socket directory). Where inotify is unavailable the condition is
+polled with an interval that starts short and backs off.
+
+A prefix counts as ready once ``system.reg`` and ``user.reg`` exist, no
+registry save is in progress, the prefix's wineserver has exited and there
+is evidence that Wine actually ran in it and finished: its wineserver was
+seen and is gone again, Proton wrote the prefix's ``version`` file, or the
+process that launched Wine has exited. The registry files alone prove
+nothing - they appear while Proton is still copying ``default_pfx``.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM |
+               _IN_MOVED_TO | _IN_CREATE | _IN_DELETE)
+
+# Upper bound on a single wait, for state changes no watch can see (e.g. process exit)
+MAX_EVENT_WAIT = 1.0
+POLL_INTERVAL_START = 0.05
+POLL_INTERVAL_MAX = 1.0
+
+PathLike = Union[str, Path]
+
+
+class _Inotify:
+    """Minimal ctypes inotify wrapper; any event just wakes the waiter."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watched = set()
+
+    def watch(self, path: str):
+        if path in self._watched or not os.path.isdir(path):
+            return
+        if self._libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK) >= 0:
+            self._watched.add(path)
+
+    def wait(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not readable:
+            return False
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+def _open_inotify() -> Optional[_Inotify]:
+    try:
+        return _Inotify()
+    except (OSError, AttributeError) as e:
+        logger.debug(f"inotify unavailable, falling back to polling: {e}")
+        return None
+
+
+def wait_for(condition: Callable[[], Any], watch_dirs: Callable[[], Iterable[PathLike]],
+             timeout: float, description: str = "condition") -> Any:
+    """
+    Wait until ``condition()`` returns a truthy value and return it (``None`` on timeout).
+
+    ``watch_dirs`` is re-evaluated on every wake-up so directories that only
+    appear while waiting (e.g. ``pfx/``) get watched as soon as they exist.
+    """
+    deadline = time.monotonic() + timeout
+    inotify = _open_inotify()
+    interval = POLL_INTERVAL_START
+    start = time.monotonic()
+    try:
+        while True:
+            if inotify:
+                for path in watch_dirs():
+                    inotify.watch(str(path))
+            result = condition()
+            if result:
+                logger.debug(f"{description} reached after {time.monotonic() - start:.2f}s")
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.debug(f"Timed out after {timeout}s waiting for {description}")
+                return None
+            if inotify:
+                inotify.wait(min(remaining, MAX_EVENT_WAIT))
+            else:
+                time.sleep(min(remaining, interval))
+                interval = min(interval * 1.5, POLL_INTERVAL_MAX)
+    finally:
+        if inotify:
+            inotify.close()
+
+
+def wineserver_dir(pfx: PathLike) -> Optional[Path]:
+    """Wine's per-prefix server directory (``/tmp/.wine-<uid>/server-<dev>-<ino>``)."""
+    try:
+        st = os.stat(pfx)
+    except OSError:
+        return None
+    return Path(f"/tmp/.wine-{os.getuid()}") / f"server-{st.st_dev:x}-{st.st_ino:x}"
+
+
+def wineserver_running(pfx: PathLike) -> bool:
+    """True while a wineserver is serving ``pfx`` (its socket is removed on exit)."""
+    server_dir = wineserver_dir(pfx)
+    return bool(server_dir) and (server_dir / "socket").exists()
+
+
+def _registry_save_in_progress(pfx: Path) -> bool:
+    # Wine saves each hive to a reg*.tmp file and renames it over the .reg
+    try:
+        return any(name.startswith("reg") and name.endswith(".tmp") for name in os.listdir(pfx))
+    except OSError:
+        return True
+
+
+def proton_setup_done(compatdata_path: PathLike) -> bool:
+    """True once Proton has written the prefix's ``version`` file (after copying ``default_pfx``)."""
+    # tracked_files doesn't count: Proton writes it while the copy is still running
+    return (Path(compatdata_path) / "version").is_file()
+
+
+def prefix_ready(compatdata_path: PathLike, wine_finished: bool = False) -> bool:
+    """
+    True once the prefix's registry has been written and its wineserver is gone.
+
+    Unless ``wine_finished`` says Wine already ran and exited in the prefix,
+    Proton's ``version`` file must exist as well.
+    """
+    pfx = Path(compatdata_path) / "pfx"
+    for name in ("system.reg", "user.reg"):
+        try:
+            if (pfx / name).stat().st_size == 0:
+                return False
+        except OSError:
+            return False
+    if _registry_save_in_progress(pfx) or wineserver_running(pfx):
+        return False
+    return wine_finished or proton_setup_done(compatdata_path)
+
+
+def _prefix_watch_dirs(compatdata_path: Path) -> Callable[[], Iterable[PathLike]]:
+    def dirs():
+        pfx = compatdata_path / "pfx"
+        server_dir = wineserver_dir(pfx)
+        server_dirs = [server_dir.parent, server_dir] if server_dir else []
+        return [compatdata_path.parent, compatdata_path, pfx] + server_dirs
+    return dirs
+
+
+def wait_for_prefix_ready(compatdata_path: PathLike, timeout: float = 60, launcher_exited: bool = False) -> bool:
+    """
+    Wait for the prefix in ``compatdata_path`` to be fully created.
+
+    Pass ``launcher_exited=True`` when the process that started Wine in the
+    prefix (e.g. ``proton run``) has already returned.
+    """
+    compatdata_path = Path(compatdata_path)
+    wineserver_seen = False
+
+    def ready() -> bool:
+        nonlocal wineserver_seen
+        pfx = compatdata_path / "pfx"
+        if wineserver_running(pfx):
+            wineserver_seen = True
+            return False
+        return prefix_ready(compatdata_path, wine_finished=wineserver_seen or launcher_exited)
+
+    return bool(wait_for(ready, _prefix_watch_dirs(compatdata_path), timeout,
+                         f"prefix {compatdata_path} to be ready"))
+
+
+def wait_for_path(path: PathLike, timeout: float) -> bool:
+    """Wait for ``path`` to exist (watching its parent directory)."""
+    path = Path(path)
+    return bool(wait_for(path.exists, lambda: [path.parent], timeout, f"{path} to appear"))
@@ -0,0 +1,373 @@
+"""
+Process Tree Sampler
+
+Samples the jackify-engine process and all of its descendants straight from
+``/proc`` in one pass per tick, instead of going through psutil object by
+object. For each process in the tree it reads ``stat`` and ``statm`` (and
+``io``); the tree itself is discovered through ``task/<tid>/children``, or a
+single scan of ``/proc`` on kernels without that file.
+
+Children are identified once per (PID, start time) - the command line is
+read the first time a process is seen (or after it execs) and cached until
+it exits - and their usage is aggregated per executable type (``magick``,
+``7z``, ``texconv``, ...). CPU time of children that started and exited
+between two ticks is still counted: it shows up in the parent's
+``cutime``/``cstime`` and is reported as the ``exited`` group. Samples are
+kept in a bounded ring buffer.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROC_ROOT = "/proc"
+DEFAULT_HISTORY_SIZE = 720
+
+# Executable names (lowercase, without .exe) folded into one child type
+CHILD_TYPE_ALIASES = {
+    "magick": ("magick", "convert", "mogrify"),
+    "7z": ("7z", "7zz", "7za", "7zr"),
+    "texconv": ("texconv", "texdiag"),
+}
+EXITED_GROUP = "exited"
+
+_ALIAS_TO_TYPE = {alias: name for name, aliases in CHILD_TYPE_ALIASES.items() for alias in aliases}
+
+try:
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _CLK_TCK = 100
+    _PAGE_SIZE = 4096
+
+_MB = 1024 * 1024
+
+# Identity of one process: PID plus start time (clock ticks since boot), so a
+# reused PID is never mistaken for the process that had it before
+ProcessKey = Tuple[int, int]
+
+
+@dataclass
+class ProcessGroupUsage:
+    """Combined usage of the live child processes of one type"""
+    name: str
+    processes: int = 0
+    cpu_percent: float = 0.0
+    memory_mb: float = 0.0
+
+
+@dataclass
+class ProcessTreeSample:
+    """One tick: the root process itself plus its descendants grouped by type"""
+    timestamp: float
+    cpu_percent: float
+    memory_mb: float
+    memory_percent: float
+    io_read_mb: float
+    io_write_mb: float
+    thread_count: int
+    fd_count: int
+    tree_cpu_percent: float
+    tree_memory_mb: float
+    groups: Dict[str, ProcessGroupUsage] = field(default_factory=dict)
+
+
+@dataclass
+class _ProcStat:
+    pid: int
+    ppid: int
+    comm: str
+    ticks: int        # utime + stime
+    child_ticks: int  # cutime + cstime (reaped children)
+    threads: int
+    start: int
+
+    @property
+    def key(self) -> ProcessKey:
+        return self.pid, self.start
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _parse_stat(pid: int, text: str) -> Optional[_ProcStat]:
+    # comm may contain spaces and parentheses; the fields follow the last ')'
+    open_paren, close_paren = text.find("("), text.rfind(")")
+    if open_paren < 0 or close_paren < 0:
+        return None
+    fields = text[close_paren + 2:].split()
+    try:
+        # fields[0] is stat field 3 (state)
+        return _ProcStat(
+            pid=pid,
+            ppid=int(fields[1]),
+            comm=text[open_paren + 1:close_paren],
+            ticks=int(fields[11]) + int(fields[12]),
+            child_ticks=int(fields[13]) + int(fields[14]),
+            threads=int(fields[17]),
+            start=int(fields[19]),
+        )
+    except (IndexError, ValueError):
+        return None
+
+
+def executable_type(comm: str, cmdline: Iterable[str] = ()) -> str:
+    """Child type for a process: a CHILD_TYPE_ALIASES key, or its executable name"""
+    names = []
+    # argv[1] too, for launchers such as ``wine texconv.exe``
+    for arg in list(cmdline)[:2]:
+        if arg.startswith("-"):
+            break
+        base = arg.replace("\\", "/").rsplit("/", 1)[-1].lower()
+        if base.endswith(".exe"):
+            base = base[:-4]
+        if base:
+            names.append(base)
+    comm_name = comm.lower()
+    if comm_name.endswith(".exe"):
+        comm_name = comm_name[:-4]
+    for name in names + [comm_name]:
+        if name in _ALIAS_TO_TYPE:
+            return _ALIAS_TO_TYPE[name]
+    return names[0] if names else (comm_name or "unknown")
+
+
+class ProcessTreeSampler:
+    """Batched /proc sampler for one process and its descendants."""
+
+    def __init__(self, pid: int, history_size: int = DEFAULT_HISTORY_SIZE, proc_root: str = PROC_ROOT):
+        self.pid = pid
+        self.proc_root = proc_root
+        self.history: Deque[ProcessTreeSample] = deque(maxlen=history_size)
+        # (comm, type) per process; comm changes on exec, so it is re-checked
+        self._identities: Dict[ProcessKey, Tuple[str, str]] = {}
+        self._last_stats: Dict[ProcessKey, _ProcStat] = {}
+        self._last_time: Optional[float] = None
+        self._use_children_files: Optional[bool] = None
+        self._mem_total = self._read_mem_total()
+
+    @staticmethod
+    def available(proc_root: str = PROC_ROOT) -> bool:
+        """True if /proc looks like Linux procfs."""
+        return os.path.exists(os.path.join(proc_root, "self", "stat"))
+
+    def _path(self, pid: int, *parts: str) -> str:
+        return os.path.join(self.proc_root, str(pid), *parts)
+
+    def _read_mem_total(self) -> Optional[int]:
+        text = _read(os.path.join(self.proc_root, "meminfo")) or ""
+        for line in text.splitlines():
+            if line.startswith("MemTotal:"):
+                try:
+                    return int(line.split()[1]) * 1024
+                except (IndexError, ValueError):
+                    return None
+        return None
+
+    def _stat(self, pid: int) -> Optional[_ProcStat]:
+        text = _read(self._path(pid, "stat"))
+        return _parse_stat(pid, text) if text else None
+
+    def _rss(self, pid: int) -> int:
+        text = _read(self._path(pid, "statm"))
+        try:
+            return int(text.split()[1]) * _PAGE_SIZE if text else 0
+        except (IndexError, ValueError):
+            return 0
+
+    def _io(self, pid: int) -> Tuple[int, int]:
+        read_bytes = write_bytes = 0
+        for line in (_read(self._path(pid, "io")) or "").splitlines():
+            name, _, value = line.partition(":")
+            if name == "read_bytes":
+                read_bytes = int(value)
+            elif name == "write_bytes":
+                write_bytes = int(value)
+        return read_bytes, write_bytes
+
+    def _task_ids(self, pid: int) -> List[str]:
+        try:
+            return os.listdir(self._path(pid, "task"))
+        except OSError:
+            return []
+
+    def _children_of(self, pid: int, tids: List[str]) -> Optional[List[int]]:
+        """Direct children from task/<tid>/children, or None if the kernel lacks the file"""
+        children = []
+        for tid in tids:
+            text = _read(self._path(pid, "task", tid, "children"))
+            if text is None:
+                if not os.path.exists(self._path(pid, "task", tid)):
+                    continue  # the thread exited
+                return None
+            children.extend(int(child) for child in text.split())
+        return children
+
+    def _collect_tree(self, root: _ProcStat, root_tids: List[str]) -> List[_ProcStat]:
+        """Descendants of the root (excluding it)"""
+        if self._use_children_files is not False:
+            descendants: List[_ProcStat] = []
+            pending = [(root, root_tids)]
+            while pending:
+                parent, tids = pending.pop()
+                children = self._children_of(parent.pid, tids)
+                if children is None:
+                    self._use_children_files = False
+                    logger.debug("/proc/<pid>/task/<tid>/children unavailable, scanning /proc instead")
+                    break
+                self._use_children_files = True
+                for child_pid in children:
+                    child = self._stat(child_pid)
+                    if child is None:
+                        continue
+                    descendants.append(child)
+                    pending.append((child, self._task_ids(child_pid) if child.threads > 1 else [str(child_pid)]))
+            else:
+                return descendants
+        return self._scan_tree(root)
+
+    def _scan_tree(self, root: _ProcStat) -> List[_ProcStat]:
+        by_parent: Dict[int, List[_ProcStat]] = {}
+        try:
+            entries = os.listdir(self.proc_root)
+        except OSError:
+            return []
+        for entry in entries:
+            if not entry.isdigit() or int(entry) == root.pid:
+                continue
+            stat = self._stat(int(entry))
+            if stat is not None:
+                by_parent.setdefault(stat.ppid, []).append(stat)
+        descendants = []
+        pending = [root.pid]
+        while pending:
+            for child in by_parent.get(pending.pop(), []):
+                descendants.append(child)
+                pending.append(child.pid)
+        return descendants
+
+    def _identify(self, stat: _ProcStat) -> str:
+        identity = self._identities.get(stat.key)
+        if identity is None or identity[0] != stat.comm:
+            cmdline = (_read(self._path(stat.pid, "cmdline")) or "").split("\0")
+            identity = (stat.comm, executable_type(stat.comm, [arg for arg in cmdline if arg]))
+            self._identities[stat.key] = identity
+        return identity[1]
+
+    def sample(self) -> ProcessTreeSample:
+        """
+        Take one sample of the tree and append it to the history.
+
+        CPU percentages are relative to the previous sample (0 on the first).
+        Raises ProcessLookupError if the root process is gone.
+        """
+        now = time.time()
+        mono = time.monotonic()
+        root = self._stat(self.pid)
+        if root is None:
+            raise ProcessLookupError(self.pid)
+        root_tids = self._task_ids(self.pid)
+        descendants = self._collect_tree(root, root_tids)
+        elapsed = mono - self._last_time if self._last_time is not None else None
+
+        def cpu_percent(stat: _ProcStat) -> float:
+            if elapsed is None or elapsed <= 0:
+                return 0.0
+            previous = self._last_stats.get(stat.key)
+            # A process first seen now did all of its work since the last tick
+            delta = stat.ticks - (previous.ticks if previous else 0)
+            return max(0, delta) / _CLK_TCK / elapsed * 100
+
+        stats = {stat.key: stat for stat in [root] + descendants}
+        groups: Dict[str, ProcessGroupUsage] = {}
+        for child in descendants:
+            name = self._identify(child)
+            group = groups.setdefault(name, ProcessGroupUsage(name))
+            group.processes += 1
+            group.cpu_percent += cpu_percent(child)
+            group.memory_mb += self._rss(child.pid) / _MB
+
+        # Children reaped since the last tick: what their parents' cutime/cstime
+        # grew by, less what those children had already been seen using. When a
+        # whole subtree exits, every process in it ends up in the cutime of the
+        # nearest ancestor that is still alive, so that is where it is credited.
+        if elapsed:
+            last_by_pid = {previous.pid: previous for previous in self._last_stats.values()}
+            surviving = {key[0] for key in stats if key in self._last_stats}
+            vanished: Dict[int, int] = {}
+            for key, previous in self._last_stats.items():
+                if key in stats:
+                    continue
+                ancestor = previous.ppid
+                seen = set()
+                while ancestor not in surviving and ancestor in last_by_pid and ancestor not in seen:
+                    seen.add(ancestor)
+                    ancestor = last_by_pid[ancestor].ppid
+                if ancestor in surviving:
+                    vanished[ancestor] = vanished.get(ancestor, 0) + previous.ticks + previous.child_ticks
+            exited_ticks = 0
+            for key, stat in stats.items():
+                previous = self._last_stats.get(key)
+                grown = stat.child_ticks - (previous.child_ticks if previous else 0)
+                exited_ticks += max(0, grown - vanished.get(stat.pid, 0))
+            if exited_ticks:
+                groups[EXITED_GROUP] = ProcessGroupUsage(EXITED_GROUP, 0, exited_ticks / _CLK_TCK / elapsed * 100)
+
+        root_cpu = cpu_percent(root)
+        for key in list(self._identities):
+            if key not in stats:
+                del self._identities[key]
+        self._last_stats = stats
+        self._last_time = mono
+
+        root_rss = self._rss(self.pid)
+        read_bytes, write_bytes = self._io(self.pid)
+        try:
+            fd_count = len(os.listdir(self._path(self.pid, "fd")))
+        except OSError:
+            fd_count = 0
+        sample = ProcessTreeSample(
+            timestamp=now,
+            cpu_percent=root_cpu,
+            memory_mb=root_rss / _MB,
+            memory_percent=(root_rss / self._mem_total * 100) if self._mem_total else 0.0,
+            io_read_mb=read_bytes / _MB,
+            io_write_mb=write_bytes / _MB,
+            thread_count=len(root_tids) or root.threads,
+            fd_count=fd_count,
+            tree_cpu_percent=root_cpu + sum(g.cpu_percent for g in groups.values()),
+            tree_memory_mb=root_rss / _MB + sum(g.memory_mb for g in groups.values()),
+            groups=groups,
+        )
+        self.history.append(sample)
+        return sample
+
+    def breakdown(self, last: Optional[int] = None) -> Dict[str, ProcessGroupUsage]:
+        """
+        Average CPU and RSS per child type over the last ``last`` samples (all
+        buffered samples by default); ``processes`` is the peak count seen.
+        """
+        samples = list(self.history)[-last:] if last else list(self.history)
+        if not samples:
+            return {}
+        totals: Dict[str, ProcessGroupUsage] = {}
+        for sample in samples:
+            for name, group in sample.groups.items():
+                total = totals.setdefault(name, ProcessGroupUsage(name))
+                total.processes = max(total.processes, group.processes)
+                total.cpu_percent += group.cpu_percent
+                total.memory_mb += group.memory_mb
+        for total in totals.values():
+            total.cpu_percent /= len(samples)
+            total.memory_mb /= len(samples)
+        return dict(sorted(totals.items(), key=lambda item: item[1].cpu_percent, reverse=True))
@@ -0,0 +1,273 @@
+"""
+Progress Event Bus
+
+Coalesces high-frequency progress updates from the engine output reader into
+frames published at a bounded rate. The reader thread feeds every line in;
+subscribers (GUI screens, CLI status lines) only see at most ``max_fps``
+frames per second, each carrying an immutable snapshot plus a diff of what
+changed since the previous frame.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from jackify.shared.progress_models import ProgressFrame, InstallationProgress
+from .progress_parser import ProgressStateManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FPS = 20.0
+
+
+class RateLimiter:
+    """Time-based gate that opens at most ``max_fps`` times per second."""
+
+    def __init__(self, max_fps: float = DEFAULT_MAX_FPS, clock: Callable[[], float] = time.monotonic):
+        self.interval = 1.0 / max_fps if max_fps and max_fps > 0 else 0.0
+        self._clock = clock
+        self._last = None
+
+    def ready(self, now: Optional[float] = None) -> bool:
+        """Return True (and start a new interval) if enough time has passed."""
+        if now is None:
+            now = self._clock()
+        if self._last is None or now - self._last >= self.interval:
+            self._last = now
+            return True
+        return False
+
+    def remaining(self, now: Optional[float] = None) -> float:
+        """Seconds until the gate opens again (0 if already open)."""
+        if self._last is None:
+            return 0.0
+        if now is None:
+            now = self._clock()
+        return max(0.0, self.interval - (now - self._last))
+
+    def reset(self):
+        """Open the gate immediately on the next call."""
+        self._last = None
+
+
+class StatusLineThrottle:
+    """
+    Rate-limited writer for ``\r`` status lines in a terminal.
+
+    A skipped line is kept, not dropped: :meth:`flush` writes the latest one
+    so the terminal never stops on an outdated status. Call it before any
+    other output and at end of stream.
+    """
+
+    def __init__(self, write: Callable[[str], None], max_fps: float = DEFAULT_MAX_FPS,
+                 clock: Callable[[], float] = time.monotonic):
+        self._write = write
+        self._limiter = RateLimiter(max_fps, clock)
+        self._pending: Optional[str] = None
+
+    def status(self, text: str, force: bool = False):
+        """Write ``text`` now if the rate allows (or ``force``), else keep it for :meth:`flush`."""
+        if self._limiter.ready() or force:
+            self._pending = None
+            self._write(text)
+        else:
+            self._pending = text
+
+    def flush(self):
+        """Write the latest skipped status line, if any."""
+        if self._pending is not None:
+            text, self._pending = self._pending, None
+            self._write(text)
+
+
+def _file_signature(file_progress) -> Tuple:
+    """Fields that make a file entry visibly different between frames."""
+    return (
+        file_progress.operation,
+        file_progress.percent,
+        file_progress.current_size,
+        file_progress.total_size,
+        file_progress.speed,
+    )
+
+
+class ProgressEventBus:
+    """
+    Rate-limited publisher of ProgressFrame objects.
+
+    Wraps a ProgressStateManager: lines are parsed and folded into the state
+    as they arrive, but frames are only built and delivered when the rate
+    limiter allows. If updates arrive faster than that, the latest state wins
+    and the skipped updates are counted in ``dropped_frames``. A trailing
+    timer makes sure the last update is still published when the engine goes
+    quiet.
+
+    Subscribers are called on whichever thread publishes the frame (the
+    reader thread or the trailing timer), so they must be cheap and
+    thread-safe - a Qt signal ``emit`` is the intended use.
+    """
+
+    def __init__(self, state_manager: Optional[ProgressStateManager] = None,
+                 max_fps: float = DEFAULT_MAX_FPS, trailing_flush: bool = True):
+        """
+        Args:
+            state_manager: State manager to feed; a new one is created if omitted
+            max_fps: Maximum frames published per second
+            trailing_flush: Publish pending updates after the interval even if no new line arrives
+        """
+        self.state_manager = state_manager or ProgressStateManager()
+        self._limiter = RateLimiter(max_fps)
+        self._trailing_flush = trailing_flush
+        self._subscribers: List[Callable[[ProgressFrame], None]] = []
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self._sequence = 0
+        self._pending = 0
+        self._last_files: Dict[str, Tuple] = {}
+        self._last_phase: Tuple = (None, None)
+        self._last_speeds: Dict[str, float] = {}
+        self.updates_received = 0
+        self.frames_published = 0
+        self.dropped_frames = 0
+
+    def subscribe(self, callback: Callable[[ProgressFrame], None]) -> Callable[[], None]:
+        """
+        Register a frame callback.
+
+        Returns:
+            A function that removes the subscription
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return lambda: self.unsubscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[ProgressFrame], None]):
+        """Remove a previously registered callback (no-op if unknown)."""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def process_line(self, line: str) -> bool:
+        """
+        Feed one line of engine output.
+
+        Returns:
+            True if the line updated the progress state (whether or not a frame was published)
+        """
+        with self._lock:
+            updated = self.state_manager.process_line(line)
+            if updated:
+                self._note_update()
+            return updated
+
+    def notify_updated(self):
+        """Record an update made directly on ``state_manager.state``."""
+        with self._lock:
+            self._note_update()
+
+    def flush(self) -> Optional[ProgressFrame]:
+        """Publish any pending update immediately, ignoring the rate limit."""
+        with self._lock:
+            self._cancel_timer()
+            if not self._pending:
+                return None
+            self._limiter.ready()
+            return self._publish()
+
+    def close(self):
+        """Flush pending updates and stop the trailing timer."""
+        with self._lock:
+            self.flush()
+            self._closed = True
+
+    def reset(self):
+        """Reset progress state and frame bookkeeping for a new run."""
+        with self._lock:
+            self._cancel_timer()
+            self.state_manager.reset()
+            self._limiter.reset()
+            self._reset_counters()
+            self._closed = False
+
+    def get_state(self) -> InstallationProgress:
+        """Live (non-snapshot) state; only safe to read from the feeding thread."""
+        return self.state_manager.get_state()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters for diagnostics: updates seen, frames published, updates coalesced away."""
+        with self._lock:
+            return {
+                'updates_received': self.updates_received,
+                'frames_published': self.frames_published,
+                'dropped_frames': self.dropped_frames,
+            }
+
+    def _note_update(self):
+        self.updates_received += 1
+        self._pending += 1
+        if self._limiter.ready():
+            self._cancel_timer()
+            self._publish()
+        elif self._trailing_flush and self._timer is None and not self._closed:
+            self._timer = threading.Timer(self._limiter.remaining(), self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+            if self._pending and not self._closed:
+                self._limiter.ready()
+                self._publish()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _publish(self) -> ProgressFrame:
+        state = self.state_manager.get_state().snapshot()
+
+        files = {f.filename: _file_signature(f) for f in state.active_files}
+        previous = self._last_files
+        added = tuple(name for name in files if name not in previous)
+        removed = tuple(name for name in previous if name not in files)
+        updated = tuple(name for name, sig in files.items()
+                        if name in previous and previous[name] != sig)
+
+        phase = (state.phase, state.phase_name)
+        phase_changed = phase != self._last_phase
+        speed_changed = state.speeds != self._last_speeds
+
+        coalesced = self._pending
+        self.dropped_frames += max(0, coalesced - 1)
+        self._sequence += 1
+        frame = ProgressFrame(
+            sequence=self._sequence,
+            state=state,
+            files_added=added,
+            files_updated=updated,
+            files_removed=removed,
+            phase_changed=phase_changed,
+            speed_changed=speed_changed,
+            coalesced_updates=coalesced,
+            dropped_frames=self.dropped_frames,
+        )
+
+        self._last_files = files
+        self._last_phase = phase
+        self._last_speeds = dict(state.speeds)
+        self._pending = 0
+        self.frames_published += 1
+
+        for callback in list(self._subscribers):
+            try:
+                callback(frame)
+            except Exception as e:
+                logger.error(f"Progress subscriber {callback!r} failed: {e}", exc_info=True)
+        return frame
@@ -35,6 +35,133 @@ class ParsedLine:
     message: str = ""
 
 
+# Size units understood by the engine output ("1.1GB/56.3GB", "6.8MB/s")
+_BYTE_MULTIPLIERS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024 * 1024,
+    'GB': 1024 * 1024 * 1024,
+    'TB': 1024 * 1024 * 1024 * 1024
+}
+
+# Operation words used by the [FILE_PROGRESS] format
+_FILE_PROGRESS_OPERATIONS = {
+    'downloading': OperationType.DOWNLOAD,
+    'extracting': OperationType.EXTRACT,
+    'validating': OperationType.VALIDATE,
+    'installing': OperationType.INSTALL,
+    'building': OperationType.INSTALL,  # BSA building
+    'writing': OperationType.INSTALL,   # BSA writing
+    'verifying': OperationType.VALIDATE,  # BSA verification
+    'checking existing': OperationType.VALIDATE,  # Resume verification
+    'converting': OperationType.INSTALL,
+    'compiling': OperationType.INSTALL,
+    'hashing': OperationType.VALIDATE,
+    'completed': OperationType.UNKNOWN,
+}
+
+# All patterns are compiled once at import time. parse_line() only runs a
+# pattern when the characters it cannot match without are present in the line.
+
+# Phase: "=== Installing files ===" or "[...] Installing"
+_SECTION_RE = re.compile(r'===?\s*(.+?)\s*===?')
+_ACTION_RE = re.compile(
+    r'\[.*?\]\s*(Installing|Downloading|Extracting|Validating|Processing|Checking existing)',
+    re.IGNORECASE
+)
+
+# Wabbajack status update format: "[12/14] StatusText (current/total)"
+_WABBAJACK_STATUS_RE = re.compile(r'\[(\d+)/(\d+)\]\s+(.+?)\s+\(([^)]+)\)', re.IGNORECASE)
+# Alternative format: "[timestamp] StatusText (current/total) - speed"
+_TIMESTAMP_STATUS_RE = re.compile(r'\[[^\]]+\]\s+(.+?)\s+\((\d+)/(\d+)\)\s*-\s*([^\s]+)', re.IGNORECASE)
+# Cheap prefilter: the timestamp format always has ") - " after the counter
+_TIMESTAMP_STATUS_HINT_RE = re.compile(r'\)\s*-\s*\S')
+# .wabbajack download: "[timestamp] Downloading modlist.wabbajack (size/size) - speed"
+_WABBAJACK_DOWNLOAD_RE = re.compile(
+    r'\[[^\]]+\]\s+Downloading\s+([^\s]+\.wabbajack|\.wabbajack)\s+\(([^)]+)\)\s*-\s*([^\s]+)',
+    re.IGNORECASE
+)
+_WABBAJACK_FILENAME_RE = re.compile(r'([A-Za-z0-9_\-\.]+\.wabbajack)', re.IGNORECASE)
+# "49.7/1947.2MB" - only the second number carries a unit
+_PARTIAL_UNIT_DATA_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)?\s*/\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)',
+    re.IGNORECASE
+)
+
+# File progress
+# Format: [FILE_PROGRESS] (Downloading|Extracting|...): filename.zip (20.0%) [3.7MB/s] (current/total)
+# Speed bracket and counter are optional
+_FILE_PROGRESS_RE = re.compile(
+    r'\[FILE_PROGRESS\]\s+(Downloading|Extracting|Validating|Installing|Converting|Building|Writing|Verifying|Completed|Checking existing):\s+(.+?)\s+\((\d+(?:\.\d+)?)%\)\s*(?:\[(.+?)\])?\s*(?:\((\d+)/(\d+)\))?',
+    re.IGNORECASE
+)
+_STATUS_MESSAGE_RE = re.compile(
+    r'\[.*?\]\s*(?:Downloading|Installing|Extracting)\s+(?:Mod|Files|Archives)',
+    re.IGNORECASE
+)
+_ACTION_FILE_PERCENT_RE = re.compile(
+    r'(?:Installing|Downloading|Extracting|Validating):\s*(.+?)\s*\((\d+(?:\.\d+)?)%\)',
+    re.IGNORECASE
+)
+_FILE_PERCENT_RE = re.compile(
+    r'(.+?\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s*[:-]\s*(\d+(?:\.\d+)?)%',
+    re.IGNORECASE
+)
+_FILE_SPEED_RE = re.compile(
+    r'(.+?\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s*[\[@]\s*([^\]]+)\]?',
+    re.IGNORECASE
+)
+_FILE_AT_PERCENT_RE = re.compile(
+    r'([A-Za-z0-9][^\s]*?[-_A-Za-z0-9]+\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s+(?:at|@|:|-)?\s*(\d+(?:\.\d+)?)%',
+    re.IGNORECASE
+)
+_FILE_SIZE_OF_RE = re.compile(
+    r'([A-Za-z0-9][^\s]*?[-_A-Za-z0-9]+\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s*[\(]?\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/?\s*of\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)',
+    re.IGNORECASE
+)
+# Each legacy filename pattern starts with a lazy "(.+?\.ext)" group, which is
+# expensive to try at every position. These prefilters check for the text that
+# must follow the extension, matched against the lowercased line.
+_FILE_EXT = r'\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack)'
+_FILE_PERCENT_HINT_RE = re.compile(_FILE_EXT + r'\s*[:-]\s*\d+(?:\.\d+)?%')
+_FILE_SPEED_HINT_RE = re.compile(_FILE_EXT + r'\s*[\[@]')
+_FILE_AT_PERCENT_HINT_RE = re.compile(_FILE_EXT + r'\s+(?:at|@|:|-)?\s*\d+(?:\.\d+)?%')
+_FILE_SIZE_OF_HINT_RE = re.compile(_FILE_EXT + r'\s*[\(]?\s*\d+(?:\.\d+)?\s*(?:b|kb|mb|gb|tb)\s*/?\s*of')
+_FILE_SPEED_AT_HINT_RE = re.compile(_FILE_EXT + r'\s+(?:downloading|extracting|validating|installing)\s+at\s+\d')
+_FILE_SPEED_AT_RE = re.compile(
+    r'([A-Za-z0-9][^\s]*?[-_A-Za-z0-9]+\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s+(?:downloading|extracting|validating|installing)\s+at\s+(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s',
+    re.IGNORECASE
+)
+
+# Overall progress: "Progress: 85%" or "85% complete"
+_OVERALL_RE = re.compile(r'(?:Progress|Overall):\s*(\d+(?:\.\d+)?)%', re.IGNORECASE)
+_PERCENT_COMPLETE_RE = re.compile(r'^(\d+(?:\.\d+)?)%\s*(?:complete|done|progress)', re.IGNORECASE)
+
+# Steps and data sizes: "[12/14]", "1.1GB/56.3GB", "1234/5678"
+_STEP_RE = re.compile(r'\[(\d+)/(\d+)\]')
+_DATA_RE = re.compile(
+    r'\(?(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\)?',
+    re.IGNORECASE
+)
+_COUNT_PAIR_RE = re.compile(r'(\d+)\s*/\s*(\d+)')
+# Cheap prefilter: a size pair always has a unit ending in "B" right before the slash
+_DATA_HINT_RE = re.compile(r'[bB]\s*/\s*\d')
+
+# Speeds: "- 6.8MB/s", "at 267.3MB/s", "speed: 45.2 MB/s"
+# The dash/at variants only capture numbers and units, so they are matched
+# case-sensitively against the lowercased line, which lets the regex engine
+# scan for the literal prefix instead of trying every position
+_DASH_SPEED_LOWER_RE = re.compile(r'-\s*(\d+(?:\.\d+)?)\s*(b|kb|mb|gb|tb)\s*/s')
+_AT_SPEED_LOWER_RE = re.compile(r'(?:at|speed:?)\s*(\d+(?:\.\d+)?)\s*(b|kb|mb|gb|tb)\s*/s')
+_SPEED_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s', re.IGNORECASE)
+
+# Completion: "Finished downloading filename.7z. Hash: ..."
+_COMPLETED_RE = re.compile(
+    r'Finished\s+(?:downloading|extracting|validating|installing)\s+(.+?)(?:\.\s|\.$|\s+Hash:)',
+    re.IGNORECASE
+)
+
+
 class ProgressParser:
     """
     Parses jackify-engine output to extract progress information.
@@ -46,71 +173,21 @@ class ProgressParser:
     - Step counts
     - Data sizes
     - Operation speeds
+    
+    Each line is classified with cheap substring checks first, so only the
+    extractors that can possibly match are run against it.
     """
     
     def __init__(self):
-        """Initialize parser with pattern definitions."""
-        # Phase detection patterns
-        self.phase_patterns = [
-            (r'===?\s*(.+?)\s*===?', self._extract_phase_from_section),
-            (r'\[.*?\]\s*(?:Installing|Downloading|Extracting|Validating|Processing)', self._extract_phase_from_action),
-            (r'(?:Starting|Beginning)\s+(.+?)(?:\s+phase|\.|$)', re.IGNORECASE),
-        ]
-        
-        # File progress patterns
-        self.file_patterns = [
-            # Pattern: "Installing: filename.7z (42%)"
-            (r'(?:Installing|Downloading|Extracting|Validating):\s*(.+?)\s*\((\d+(?:\.\d+)?)%\)', self._parse_file_with_percent),
-            # Pattern: "filename.7z: 42%"
-            (r'(.+?\.(?:7z|zip|rar|bsa|dds)):\s*(\d+(?:\.\d+)?)%', self._parse_file_with_percent),
-            # Pattern: "filename.7z [45.2MB/s]"
-            (r'(.+?\.(?:7z|zip|rar|bsa|dds))\s*\[([^\]]+)\]', self._parse_file_with_speed),
-        ]
-        
-        # Overall progress patterns (stored as regex patterns, not tuples with callbacks)
-        # Wabbajack format: "[12/14] Installing files (1.1GB/56.3GB)"
-        self.overall_patterns = [
-            # Pattern: "Progress: 85%" or "85%"
-            (r'(?:Progress|Overall):\s*(\d+(?:\.\d+)?)%', re.IGNORECASE),
-            (r'^(\d+(?:\.\d+)?)%\s*(?:complete|done|progress)', re.IGNORECASE),
-        ]
-        
-        # Wabbajack status update format: "[12/14] StatusText (current/total)"
-        # This is the primary format we should match
-        self.wabbajack_status_pattern = re.compile(
-            r'\[(\d+)/(\d+)\]\s+(.+?)\s+\(([^)]+)\)',
-            re.IGNORECASE
-        )
-        
-        # Alternative format: "[timestamp] StatusText (current/total) - speed"
-        # Example: "[00:00:10] Downloading Mod Archives (17/214) - 6.8MB/s"
-        self.timestamp_status_pattern = re.compile(
-            r'\[[^\]]+\]\s+(.+?)\s+\((\d+)/(\d+)\)\s*-\s*([^\s]+)',
-            re.IGNORECASE
-        )
-        
-        # Data size patterns
-        self.data_patterns = [
-            # Pattern: "1.1GB/56.3GB" or "(1.1GB/56.3GB)"
-            (r'\(?(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\)?', re.IGNORECASE),
-            # Pattern: "Processing 1.1GB of 56.3GB"
-            (r'Processing\s+(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s+of\s+(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)', re.IGNORECASE),
-        ]
-        
-        # Speed patterns
-        self.speed_patterns = [
-            # Pattern: "267.3MB/s" or "45.2 MB/s"
-            (r'(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s', re.IGNORECASE),
-            # Pattern: "at 267.3MB/s" or "speed: 45.2 MB/s"
-            (r'(?:at|speed:?)\s+(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s', re.IGNORECASE),
-        ]
-        
+        """Initialize parser state."""
         # File filter - only display meaningful artifacts in the UI
         self.allowed_extensions = {
             '.7z', '.zip', '.rar', '.bsa', '.ba2', '.dds', '.wabbajack',
             '.exe', '.esp', '.esm', '.esl', '.bin', '.dll', '.pak',
             '.tar', '.gz', '.xz', '.bz2', '.z01', '.z02', '.cab', '.msi'
         }
+        # The same few hundred filenames repeat across thousands of progress lines
+        self._display_file_cache = {}
     
     def should_display_file(self, filename: str) -> bool:
         """Public helper so other components can reuse the filter."""
@@ -120,6 +197,16 @@ class ProgressParser:
         """Determine whether a filename is worth showing in the UI."""
         if not filename:
             return False
+        cached = self._display_file_cache.get(filename)
+        if cached is None:
+            cached = self._check_display_file(filename)
+            if len(self._display_file_cache) >= 4096:
+                self._display_file_cache.clear()
+            self._display_file_cache[filename] = cached
+        return cached
+    
+    def _check_display_file(self, filename: str) -> bool:
+        """Uncached filename filter used by _should_display_file()."""
         base = os.path.basename(filename.strip())
         if not base:
             return False
@@ -149,223 +236,234 @@ class ProgressParser:
         Returns:
             ParsedLine with extracted information
         """
-        result = ParsedLine(message=line.strip())
+        stripped = line.strip()
+        result = ParsedLine(message=stripped)
         
-        if not line.strip():
+        if not stripped:
             return result
         
+        # Classify the line once; each extractor below is skipped when the
+        # characters its patterns require are missing
+        lower = line.lower()
+        has_bracket = '[' in line
+        has_paren = '(' in line
+        has_slash = '/' in line
+        
         # Try to extract phase information
-        phase_info = self._extract_phase(line)
-        if phase_info:
-            result.phase, result.phase_name = phase_info
-            result.has_progress = True
+        if has_bracket or '==' in line:
+            phase_info = self._extract_phase(line)
+            if phase_info:
+                result.phase, result.phase_name = phase_info
+                result.has_progress = True
         
         # Try to extract file progress
-        file_prog = self._extract_file_progress(line)
+        file_prog = self._extract_file_progress(line, lower)
         if file_prog:
             result.file_progress = file_prog
             result.has_progress = True
             # Check if file counter was attached (for extraction or install phases)
-            if hasattr(file_prog, '_file_counter'):
+            if file_prog._file_counter is not None:
                 result.file_counter = file_prog._file_counter
-                delattr(file_prog, '_file_counter')  # Clean up temp attribute
+                file_prog._file_counter = None  # Clean up temp attribute
         
         # Try to extract overall progress
-        overall = self._extract_overall_progress(line)
-        if overall is not None:
-            result.overall_percent = overall
-            result.has_progress = True
+        if '%' in line and ('progress:' in lower or 'overall:' in lower or line[0].isdigit()):
+            overall = self._extract_overall_progress(line)
+            if overall is not None:
+                result.overall_percent = overall
+                result.has_progress = True
         
         # Try to extract Wabbajack status format first: "[12/14] StatusText (1.1GB/56.3GB)"
         # BUT skip if this is a .wabbajack download line (handled by specific pattern below)
-        wabbajack_match = self.wabbajack_status_pattern.search(line)
-        if wabbajack_match:
-            status_text = wabbajack_match.group(3).strip().lower()
-            # Skip if this is a .wabbajack download - let the specific pattern handle it
-            if '.wabbajack' in status_text or 'downloading .wabbajack' in status_text:
-                # Don't process this as generic status - let .wabbajack pattern handle it
-                pass
-            else:
-                # Extract step info
-                current_step = int(wabbajack_match.group(1))
-                max_steps = int(wabbajack_match.group(2))
-                result.step_info = (current_step, max_steps)
-                
-                # Extract status text (phase name)
-                phase_info = self._extract_phase_from_text(status_text)
-                if phase_info:
-                    result.phase, result.phase_name = phase_info
-                
-                # Extract data info from parentheses
-                data_str = wabbajack_match.group(4).strip()
-                data_info = self._parse_data_string(data_str)
-                if data_info:
-                    result.data_info = data_info
-                
-                result.has_progress = True
-        
-        # Try alternative format: "[timestamp] StatusText (current/total) - speed"
-        # Example: "[00:00:10] Downloading Mod Archives (17/214) - 6.8MB/s"
-        timestamp_match = self.timestamp_status_pattern.search(line)
-        if timestamp_match:
-            # Extract status text (phase name)
-            status_text = timestamp_match.group(1).strip()
-            phase_info = self._extract_phase_from_text(status_text)
-            if phase_info:
-                result.phase, result.phase_name = phase_info
-            
-            # Extract step info (current/total in parentheses)
-            current_step = int(timestamp_match.group(2))
-            max_steps = int(timestamp_match.group(3))
-            result.step_info = (current_step, max_steps)
-            
-            # Extract speed
-            speed_str = timestamp_match.group(4).strip()
-            speed_info = self._parse_speed_from_string(speed_str)
-            if speed_info:
-                operation = self._detect_operation_from_line(status_text)
-                result.speed_info = (operation.value, speed_info)
-            
-            # Calculate overall percentage from step progress
-            if max_steps > 0:
-                result.overall_percent = (current_step / max_steps) * 100.0
-            
-            result.has_progress = True
-        
-        # Try .wabbajack download format: "[timestamp] Downloading .wabbajack (size/size) - speed"
-        # Example: "[00:02:08] Downloading .wabbajack (739.2/1947.2MB) - 6.0MB/s"
-        # Also handles: "[00:02:08] Downloading modlist.wabbajack (739.2/1947.2MB) - 6.0MB/s"
-        wabbajack_download_pattern = re.compile(
-            r'\[[^\]]+\]\s+Downloading\s+([^\s]+\.wabbajack|\.wabbajack)\s+\(([^)]+)\)\s*-\s*([^\s]+)',
-            re.IGNORECASE
-        )
-        wabbajack_match = wabbajack_download_pattern.search(line)
-        if wabbajack_match:
-            # Extract filename (group 1)
-            filename = wabbajack_match.group(1).strip()
-            if filename == ".wabbajack":
-                # Try to extract actual filename from message if available
-                filename_match = re.search(r'([A-Za-z0-9_\-\.]+\.wabbajack)', line, re.IGNORECASE)
-                if filename_match:
-                    filename = filename_match.group(1)
-                else:
-                    # Use display message as filename
-                    filename = "Downloading .wabbajack file"
-            
-            # Extract data info from parentheses (e.g., "49.7/1947.2MB" or "739.2MB/1947.2MB")
-            # Format can be: "current/totalUnit" or "currentUnit/totalUnit"
-            data_str = wabbajack_match.group(2).strip()
-            data_info = None
-            
-            # Try standard format first (both have units)
-            data_info = self._extract_data_info(f"({data_str})")
-            
-            # If that fails, try format where only second number has unit: "49.7/1947.2MB"
-            if not data_info:
-                pattern = r'(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)?\s*/\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)'
-                match = re.search(pattern, data_str, re.IGNORECASE)
-                if match:
-                    current_val = float(match.group(1))
-                    current_unit = match.group(2) if match.group(2) else match.group(4)  # Use second unit if first missing
-                    total_val = float(match.group(3))
-                    total_unit = match.group(4)
-                    
-                    current_bytes = self._convert_to_bytes(current_val, current_unit)
-                    total_bytes = self._convert_to_bytes(total_val, total_unit)
-                    data_info = (current_bytes, total_bytes)
-            
-            if data_info:
-                result.data_info = data_info
-                # Calculate percent from data
-                current_bytes, total_bytes = data_info
-                if total_bytes > 0:
-                    result.overall_percent = (current_bytes / total_bytes) * 100.0
-            
-            # Extract speed (group 3)
-            speed_str = wabbajack_match.group(3).strip()
-            speed_info = self._parse_speed_from_string(speed_str)
-            if speed_info:
-                result.speed_info = ("download", speed_info)
-            
-            # Set phase
-            result.phase = InstallationPhase.DOWNLOAD
-            result.phase_name = f"Downloading {filename}"
-            
-            # Create FileProgress entry for .wabbajack file
-            if data_info:
-                current_bytes, total_bytes = data_info
-                percent = (current_bytes / total_bytes) * 100.0 if total_bytes > 0 else 0.0
-                from jackify.shared.progress_models import FileProgress, OperationType
-                file_progress = FileProgress(
-                    filename=filename,
-                    operation=OperationType.DOWNLOAD,
-                    percent=percent,
-                    current_size=current_bytes,
-                    total_size=total_bytes,
-                    speed=speed_info if speed_info else -1.0
-                )
-                result.file_progress = file_progress
-            
-            result.has_progress = True
+        if has_bracket and has_slash and has_paren:
+            self._apply_wabbajack_status(line, result)
+            if _TIMESTAMP_STATUS_HINT_RE.search(line):
+                self._apply_timestamp_status(line, result)
+            if 'wabbajack' in lower and 'downloading' in lower:
+                self._apply_wabbajack_download(line, result)
         
         # Try to extract step information (fallback)
-        if not result.step_info:
+        if not result.step_info and has_bracket and has_slash:
             step_info = self._extract_step_info(line)
             if step_info:
                 result.step_info = step_info
                 result.has_progress = True
         
         # Try to extract data size information (fallback)
-        if not result.data_info:
+        if not result.data_info and has_slash and 'b' in lower:
             data_info = self._extract_data_info(line)
             if data_info:
                 result.data_info = data_info
                 result.has_progress = True
         
         # Try to extract speed information
-        speed_info = self._extract_speed_info(line)
-        if speed_info:
-            result.speed_info = speed_info
-            result.has_progress = True
+        if '/s' in lower:
+            speed_info = self._extract_speed_info(line, lower)
+            if speed_info:
+                result.speed_info = speed_info
+                result.has_progress = True
         
         # Try to detect file completion
-        completed_file = self._extract_completed_file(line)
-        if completed_file:
-            result.completed_filename = completed_file
-            result.has_progress = True
+        if 'finished' in lower:
+            completed_file = self._extract_completed_file(line)
+            if completed_file:
+                result.completed_filename = completed_file
+                result.has_progress = True
         
         return result
     
+    def _apply_wabbajack_status(self, line: str, result: ParsedLine):
+        """Apply "[12/14] StatusText (1.1GB/56.3GB)" status updates to result."""
+        wabbajack_match = _WABBAJACK_STATUS_RE.search(line)
+        if not wabbajack_match:
+            return
+        status_text = wabbajack_match.group(3).strip().lower()
+        # Skip if this is a .wabbajack download - let the specific pattern handle it
+        if '.wabbajack' in status_text or 'downloading .wabbajack' in status_text:
+            return
+        
+        # Extract step info
+        current_step = int(wabbajack_match.group(1))
+        max_steps = int(wabbajack_match.group(2))
+        result.step_info = (current_step, max_steps)
+        
+        # Extract status text (phase name)
+        phase_info = self._extract_phase_from_text(status_text)
+        if phase_info:
+            result.phase, result.phase_name = phase_info
+        
+        # Extract data info from parentheses
+        data_str = wabbajack_match.group(4).strip()
+        data_info = self._parse_data_string(data_str)
+        if data_info:
+            result.data_info = data_info
+        
+        result.has_progress = True
+    
+    def _apply_timestamp_status(self, line: str, result: ParsedLine):
+        """
+        Apply "[timestamp] StatusText (current/total) - speed" updates to result.
+        Example: "[00:00:10] Downloading Mod Archives (17/214) - 6.8MB/s"
+        """
+        timestamp_match = _TIMESTAMP_STATUS_RE.search(line)
+        if not timestamp_match:
+            return
+        # Extract status text (phase name)
+        status_text = timestamp_match.group(1).strip()
+        phase_info = self._extract_phase_from_text(status_text)
+        if phase_info:
+            result.phase, result.phase_name = phase_info
+        
+        # Extract step info (current/total in parentheses)
+        current_step = int(timestamp_match.group(2))
+        max_steps = int(timestamp_match.group(3))
+        result.step_info = (current_step, max_steps)
+        
+        # Extract speed
+        speed_str = timestamp_match.group(4).strip()
+        speed_info = self._parse_speed_from_string(speed_str)
+        if speed_info:
+            operation = self._detect_operation_from_line(status_text)
+            result.speed_info = (operation.value, speed_info)
+        
+        # Calculate overall percentage from step progress
+        if max_steps > 0:
+            result.overall_percent = (current_step / max_steps) * 100.0
+        
+        result.has_progress = True
+    
+    def _apply_wabbajack_download(self, line: str, result: ParsedLine):
+        """
+        Apply .wabbajack download updates to result.
+        Example: "[00:02:08] Downloading .wabbajack (739.2/1947.2MB) - 6.0MB/s"
+        Also handles: "[00:02:08] Downloading modlist.wabbajack (739.2/1947.2MB) - 6.0MB/s"
+        """
+        wabbajack_match = _WABBAJACK_DOWNLOAD_RE.search(line)
+        if not wabbajack_match:
+            return
+        # Extract filename (group 1)
+        filename = wabbajack_match.group(1).strip()
+        if filename == ".wabbajack":
+            # Try to extract actual filename from message if available
+            filename_match = _WABBAJACK_FILENAME_RE.search(line)
+            if filename_match:
+                filename = filename_match.group(1)
+            else:
+                # Use display message as filename
+                filename = "Downloading .wabbajack file"
+        
+        # Extract data info from parentheses (e.g., "49.7/1947.2MB" or "739.2MB/1947.2MB")
+        # Format can be: "current/totalUnit" or "currentUnit/totalUnit"
+        data_str = wabbajack_match.group(2).strip()
+        
+        # Try standard format first (both have units)
+        data_info = self._extract_data_info(f"({data_str})")
+        
+        # If that fails, try format where only second number has unit: "49.7/1947.2MB"
+        if not data_info:
+            match = _PARTIAL_UNIT_DATA_RE.search(data_str)
+            if match:
+                current_val = float(match.group(1))
+                current_unit = match.group(2) if match.group(2) else match.group(4)  # Use second unit if first missing
+                total_val = float(match.group(3))
+                total_unit = match.group(4)
+                
+                current_bytes = self._convert_to_bytes(current_val, current_unit)
+                total_bytes = self._convert_to_bytes(total_val, total_unit)
+                data_info = (current_bytes, total_bytes)
+        
+        if data_info:
+            result.data_info = data_info
+            # Calculate percent from data
+            current_bytes, total_bytes = data_info
+            if total_bytes > 0:
+                result.overall_percent = (current_bytes / total_bytes) * 100.0
+        
+        # Extract speed (group 3)
+        speed_str = wabbajack_match.group(3).strip()
+        speed_info = self._parse_speed_from_string(speed_str)
+        if speed_info:
+            result.speed_info = ("download", speed_info)
+        
+        # Set phase
+        result.phase = InstallationPhase.DOWNLOAD
+        result.phase_name = f"Downloading {filename}"
+        
+        # Create FileProgress entry for .wabbajack file
+        if data_info:
+            current_bytes, total_bytes = data_info
+            percent = (current_bytes / total_bytes) * 100.0 if total_bytes > 0 else 0.0
+            result.file_progress = FileProgress(
+                filename=filename,
+                operation=OperationType.DOWNLOAD,
+                percent=percent,
+                current_size=current_bytes,
+                total_size=total_bytes,
+                speed=speed_info if speed_info else -1.0
+            )
+        
+        result.has_progress = True
+    
     def _extract_phase(self, line: str) -> Optional[Tuple[InstallationPhase, str]]:
         """Extract phase information from line."""
         # Check for section headers like "=== Installing files ==="
-        section_match = re.search(r'===?\s*(.+?)\s*===?', line)
-        if section_match:
-            section_name = section_match.group(1).strip().lower()
-            phase = self._map_section_to_phase(section_name)
-            return (phase, section_match.group(1).strip())
+        if '==' in line:
+            section_match = _SECTION_RE.search(line)
+            if section_match:
+                section_name = section_match.group(1).strip().lower()
+                phase = self._map_section_to_phase(section_name)
+                return (phase, section_match.group(1).strip())
         
         # Check for action-based phase indicators
-        action_match = re.search(r'\[.*?\]\s*(Installing|Downloading|Extracting|Validating|Processing|Checking existing)', line, re.IGNORECASE)
-        if action_match:
-            action = action_match.group(1).lower()
-            phase = self._map_action_to_phase(action)
-            return (phase, action_match.group(1))
+        if '[' in line:
+            action_match = _ACTION_RE.search(line)
+            if action_match:
+                action = action_match.group(1).lower()
+                phase = self._map_action_to_phase(action)
+                return (phase, action_match.group(1))
         
         return None
     
-    def _extract_phase_from_section(self, match: re.Match) -> Optional[Tuple[InstallationPhase, str]]:
-        """Extract phase from section header match."""
-        section_name = match.group(1).strip().lower()
-        phase = self._map_section_to_phase(section_name)
-        return (phase, match.group(1).strip())
-    
-    def _extract_phase_from_action(self, match: re.Match) -> Optional[Tuple[InstallationPhase, str]]:
-        """Extract phase from action match."""
-        action = match.group(1).lower()
-        phase = self._map_action_to_phase(action)
-        return (phase, match.group(1))
-    
     def _map_section_to_phase(self, section_name: str) -> InstallationPhase:
         """Map section name to InstallationPhase enum."""
         section_lower = section_name.lower()
@@ -398,7 +496,7 @@ class ProgressParser:
         else:
             return InstallationPhase.UNKNOWN
     
-    def _extract_file_progress(self, line: str) -> Optional[FileProgress]:
+    def _extract_file_progress(self, line: str, lower: Optional[str] = None) -> Optional[FileProgress]:
         """Extract file-level progress information."""
         # CRITICAL: Defensive checks to prevent segfault in regex engine
         # Segfaults happen in C code before Python exceptions, so we must validate input first
@@ -411,17 +509,12 @@ class ProgressParser:
         if '\x00' in line:
             # Replace null bytes to prevent corruption
             line = line.replace('\x00', '')
+            lower = None
+        if lower is None:
+            lower = line.lower()
         
         # PRIORITY: Check for [FILE_PROGRESS] prefix first (new engine format)
-        # Format: [FILE_PROGRESS] Downloading: filename.zip (20.0%) [3.7MB/s]
-        # Updated format: [FILE_PROGRESS] (Downloading|Extracting|Installing|Converting|Completed|etc): filename.zip (20.0%) [3.7MB/s] (current/total)
-        # Speed bracket is optional to handle cases where speed may not be present
-        # Counter (current/total) is optional and used for Extracting and Installing phases
-        file_progress_match = re.search(
-            r'\[FILE_PROGRESS\]\s+(Downloading|Extracting|Validating|Installing|Converting|Building|Writing|Verifying|Completed|Checking existing):\s+(.+?)\s+\((\d+(?:\.\d+)?)%\)\s*(?:\[(.+?)\])?\s*(?:\((\d+)/(\d+)\))?',
-            line,
-            re.IGNORECASE
-        )
+        file_progress_match = _FILE_PROGRESS_RE.search(line) if '[file_progress]' in lower else None
         if file_progress_match:
             operation_str = file_progress_match.group(1).strip()
             filename = file_progress_match.group(2).strip()
@@ -432,21 +525,8 @@ class ProgressParser:
             counter_total = int(file_progress_match.group(6)) if file_progress_match.group(6) else None
 
             # Map operation string first (needed for hidden progress items)
-            operation_map = {
-                'downloading': OperationType.DOWNLOAD,
-                'extracting': OperationType.EXTRACT,
-                'validating': OperationType.VALIDATE,
-                'installing': OperationType.INSTALL,
-                'building': OperationType.INSTALL,  # BSA building
-                'writing': OperationType.INSTALL,   # BSA writing
-                'verifying': OperationType.VALIDATE,  # BSA verification
-                'checking existing': OperationType.VALIDATE,  # Resume verification
-                'converting': OperationType.INSTALL,
-                'compiling': OperationType.INSTALL,
-                'hashing': OperationType.VALIDATE,
-                'completed': OperationType.UNKNOWN,
-            }
-            operation = operation_map.get(operation_str.lower(), OperationType.UNKNOWN)
+            operation_lower = operation_str.lower()
+            operation = _FILE_PROGRESS_OPERATIONS.get(operation_lower, OperationType.UNKNOWN)
 
             # If we have counter info but file shouldn't be displayed, create a minimal FileProgress
             # just to carry the counter information (for extraction/install summary display)
@@ -466,9 +546,8 @@ class ProgressParser:
             if not self._should_display_file(filename):
                 return None
 
-            # Operation already mapped above (line 352)
             # If operation is "Completed", ensure percent is 100%
-            if operation_str.lower() == 'completed':
+            if operation_lower == 'completed':
                 percent = 100.0
             
             # Parse speed if available
@@ -489,10 +568,10 @@ class ProgressParser:
             # Store counter in a temporary attribute we can access later
             # Distinguish between texture conversion, BSA building, and install counters
             if counter_current is not None and counter_total is not None:
-                if operation_str.lower() == 'converting':
+                if operation_lower == 'converting':
                     # This is a texture conversion counter
                     file_progress._texture_counter = (counter_current, counter_total)
-                elif operation_str.lower() == 'building':
+                elif operation_lower == 'building':
                     # This is a BSA building counter
                     file_progress._bsa_counter = (counter_current, counter_total)
                 else:
@@ -501,136 +580,125 @@ class ProgressParser:
 
             return file_progress
         
+        has_bracket = '[' in line
+        has_percent = '%' in line
+        
         # Skip lines that are clearly status messages, not file progress
-        if re.search(r'\[.*?\]\s*(?:Downloading|Installing|Extracting)\s+(?:Mod|Files|Archives)', line, re.IGNORECASE):
+        if has_bracket and _STATUS_MESSAGE_RE.search(line):
             return None
         
         # Pattern 1: "Installing: filename.7z (42%)" or "Downloading: filename.7z (42%)"
-        match = re.search(r'(?:Installing|Downloading|Extracting|Validating):\s*(.+?)\s*\((\d+(?:\.\d+)?)%\)', line, re.IGNORECASE)
-        if match:
-            filename = match.group(1).strip()
-            percent = float(match.group(2))
-            operation = self._detect_operation_from_line(line)
-            file_progress = FileProgress(
-                filename=filename,
-                operation=operation,
-                percent=percent
-            )
-            size_info = self._extract_data_info(line)
-            if size_info:
-                file_progress.current_size, file_progress.total_size = size_info
-            return file_progress
+        if has_percent and ':' in line:
+            match = _ACTION_FILE_PERCENT_RE.search(line)
+            if match:
+                filename = match.group(1).strip()
+                percent = float(match.group(2))
+                operation = self._detect_operation_from_line(line)
+                file_progress = FileProgress(
+                    filename=filename,
+                    operation=operation,
+                    percent=percent
+                )
+                size_info = self._extract_data_info(line)
+                if size_info:
+                    file_progress.current_size, file_progress.total_size = size_info
+                return file_progress
+        
+        # The remaining patterns all need a filename with one of these extensions
+        if '.' not in line:
+            return None
         
         # Pattern 2: "filename.7z: 42%" or "filename.7z - 42%" or "filename.wabbajack: 42%"
-        match = re.search(r'(.+?\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s*[:-]\s*(\d+(?:\.\d+)?)%', line, re.IGNORECASE)
-        if match:
-            filename = match.group(1).strip()
-            percent = float(match.group(2))
-            operation = self._detect_operation_from_line(line)
-            file_progress = FileProgress(
-                filename=filename,
-                operation=operation,
-                percent=percent
-            )
-            size_info = self._extract_data_info(line)
-            if size_info:
-                file_progress.current_size, file_progress.total_size = size_info
-            return file_progress
+        if has_percent and _FILE_PERCENT_HINT_RE.search(lower):
+            match = _FILE_PERCENT_RE.search(line)
+            if match:
+                filename = match.group(1).strip()
+                percent = float(match.group(2))
+                operation = self._detect_operation_from_line(line)
+                file_progress = FileProgress(
+                    filename=filename,
+                    operation=operation,
+                    percent=percent
+                )
+                size_info = self._extract_data_info(line)
+                if size_info:
+                    file_progress.current_size, file_progress.total_size = size_info
+                return file_progress
         
         # Pattern 3: "filename.7z [45.2MB/s]" or "filename.7z @ 45.2MB/s" or "filename.wabbajack [45.2MB/s]"
-        match = re.search(r'(.+?\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s*[\[@]\s*([^\]]+)\]?', line, re.IGNORECASE)
-        if match:
-            filename = match.group(1).strip()
-            speed_str = match.group(2).strip().rstrip(']')
-            speed = self._parse_speed(speed_str)
-            operation = self._detect_operation_from_line(line)
-            file_progress = FileProgress(
-                filename=filename,
-                operation=operation,
-                speed=speed
-            )
-            size_info = self._extract_data_info(line)
-            if size_info:
-                file_progress.current_size, file_progress.total_size = size_info
-            return file_progress
+        if (has_bracket or '@' in line) and _FILE_SPEED_HINT_RE.search(lower):
+            match = _FILE_SPEED_RE.search(line)
+            if match:
+                filename = match.group(1).strip()
+                speed_str = match.group(2).strip().rstrip(']')
+                speed = self._parse_speed(speed_str)
+                operation = self._detect_operation_from_line(line)
+                file_progress = FileProgress(
+                    filename=filename,
+                    operation=operation,
+                    speed=speed
+                )
+                size_info = self._extract_data_info(line)
+                if size_info:
+                    file_progress.current_size, file_progress.total_size = size_info
+                return file_progress
         
         # Pattern 4: Lines that look like filenames with progress info
         # Match lines that contain a filename-like pattern followed by percentage
         # This catches formats like "Enderal Remastered Armory - Standard-490-1-2-0-1669565635.7z at 42%"
         # or "modlist.wabbajack at 42%"
-        match = re.search(r'([A-Za-z0-9][^\s]*?[-_A-Za-z0-9]+\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s+(?:at|@|:|-)?\s*(\d+(?:\.\d+)?)%', line, re.IGNORECASE)
-        if match:
-            filename = match.group(1).strip()
-            percent = float(match.group(2))
-            operation = self._detect_operation_from_line(line)
-            return FileProgress(
-                filename=filename,
-                operation=operation,
-                percent=percent
-            )
+        if has_percent and _FILE_AT_PERCENT_HINT_RE.search(lower):
+            match = _FILE_AT_PERCENT_RE.search(line)
+            if match:
+                filename = match.group(1).strip()
+                percent = float(match.group(2))
+                operation = self._detect_operation_from_line(line)
+                return FileProgress(
+                    filename=filename,
+                    operation=operation,
+                    percent=percent
+                )
         
         # Pattern 5: Filename with size info that might indicate progress
         # "filename.7z (1.2MB/5.4MB)" or "filename.7z 1.2MB of 5.4MB" or "filename.wabbajack (1.2MB/5.4MB)"
-        match = re.search(r'([A-Za-z0-9][^\s]*?[-_A-Za-z0-9]+\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s*[\(]?\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/?\s*of\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)', line, re.IGNORECASE)
-        if match:
-            filename = match.group(1).strip()
-            current_val = float(match.group(2))
-            current_unit = match.group(3).upper()
-            total_val = float(match.group(4))
-            total_unit = match.group(5).upper()
-            current_bytes = self._convert_to_bytes(current_val, current_unit)
-            total_bytes = self._convert_to_bytes(total_val, total_unit)
-            percent = (current_bytes / total_bytes * 100.0) if total_bytes > 0 else 0.0
-            operation = self._detect_operation_from_line(line)
-            return FileProgress(
-                filename=filename,
-                operation=operation,
-                percent=percent,
-                current_size=current_bytes,
-                total_size=total_bytes
-            )
+        if 'of' in lower and _FILE_SIZE_OF_HINT_RE.search(lower):
+            match = _FILE_SIZE_OF_RE.search(line)
+            if match:
+                filename = match.group(1).strip()
+                current_val = float(match.group(2))
+                current_unit = match.group(3).upper()
+                total_val = float(match.group(4))
+                total_unit = match.group(5).upper()
+                current_bytes = self._convert_to_bytes(current_val, current_unit)
+                total_bytes = self._convert_to_bytes(total_val, total_unit)
+                percent = (current_bytes / total_bytes * 100.0) if total_bytes > 0 else 0.0
+                operation = self._detect_operation_from_line(line)
+                return FileProgress(
+                    filename=filename,
+                    operation=operation,
+                    percent=percent,
+                    current_size=current_bytes,
+                    total_size=total_bytes
+                )
         
         # Pattern 6: Filename with speed info
         # "filename.7z downloading at 45.2MB/s" or "filename.wabbajack downloading at 45.2MB/s"
-        match = re.search(r'([A-Za-z0-9][^\s]*?[-_A-Za-z0-9]+\.(?:7z|zip|rar|bsa|dds|exe|esp|esm|esl|wabbajack))\s+(?:downloading|extracting|validating|installing)\s+at\s+(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s', line, re.IGNORECASE)
-        if match:
-            filename = match.group(1).strip()
-            speed_val = float(match.group(2))
-            speed_unit = match.group(3).upper()
-            speed = self._convert_to_bytes(speed_val, speed_unit)
-            operation = self._detect_operation_from_line(line)
-            return FileProgress(
-                filename=filename,
-                operation=operation,
-                speed=speed
-            )
+        if '/s' in lower and _FILE_SPEED_AT_HINT_RE.search(lower):
+            match = _FILE_SPEED_AT_RE.search(line)
+            if match:
+                filename = match.group(1).strip()
+                speed_val = float(match.group(2))
+                speed_unit = match.group(3).upper()
+                speed = self._convert_to_bytes(speed_val, speed_unit)
+                operation = self._detect_operation_from_line(line)
+                return FileProgress(
+                    filename=filename,
+                    operation=operation,
+                    speed=speed
+                )
         
         return None
     
-    def _parse_file_with_percent(self, match: re.Match) -> Optional[FileProgress]:
-        """Parse file progress from percentage match."""
-        filename = match.group(1).strip()
-        percent = float(match.group(2))
-        operation = OperationType.UNKNOWN
-        # Try to detect operation from context
-        return FileProgress(
-            filename=filename,
-            operation=operation,
-            percent=percent
-        )
-    
-    def _parse_file_with_speed(self, match: re.Match) -> Optional[FileProgress]:
-        """Parse file progress from speed match."""
-        filename = match.group(1).strip()
-        speed_str = match.group(2).strip()
-        speed = self._parse_speed(speed_str)
-        operation = OperationType.UNKNOWN
-        return FileProgress(
-            filename=filename,
-            operation=operation,
-            speed=speed
-        )
-    
     def _detect_operation_from_line(self, line: str) -> OperationType:
         """Detect operation type from line content."""
         line_lower = line.lower()
@@ -648,12 +716,12 @@ class ProgressParser:
     def _extract_overall_progress(self, line: str) -> Optional[float]:
         """Extract overall progress percentage."""
         # Pattern: "Progress: 85%" or "85%"
-        match = re.search(r'(?:Progress|Overall):\s*(\d+(?:\.\d+)?)%', line, re.IGNORECASE)
+        match = _OVERALL_RE.search(line)
         if match:
             return float(match.group(1))
         
         # Pattern: "85% complete"
-        match = re.search(r'^(\d+(?:\.\d+)?)%\s*(?:complete|done|progress)', line, re.IGNORECASE)
+        match = _PERCENT_COMPLETE_RE.search(line)
         if match:
             return float(match.group(1))
         
@@ -662,14 +730,14 @@ class ProgressParser:
     def _extract_step_info(self, line: str) -> Optional[Tuple[int, int]]:
         """Extract step information like [12/14]."""
         # Try Wabbajack status format first: "[12/14] StatusText (data)"
-        match = self.wabbajack_status_pattern.search(line)
+        match = _WABBAJACK_STATUS_RE.search(line)
         if match:
             current = int(match.group(1))
             total = int(match.group(2))
             return (current, total)
         
         # Fallback to simple [12/14] pattern
-        match = re.search(r'\[(\d+)/(\d+)\]', line)
+        match = _STEP_RE.search(line)
         if match:
             current = int(match.group(1))
             total = int(match.group(2))
@@ -679,7 +747,9 @@ class ProgressParser:
     def _extract_data_info(self, line: str) -> Optional[Tuple[int, int]]:
         """Extract data size information like 1.1GB/56.3GB."""
         # Pattern: "1.1GB/56.3GB" or "(1.1GB/56.3GB)"
-        match = re.search(r'\(?(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\)?', line, re.IGNORECASE)
+        if not _DATA_HINT_RE.search(line):
+            return None
+        match = _DATA_RE.search(line)
         if match:
             current_val = float(match.group(1))
             current_unit = match.group(2).upper()
@@ -696,20 +766,12 @@ class ProgressParser:
     def _parse_data_string(self, data_str: str) -> Optional[Tuple[int, int]]:
         """Parse data string like '1.1GB/56.3GB' or '1234/5678'."""
         # Try size format first: "1.1GB/56.3GB"
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)', data_str, re.IGNORECASE)
-        if match:
-            current_val = float(match.group(1))
-            current_unit = match.group(2).upper()
-            total_val = float(match.group(3))
-            total_unit = match.group(4).upper()
-            
-            current_bytes = self._convert_to_bytes(current_val, current_unit)
-            total_bytes = self._convert_to_bytes(total_val, total_unit)
-            
-            return (current_bytes, total_bytes)
+        size_info = self._extract_data_info(data_str)
+        if size_info:
+            return size_info
         
         # Try numeric format: "1234/5678" (might be file counts or bytes)
-        match = re.search(r'(\d+)\s*/\s*(\d+)', data_str)
+        match = _COUNT_PAIR_RE.search(data_str)
         if match:
             current = int(match.group(1))
             total = int(match.group(2))
@@ -739,11 +801,12 @@ class ProgressParser:
         else:
             return (InstallationPhase.UNKNOWN, text)
     
-    def _extract_speed_info(self, line: str) -> Optional[Tuple[str, float]]:
+    def _extract_speed_info(self, line: str, lower: Optional[str] = None) -> Optional[Tuple[str, float]]:
         """Extract speed information."""
+        line_lower = lower if lower is not None else line.lower()
         # Pattern: "267.3MB/s" or "at 45.2 MB/s" or "- 6.8MB/s"
         # Try pattern with dash separator first (common in status lines)
-        match = re.search(r'-\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s', line, re.IGNORECASE)
+        match = _DASH_SPEED_LOWER_RE.search(line_lower)
         if match:
             speed_val = float(match.group(1))
             speed_unit = match.group(2).upper()
@@ -751,7 +814,6 @@ class ProgressParser:
             
             # Try to detect operation type from context
             operation = "unknown"
-            line_lower = line.lower()
             if 'download' in line_lower:
                 operation = "download"
             elif 'extract' in line_lower:
@@ -762,7 +824,7 @@ class ProgressParser:
             return (operation, speed_bytes)
         
         # Pattern: "at 267.3MB/s" or "speed: 45.2 MB/s"
-        match = re.search(r'(?:at|speed:?)\s*(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s', line, re.IGNORECASE)
+        match = _AT_SPEED_LOWER_RE.search(line_lower)
         if match:
             speed_val = float(match.group(1))
             speed_unit = match.group(2).upper()
@@ -770,7 +832,6 @@ class ProgressParser:
             
             # Try to detect operation type from context
             operation = "unknown"
-            line_lower = line.lower()
             if 'download' in line_lower:
                 operation = "download"
             elif 'extract' in line_lower:
@@ -784,7 +845,7 @@ class ProgressParser:
     
     def _parse_speed(self, speed_str: str) -> float:
         """Parse speed string to bytes per second."""
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s', speed_str, re.IGNORECASE)
+        match = _SPEED_RE.search(speed_str)
         if match:
             value = float(match.group(1))
             unit = match.group(2).upper()
@@ -793,23 +854,14 @@ class ProgressParser:
     
     def _parse_speed_from_string(self, speed_str: str) -> float:
         """Parse speed string like '6.8MB/s' to bytes per second."""
-        # Handle format: "6.8MB/s" or "6.8 MB/s" or "6.8MB/sec"
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)\s*/s(?:ec)?', speed_str, re.IGNORECASE)
-        if match:
-            value = float(match.group(1))
-            unit = match.group(2).upper()
-            return self._convert_to_bytes(value, unit)
-        return 0.0
+        # Handles "6.8MB/s", "6.8 MB/s" and "6.8MB/sec" (the "/s" prefix is enough to match)
+        return self._parse_speed(speed_str)
     
     def _extract_completed_file(self, line: str) -> Optional[str]:
         """Extract filename from completion messages like 'Finished downloading filename.7z'."""
         # Pattern: "Finished downloading filename.7z. Hash: ..."
         # or "Finished downloading filename.7z"
-        match = re.search(
-            r'Finished\s+(?:downloading|extracting|validating|installing)\s+(.+?)(?:\.\s|\.$|\s+Hash:)',
-            line,
-            re.IGNORECASE
-        )
+        match = _COMPLETED_RE.search(line)
         if match:
             filename = match.group(1).strip()
             # Remove any trailing dots or whitespace
@@ -819,14 +871,7 @@ class ProgressParser:
     
     def _convert_to_bytes(self, value: float, unit: str) -> int:
         """Convert value with unit to bytes."""
-        multipliers = {
-            'B': 1,
-            'KB': 1024,
-            'MB': 1024 * 1024,
-            'GB': 1024 * 1024 * 1024,
-            'TB': 1024 * 1024 * 1024 * 1024
-        }
-        return int(value * multipliers.get(unit, 1))
+        return int(value * _BYTE_MULTIPLIERS.get(unit, 1))
 
 
 class ProgressStateManager:
@@ -844,6 +889,7 @@ class ProgressStateManager:
         self._file_history = {}
         self._wabbajack_entry_name = None
         self._synthetic_flag = "_synthetic_wabbajack"
+        self._wabbajack_names = set()  # Active entries whose name mentions .wabbajack
     
     def process_line(self, line: str) -> bool:
         """
@@ -896,19 +942,19 @@ class ProgressStateManager:
         # Update file progress
         if parsed.file_progress:
             # Skip hidden files (used only for carrying counter info)
-            if hasattr(parsed.file_progress, '_hidden') and parsed.file_progress._hidden:
+            if parsed.file_progress._hidden:
                 # Counter already extracted above, don't add to active files
                 return updated
 
             # Update texture conversion counter at state level if this is a texture conversion
-            if hasattr(parsed.file_progress, '_texture_counter'):
+            if parsed.file_progress._texture_counter is not None:
                 tex_current, tex_total = parsed.file_progress._texture_counter
                 self.state.texture_conversion_current = tex_current
                 self.state.texture_conversion_total = tex_total
                 updated = True
 
             # Update BSA building counter at state level if this is a BSA building operation
-            if hasattr(parsed.file_progress, '_bsa_counter'):
+            if parsed.file_progress._bsa_counter is not None:
                 bsa_current, bsa_total = parsed.file_progress._bsa_counter
                 self.state.bsa_building_current = bsa_current
                 self.state.bsa_building_total = bsa_total
@@ -929,11 +975,7 @@ class ProgressStateManager:
             self._augment_file_metrics(parsed.file_progress)
             # Don't add files that are already at 100% unless they're being updated
             # This prevents re-adding completed files
-            existing_file = None
-            for f in self.state.active_files:
-                if f.filename == parsed.file_progress.filename:
-                    existing_file = f
-                    break
+            existing_file = self.state.get_file(parsed.file_progress.filename)
             
             # Don't add files that are already at 100% when first detected (downloads that already exist)
             # This prevents showing 1600 files instantly at 100% in the activity window
@@ -946,11 +988,11 @@ class ProgressStateManager:
                 # File reached 100% that we were already tracking - show completion briefly
                 parsed.file_progress.percent = 100.0
                 parsed.file_progress.last_update = time.time()  # Set timestamp to NOW for minimum display
-                self.state.add_file(parsed.file_progress)
+                self._add_file(parsed.file_progress)
                 updated = True
             else:
                 # File still in progress, add/update it normally
-                self.state.add_file(parsed.file_progress)
+                self._add_file(parsed.file_progress)
                 updated = True
         elif parsed.data_info:
             # CRITICAL: Remove .wabbajack entries as soon as archive download phase starts
@@ -979,21 +1021,21 @@ class ProgressStateManager:
                 parsed.completed_filename = None
 
         if parsed.completed_filename:
-            # Try to find existing file in the list
+            # Try to find existing file: exact key first, then by filename without path
             found_existing = False
-            for file_prog in self.state.active_files:
-                # Match by exact filename or by filename without path
-                filename_match = (
-                    file_prog.filename == parsed.completed_filename or
-                    file_prog.filename.endswith(parsed.completed_filename) or
-                    parsed.completed_filename in file_prog.filename
-                )
-                if filename_match:
-                    file_prog.percent = 100.0
-                    file_prog.last_update = time.time()  # Update timestamp for staleness check
-                    updated = True
-                    found_existing = True
-                    break
+            match = self.state.get_file(parsed.completed_filename)
+            if match is None:
+                for file_prog in self.state.active_files:
+                    if (file_prog.filename.endswith(parsed.completed_filename) or
+                            parsed.completed_filename in file_prog.filename):
+                        match = file_prog
+                        break
+            if match is not None:
+                match.percent = 100.0
+                match.last_update = time.time()  # Update timestamp for staleness check
+                self.state.touch_file(match)
+                updated = True
+                found_existing = True
             
             # If file wasn't in the list (completed too fast to get a progress line),
             # create a FileProgress entry so it appears briefly
@@ -1014,7 +1056,7 @@ class ProgressStateManager:
                     # speed defaults to -1.0 (not provided)
                 )
                 completed_file.last_update = time.time()
-                self.state.add_file(completed_file)
+                self._add_file(completed_file)
                 updated = True
         
         # Update speed information
@@ -1048,6 +1090,7 @@ class ProgressStateManager:
         self._file_history = {}
         self._wabbajack_entry_name = None
         self._synthetic_flag = "_synthetic_wabbajack"
+        self._wabbajack_names = set()
         self._has_real_wabbajack = False
 
     def _augment_file_metrics(self, file_progress: FileProgress):
@@ -1125,6 +1168,7 @@ class ProgressStateManager:
                     synthetic_entry.total_size = total_bytes
                     synthetic_entry.last_update = time.time()
                     self._augment_file_metrics(synthetic_entry)
+                    self.state.touch_file(synthetic_entry)
                     return True
                 else:
                     # It's real - don't create synthetic
@@ -1163,6 +1207,7 @@ class ProgressStateManager:
             synthetic_entry.total_size = total_bytes
             synthetic_entry.last_update = time.time()
             self._augment_file_metrics(synthetic_entry)
+            self.state.touch_file(synthetic_entry)
         else:
             special_file = FileProgress(
                 filename=entry_name,
@@ -1174,7 +1219,7 @@ class ProgressStateManager:
             special_file.last_update = time.time()
             setattr(special_file, self._synthetic_flag, True)
             self._augment_file_metrics(special_file)
-            self.state.add_file(special_file)
+            self._add_file(special_file)
         return True
 
     def _has_real_download_activity(self) -> bool:
@@ -1186,31 +1231,34 @@ class ProgressStateManager:
                 return True
         return False
 
+    def _add_file(self, file_progress: FileProgress):
+        """Add/update an active file, remembering .wabbajack entries for later removal."""
+        if 'wabbajack' in file_progress.filename.lower():
+            self._wabbajack_names.add(file_progress.filename)
+        self.state.add_file(file_progress)
+
     def _remove_synthetic_wabbajack(self):
         """Remove any synthetic .wabbajack entries once real files appear."""
-        remaining = []
-        removed = False
-        for fp in self.state.active_files:
-            if getattr(fp, self._synthetic_flag, False):
-                removed = True
-                self._file_history.pop(fp.filename, None)
-                continue
-            remaining.append(fp)
-        if removed:
-            self.state.active_files = remaining
+        # Synthetic entries are always named after the .wabbajack file, so only
+        # the tracked wabbajack names need checking
+        for name in list(self._wabbajack_names):
+            fp = self.state.get_file(name)
+            if fp is not None and getattr(fp, self._synthetic_flag, False):
+                self.state.remove_file(name)
+                self._file_history.pop(name, None)
+                self._wabbajack_names.discard(name)
     
     def _remove_all_wabbajack_entries(self):
         """Remove ALL .wabbajack entries (synthetic and real) when archive download phase starts."""
-        remaining = []
+        if not self._wabbajack_names:
+            return
         removed = False
-        for fp in self.state.active_files:
-            if fp.filename.lower().endswith('.wabbajack') or 'wabbajack' in fp.filename.lower():
+        for name in self._wabbajack_names:
+            if self.state.remove_file(name) is not None:
                 removed = True
-                self._file_history.pop(fp.filename, None)
-                continue
-            remaining.append(fp)
+                self._file_history.pop(name, None)
+        self._wabbajack_names.clear()
         if removed:
-            self.state.active_files = remaining
             # Also clear the wabbajack entry name to prevent re-adding
             self._wabbajack_entry_name = None
 
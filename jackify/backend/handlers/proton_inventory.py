@@ -0,0 +1,255 @@
+"""
+Proton Inventory
+
+Persistent record of the Proton builds (and other compatibility tools) found
+in ``steamapps/common`` and ``compatibilitytools.d`` directories, stored as
+``proton_inventory.json`` in the Jackify data directory.
+
+For each tool it keeps the path, the contents of its ``version`` file, where
+its ``wine`` binary lives and the tool's mtime. A scan directory is only
+listed again when its own mtime changed (a tool was added, removed or
+renamed), and a tool is only re-probed when its mtime changed (Steam
+updated it in place) or no ``wine`` binary was found in it last time. Everything else comes from the stored record, so
+settings dialogs and workflow start-up don't walk Proton trees.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from jackify.shared.paths import get_jackify_data_dir
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_VERSION = 1
+INVENTORY_FILENAME = "proton_inventory.json"
+# Standard layouts: GE-Proton and current Valve Proton, then older Valve builds
+WINE_BIN_CANDIDATES = (("files", "bin", "wine"), ("dist", "bin", "wine"))
+MAX_WINE_SEARCH_DEPTH = 5
+
+PathLike = Union[str, Path]
+
+
+def find_wine_binary(proton_dir: PathLike) -> Optional[str]:
+    """
+    Location of the ``wine`` executable inside a Proton directory.
+
+    Checks the standard layouts first, then searches up to
+    ``MAX_WINE_SEARCH_DEPTH`` levels deep for builds with a different structure.
+    """
+    proton_dir = str(proton_dir)
+    for parts in WINE_BIN_CANDIDATES:
+        candidate = os.path.join(proton_dir, *parts)
+        if os.path.isfile(candidate):
+            return candidate
+    if not os.path.isdir(proton_dir):
+        return None
+
+    base_depth = proton_dir.rstrip(os.sep).count(os.sep)
+    try:
+        for root, dirs, files in os.walk(proton_dir, followlinks=False):
+            if root.count(os.sep) - base_depth >= MAX_WINE_SEARCH_DEPTH:
+                dirs.clear()
+            if "wine" in files:
+                wine_path = os.path.join(root, "wine")
+                if os.path.isfile(wine_path) and os.access(wine_path, os.X_OK):
+                    return wine_path
+    except OSError as e:
+        logger.debug(f"Error during wine search in {proton_dir}: {e}")
+    return None
+
+
+def _read_version(tool_dir: str) -> Optional[str]:
+    try:
+        with open(os.path.join(tool_dir, "version"), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _tool_mtime(tool_dir: str) -> Optional[int]:
+    """Latest mtime of the tool directory and its ``version`` file (updates rewrite the latter)."""
+    try:
+        mtime = os.stat(tool_dir).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        mtime = max(mtime, os.stat(os.path.join(tool_dir, "version")).st_mtime_ns)
+    except OSError:
+        pass
+    return mtime
+
+
+def _dir_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ProtonInventory:
+    """mtime-validated, persisted index of compatibility tools."""
+
+    def __init__(self, path: Optional[PathLike] = None):
+        self._fixed_path = Path(path) if path else None
+        self.path: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        # scan dir -> {"mtime": int, "tools": [tool path, ...]}
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        # tool path -> {"name", "version", "wine_bin", "mtime"}
+        self._tools: Dict[str, Dict[str, Any]] = {}
+
+    def _inventory_path(self) -> Path:
+        # Resolved outside the lock: on first run ConfigHandler() auto-detects
+        # Proton, which comes back into this inventory
+        return self._fixed_path or get_jackify_data_dir() / INVENTORY_FILENAME
+
+    def _load(self, path: Path):
+        if self._loaded and path == self.path:
+            return
+        self.path = path
+        self._loaded = True
+        self._dirs = {}
+        self._tools = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable Proton inventory {self.path}: {e}")
+            return
+        if data.get("version") != INVENTORY_VERSION:
+            return
+        self._dirs = data.get("dirs") or {}
+        self._tools = data.get("tools") or {}
+
+    def _save(self):
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INVENTORY_VERSION, "dirs": self._dirs, "tools": self._tools},
+                          f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write Proton inventory {self.path}: {e}")
+
+    def _tool_record(self, tool_dir: str) -> Optional[Dict[str, Any]]:
+        """Stored record for ``tool_dir``, re-probed if the tool changed on disk."""
+        mtime = _tool_mtime(tool_dir)
+        if mtime is None:
+            if self._tools.pop(tool_dir, None) is not None:
+                self._dirty = True
+            return None
+        stored = self._tools.get(tool_dir)
+        # A tool without a wine binary yet (e.g. still being extracted into
+        # files/, which doesn't touch the tool's own mtime) is probed every time
+        if stored is not None and stored.get("mtime") == mtime and stored.get("wine_bin"):
+            return stored
+        record = {
+            "name": os.path.basename(tool_dir),
+            "version": _read_version(tool_dir),
+            "wine_bin": find_wine_binary(tool_dir),
+            "mtime": mtime,
+        }
+        if record != stored:
+            logger.debug(f"Probed compatibility tool {tool_dir}: wine={record['wine_bin']}")
+            self._tools[tool_dir] = record
+            self._dirty = True
+        return record
+
+    def _scan_dir(self, scan_dir: str, require_proton_script: bool) -> List[str]:
+        """Tool directories inside ``scan_dir``, listing it only when its mtime changed."""
+        mtime = _dir_mtime(scan_dir)
+        entry = self._dirs.get(scan_dir)
+        if mtime is None:
+            if entry is not None:
+                del self._dirs[scan_dir]
+                self._dirty = True
+            return []
+        if entry is not None and entry.get("mtime") == mtime:
+            return entry["tools"]
+
+        logger.debug(f"Rescanning compatibility tool directory {scan_dir}")
+        tools = []
+        try:
+            with os.scandir(scan_dir) as entries:
+                for child in entries:
+                    if not child.is_dir():
+                        continue
+                    # steamapps/common also holds games; only Proton builds ship a 'proton' script
+                    if require_proton_script and not os.path.isfile(os.path.join(child.path, "proton")):
+                        continue
+                    tools.append(child.path)
+        except OSError as e:
+            logger.warning(f"Error scanning {scan_dir}: {e}")
+        tools.sort()
+        self._dirs[scan_dir] = {"mtime": mtime, "tools": tools}
+        self._dirty = True
+        return tools
+
+    def tools(self, common_dirs: Iterable[PathLike], compat_dirs: Iterable[PathLike]) -> List[Dict[str, Any]]:
+        """
+        Every tool found in the given directories, in directory order.
+
+        Each entry has ``name``, ``path`` (Path), ``wine_bin`` (Path or None),
+        ``version`` (contents of the ``version`` file), ``source_dir`` (Path)
+        and ``kind`` (``'steam'`` for steamapps/common, ``'compat'`` for
+        compatibilitytools.d).
+        """
+        found = []
+        seen = set()
+        path = self._inventory_path()
+        with self._lock:
+            self._load(path)
+            for kind, dirs in (("steam", common_dirs), ("compat", compat_dirs)):
+                for scan_dir in dirs:
+                    scan_dir = str(scan_dir)
+                    if scan_dir in seen:
+                        continue
+                    seen.add(scan_dir)
+                    for tool_dir in self._scan_dir(scan_dir, require_proton_script=(kind == "steam")):
+                        record = self._tool_record(tool_dir)
+                        if record is None:
+                            continue
+                        found.append({
+                            "name": record["name"],
+                            "path": Path(tool_dir),
+                            "wine_bin": Path(record["wine_bin"]) if record["wine_bin"] else None,
+                            "version": record["version"],
+                            "source_dir": Path(scan_dir),
+                            "kind": kind,
+                        })
+            self._save()
+        return found
+
+    def wine_binary(self, proton_dir: PathLike) -> Optional[str]:
+        """Cached :func:`find_wine_binary` for any Proton directory."""
+        path = self._inventory_path()
+        with self._lock:
+            self._load(path)
+            record = self._tool_record(os.path.abspath(os.path.expanduser(str(proton_dir))))
+            self._save()
+        return record["wine_bin"] if record else None
+
+
+_inventory: Optional[ProtonInventory] = None
+_inventory_lock = threading.Lock()
+
+
+def get_proton_inventory() -> ProtonInventory:
+    """Process-wide inventory backed by the Jackify data directory."""
+    global _inventory
+    with _inventory_lock:
+        if _inventory is None:
+            _inventory = ProtonInventory()
+        return _inventory
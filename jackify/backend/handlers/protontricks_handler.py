@@ -13,10 +13,25 @@ import shutil
 import logging
 from typing import Dict, Optional, List
 import sys
+import threading
+import time
+
+from .wine_registry import RegistryEdits
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+_UNSET = object()
+
+# `protontricks -l` output per protontricks type, reused while shortcuts.vdf,
+# STEAM_DIR and the compatdata directory are unchanged
+_shortcut_list_cache: Dict[str, tuple] = {}
+# A compatdata/<appid> directory this recent without pfx/system.reg is a
+# prefix Proton is still creating
+PREFIX_CREATION_WINDOW = 120
+_LISTED_SHORTCUT = re.compile(r"Non-Steam shortcut:\s*(.*?)\s*\((\d+)\)\s*$")
+_shortcut_list_lock = threading.Lock()
+
 
 class ProtontricksHandler:
     """
@@ -34,6 +49,11 @@ class ProtontricksHandler:
         self.steamdeck = steamdeck # Store steamdeck status
         self._native_steam_service = None
         self.use_native_operations = True  # Enable native Steam operations by default
+        # Per-handler results reused by every protontricks call
+        self._steam_dir = _UNSET
+        self._base_env = None
+        self._cabextract_dir = None
+        self._debug_mode = None
 
     def _get_steam_dir_from_libraryfolders(self) -> Optional[Path]:
         """
@@ -44,24 +64,13 @@ class ProtontricksHandler:
             Path to Steam installation directory (the one with config/, steamapps/, etc.) or None
         """
         from ..handlers.path_handler import PathHandler
+        from .steam_library_index import get_steam_library_index
         
-        # Check all possible libraryfolders.vdf locations
-        vdf_paths = [
-            Path.home() / ".steam/steam/config/libraryfolders.vdf",
-            Path.home() / ".local/share/Steam/config/libraryfolders.vdf",
-            Path.home() / ".steam/root/config/libraryfolders.vdf",
-            Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/config/libraryfolders.vdf",  # Flatpak
-            Path.home() / ".var/app/com.valvesoftware.Steam/data/Steam/config/libraryfolders.vdf",  # Flatpak alternative
-        ]
-        
-        for vdf_path in vdf_paths:
-            if vdf_path.is_file():
-                # The Steam installation directory is the parent of the config directory
-                steam_dir = vdf_path.parent.parent
-                # Verify it has steamapps directory (required by protontricks)
-                if (steam_dir / "steamapps").exists():
-                    logger.debug(f"Determined STEAM_DIR from libraryfolders.vdf: {steam_dir}")
-                    return steam_dir
+        # Steam installations with a libraryfolders.vdf and steamapps/ (required by protontricks)
+        steam_dirs = get_steam_library_index().steam_dirs()
+        if steam_dirs:
+            logger.debug(f"Determined STEAM_DIR from libraryfolders.vdf: {steam_dirs[0]}")
+            return steam_dirs[0]
         
         # Fallback: try to get from library paths
         library_paths = PathHandler.get_all_steam_library_paths()
@@ -278,23 +287,36 @@ class ProtontricksHandler:
                 logger.error("Could not detect protontricks installation")
                 return None
 
+        # `-l` only changes when shortcuts are added or removed
+        if args == ("-l",) and not kwargs:
+            return self._list_with_cache()
+
+        env = self._get_protontricks_env(kwargs.get('env'))
+
         # Build command based on detected protontricks type
         if self.which_protontricks == 'bundled':
             # CRITICAL: Use safe Python executable to prevent AppImage recursive spawning
             from .subprocess_utils import get_safe_python_executable
             python_exe = get_safe_python_executable()
-            
-            # Use bundled wrapper script for reliable invocation
-            # The wrapper script imports cli and calls it with sys.argv
-            wrapper_script = self._get_bundled_protontricks_wrapper_path()
-            if wrapper_script and Path(wrapper_script).exists():
-                cmd = [python_exe, str(wrapper_script)]
-                cmd.extend([str(a) for a in args])
-            else:
-                # Fallback: use python -m to run protontricks CLI directly
-                # This avoids importing protontricks.__init__ which imports gui.py which needs Pillow
-                cmd = [python_exe, "-m", "protontricks.cli.main"]
-                cmd.extend([str(a) for a in args])
+
+            # Run in the persistent worker, which has protontricks imported already
+            from .protontricks_worker import get_protontricks_worker
+            worker = get_protontricks_worker(python_exe)
+            try:
+                result = worker.run(args, **{'stdout': subprocess.PIPE, 'stderr': subprocess.PIPE,
+                                             'text': True, **kwargs, 'env': env})
+            except subprocess.TimeoutExpired:
+                raise
+            except Exception as e:
+                logger.warning(f"Protontricks worker failed, running a new process instead: {e}")
+                result = None
+            if result is not None:
+                return result
+
+            # Fallback: use python -m to run protontricks CLI directly
+            # This avoids importing protontricks.__init__ which imports gui.py which needs Pillow
+            cmd = [python_exe, "-m", "protontricks.cli.main"]
+            cmd.extend([str(a) for a in args])
         elif self.which_protontricks == 'flatpak':
             cmd = ["flatpak", "run", "com.github.Matoking.protontricks"]
             cmd.extend(args)
@@ -309,72 +331,159 @@ class ProtontricksHandler:
             'text': True,
             **kwargs # Allow overriding defaults (like stderr=DEVNULL)
         }
-        
-        # Handle environment: if env was passed in kwargs, merge it with our clean env
-        # Otherwise create a clean env from scratch
-        if 'env' in kwargs and kwargs['env']:
-            # Merge passed env with our clean env (our values take precedence)
-            env = self._get_clean_subprocess_env()
-            env.update(kwargs['env'])  # Merge passed env, but our clean env is base
-            # Re-apply our critical settings after merge to ensure they're set
-        else:
+        run_kwargs['env'] = env
+        try:
+            return subprocess.run(cmd, **run_kwargs)
+        except Exception as e:
+            logger.error(f"Error running protontricks: {e}")
+            return None
+
+    def _get_protontricks_env(self, extra_env=None):
+        """
+        Environment for a protontricks call.
+
+        The clean base environment, STEAM_DIR, bundled tool paths and the debug
+        setting are worked out once per handler; each call gets a copy.
+        """
+        if self._base_env is None:
             # Bundled-runtime fix: Use cleaned environment for all protontricks calls
             env = self._get_clean_subprocess_env()
-        
-        # Suppress Wine debug output
-        env['WINEDEBUG'] = '-all'
-        
-        # CRITICAL: Set STEAM_DIR based on libraryfolders.vdf to prevent user prompts
-        steam_dir = self._get_steam_dir_from_libraryfolders()
-        if steam_dir:
-            env['STEAM_DIR'] = str(steam_dir)
-            logger.debug(f"Set STEAM_DIR for protontricks: {steam_dir}")
-        else:
-            logger.warning("Could not determine STEAM_DIR from libraryfolders.vdf - protontricks may prompt user")
 
-        # CRITICAL: Only set bundled winetricks for NATIVE protontricks
-        # Flatpak protontricks runs in a sandbox and CANNOT access AppImage FUSE mounts (/tmp/.mount_*)
-        # Flatpak protontricks has its own winetricks bundled inside the flatpak
-        if self.which_protontricks == 'native':
-            winetricks_path = self._get_bundled_winetricks_path()
-            if winetricks_path:
-                env['WINETRICKS'] = str(winetricks_path)
-                logger.debug(f"Set WINETRICKS for native protontricks: {winetricks_path}")
-            else:
-                logger.warning("Bundled winetricks not found - native protontricks will use system winetricks")
+            # Suppress Wine debug output
+            env['WINEDEBUG'] = '-all'
 
-            cabextract_path = self._get_bundled_cabextract_path()
-            if cabextract_path:
-                cabextract_dir = str(cabextract_path.parent)
-                current_path = env.get('PATH', '')
-                env['PATH'] = f"{cabextract_dir}{os.pathsep}{current_path}" if current_path else cabextract_dir
-                logger.debug(f"Added bundled cabextract to PATH for native protontricks: {cabextract_dir}")
+            # CRITICAL: Set STEAM_DIR based on libraryfolders.vdf to prevent user prompts
+            if self._steam_dir is _UNSET:
+                self._steam_dir = self._get_steam_dir_from_libraryfolders()
+            if self._steam_dir:
+                env['STEAM_DIR'] = str(self._steam_dir)
+                logger.debug(f"Set STEAM_DIR for protontricks: {self._steam_dir}")
             else:
-                logger.warning("Bundled cabextract not found - native protontricks will use system cabextract")
-        else:
-            # Flatpak protontricks - DO NOT set bundled paths
-            logger.debug(f"Using {self.which_protontricks} protontricks - it has its own winetricks (cannot access AppImage mounts)")
-        
-        # CRITICAL: Suppress winetricks verbose output when not in debug mode
-        # WINETRICKS_SUPER_QUIET suppresses "Executing..." messages from winetricks
-        from ..handlers.config_handler import ConfigHandler
-        config_handler = ConfigHandler()
-        debug_mode = config_handler.get('debug_mode', False)
-        if not debug_mode:
-            env['WINETRICKS_SUPER_QUIET'] = '1'
-            logger.debug("Set WINETRICKS_SUPER_QUIET=1 to suppress winetricks verbose output")
-        else:
-            logger.debug("Debug mode enabled - winetricks verbose output will be shown")
-        
-        # Note: No need to modify LD_LIBRARY_PATH for Wine/Proton as it's a system dependency
-        # Wine/Proton finds its own libraries through the system's library search paths
+                logger.warning("Could not determine STEAM_DIR from libraryfolders.vdf - protontricks may prompt user")
+
+            # CRITICAL: Only set bundled winetricks for NATIVE protontricks
+            # Flatpak protontricks runs in a sandbox and CANNOT access AppImage FUSE mounts (/tmp/.mount_*)
+            # Flatpak protontricks has its own winetricks bundled inside the flatpak
+            if self.which_protontricks == 'native':
+                winetricks_path = self._get_bundled_winetricks_path()
+                if winetricks_path:
+                    env['WINETRICKS'] = str(winetricks_path)
+                    logger.debug(f"Set WINETRICKS for native protontricks: {winetricks_path}")
+                else:
+                    logger.warning("Bundled winetricks not found - native protontricks will use system winetricks")
+
+                cabextract_path = self._get_bundled_cabextract_path()
+                if cabextract_path:
+                    cabextract_dir = self._cabextract_dir = str(cabextract_path.parent)
+                    current_path = env.get('PATH', '')
+                    env['PATH'] = f"{cabextract_dir}{os.pathsep}{current_path}" if current_path else cabextract_dir
+                    logger.debug(f"Added bundled cabextract to PATH for native protontricks: {cabextract_dir}")
+                else:
+                    logger.warning("Bundled cabextract not found - native protontricks will use system cabextract")
+            else:
+                # Flatpak protontricks - DO NOT set bundled paths
+                logger.debug(f"Using {self.which_protontricks} protontricks - it has its own winetricks (cannot access AppImage mounts)")
+
+            # CRITICAL: Suppress winetricks verbose output when not in debug mode
+            # WINETRICKS_SUPER_QUIET suppresses "Executing..." messages from winetricks
+            if self._debug_mode is None:
+                from ..handlers.config_handler import ConfigHandler
+                self._debug_mode = bool(ConfigHandler().get('debug_mode', False))
+            if not self._debug_mode:
+                env['WINETRICKS_SUPER_QUIET'] = '1'
+                logger.debug("Set WINETRICKS_SUPER_QUIET=1 to suppress winetricks verbose output")
+            else:
+                logger.debug("Debug mode enabled - winetricks verbose output will be shown")
+
+            # Note: No need to modify LD_LIBRARY_PATH for Wine/Proton as it's a system dependency
+            # Wine/Proton finds its own libraries through the system's library search paths
+            self._base_env = env
+
+        env = dict(self._base_env)
+        if extra_env:
+            # Merge passed env, then re-apply our critical settings
+            env.update(extra_env)
+            for key in ('WINEDEBUG', 'STEAM_DIR', 'WINETRICKS', 'WINETRICKS_SUPER_QUIET'):
+                if key in self._base_env:
+                    env[key] = self._base_env[key]
+            if self._cabextract_dir and extra_env.get('PATH'):
+                env['PATH'] = f"{self._cabextract_dir}{os.pathsep}{extra_env['PATH']}"
+        return env
 
-        run_kwargs['env'] = env
+    def list_shortcuts_output(self, expect=None):
+        """
+        `protontricks -l`, reused until the shortcuts or prefixes change.
+
+        Args:
+            expect: Shortcut name or AppID the caller is looking for. If a
+                cached listing doesn't contain it, protontricks is run again.
+        """
+        if self.which_protontricks is None and not self.detect_protontricks():
+            logger.error("Could not detect protontricks installation")
+            return None
+        return self._list_with_cache(expect)
+
+    def _list_cache_state(self):
+        """What `-l` output depends on, or None if it can't be worked out."""
+        from .path_handler import PathHandler
+        shortcuts_path = PathHandler()._find_shortcuts_vdf()
+        if self._steam_dir is _UNSET:
+            self._steam_dir = self._get_steam_dir_from_libraryfolders()
+        if not shortcuts_path or not self._steam_dir:
+            return None
+        compatdata = Path(self._steam_dir) / "steamapps" / "compatdata"
         try:
-            return subprocess.run(cmd, **run_kwargs)
-        except Exception as e:
-            logger.error(f"Error running protontricks: {e}")
+            st = os.stat(shortcuts_path)
+            compatdata_mtime = compatdata.stat().st_mtime_ns if compatdata.is_dir() else None
+        except OSError:
             return None
+        return (shortcuts_path, st.st_mtime_ns, st.st_size, str(self._steam_dir), compatdata_mtime)
+
+    def _prefix_creation_in_progress(self) -> bool:
+        """True if a recently created compatdata prefix isn't populated yet."""
+        if not self._steam_dir:
+            return False
+        compatdata = Path(self._steam_dir) / "steamapps" / "compatdata"
+        cutoff = time.time() - PREFIX_CREATION_WINDOW
+        try:
+            with os.scandir(compatdata) as entries:
+                for entry in entries:
+                    if not entry.is_dir() or entry.stat().st_mtime < cutoff:
+                        continue
+                    if not os.path.exists(os.path.join(entry.path, "pfx", "system.reg")):
+                        return True
+        except OSError:
+            return False
+        return False
+
+    @staticmethod
+    def _listing_contains(result, expect) -> bool:
+        wanted = str(expect).strip().lower()
+        for line in (result.stdout or "").splitlines():
+            match = _LISTED_SHORTCUT.search(line)
+            if match and wanted in (match.group(1).strip().lower(), match.group(2)):
+                return True
+        return False
+
+    def _list_with_cache(self, expect=None):
+        state = self._list_cache_state()
+        key = str(self.which_protontricks)
+        with _shortcut_list_lock:
+            cached = _shortcut_list_cache.get(key)
+            if state is not None and cached and cached[0] == state:
+                if expect is None or self._listing_contains(cached[1], expect):
+                    logger.debug("Using cached protontricks -l output (shortcuts and prefixes unchanged)")
+                    return cached[1]
+                logger.debug(f"'{expect}' not in cached protontricks -l output, listing again")
+                del _shortcut_list_cache[key]
+        result = self.run_protontricks("-l", stdout=subprocess.PIPE, errors='replace')
+        if result is not None and result.returncode == 0 and state is not None:
+            if self._prefix_creation_in_progress():
+                logger.debug("A Wine prefix is still being created; not caching protontricks -l output")
+            else:
+                with _shortcut_list_lock:
+                    _shortcut_list_cache[key] = (state, result)
+        return result
 
     def set_protontricks_permissions(self, modlist_dir, steamdeck=False):
         """
@@ -470,11 +579,15 @@ class ProtontricksHandler:
         # ... (old implementation with filtering) ...
     
     # Renamed from list_non_steam_games for clarity and purpose
-    def list_non_steam_shortcuts(self) -> Dict[str, str]:
+    def list_non_steam_shortcuts(self, expect=None) -> Dict[str, str]:
         """List ALL non-Steam shortcuts.
 
         Uses native VDF parsing when enabled, falls back to protontricks -l parsing.
 
+        Args:
+            expect: Shortcut name or AppID the caller is looking for; a cached
+                protontricks listing without it is refreshed.
+
         Returns:
             A dictionary mapping the shortcut name (AppName) to its AppID.
             Returns an empty dictionary if none are found or an error occurs.
@@ -498,21 +611,18 @@ class ProtontricksHandler:
             self.logger.info(f"Protontricks detection successful: {self.which_protontricks}")
         # --- End detection check ---
         try:
-            cmd = [] # Initialize cmd list
-            if self.which_protontricks == 'flatpak':
-                cmd = ["flatpak", "run", "com.github.Matoking.protontricks", "-l"]
-            elif self.protontricks_path:
-                cmd = [self.protontricks_path, "-l"]
-            else:
-                logger.error("Protontricks path not determined, cannot list shortcuts.")
+            result = self._list_with_cache(expect)
+            if result is None:
+                logger.error("Failed to run protontricks -l")
                 return {}
-            self.logger.debug(f"Running command: {' '.join(cmd)}")
-            # Bundled-runtime fix: Use cleaned environment
-            env = self._get_clean_subprocess_env()
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8', errors='ignore', env=env)
+            if result.returncode != 0:
+                # Log error but don't necessarily stop; might have partial output
+                logger.error(f"Error running protontricks -l (Exit code: {result.returncode})")
+                logger.error(f"Stderr (truncated): {result.stderr[:500] if result.stderr else ''}")
+                # Return what we have, might be useful
             # Regex to capture name and AppID
             pattern = re.compile(r"Non-Steam shortcut:\s+(.+)\s+\((\d+)\)")
-            for line in result.stdout.splitlines():
+            for line in (result.stdout or "").splitlines():
                 line = line.strip()
                 match = pattern.match(line)
                 if match:
@@ -522,14 +632,6 @@ class ProtontricksHandler:
                     logger.debug(f"Found non-Steam shortcut: '{app_name}' with AppID {app_id}")
             if not non_steam_shortcuts:
                 logger.warning("No non-Steam shortcuts found in protontricks output.")
-        except FileNotFoundError:
-             logger.error(f"Protontricks command not found. Path: {cmd[0] if cmd else 'N/A'}")
-             return {}
-        except subprocess.CalledProcessError as e:
-            # Log error but don't necessarily stop; might have partial output
-            logger.error(f"Error running protontricks -l (Exit code: {e.returncode}): {e}")
-            logger.error(f"Stderr (truncated): {e.stderr[:500] if e.stderr else ''}")
-            # Return what we have, might be useful
         except Exception as e:
             logger.error(f"Unexpected error listing non-Steam shortcuts: {e}", exc_info=True)
             return {}
@@ -550,6 +652,18 @@ class ProtontricksHandler:
         logger.info("Enabling visibility of (.)dot files...")
         
         try:
+            # Read/write user.reg directly when possible; no Wine process needed
+            prefix_path = self.get_wine_prefix_path(appid)
+            if prefix_path:
+                edits = RegistryEdits(prefix_path).show_dotfiles()
+                if edits.verify():
+                    logger.info("DotFiles already enabled via registry... skipping")
+                    return True
+                if edits.apply_offline() and edits.verify():
+                    logger.info("Dotfiles enabled directly in user.reg")
+                    return True
+                logger.debug("Prefix registry is in use, falling back to wine reg via protontricks")
+
             # Check current setting
             result = self.run_protontricks(
                 "-c", "WINEDEBUG=-all wine reg query \"HKEY_CURRENT_USER\\Software\\Wine\" /v ShowDotFiles", 
@@ -590,7 +704,6 @@ class ProtontricksHandler:
             # Method 2: Create user.reg entry (Backup Method)
             # This is useful if registry commands fail but direct file access works
             logger.debug("Ensuring user.reg has correct entry...")
-            prefix_path = self.get_wine_prefix_path(appid) 
             if prefix_path:
                 user_reg_path = Path(prefix_path) / "user.reg" 
                 try:
@@ -885,6 +998,8 @@ class ProtontricksHandler:
         self._ensure_flatpak_cache_access(jackify_cache_dir)
 
         env['WINETRICKS_CACHE'] = str(jackify_cache_dir)
+        # winetricks itself reads W_CACHE
+        env['W_CACHE'] = str(jackify_cache_dir)
         self.logger.info(f"Using winetricks cache: {jackify_cache_dir}")
         if specific_components is not None:
             components_to_install = specific_components
@@ -0,0 +1,227 @@
+"""
+Protontricks Worker
+
+Runs bundled protontricks commands in one long-lived Python process instead
+of starting a new interpreter (and re-importing protontricks) for every
+call. The worker imports ``protontricks.cli.main`` once, then executes each
+request with the caller's environment, sending the command's stdout/stderr
+to temporary files so output from winetricks and Wine child processes is
+captured exactly as ``subprocess.run`` would capture it.
+
+If the worker can't start (protontricks not importable by that Python) or
+dies, :meth:`ProtontricksWorker.run` returns None and the caller runs the
+command as a normal subprocess.
+"""
+
+import atexit
+import json
+import logging
+import os
+import select
+import subprocess
+import tempfile
+import threading
+from typing import Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the worker to import protontricks
+STARTUP_TIMEOUT = 60
+
+# Executed with ``python -c`` so it only needs protontricks to be importable,
+# exactly like ``python -m protontricks.cli.main``.
+_WORKER_SOURCE = r'''
+import json, logging, os, sys, traceback
+proto_in = os.fdopen(os.dup(0), "r")
+proto_out = os.fdopen(os.dup(1), "w")
+devnull = os.open(os.devnull, os.O_RDWR)
+os.dup2(devnull, 0)
+os.dup2(devnull, 1)
+try:
+    from protontricks.cli.main import main
+except Exception as e:
+    proto_out.write(json.dumps({"ready": False, "error": repr(e)}) + "\n")
+    proto_out.flush()
+    sys.exit(1)
+proto_out.write(json.dumps({"ready": True}) + "\n")
+proto_out.flush()
+saved = {fd: os.dup(fd) for fd in (1, 2)}
+for line in proto_in:
+    request = json.loads(line)
+    os.environ.clear()
+    os.environ.update(request["env"])
+    targets = {1: request["stdout"], 2: request["stderr"]}
+    for fd, path in targets.items():
+        sys.stdout.flush(); sys.stderr.flush()
+        target = os.open(path, os.O_WRONLY | os.O_TRUNC) if path else devnull
+        os.dup2(target, fd)
+        if target != devnull:
+            os.close(target)
+    returncode = 0
+    try:
+        result = main(request["args"])
+        if isinstance(result, int):
+            returncode = result
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        if not isinstance(e.code, (int, type(None))):
+            print(e.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+        returncode = 1
+    sys.stdout.flush(); sys.stderr.flush()
+    for fd, original in saved.items():
+        os.dup2(original, fd)
+    # protontricks adds a log handler on every run
+    logging.getLogger("protontricks").handlers.clear()
+    proto_out.write(json.dumps({"returncode": returncode}) + "\n")
+    proto_out.flush()
+'''
+
+# subprocess.run() keyword arguments the worker can honour
+_SUPPORTED_KWARGS = {"stdout", "stderr", "text", "env", "encoding", "errors", "universal_newlines", "timeout"}
+
+
+class ProtontricksWorker:
+    """A persistent interpreter with protontricks imported, serving one command at a time."""
+
+    def __init__(self, python_exe: str):
+        self.python_exe = python_exe
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self.available = True
+
+    def _start(self, env: Dict[str, str]) -> bool:
+        try:
+            self._proc = subprocess.Popen(
+                [self.python_exe, "-u", "-c", _WORKER_SOURCE],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, env=env, close_fds=True,
+            )
+        except OSError as e:
+            logger.warning(f"Could not start protontricks worker: {e}")
+            self.available = False
+            return False
+        reply = self._read_reply(STARTUP_TIMEOUT)
+        if not reply or not reply.get("ready"):
+            logger.warning(f"Protontricks worker unavailable, using one process per call: "
+                           f"{reply.get('error') if reply else 'no response'}")
+            self.close()
+            self.available = False
+            return False
+        logger.debug(f"Started protontricks worker (pid {self._proc.pid})")
+        return True
+
+    def _read_reply(self, timeout: Optional[float]) -> Optional[dict]:
+        if timeout is not None:
+            readable, _, _ = select.select([self._proc.stdout], [], [], timeout)
+            if not readable:
+                return None
+        line = self._proc.stdout.readline()
+        if not line:
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    def close(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def supports(self, kwargs: Dict) -> bool:
+        """True if a ``subprocess.run``-style call with these kwargs can go to the worker."""
+        if not self.available or not set(kwargs) <= _SUPPORTED_KWARGS:
+            return False
+        return all(kwargs.get(name, subprocess.PIPE) in (subprocess.PIPE, subprocess.DEVNULL)
+                   for name in ("stdout", "stderr"))
+
+    def run(self, args: Sequence[str], **kwargs) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run ``protontricks <args>`` in the worker, like ``subprocess.run`` would.
+
+        Returns None if the worker is unavailable, so the caller can fall back.
+        Raises ``subprocess.TimeoutExpired`` if ``timeout`` is exceeded.
+        """
+        if not self.supports(kwargs):
+            return None
+        env = dict(kwargs.get("env") or os.environ)
+        timeout = kwargs.get("timeout")
+        text = bool(kwargs.get("text") or kwargs.get("universal_newlines") or kwargs.get("encoding") or kwargs.get("errors"))
+        args = [str(a) for a in args]
+
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                if not self._start(env):
+                    return None
+            outputs = {}
+            try:
+                for name in ("stdout", "stderr"):
+                    if kwargs.get(name, subprocess.PIPE) == subprocess.PIPE:
+                        fd, outputs[name] = tempfile.mkstemp(prefix=f"jackify-protontricks-{name}-")
+                        os.close(fd)
+                request = {"args": args, "env": env,
+                           "stdout": outputs.get("stdout"), "stderr": outputs.get("stderr")}
+                try:
+                    self._proc.stdin.write(json.dumps(request) + "\n")
+                    self._proc.stdin.flush()
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Protontricks worker died ({e}), restarting on next call")
+                    self.close()
+                    return None
+                reply = self._read_reply(timeout)
+                if reply is None:
+                    timed_out = self._proc.poll() is None
+                    if self._proc is not None and timed_out:
+                        self._proc.kill()
+                    self.close()
+                    if timed_out and timeout is not None:
+                        raise subprocess.TimeoutExpired(["protontricks", *args], timeout)
+                    logger.warning("Protontricks worker exited unexpectedly, running command in a new process")
+                    return None
+                captured = {}
+                for name, path in outputs.items():
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    if text:
+                        data = data.decode(kwargs.get("encoding") or "utf-8", kwargs.get("errors") or "strict")
+                    captured[name] = data
+            finally:
+                for path in outputs.values():
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        return subprocess.CompletedProcess(["protontricks", *args], reply["returncode"],
+                                           captured.get("stdout"), captured.get("stderr"))
+
+
+_workers: Dict[str, ProtontricksWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_protontricks_worker(python_exe: str) -> ProtontricksWorker:
+    """Shared worker for ``python_exe`` (started on first use)."""
+    with _workers_lock:
+        worker = _workers.get(python_exe)
+        if worker is None:
+            worker = ProtontricksWorker(python_exe)
+            _workers[python_exe] = worker
+        return worker
+
+
+@atexit.register
+def _close_workers():
+    with _workers_lock:
+        for worker in _workers.values():
+            worker.close()
@@ -7,13 +7,13 @@ Handles setting resolution in various INI files
 
 import os
 import re
-import glob
 import logging
 import subprocess
 from pathlib import Path
 from typing import Optional, List, Dict
 # Import colors from the new central location
 from .ui_colors import COLOR_PROMPT, COLOR_RESET, COLOR_ERROR, COLOR_INFO
+from .modlist_tree_index import get_modlist_tree_index
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -148,8 +148,64 @@ class ResolutionHandler:
             # Fallback to a common list if xrandr is not available or fails
             return ["1280x720", "1280x800", "1920x1080", "1920x1200", "2560x1440"]
             
+    # Game-specific prefs files that carry iSize W/H
+    PREFS_FILENAMES = {
+        "Skyrim Special Edition": ["skyrimprefs.ini"],
+        "Fallout 4": ["Fallout4Prefs.ini"],
+        "Fallout New Vegas": ["falloutprefs.ini"],
+        "Oblivion": ["Oblivion.ini"],
+    }
+
     @staticmethod
-    def update_ini_resolution(modlist_dir: str, game_var: str, set_res: str, vanilla_game_dir: str = None) -> bool:
+    def find_resolution_ini_files(modlist_dir: str, game_var: str,
+                                  vanilla_game_dir: str = None) -> Optional[Dict[str, List[Path]]]:
+        """
+        Finds the INI files update_ini_resolution would edit.
+
+        Args:
+            modlist_dir (str): Path to the modlist directory.
+            game_var (str): The game identifier (e.g., "Skyrim Special Edition", "Fallout 4").
+            vanilla_game_dir (str): Optional path to vanilla game directory for fallback.
+
+        Returns:
+            dict: {"sse_tweaks": [...], "highfps": [...], "prefs": [...]}, or None if
+            resolution setting is not implemented for the game.
+        """
+        prefs_filenames = ResolutionHandler.PREFS_FILENAMES.get(game_var)
+        if prefs_filenames is None:
+            return None
+
+        # One shared scan of the modlist answers every filename lookup below
+        tree_index = get_modlist_tree_index(modlist_dir)
+        ini_files: Dict[str, List[Path]] = {"sse_tweaks": [], "highfps": [], "prefs": []}
+        if game_var == "Skyrim Special Edition":
+            ini_files["sse_tweaks"] = tree_index.find("SSEDisplayTweaks.ini")
+        elif game_var == "Fallout 4":
+            ini_files["highfps"] = tree_index.find("HighFPSPhysicsFix.ini")
+
+        # Search entire modlist directory recursively for all target files
+        logger.debug(f"Searching entire modlist directory for: {prefs_filenames}")
+        for fname in prefs_filenames:
+            found_files = tree_index.find(fname)
+            ini_files["prefs"].extend(found_files)
+            if found_files:
+                logger.debug(f"Found {len(found_files)} {fname} files: {[str(f) for f in found_files]}")
+
+        if not ini_files["prefs"] and vanilla_game_dir:
+            logger.warning(f"No preference files ({prefs_filenames}) found in modlist directory.")
+            # Fallback: Try vanilla game directory if provided
+            logger.info(f"Attempting fallback to vanilla game directory: {vanilla_game_dir}")
+            vanilla_path = Path(vanilla_game_dir)
+            for fname in prefs_filenames:
+                vanilla_files = list(vanilla_path.rglob(fname))
+                ini_files["prefs"].extend(vanilla_files)
+                if vanilla_files:
+                    logger.info(f"Found {len(vanilla_files)} {fname} files in vanilla game directory")
+        return ini_files
+
+    @staticmethod
+    def update_ini_resolution(modlist_dir: str, game_var: str, set_res: str, vanilla_game_dir: str = None,
+                              ini_files: Optional[Dict[str, List[Path]]] = None) -> bool:
         """
         Updates the resolution in relevant INI files for the specified game.
 
@@ -158,6 +214,7 @@ class ResolutionHandler:
             game_var (str): The game identifier (e.g., "Skyrim Special Edition", "Fallout 4").
             set_res (str): The desired resolution (e.g., "1920x1080").
             vanilla_game_dir (str): Optional path to vanilla game directory for fallback.
+            ini_files (dict): Files from find_resolution_ini_files; searched for if not given.
 
         Returns:
             bool: True if successful or not applicable, False on error.
@@ -166,16 +223,19 @@ class ResolutionHandler:
         
         try:
             isize_w, isize_h = set_res.split('x')
-            modlist_path = Path(modlist_dir)
+            if ini_files is None:
+                ini_files = ResolutionHandler.find_resolution_ini_files(modlist_dir, game_var, vanilla_game_dir)
+            if ini_files is None:
+                logger.warning(f"Resolution setting not implemented for game: {game_var}")
+                return True # Not an error, just not applicable
             success_count = 0
             files_processed = 0
 
             # 1. Handle SSEDisplayTweaks.ini (Skyrim SE only)
             if game_var == "Skyrim Special Edition":
                 logger.debug("Processing SSEDisplayTweaks.ini...")
-                sse_tweaks_files = list(modlist_path.rglob("SSEDisplayTweaks.ini"))
-                if sse_tweaks_files:
-                     for ini_file in sse_tweaks_files:
+                if ini_files["sse_tweaks"]:
+                     for ini_file in ini_files["sse_tweaks"]:
                         files_processed += 1
                         logger.debug(f"Updating {ini_file}")
                         if ResolutionHandler._modify_sse_tweaks(ini_file, set_res):
@@ -186,9 +246,8 @@ class ResolutionHandler:
             # 1.5. Handle HighFPSPhysicsFix.ini (Fallout 4 only)
             elif game_var == "Fallout 4":
                 logger.debug("Processing HighFPSPhysicsFix.ini...")
-                highfps_files = list(modlist_path.rglob("HighFPSPhysicsFix.ini"))
-                if highfps_files:
-                     for ini_file in highfps_files:
+                if ini_files["highfps"]:
+                     for ini_file in ini_files["highfps"]:
                         files_processed += 1
                         logger.debug(f"Updating {ini_file}")
                         if ResolutionHandler._modify_highfps_physics_fix(ini_file, set_res):
@@ -197,45 +256,10 @@ class ResolutionHandler:
                     logger.debug("No HighFPSPhysicsFix.ini found, skipping.")
 
             # 2. Handle game-specific Prefs/INI files
-            prefs_filenames = []
-            if game_var == "Skyrim Special Edition":
-                prefs_filenames = ["skyrimprefs.ini"]
-            elif game_var == "Fallout 4":
-                prefs_filenames = ["Fallout4Prefs.ini"]
-            elif game_var == "Fallout New Vegas":
-                prefs_filenames = ["falloutprefs.ini"]
-            elif game_var == "Oblivion":
-                prefs_filenames = ["Oblivion.ini"]
-            else:
-                logger.warning(f"Resolution setting not implemented for game: {game_var}")
-                return True # Not an error, just not applicable
-            
-            logger.debug(f"Processing {prefs_filenames}...")
-            prefs_files_found = []
-            # Search entire modlist directory recursively for all target files
-            logger.debug(f"Searching entire modlist directory for: {prefs_filenames}")
-            for fname in prefs_filenames:
-                found_files = list(modlist_path.rglob(fname))
-                prefs_files_found.extend(found_files)
-                if found_files:
-                    logger.debug(f"Found {len(found_files)} {fname} files: {[str(f) for f in found_files]}")
-            
+            prefs_files_found = ini_files["prefs"]
             if not prefs_files_found:
-                logger.warning(f"No preference files ({prefs_filenames}) found in modlist directory.")
-                
-                # Fallback: Try vanilla game directory if provided
-                if vanilla_game_dir:
-                    logger.info(f"Attempting fallback to vanilla game directory: {vanilla_game_dir}")
-                    vanilla_path = Path(vanilla_game_dir)
-                    for fname in prefs_filenames:
-                        vanilla_files = list(vanilla_path.rglob(fname))
-                        prefs_files_found.extend(vanilla_files)
-                        if vanilla_files:
-                            logger.info(f"Found {len(vanilla_files)} {fname} files in vanilla game directory")
-                
-                if not prefs_files_found:
-                    logger.warning("No preference files found in modlist or vanilla game directory. Manual INI edit might be needed.")
-                    return True 
+                logger.warning("No preference files found in modlist or vanilla game directory. Manual INI edit might be needed.")
+                return True 
             
             for ini_file in prefs_files_found:
                 files_processed += 1
@@ -380,7 +404,7 @@ class ResolutionHandler:
             
         try:
             # Find all SSEDisplayTweaks.ini files
-            ini_files = glob.glob(f"{self.modlist_dir}/**/SSEDisplayTweaks.ini", recursive=True)
+            ini_files = get_modlist_tree_index(self.modlist_dir).find("SSEDisplayTweaks.ini")
             
             if not ini_files:
                 logger.debug("No SSEDisplayTweaks.ini files found")
@@ -451,10 +475,10 @@ class ResolutionHandler:
                 return False
                 
             # Search for INI files in the appropriate directories
+            tree_index = get_modlist_tree_index(self.modlist_dir)
             ini_files = []
             for folder in stock_folders:
-                path_pattern = os.path.join(self.modlist_dir, folder, f"**/{ini_filename}")
-                ini_files.extend(glob.glob(path_pattern, recursive=True))
+                ini_files.extend(tree_index.find(ini_filename, under=os.path.join(self.modlist_dir, folder)))
             
             if not ini_files:
                 logger.warn(f"No {ini_filename} files found in specified directories")
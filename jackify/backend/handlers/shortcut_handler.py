@@ -17,6 +17,7 @@ from .protontricks_handler import ProtontricksHandler
 from .vdf_handler import VDFHandler # Changed to relative import
 from .path_handler import PathHandler # Added PathHandler import
 from .completers import path_completer
+from .shortcuts_session import get_shortcuts_session, normalize_exe, shortcut_exe, shortcut_name as shortcut_name_of
 
 # Get logger for the module
 logger = logging.getLogger(__name__)
@@ -315,42 +316,6 @@ class ShortcutHandler:
         """
         if tags is None:
             tags = []  # Ensure tags is a list
-            
-        # Initialize data structure
-        data = {'shortcuts': {}}  # Default structure if file doesn't exist or is empty
-        
-        try:
-            # CRITICAL: Open in BINARY READ mode ('rb')
-            if os.path.exists(shortcuts_file):
-                with open(shortcuts_file, 'rb') as f:
-                    file_data = f.read()
-                    if file_data:  # Only try to parse if the file has content
-                        try:
-                            data = vdf.binary_loads(file_data)
-                            # Ensure the top-level 'shortcuts' key exists
-                            if 'shortcuts' not in data:
-                                data['shortcuts'] = {}
-                        except Exception as e:
-                            self.logger.warning(f"Could not parse existing shortcuts.vdf: {e}")
-                            # Reset to default structure if loading fails
-                            data = {'shortcuts': {}}
-            else:
-                self.logger.info(f"shortcuts.vdf not found at {shortcuts_file}. A new file will be created.")
-        except Exception as e:
-            self.logger.warning(f"Error accessing shortcuts.vdf: {e}")
-            # Reset to default structure if loading fails
-            data = {'shortcuts': {}}
-        
-        # Ensure the shortcuts key exists
-        if 'shortcuts' not in data:
-            data['shortcuts'] = {}
-            
-        # Find the next available index key (0, 1, 2, ...)
-        next_index = 0
-        if data.get('shortcuts'):  # Check if shortcuts dictionary exists and is not empty
-            shortcut_indices = [int(k) for k in data['shortcuts'].keys() if k.isdigit()]
-            if shortcut_indices:
-                next_index = max(shortcut_indices) + 1
         
         # Steam expects specific fields for each shortcut.
         # Even empty ones are often necessary.
@@ -377,31 +342,27 @@ class ShortcutHandler:
         if tags:
             new_shortcut['tags'] = {str(i): tag for i, tag in enumerate(tags)}
         
-        # Calculate the AppID - this is how Steam does it
-        app_id = (0x80000000 + int(next_index)) % (2**32)
-        
-        # Ensure the AppID is within the valid 32-bit signed integer range
-        if app_id > 0x7FFFFFFF:
-            app_id = app_id - 0x100000000
-        
-        # Add the appid to the shortcut entry (like STL does)
-        new_shortcut['appid'] = app_id
-        
-        # Add the new shortcut entry using the string representation of the index
-        data['shortcuts'][str(next_index)] = new_shortcut
-        self.logger.info(f"Adding shortcut '{app_name}' at index {next_index}")
-        
+        session = get_shortcuts_session(shortcuts_file)
         try:
-            # CRITICAL: Open in BINARY WRITE mode ('wb')
-            # First create a temp file to ensure we don't corrupt the original if something goes wrong
-            temp_file = f"{shortcuts_file}.temp"
-            with open(temp_file, 'wb') as f:
-                vdf_data = vdf.binary_dumps(data)
-                f.write(vdf_data)
+            # The session parses the file (or starts empty if it is missing or unreadable)
+            # and writes it back atomically, keeping the previous file as a backup
+            with session.transaction():
+                if not session.exists:
+                    self.logger.info(f"shortcuts.vdf not found at {shortcuts_file}. A new file will be created.")
                 
-            # Now rename the temp file to the actual file
-            import shutil
-            shutil.move(temp_file, shortcuts_file)
+                # Added at the next available index key (0, 1, 2, ...)
+                next_index = session.add(new_shortcut)
+                
+                # Calculate the AppID - this is how Steam does it
+                app_id = (0x80000000 + int(next_index)) % (2**32)
+                
+                # Ensure the AppID is within the valid 32-bit signed integer range
+                if app_id > 0x7FFFFFFF:
+                    app_id = app_id - 0x100000000
+                
+                # Add the appid to the shortcut entry (like STL does)
+                session.update(next_index, appid=app_id)
+                self.logger.info(f"Adding shortcut '{app_name}' at index {next_index}")
             
             self.logger.info(f"Successfully updated shortcuts.vdf! AppID: {app_id}")
             return True, app_id
@@ -981,7 +942,7 @@ class ShortcutHandler:
             if not pt_handler.detect_protontricks():
                 self.logger.warning("Protontricks not detected - cannot use as fallback")
                 return None
-            result = pt_handler.run_protontricks("-l")
+            result = pt_handler.list_shortcuts_output(expect=shortcut_name)
             if not result or result.returncode != 0:
                 self.logger.warning(f"Protontricks fallback failed: {result.stderr if result else 'No result'}")
                 return None
@@ -998,12 +959,8 @@ class ShortcutHandler:
             shortcuts_vdf_path = self.shortcuts_path
             if shortcuts_vdf_path and os.path.isfile(shortcuts_vdf_path):
                 try:
-                    shortcuts_data = VDFHandler.load(shortcuts_vdf_path, binary=True)
-                    if shortcuts_data and 'shortcuts' in shortcuts_data:
-                        for idx, shortcut in shortcuts_data['shortcuts'].items():
-                            app_name = shortcut.get('AppName', shortcut.get('appname', '')).strip()
-                            exe = shortcut.get('Exe', shortcut.get('exe', '')).strip('"').strip()
-                            vdf_shortcuts.append((app_name, exe, idx))
+                    for idx, shortcut in get_shortcuts_session(shortcuts_vdf_path).items():
+                        vdf_shortcuts.append((shortcut_name_of(shortcut), shortcut_exe(shortcut), idx))
                 except Exception as e:
                     self.logger.error(f"Error parsing shortcuts.vdf for exe path matching: {e}")
             # Try to match by both name and exe_path if exe_path is provided
@@ -1051,34 +1008,29 @@ class ShortcutHandler:
             return None
 
         try:
-            shortcuts_data = VDFHandler.load(self.shortcuts_path, binary=True)
-            if not shortcuts_data or 'shortcuts' not in shortcuts_data:
+            session = get_shortcuts_session(self.shortcuts_path)
+            if not session.items():
                 self.logger.warning("No shortcuts found in shortcuts.vdf")
                 return None
 
-            shortcut_name_clean = shortcut_name.strip().lower()
-
-            for idx, shortcut in shortcuts_data['shortcuts'].items():
-                name = shortcut.get('AppName', shortcut.get('appname', '')).strip()
-
-                if name.lower() == shortcut_name_clean:
-                    appid = shortcut.get('appid')
+            exe_path_norm = normalize_exe(exe_path) if exe_path else None
 
-                    if appid:
-                        if exe_path:
-                            vdf_exe = shortcut.get('Exe', shortcut.get('exe', '')).strip('"').strip()
-                            exe_path_norm = os.path.abspath(os.path.expanduser(exe_path)).lower()
-                            vdf_exe_norm = os.path.abspath(os.path.expanduser(vdf_exe)).lower()
+            for idx, shortcut in session.find_by_name(shortcut_name, exact=False):
+                name = shortcut_name_of(shortcut)
+                appid = shortcut.get('appid')
 
-                            if vdf_exe_norm == exe_path_norm:
-                                self.logger.info(f"Found AppID {appid} for shortcut '{name}' with matching exe '{vdf_exe}'")
-                                return str(int(appid) & 0xFFFFFFFF)
-                            else:
-                                self.logger.debug(f"Found shortcut '{name}' but exe doesn't match: '{vdf_exe}' vs '{exe_path}'")
-                                continue
-                        else:
-                            self.logger.info(f"Found AppID {appid} for shortcut '{name}' (no exe validation)")
+                if appid:
+                    if exe_path:
+                        vdf_exe = shortcut_exe(shortcut)
+                        if normalize_exe(vdf_exe) == exe_path_norm:
+                            self.logger.info(f"Found AppID {appid} for shortcut '{name}' with matching exe '{vdf_exe}'")
                             return str(int(appid) & 0xFFFFFFFF)
+                        else:
+                            self.logger.debug(f"Found shortcut '{name}' but exe doesn't match: '{vdf_exe}' vs '{exe_path}'")
+                            continue
+                    else:
+                        self.logger.info(f"Found AppID {appid} for shortcut '{name}' (no exe validation)")
+                        return str(int(appid) & 0xFFFFFFFF)
 
             self.logger.warning(f"No matching shortcut found in shortcuts.vdf for '{shortcut_name}'")
             return None
@@ -1088,8 +1040,6 @@ class ShortcutHandler:
             self.logger.exception("Traceback:")
             return None
 
-    # --- Discovery Methods Moved from ModlistHandler ---
-
     def _scan_shortcuts_for_executable(self, executable_name: str) -> List[Dict[str, str]]:
         """
         Scans the user's shortcuts.vdf file for entries pointing to a specific executable.
@@ -1111,20 +1061,15 @@ class ShortcutHandler:
         # Directly process the single shortcuts.vdf file found during init
         shortcuts_file = self.shortcuts_path
         try:
-            # Use VDFHandler static method for loading
-            shortcuts_data = VDFHandler.load(shortcuts_file, binary=True)
-            if shortcuts_data is None or 'shortcuts' not in shortcuts_data:
+            # Shared session: parsed once, re-read only when the file changes
+            session = get_shortcuts_session(shortcuts_file)
+            if not session.items():
                 self.logger.warning(f"Could not load or parse data from {shortcuts_file}")
                 return [] # Cannot proceed if file is empty/invalid
 
-            for shortcut_id, shortcut in shortcuts_data['shortcuts'].items():
-                # Ensure shortcut entry is a dictionary
-                if not isinstance(shortcut, dict):
-                    self.logger.warning(f"Skipping invalid shortcut entry (not a dict) at index {shortcut_id} in {shortcuts_file}")
-                    continue 
-                    
+            for shortcut_id, shortcut in session.find_by_executable_name(executable_name):
                 app_name = shortcut.get('AppName', shortcut.get('appname'))
-                exe_path = shortcut.get('Exe', shortcut.get('exe', '')).strip('"')
+                exe_path = shortcut_exe(shortcut)
                 start_dir = shortcut.get('StartDir', shortcut.get('startdir', '')).strip('"')
                 
                 # Check if the base name of the exe_path matches the target
@@ -1233,41 +1178,28 @@ class ShortcutHandler:
         
         vdf_path = self.shortcuts_path
         try:
-            self.logger.debug(f"Parsing shortcuts file: {vdf_path}")
-            shortcuts_data = VDFHandler.load(vdf_path, binary=True)
-            
-            if not shortcuts_data or 'shortcuts' not in shortcuts_data:
+            session = get_shortcuts_session(vdf_path)
+            if not session.items():
                 self.logger.warning(f"Shortcuts data is empty or invalid in {vdf_path}")
                 return [] # Return empty if no data
 
-            # The shortcuts are under a top-level 'shortcuts' key
-            shortcuts_dict = shortcuts_data.get('shortcuts', {})
-            
-            for index, shortcut_details in shortcuts_dict.items():
-                # Ensure shortcut_details is a dictionary
-                if not isinstance(shortcut_details, dict):
-                    self.logger.warning(f"Skipping invalid shortcut entry at index {index} in {vdf_path}")
-                    continue
-
-                exe_path = shortcut_details.get('Exe', shortcut_details.get('exe', '')).strip('"') # Get Exe path, remove quotes
+            # Candidates come from the session's Exe index instead of a full scan
+            for index, shortcut_details in session.find_by_executable_name(executable_name):
+                exe_path = shortcut_exe(shortcut_details) # Unquoted Exe path
                 app_name = shortcut_details.get('AppName', shortcut_details.get('appname', 'Unknown Shortcut'))
 
-                # Check if the executable_name is present in the Exe path
-                if executable_name in os.path.basename(exe_path):
-                    self.logger.info(f"Found matching shortcut '{app_name}' in {vdf_path}")
-                    # Extract relevant details with case-insensitive fallbacks
-                    app_id = shortcut_details.get('appid', shortcut_details.get('AppID', shortcut_details.get('appId', None)))
-                    start_dir = shortcut_details.get('StartDir', shortcut_details.get('startdir', '')).strip('"')
-
-                    match = {
-                        'AppName': app_name,
-                        'Exe': exe_path, # Store unquoted path
-                        'StartDir': start_dir,
-                        'appid': app_id  # Include the AppID for conversion to unsigned
-                    }
-                    matching_shortcuts.append(match)
-                else:
-                     self.logger.debug(f"Skipping shortcut '{app_name}': Exe path '{exe_path}' does not contain '{executable_name}'")
+                self.logger.info(f"Found matching shortcut '{app_name}' in {vdf_path}")
+                # Extract relevant details with case-insensitive fallbacks
+                app_id = shortcut_details.get('appid', shortcut_details.get('AppID', shortcut_details.get('appId', None)))
+                start_dir = shortcut_details.get('StartDir', shortcut_details.get('startdir', '')).strip('"')
+
+                match = {
+                    'AppName': app_name,
+                    'Exe': exe_path, # Store unquoted path
+                    'StartDir': start_dir,
+                    'appid': app_id  # Include the AppID for conversion to unsigned
+                }
+                matching_shortcuts.append(match)
 
         except Exception as e:
             self.logger.error(f"Error processing shortcuts file {vdf_path}: {e}", exc_info=True)
@@ -1300,87 +1232,34 @@ class ShortcutHandler:
             self.logger.error("Could not find shortcuts.vdf to update.")
             return False
 
-        data = {'shortcuts': {}}
-        # Load existing shortcuts safely (binary read)
-        try:
-            if os.path.exists(shortcuts_file):
-                with open(shortcuts_file, 'rb') as f:
-                    file_data = f.read()
-                    if file_data:
-                        data = vdf.binary_loads(file_data)
-                        if 'shortcuts' not in data:
-                            data['shortcuts'] = {}
-            else:
-                self.logger.error(f"shortcuts.vdf does not exist at {shortcuts_file}. Cannot update.")
-                return False
-        except Exception as e:
-            self.logger.error(f"Error reading or parsing shortcuts.vdf: {e}")
+        if not os.path.exists(shortcuts_file):
+            self.logger.error(f"shortcuts.vdf does not exist at {shortcuts_file}. Cannot update.")
             return False
 
-        # Normalize paths for robust matching (handle quotes, absolute paths, case)
-        def _normalize_path(p: str) -> str:
-            try:
-                # Strip surrounding quotes, expanduser, abspath, collapse duplicate slashes
-                p_clean = os.path.abspath(os.path.expanduser(p.strip().strip('"')))
-                return os.path.normpath(p_clean).lower()
-            except Exception:
-                return p.strip().strip('"').lower()
-
-        exe_norm = _normalize_path(exe_path)
-        target_index = None
-        for index, shortcut_data in data.get('shortcuts', {}).items():
-            shortcut_name = (shortcut_data.get('AppName', '') or '').strip()
-            shortcut_exe_raw = shortcut_data.get('Exe', '')
-            shortcut_exe_norm = _normalize_path(shortcut_exe_raw)
-            if shortcut_name == app_name and shortcut_exe_norm == exe_norm:
-                target_index = index
-                break
-
-        if target_index is None:
-            self.logger.error(f"Could not find shortcut with AppName '{app_name}' and Exe '{exe_path}' in shortcuts.vdf.")
-            # Log all AppNames and Exe values for debugging
-            for index, shortcut_data in data.get('shortcuts', {}).items():
-                shortcut_name = shortcut_data.get('AppName', '')
-                shortcut_exe = shortcut_data.get('Exe', '')
-                self.logger.error(f"Found shortcut: AppName='{shortcut_name}', Exe='{shortcut_exe}' -> norm='{_normalize_path(shortcut_exe)}'")
-            return False
+        session = get_shortcuts_session(shortcuts_file)
+        try:
+            with session.transaction():
+                # Name plus normalized Exe (quotes, absolute paths, case) for robust matching
+                match = session.find(app_name.strip(), exe_path)
+                if match is None:
+                    self.logger.error(f"Could not find shortcut with AppName '{app_name}' and Exe '{exe_path}' in shortcuts.vdf.")
+                    # Log all AppNames and Exe values for debugging
+                    for index, shortcut_data in session.items():
+                        shortcut_name = shortcut_data.get('AppName', '')
+                        shortcut_exe_raw = shortcut_data.get('Exe', '')
+                        self.logger.error(f"Found shortcut: AppName='{shortcut_name}', Exe='{shortcut_exe_raw}' -> norm='{normalize_exe(shortcut_exe_raw)}'")
+                    return False
 
-        # Update the LaunchOptions for the found shortcut
-        if target_index in data['shortcuts']:
-            self.logger.info(f"Found shortcut at index {target_index}. Updating LaunchOptions...")
-            data['shortcuts'][target_index]['LaunchOptions'] = new_launch_options
-        else:
-            self.logger.error(f"Target index {target_index} not found in shortcuts dictionary after identification.")
-            return False
+                # Update the LaunchOptions for the found shortcut
+                target_index = match[0]
+                self.logger.info(f"Found shortcut at index {target_index}. Updating LaunchOptions...")
+                session.update(target_index, LaunchOptions=new_launch_options)
 
-        # Write the updated data back safely (binary write to temp file first)
-        try:
-            temp_file = f"{shortcuts_file}.temp"
-            with open(temp_file, 'wb') as f:
-                vdf_data = vdf.binary_dumps(data)
-                f.write(vdf_data)
-
-            # Create backup before overwriting
-            backup_dir = os.path.join(os.path.dirname(shortcuts_file), "backups")
-            os.makedirs(backup_dir, exist_ok=True)
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            backup_path = os.path.join(backup_dir, f"shortcuts_update_{app_name}_{timestamp}.bak")
-            if os.path.exists(shortcuts_file):
-                shutil.copy2(shortcuts_file, backup_path)
-                self.logger.info(f"Created backup before update at {backup_path}")
-
-            shutil.move(temp_file, shortcuts_file)
+            # Written atomically; the previous file is kept as shortcuts.vdf.<timestamp>.bak
             self.logger.info(f"Successfully updated LaunchOptions for shortcut '{app_name}' in {shortcuts_file}.")
             return True
         except Exception as e:
             self.logger.error(f"Error writing updated shortcuts.vdf: {e}")
-            # Attempt to restore backup if update failed
-            if 'backup_path' in locals() and os.path.exists(backup_path):
-                try:
-                    shutil.copy2(backup_path, shortcuts_file)
-                    self.logger.warning(f"Restored shortcuts.vdf from backup {backup_path} after update failure.")
-                except Exception as restore_e:
-                    self.logger.critical(f"CRITICAL: Failed to write updated shortcuts.vdf AND failed to restore backup! Error: {restore_e}")
             return False
 
     @staticmethod
@@ -0,0 +1,338 @@
+"""
+Shortcuts Session
+
+One parsed copy of a user's ``shortcuts.vdf`` shared by everything that
+reads or edits non-Steam shortcuts during a run. The file is parsed once and
+indexed by AppName, Exe and AppID; later lookups only ``stat`` the file to
+notice writes made by Steam (or anything else) and re-parse when it changed.
+
+Edits are made in memory. Inside ``with session.transaction():`` any number
+of them are written back together when the outermost block exits. The write
+is atomic: a temporary file is fsync'ed and renamed over ``shortcuts.vdf``,
+and the previous file is kept as a backup in the same step (hard-linked, so
+backing up costs no copy).
+"""
+
+import contextlib
+import copy
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import vdf
+
+logger = logging.getLogger(__name__)
+
+SHORTCUTS_FILENAME = "shortcuts.vdf"
+
+PathLike = Union[str, Path]
+Shortcut = Tuple[str, Dict[str, Any]]
+
+
+def _field(shortcut: Dict[str, Any], name: str, default: Any = "") -> Any:
+    # Steam has written both 'AppName' and 'appname' style keys over the years
+    value = shortcut.get(name)
+    if value is None:
+        value = shortcut.get(name.lower(), default)
+    return value
+
+
+def shortcut_name(shortcut: Dict[str, Any]) -> str:
+    return (_field(shortcut, "AppName") or "").strip()
+
+
+def shortcut_exe(shortcut: Dict[str, Any]) -> str:
+    """Exe path without surrounding quotes."""
+    return (_field(shortcut, "Exe") or "").strip().strip('"').strip()
+
+
+def normalize_exe(exe_path: str) -> str:
+    """Comparable form of an Exe path (quotes stripped, absolute, case-folded)."""
+    try:
+        return os.path.normpath(os.path.abspath(os.path.expanduser(exe_path.strip().strip('"')))).lower()
+    except Exception:
+        return exe_path.strip().strip('"').lower()
+
+
+def unsigned_appid(appid: Any) -> Optional[int]:
+    try:
+        return int(appid) & 0xFFFFFFFF
+    except (TypeError, ValueError):
+        return None
+
+
+class ShortcutsSession:
+    """Indexed, transactional view of one shortcuts.vdf file."""
+
+    def __init__(self, path: PathLike):
+        self.path = os.path.abspath(str(path))
+        if os.path.basename(self.path) != SHORTCUTS_FILENAME:
+            raise ValueError(f"Can only manage shortcuts.vdf, not: {self.path}")
+        self._lock = threading.RLock()
+        self.data: Dict[str, Any] = {"shortcuts": {}}
+        self._file_state: Optional[Tuple[int, int, int]] = None
+        self._loaded = False
+        self._dirty = False
+        self._depth = 0
+        self._by_name: Dict[str, List[str]] = {}
+        self._by_exe: Dict[str, List[str]] = {}
+        self._by_appid: Dict[int, str] = {}
+
+    # --- Loading -------------------------------------------------------------
+
+    def _current_file_state(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _load(self, state: Optional[Tuple[int, int, int]]):
+        data = {"shortcuts": {}}
+        if state is not None:
+            try:
+                with open(self.path, "rb") as f:
+                    raw = f.read()
+                if raw:
+                    data = vdf.binary_loads(raw)
+            except Exception as e:
+                logger.warning(f"Could not parse {self.path}: {e}")
+                data = {"shortcuts": {}}
+        if not isinstance(data.get("shortcuts"), dict):
+            data["shortcuts"] = {}
+        self.data = data
+        self._file_state = state
+        self._loaded = True
+        self._dirty = False
+        self._reindex()
+        logger.debug(f"Loaded {len(self.shortcuts)} shortcut(s) from {self.path}")
+
+    def refresh(self, force: bool = False):
+        """Re-read the file if it changed on disk. Pending edits are kept."""
+        with self._lock:
+            if self._dirty and not force:
+                return
+            state = self._current_file_state()
+            if force or not self._loaded or state != self._file_state:
+                self._load(state)
+
+    def _reindex(self):
+        by_name: Dict[str, List[str]] = {}
+        by_exe: Dict[str, List[str]] = {}
+        by_appid: Dict[int, str] = {}
+        for index, shortcut in self.data["shortcuts"].items():
+            if not isinstance(shortcut, dict):
+                continue
+            by_name.setdefault(shortcut_name(shortcut).lower(), []).append(index)
+            by_exe.setdefault(normalize_exe(shortcut_exe(shortcut)), []).append(index)
+            appid = unsigned_appid(_field(shortcut, "appid", None))
+            if appid is not None:
+                by_appid.setdefault(appid, index)
+        self._by_name = by_name
+        self._by_exe = by_exe
+        self._by_appid = by_appid
+
+    # --- Lookups -------------------------------------------------------------
+
+    @property
+    def exists(self) -> bool:
+        return self._file_state is not None
+
+    @property
+    def shortcuts(self) -> Dict[str, Dict[str, Any]]:
+        return self.data["shortcuts"]
+
+    def items(self) -> List[Shortcut]:
+        """All ``(index, shortcut)`` pairs (valid entries only)."""
+        with self._lock:
+            self.refresh()
+            return [(index, s) for index, s in self.shortcuts.items() if isinstance(s, dict)]
+
+    def find_by_name(self, name: str, exact: bool = True) -> List[Shortcut]:
+        """
+        Shortcuts called ``name``.
+
+        ``exact`` compares AppName as-is; otherwise surrounding whitespace and
+        case are ignored.
+        """
+        with self._lock:
+            self.refresh()
+            matches = [(index, self.shortcuts[index]) for index in self._by_name.get(name.strip().lower(), [])]
+        if exact:
+            matches = [(index, s) for index, s in matches if _field(s, "AppName") == name]
+        return matches
+
+    def find_by_exe(self, exe_path: str) -> List[Shortcut]:
+        """Shortcuts whose Exe is ``exe_path`` (after normalisation)."""
+        with self._lock:
+            self.refresh()
+            return [(index, self.shortcuts[index]) for index in self._by_exe.get(normalize_exe(exe_path), [])]
+
+    def find_by_executable_name(self, executable_name: str) -> List[Shortcut]:
+        """Shortcuts whose Exe file name contains ``executable_name`` (e.g. ``ModOrganizer.exe``)."""
+        wanted = executable_name.lower()
+        matches = []
+        with self._lock:
+            self.refresh()
+            # The index is case-folded; confirm each candidate against the real Exe
+            for exe, indexes in self._by_exe.items():
+                if wanted not in os.path.basename(exe):
+                    continue
+                for index in indexes:
+                    shortcut = self.shortcuts[index]
+                    if executable_name in os.path.basename(shortcut_exe(shortcut)):
+                        matches.append((index, shortcut))
+        # Back to file order
+        matches.sort(key=lambda match: int(match[0]) if str(match[0]).isdigit() else 0)
+        return matches
+
+    def find(self, name: str, exe_path: Optional[str] = None, exact: bool = True) -> Optional[Shortcut]:
+        """First shortcut named ``name`` (and pointing at ``exe_path``, if given)."""
+        matches = self.find_by_name(name, exact=exact)
+        if exe_path:
+            wanted = normalize_exe(exe_path)
+            matches = [(index, s) for index, s in matches if normalize_exe(shortcut_exe(s)) == wanted]
+        return matches[0] if matches else None
+
+    def find_by_appid(self, appid: Union[int, str]) -> Optional[Shortcut]:
+        """Shortcut with ``appid`` (signed or unsigned form)."""
+        with self._lock:
+            self.refresh()
+            index = self._by_appid.get(unsigned_appid(appid))
+            return (index, self.shortcuts[index]) if index is not None else None
+
+    # --- Edits ---------------------------------------------------------------
+
+    def _require_loaded(self):
+        if not self._loaded:
+            self.refresh()
+
+    def update(self, index: str, **fields: Any):
+        """Set fields on the shortcut at ``index``."""
+        with self._lock:
+            self._require_loaded()
+            self.shortcuts[index].update(fields)
+            self._dirty = True
+            self._reindex()
+
+    def add(self, entry: Dict[str, Any]) -> str:
+        """Append a shortcut; returns its index key."""
+        with self._lock:
+            self._require_loaded()
+            indices = [int(k) for k in self.shortcuts if str(k).isdigit()]
+            index = str(max(indices, default=-1) + 1)
+            self.shortcuts[index] = entry
+            self._dirty = True
+            self._reindex()
+            return index
+
+    def remove(self, index: str):
+        with self._lock:
+            self._require_loaded()
+            del self.shortcuts[index]
+            self._dirty = True
+            self._reindex()
+
+    def replace_data(self, data: Dict[str, Any]):
+        """Replace the whole document (for callers that build it themselves)."""
+        with self._lock:
+            self.data = data
+            if not isinstance(self.data.get("shortcuts"), dict):
+                self.data["shortcuts"] = {}
+            self._loaded = True
+            self._dirty = True
+            self._reindex()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Independent copy of the current document."""
+        with self._lock:
+            self.refresh()
+            return copy.deepcopy(self.data)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["ShortcutsSession"]:
+        """
+        Group edits into one write.
+
+        The outermost block writes pending edits on exit (raising ``OSError``
+        if that fails); an exception inside it discards them.
+        """
+        with self._lock:
+            if self._depth == 0:
+                self.refresh()
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0 and self._dirty:
+                    logger.debug(f"Discarding uncommitted shortcut edits for {self.path}")
+                    self.refresh(force=True)
+                raise
+            self._depth -= 1
+            if self._depth == 0 and self._dirty and not self.save():
+                raise OSError(f"Failed to write {self.path}")
+
+    def save(self) -> bool:
+        """Write pending edits atomically, keeping the previous file as a backup."""
+        with self._lock:
+            if self._depth > 0:
+                # Written when the enclosing transaction ends
+                return True
+            if not self._dirty:
+                return True
+            tmp_path = f"{self.path}.jackify-tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    f.write(vdf.binary_dumps(self.data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._backup_current()
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.error(f"Error writing {self.path}: {e}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                return False
+            self._file_state = self._current_file_state()
+            self._dirty = False
+            logger.info(f"Successfully saved changes to {self.path}")
+            return True
+
+    def _backup_current(self):
+        """Keep the file about to be replaced: a timestamped backup, plus ``.bak`` if none exists yet."""
+        if self._current_file_state() is None:
+            return
+        backup_path = f"{self.path}.{int(time.time())}.bak"
+        simple_backup = f"{self.path}.bak"
+        for target in (backup_path, simple_backup):
+            if os.path.exists(target):
+                continue
+            try:
+                # The old inode is renamed away, never modified, so a hard link is a safe backup
+                os.link(self.path, target)
+            except OSError:
+                shutil.copy2(self.path, target)
+            logger.debug(f"Created backup of shortcuts.vdf at {target}")
+
+
+_sessions: Dict[str, ShortcutsSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_shortcuts_session(path: PathLike) -> ShortcutsSession:
+    """Shared session for ``path`` (one per shortcuts.vdf per process)."""
+    key = os.path.abspath(str(path))
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = ShortcutsSession(key)
+            _sessions[key] = session
+        return session
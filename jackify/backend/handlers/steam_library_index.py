@@ -0,0 +1,267 @@
+"""
+Steam Library Index
+
+Shared view of the user's Steam libraries. ``libraryfolders.vdf`` (every
+known location, native and Flatpak) and each library's
+``appmanifest_*.acf`` files are parsed once and turned into lookup tables:
+
+- the list of library roots
+- AppID -> game install directory (``steamapps/common/<installdir>``)
+- AppID -> ``steamapps/compatdata/<appid>``
+
+Every lookup revalidates by ``stat``: a changed ``libraryfolders.vdf``
+mtime re-reads the library list, a changed ``steamapps`` mtime (Steam
+renames manifests into place) re-reads that library's manifests, and a
+changed ``compatdata`` mtime re-lists its prefixes. Nothing else touches the
+disk, so repeated lookups during a run are dictionary hits.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import vdf
+
+logger = logging.getLogger(__name__)
+
+LIBRARYFOLDERS_VDF_PATHS = (
+    "~/.steam/steam/config/libraryfolders.vdf",
+    "~/.local/share/Steam/config/libraryfolders.vdf",
+    "~/.steam/root/config/libraryfolders.vdf",
+    "~/.var/app/com.valvesoftware.Steam/.local/share/Steam/config/libraryfolders.vdf",  # Flatpak
+    "~/.var/app/com.valvesoftware.Steam/data/Steam/config/libraryfolders.vdf",  # Flatpak alternative
+)
+
+PathLike = Union[str, Path]
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_vdf(path: str) -> dict:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return vdf.load(f)
+
+
+def _parse_libraryfolders(path: str) -> List[str]:
+    """Library paths listed in a ``libraryfolders.vdf``, in file order."""
+    try:
+        data = _load_vdf(path)
+    except Exception as e:
+        logger.error(f"Failed to parse {path}: {e}")
+        return []
+    # Current format: libraryfolders -> "0", "1", ... -> {"path": ...}.
+    # Older files map the index directly to the path string.
+    folders = data.get("libraryfolders") or data.get("LibraryFolders") or {}
+    paths = []
+    for key, value in folders.items():
+        if isinstance(value, dict):
+            lib_path = value.get("path")
+        elif key.isdigit() and isinstance(value, str):
+            lib_path = value
+        else:
+            lib_path = None
+        if lib_path:
+            paths.append(lib_path.replace("\\\\", "\\"))
+    return paths
+
+
+def _parse_manifests(steamapps: str) -> Dict[str, str]:
+    """AppID -> ``installdir`` for every ``appmanifest_*.acf`` in ``steamapps``."""
+    installs = {}
+    try:
+        entries = os.listdir(steamapps)
+    except OSError:
+        return installs
+    for name in entries:
+        if not (name.startswith("appmanifest_") and name.endswith(".acf")):
+            continue
+        try:
+            app_state = _load_vdf(os.path.join(steamapps, name)).get("AppState", {})
+        except Exception as e:
+            logger.debug(f"Skipping unreadable manifest {name} in {steamapps}: {e}")
+            continue
+        appid = str(app_state.get("appid") or name[len("appmanifest_"):-len(".acf")])
+        install_dir = app_state.get("installdir")
+        if install_dir:
+            installs[appid] = install_dir
+    return installs
+
+
+def _list_compatdata(compatdata: str) -> Dict[str, str]:
+    try:
+        with os.scandir(compatdata) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_dir()}
+    except OSError:
+        return {}
+
+
+class SteamLibrary:
+    """One library root; ``path`` is as listed in libraryfolders.vdf, ``resolved`` has symlinks resolved."""
+
+    __slots__ = ("path", "resolved")
+
+    def __init__(self, path: Path, resolved: Path):
+        self.path = path
+        self.resolved = resolved
+
+    @property
+    def steamapps(self) -> Path:
+        return self.resolved / "steamapps"
+
+    @property
+    def common(self) -> Path:
+        return self.path / "steamapps" / "common"
+
+    def __repr__(self):
+        return f"SteamLibrary({str(self.resolved)!r})"
+
+
+class SteamLibraryIndex:
+    """Cached Steam library, install directory and compatdata lookups."""
+
+    def __init__(self, vdf_paths: Tuple[str, ...] = LIBRARYFOLDERS_VDF_PATHS):
+        self._vdf_paths = tuple(os.path.expanduser(path) for path in vdf_paths)
+        self._lock = threading.RLock()
+        # Parsed files: path -> (mtime, library paths)
+        self._vdf_cache: Dict[str, Tuple[int, List[str]]] = {}
+        self._vdf_state: Optional[Tuple] = None
+        self._libraries: List[SteamLibrary] = []
+        self._steam_dirs: List[Path] = []
+        # Per library (resolved root): (mtime, data)
+        self._manifests: Dict[str, Tuple[Optional[int], Dict[str, str]]] = {}
+        self._compatdata: Dict[str, Tuple[Optional[int], Dict[str, str]]] = {}
+
+    def invalidate(self):
+        """Forget everything; the next lookup re-reads from disk."""
+        with self._lock:
+            self._vdf_cache.clear()
+            self._vdf_state = None
+            self._libraries = []
+            self._steam_dirs = []
+            self._manifests.clear()
+            self._compatdata.clear()
+
+    def _library_paths_in(self, vdf_path: str, mtime: int) -> List[str]:
+        cached = self._vdf_cache.get(vdf_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        logger.debug(f"Parsing libraryfolders.vdf: {vdf_path}")
+        paths = _parse_libraryfolders(vdf_path)
+        self._vdf_cache[vdf_path] = (mtime, paths)
+        return paths
+
+    def _refresh_libraries(self):
+        state = tuple((path, _mtime(path)) for path in self._vdf_paths)
+        if state == self._vdf_state:
+            return
+        libraries: List[SteamLibrary] = []
+        seen_libraries = set()
+        steam_dirs: List[Path] = []
+        seen_steam_dirs = set()
+        for vdf_path, mtime in state:
+            if mtime is None:
+                continue
+            # The Steam installation is the directory holding config/
+            steam_dir = Path(vdf_path).parent.parent
+            real_steam_dir = os.path.realpath(steam_dir)
+            if real_steam_dir not in seen_steam_dirs and os.path.isdir(os.path.join(real_steam_dir, "steamapps")):
+                seen_steam_dirs.add(real_steam_dir)
+                steam_dirs.append(steam_dir)
+            for lib_path_str in self._library_paths_in(vdf_path, mtime):
+                lib_path = Path(lib_path_str)
+                try:
+                    # Resolve symlinks for consistency (mmcblk0p1 -> deck/UUID)
+                    resolved = lib_path.resolve()
+                except (OSError, RuntimeError) as e:
+                    logger.warning(f"Could not resolve {lib_path}, using as-is: {e}")
+                    resolved = lib_path
+                if resolved in seen_libraries:
+                    continue
+                seen_libraries.add(resolved)
+                libraries.append(SteamLibrary(lib_path, resolved))
+        self._vdf_state = state
+        self._libraries = libraries
+        self._steam_dirs = steam_dirs
+        logger.info(f"Detected Steam libraries: {[str(lib.resolved) for lib in libraries]}")
+
+    def _library_data(self, cache: Dict, directory: Path, loader) -> Dict[str, str]:
+        key = str(directory)
+        mtime = _mtime(key)
+        cached = cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = loader(key) if mtime is not None else {}
+        cache[key] = (mtime, data)
+        return data
+
+    def libraries(self) -> List[SteamLibrary]:
+        with self._lock:
+            self._refresh_libraries()
+            return list(self._libraries)
+
+    def library_paths(self) -> List[Path]:
+        """Resolved root of every library listed in any libraryfolders.vdf."""
+        return [lib.resolved for lib in self.libraries()]
+
+    def common_dirs(self) -> List[Path]:
+        """Existing ``steamapps/common`` directories, in library order."""
+        return [lib.common for lib in self.libraries() if lib.common.is_dir()]
+
+    def steam_dirs(self) -> List[Path]:
+        """Steam installations (directories containing ``config/libraryfolders.vdf`` and ``steamapps``)."""
+        with self._lock:
+            self._refresh_libraries()
+            return list(self._steam_dirs)
+
+    def libraries_in(self, vdf_path: PathLike) -> List[str]:
+        """Library paths listed in one specific libraryfolders.vdf (cached by mtime)."""
+        vdf_path = str(vdf_path)
+        mtime = _mtime(vdf_path)
+        if mtime is None:
+            return []
+        with self._lock:
+            return list(self._library_paths_in(vdf_path, mtime))
+
+    def install_dir(self, appid: Union[str, int]) -> Optional[Path]:
+        """Install directory of a Steam game according to its app manifest."""
+        appid = str(appid)
+        with self._lock:
+            self._refresh_libraries()
+            for lib in self._libraries:
+                installs = self._library_data(self._manifests, lib.steamapps, _parse_manifests)
+                install_dir = installs.get(appid)
+                if install_dir:
+                    return lib.common / install_dir
+        return None
+
+    def compatdata(self, appid: Union[str, int]) -> Optional[Path]:
+        """``steamapps/compatdata/<appid>`` in whichever library has it."""
+        appid = str(appid)
+        with self._lock:
+            self._refresh_libraries()
+            for lib in self._libraries:
+                prefixes = self._library_data(self._compatdata, lib.steamapps / "compatdata", _list_compatdata)
+                path = prefixes.get(appid)
+                if path:
+                    return Path(path)
+        return None
+
+
+_index: Optional[SteamLibraryIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_steam_library_index() -> SteamLibraryIndex:
+    """Process-wide index shared by all handlers."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SteamLibraryIndex()
+        return _index
@@ -1,4 +1,5 @@
 import os
+import re
 import signal
 import subprocess
 import time
@@ -6,6 +7,13 @@ import resource
 import sys
 import shutil
 
+# Single precompiled pattern for stripping ANSI escape sequences from engine output
+ANSI_ESCAPE_RE = re.compile(rb'\x1b\[[0-9;?]*[ -/]*[@-~]')
+_RECORD_TERMINATOR_RE = re.compile(rb'[\r\n]')
+
+# Large enough to drain a burst of --show-file-progress updates in one syscall
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
 def get_safe_python_executable():
     """
     Get a safe Python executable for subprocess calls.
@@ -159,6 +167,50 @@ def increase_file_descriptor_limit(target_limit=1048576):
         
         return False, soft_limit, soft_limit, f"Failed to increase file descriptor limit: {e}"
 
+def iter_output_records(stream, strip_ansi=False, chunk_size=OUTPUT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Split a binary process output stream into \\r/\\n terminated records.
+
+    Reads the stream in large chunks (one syscall per chunk instead of one per
+    byte) and splits each chunk with a single precompiled regex pass. A \\r\\n
+    pair yields two records, the second one empty, matching the behaviour of the
+    original byte-at-a-time readers.
+
+    Args:
+        stream: Binary file object (pipe, BufferedReader or BytesIO)
+        strip_ansi (bool): Remove ANSI escape sequences from each record
+        chunk_size (int): Maximum number of bytes to read per call
+        encoding (str): Encoding used to decode records (errors are replaced)
+
+    Yields:
+        tuple: (text: str, terminator: str) where terminator is '\\r', '\\n',
+               or '' for trailing output that was not terminated
+    """
+    if stream is None:
+        return
+    # read1() performs at most one raw read on buffered streams; raw FileIO
+    # (bufsize=0) already does a single os.read() per read() call
+    read = getattr(stream, 'read1', None) or stream.read
+    pending = b''
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        data = pending + chunk if pending else chunk
+        start = 0
+        for match in _RECORD_TERMINATOR_RE.finditer(data):
+            end = match.start()
+            record = data[start:end]
+            if strip_ansi and b'\x1b' in record:
+                record = ANSI_ESCAPE_RE.sub(b'', record)
+            yield record.decode(encoding, errors='replace'), '\r' if data[end] == 0x0d else '\n'
+            start = end + 1
+        pending = data[start:]
+    if pending:
+        if strip_ansi:
+            pending = ANSI_ESCAPE_RE.sub(b'', pending)
+        yield pending.decode(encoding, errors='replace'), ''
+
 class ProcessManager:
     """
     Shared process manager for robust subprocess launching, tracking, and cancellation.
@@ -244,4 +296,9 @@ class ProcessManager:
     def read_stdout_char(self):
         if self.proc and self.proc.stdout:
             return self.proc.stdout.read(1)
-        return None 
\ No newline at end of file
+        return None
+
+    def iter_stdout_records(self, strip_ansi=True, chunk_size=OUTPUT_CHUNK_SIZE):
+        """Yield (text, terminator) records from the process output, see iter_output_records()."""
+        if self.proc and self.proc.stdout:
+            yield from iter_output_records(self.proc.stdout, strip_ansi=strip_ansi, chunk_size=chunk_size) 
\ No newline at end of file
@@ -3,13 +3,143 @@ Wabbajack file parser for extracting game type information from .wabbajack files
 
 This module provides efficient parsing of .wabbajack files (which are ZIP archives)
 to extract game type information without loading the entire archive.
+
+The modlist JSON inside the archive can be hundreds of MB once decompressed, so
+only the top-level header fields are scanned for, streaming the compressed member
+and skipping nested values (Archives, Directives, ...) without decoding them.
 """
 
+import itertools
 import json
 import logging
+import operator
+import os
+import re
+import time
 import zipfile
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, BinaryIO
+
+# Top-level modlist fields read by scan_modlist_header()
+HEADER_KEYS = ('GameType', 'Name', 'Version', 'Author')
+
+_SCAN_CHUNK_SIZE = 256 * 1024
+# Tokens needed to walk the top level of escape-masked JSON (see _mask_escapes):
+# strings, structure, and bare scalars
+_JSON_TOKEN_RE = re.compile(rb'"[^"]*"|[{}\[\]:,]|[^\s{}\[\]:,"]+')
+# Everything except quotes and brackets, deleted before bracket counting
+_NON_STRUCTURE_BYTES = bytes(b for b in range(256) if b not in b'{}[]"')
+# Brackets mapped to 2 (open) / 0 (close); subtracting 1 gives the depth delta
+_BRACKET_DELTA = bytes.maketrans(b'{[}]', b'\x02\x02\x00\x00')
+_HEADER_CACHE_MAX_ENTRIES = 64
+
+
+def _mask_escapes(data: bytes) -> bytes:
+    """
+    Blank out backslash escapes so every remaining quote is a real string delimiter.
+
+    Replacements keep the length, so offsets into the result are offsets into data.
+    data must start outside a string (escapes then pair up left to right).
+    """
+    return data.replace(b'\\\\', b'__').replace(b'\\"', b'__')
+
+
+def scan_modlist_header(stream: BinaryIO, keys: Iterable[str] = HEADER_KEYS,
+                        chunk_size: int = _SCAN_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Read selected scalar top-level fields from a modlist JSON stream.
+
+    Stops as soon as every requested key has been seen or the top-level object
+    ends. Chunks that stay inside a nested value are skipped by counting
+    brackets outside strings, without tokenizing them, so memory use stays at
+    about one chunk regardless of modlist size.
+
+    Args:
+        stream: Binary stream positioned at the start of the modlist JSON
+        keys: Top-level keys to extract
+        chunk_size: Bytes to read per iteration
+
+    Returns:
+        Dict of the keys found (values decoded from JSON); missing keys are absent
+
+    Raises:
+        json.JSONDecodeError: If a wanted value is not valid JSON
+    """
+    wanted = set(keys)
+    found: Dict[str, Any] = {}
+    depth = 0
+    # Unconsumed bytes carried into the next chunk; always starts outside a string
+    tail = b''
+    # Top-level parse state, only used while depth <= 1
+    expect_key = True
+    current_key = None
+
+    while wanted:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        data = tail + chunk
+        masked = _mask_escapes(data)
+        # An odd quote count means data ends inside a string; carry it whole
+        body_end = masked.rfind(b'"') if masked.count(b'"') % 2 else len(masked)
+        tail = data[body_end:]
+
+        if depth >= 2:
+            # Fast path: does this chunk ever climb back to the top level?
+            structure = masked[:body_end].translate(None, _NON_STRUCTURE_BYTES)
+            # Dropping adjacent quote pairs keeps every bracket's inside/outside-string
+            # parity and removes most strings, since few contain brackets
+            structure = structure.replace(b'""', b'')
+            if b'"' in structure:
+                structure = b''.join(structure.split(b'"')[0::2])
+            deltas = structure.translate(_BRACKET_DELTA)
+            if not deltas:
+                continue
+            lowest = min(itertools.accumulate(map(operator.sub, deltas, itertools.repeat(1))))
+            if depth + lowest >= 2:
+                depth += deltas.count(2) - deltas.count(0)
+                continue
+
+        # Slow path: walk the tokens of this chunk
+        last_end = 0
+        for match in _JSON_TOKEN_RE.finditer(masked, 0, body_end):
+            token = match.group()
+            last_end = match.end()
+            first = token[:1]
+            if first in (b'{', b'['):
+                depth += 1
+                if depth == 1:
+                    expect_key = True
+                elif depth == 2:
+                    current_key = None
+                continue
+            if first in (b'}', b']'):
+                depth -= 1
+                if depth <= 0:
+                    return found
+                continue
+            if depth != 1:
+                continue
+            if token == b',':
+                expect_key = True
+                current_key = None
+            elif token == b':':
+                expect_key = False
+            elif expect_key:
+                current_key = json.loads(data[match.start():match.end()]) if first == b'"' else None
+            elif current_key in wanted:
+                if last_end == len(data):
+                    # Bare scalar may continue in the next chunk
+                    last_end = match.start()
+                    break
+                found[current_key] = json.loads(data[match.start():match.end()])
+                wanted.discard(current_key)
+                current_key = None
+                if not wanted:
+                    return found
+        tail = data[last_end:]
+
+    return found
 
 
 class WabbajackParser:
@@ -50,7 +180,40 @@ class WabbajackParser:
         Returns:
             Tuple containing Jackify game type string (e.g., 'skyrim', 'starfield') and raw game type string
         """
+        header = self.parse_wabbajack_header(wabbajack_path)
+        if header is None:
+            return None
+
+        # Extract the game type
+        game_type = header.get('GameType')
+        if not game_type:
+            self.logger.error(f"No GameType found in modlist: {wabbajack_path}")
+            return None
+        
+        # Map to Jackify game type
+        jackify_game_type = self.game_type_mapping.get(game_type)
+        if jackify_game_type:
+            self.logger.info(f"Detected game type: {game_type} -> {jackify_game_type}")
+            return jackify_game_type, game_type
+        else:
+            self.logger.warning(f"Unknown game type in modlist: {game_type}")
+            return 'unknown', game_type
+
+    def parse_wabbajack_header(self, wabbajack_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read the GameType, Name, Version and Author fields of a .wabbajack file.
+        
+        Results are cached by (path, size, mtime), so reselecting the same file
+        does not reopen the archive.
+        
+        Args:
+            wabbajack_path: Path to the .wabbajack file
+            
+        Returns:
+            Dict with whichever of the header keys were present, or None if the file could not be read
+        """
         try:
+            wabbajack_path = Path(wabbajack_path)
             if not wabbajack_path.exists():
                 self.logger.error(f"Wabbajack file not found: {wabbajack_path}")
                 return None
@@ -58,6 +221,13 @@ class WabbajackParser:
             if not wabbajack_path.suffix.lower() == '.wabbajack':
                 self.logger.error(f"File is not a .wabbajack file: {wabbajack_path}")
                 return None
+
+            stat = wabbajack_path.stat()
+            cache_key = str(wabbajack_path.resolve())
+            cached = self._load_header_cache().get(cache_key)
+            if cached and cached.get('size') == stat.st_size and cached.get('mtime') == stat.st_mtime:
+                self.logger.debug(f"Using cached modlist header for {wabbajack_path}")
+                return dict(cached.get('header', {}))
             
             # Open the .wabbajack file as a ZIP archive
             with zipfile.ZipFile(wabbajack_path, 'r') as zip_file:
@@ -68,25 +238,15 @@ class WabbajackParser:
                     self.logger.error(f"No modlist file found in {wabbajack_path}")
                     return None
                 
-                # Extract and parse the modlist file
+                # Stream the modlist file, stopping once the header fields are found
                 modlist_file = modlist_files[0]
+                start = time.monotonic()
                 with zip_file.open(modlist_file) as modlist_stream:
-                    modlist_data = json.load(modlist_stream)
-                
-                # Extract the game type
-                game_type = modlist_data.get('GameType')
-                if not game_type:
-                    self.logger.error(f"No GameType found in modlist: {wabbajack_path}")
-                    return None
-                
-                # Map to Jackify game type
-                jackify_game_type = self.game_type_mapping.get(game_type)
-                if jackify_game_type:
-                    self.logger.info(f"Detected game type: {game_type} -> {jackify_game_type}")
-                    return jackify_game_type, game_type
-                else:
-                    self.logger.warning(f"Unknown game type in modlist: {game_type}")
-                    return 'unknown', game_type
+                    header = scan_modlist_header(modlist_stream)
+                self.logger.debug(f"Scanned modlist header of {wabbajack_path} in {time.monotonic() - start:.2f}s")
+
+            self._store_header_cache(cache_key, stat.st_size, stat.st_mtime, header)
+            return header
                     
         except zipfile.BadZipFile:
             self.logger.error(f"Invalid ZIP file: {wabbajack_path}")
@@ -97,6 +257,41 @@ class WabbajackParser:
         except Exception as e:
             self.logger.error(f"Error parsing .wabbajack file {wabbajack_path}: {e}")
             return None
+
+    @staticmethod
+    def _header_cache_file() -> Path:
+        from jackify.shared.paths import get_jackify_data_dir
+        return get_jackify_data_dir() / "modlist-cache" / "wabbajack_headers.json"
+
+    def _load_header_cache(self) -> Dict[str, Any]:
+        """Load the header cache, treating a missing or corrupt file as empty."""
+        try:
+            with open(self._header_cache_file(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable wabbajack header cache: {e}")
+            return {}
+
+    def _store_header_cache(self, cache_key: str, size: int, mtime: float, header: Dict[str, Any]):
+        """Record a scanned header, keeping only the most recently scanned entries."""
+        try:
+            cache = self._load_header_cache()
+            cache[cache_key] = {'size': size, 'mtime': mtime, 'scanned_at': time.time(), 'header': header}
+            if len(cache) > _HEADER_CACHE_MAX_ENTRIES:
+                newest = sorted(cache.items(), key=lambda item: item[1].get('scanned_at', 0), reverse=True)
+                cache = dict(newest[:_HEADER_CACHE_MAX_ENTRIES])
+            cache_file = self._header_cache_file()
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            # Cache is an optimisation only
+            self.logger.debug(f"Failed to update wabbajack header cache: {e}")
     
     def is_supported_game(self, game_type: str) -> bool:
         """
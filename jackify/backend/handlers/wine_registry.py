@@ -0,0 +1,455 @@
+"""
+Wine Registry
+
+Reads and edits a Wine prefix's registry files (``system.reg`` for
+HKEY_LOCAL_MACHINE, ``user.reg`` for HKEY_CURRENT_USER) directly, without
+starting Wine. Each file is parsed once into sections indexed by key name
+(case-insensitively, as Windows does), so any number of edits are applied in
+memory and written back with a single atomic rename per file.
+
+Wine keeps the registry in the wineserver's memory while it runs and
+overwrites the files when it exits, so offline edits are only safe once the
+prefix's wineserver is gone. :class:`RegistryEdits` waits briefly for that
+and falls back to ``wine reg add`` when the wineserver stays up.
+"""
+
+import logging
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .prefix_watcher import wait_for, wineserver_dir, wineserver_running
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+Value = Union[str, int]
+
+SYSTEM_REG = "system.reg"
+USER_REG = "user.reg"
+
+_ROOTS = {
+    "HKEY_LOCAL_MACHINE": SYSTEM_REG,
+    "HKLM": SYSTEM_REG,
+    "HKEY_CURRENT_USER": USER_REG,
+    "HKCU": USER_REG,
+}
+
+# Written at the top of files that don't exist yet (same as a fresh Wine prefix)
+_FILE_HEADERS = {
+    SYSTEM_REG: "WINE REGISTRY Version 2\n;; All keys relative to \\\\Machine\n\n#arch=win64\n",
+    USER_REG: "WINE REGISTRY Version 2\n;; All keys relative to \\\\User\\\\S-1-5-21-0-0-0-1000\n\n#arch=win64\n",
+}
+
+# Seconds between 1601-01-01 (FILETIME epoch) and 1970-01-01
+_FILETIME_EPOCH_OFFSET = 11644473600
+
+_UNESCAPES = {"n": "\n", "r": "\r", "t": "\t", "a": "\a", "b": "\b", "f": "\f", "v": "\v", "e": "\x1b", "0": "\0"}
+_ESCAPES = {"\\": "\\\\", "\"": "\\\"", "\n": "\\n", "\r": "\\r", "\t": "\\t", "\0": "\\0"}
+
+
+def _unescape(text: str, start: int, terminator: str) -> Tuple[str, int]:
+    """Decode a Wine-escaped string from ``start`` up to ``terminator``; returns (string, index after it)."""
+    out = []
+    i = start
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and i + 1 < len(text):
+            nxt = text[i + 1]
+            if nxt == "x":
+                j = i + 2
+                while j < len(text) and j < i + 6 and text[j] in "0123456789abcdefABCDEF":
+                    j += 1
+                if j > i + 2:
+                    out.append(chr(int(text[i + 2:j], 16)))
+                    i = j
+                    continue
+            out.append(_UNESCAPES.get(nxt, nxt))
+            i += 2
+            continue
+        if ch == terminator:
+            return "".join(out), i + 1
+        out.append(ch)
+        i += 1
+    return "".join(out), i
+
+
+def _escape(text: str, extra: str = "") -> str:
+    out = []
+    for ch in text:
+        if ch in _ESCAPES:
+            out.append(_ESCAPES[ch])
+        elif ch in extra:
+            out.append("\\" + ch)
+        elif ord(ch) < 32 or ord(ch) > 126:
+            out.append(f"\\x{ord(ch):04x}")
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _normalize_key(key: str) -> str:
+    return "\\".join(part for part in key.split("\\") if part).lower()
+
+
+def format_value(value: Value) -> str:
+    """``.reg`` representation of a value: ``str`` is REG_SZ, ``int`` is REG_DWORD."""
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, int):
+        return f"dword:{value & 0xFFFFFFFF:08x}"
+    return f"\"{_escape(str(value))}\""
+
+
+def parse_value(data: str) -> Any:
+    """Decode the right-hand side of a value line (REG_SZ and REG_DWORD; anything else stays raw)."""
+    data = data.strip()
+    if data.startswith("\""):
+        return _unescape(data, 1, "\"")[0]
+    if data.startswith("dword:"):
+        try:
+            return int(data[6:], 16)
+        except ValueError:
+            return data
+    return data
+
+
+class _Section:
+    """One ``[key]`` block: its header line and value entries (multi-line values kept together)."""
+
+    __slots__ = ("key", "header", "entries", "names")
+
+    def __init__(self, key: str, header: str):
+        self.key = key
+        self.header = header
+        self.entries: List[str] = []
+        # lower-cased value name ('' for the default value) -> index into entries
+        self.names: Dict[str, int] = {}
+
+    def add_entry(self, entry: str):
+        name = _entry_name(entry)
+        if name is not None:
+            self.names[name.lower()] = len(self.entries)
+        self.entries.append(entry)
+
+
+def _entry_name(entry: str) -> Optional[str]:
+    if entry.startswith("@="):
+        return ""
+    if entry.startswith("\""):
+        name, end = _unescape(entry, 1, "\"")
+        if entry[end:end + 1] == "=":
+            return name
+    return None
+
+
+def _entry_data(entry: str) -> str:
+    if entry.startswith("@="):
+        return entry[2:]
+    _, end = _unescape(entry, 1, "\"")
+    return entry[end + 1:]
+
+
+class RegistryHive:
+    """One Wine registry file, loaded into a section index."""
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self.preamble: List[str] = []
+        self.sections: List[_Section] = []
+        self._index: Dict[str, _Section] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            text = self.path.read_text(encoding="utf-8", errors="surrogateescape")
+        except FileNotFoundError:
+            text = _FILE_HEADERS.get(self.path.name, "WINE REGISTRY Version 2\n")
+        section: Optional[_Section] = None
+        entry: Optional[str] = None
+        for line in text.splitlines(keepends=True):
+            if entry is not None:
+                # Continuation of a multi-line (hex) value
+                entry += line
+                if not line.rstrip("\r\n").endswith("\\"):
+                    section.add_entry(entry)
+                    entry = None
+                continue
+            if line.startswith("["):
+                key, _ = _unescape(line, 1, "]")
+                section = _Section(key, line)
+                self.sections.append(section)
+                self._index.setdefault(_normalize_key(key), section)
+                continue
+            if section is None:
+                self.preamble.append(line)
+            elif line.rstrip("\r\n").endswith("\\") and (line.startswith("\"") or line.startswith("@")):
+                entry = line
+            else:
+                section.add_entry(line)
+        if entry is not None:
+            section.add_entry(entry)
+
+    def has_key(self, key: str) -> bool:
+        return _normalize_key(key) in self._index
+
+    def get(self, key: str, name: str) -> Any:
+        """Value ``name`` of ``key`` (``''`` for the default value), or None."""
+        section = self._index.get(_normalize_key(key))
+        if section is None:
+            return None
+        idx = section.names.get(name.lower())
+        if idx is None:
+            return None
+        return parse_value(_entry_data(section.entries[idx]))
+
+    def values(self, key: str) -> Dict[str, Any]:
+        """Every value of ``key`` by name (``''`` for the default value); empty if the key is missing."""
+        section = self._index.get(_normalize_key(key))
+        if section is None:
+            return {}
+        return {_entry_name(section.entries[idx]): parse_value(_entry_data(section.entries[idx]))
+                for idx in section.names.values()}
+
+    def set(self, key: str, name: str, value: Value):
+        """Create or replace a value, creating the key if needed."""
+        normalized = _normalize_key(key)
+        section = self._index.get(normalized)
+        if section is None:
+            now = time.time()
+            filetime = int((now + _FILETIME_EPOCH_OFFSET) * 10_000_000)
+            key_text = "\\".join(part for part in key.split("\\") if part)
+            section = _Section(key_text, f"[{_escape(key_text, '[]')}] {int(now)}\n")
+            section.add_entry(f"#time={filetime:x}\n")
+            previous = self.sections[-1].entries if self.sections else self.preamble
+            if previous and previous[-1].strip():
+                # Keys are separated by a blank line
+                previous.append("\n")
+            self.sections.append(section)
+            self._index[normalized] = section
+        entry = (f"\"{_escape(name)}\"" if name else "@") + f"={format_value(value)}\n"
+        idx = section.names.get(name.lower())
+        if idx is not None:
+            if section.entries[idx] == entry:
+                return
+            section.entries[idx] = entry
+        else:
+            # Values go after existing ones, before the blank separator line
+            insert_at = len(section.entries)
+            while insert_at > 0 and not section.entries[insert_at - 1].strip():
+                insert_at -= 1
+            section.entries.insert(insert_at, entry)
+            section.names = {}
+            for i, existing in enumerate(section.entries):
+                existing_name = _entry_name(existing)
+                if existing_name is not None:
+                    section.names[existing_name.lower()] = i
+        self.dirty = True
+
+    def delete(self, key: str, name: str):
+        section = self._index.get(_normalize_key(key))
+        if section is None or name.lower() not in section.names:
+            return
+        del section.entries[section.names[name.lower()]]
+        section.names = {}
+        for i, existing in enumerate(section.entries):
+            existing_name = _entry_name(existing)
+            if existing_name is not None:
+                section.names[existing_name.lower()] = i
+        self.dirty = True
+
+    def render(self) -> str:
+        parts = list(self.preamble)
+        for section in self.sections:
+            parts.append(section.header)
+            parts.extend(section.entries)
+        text = "".join(parts)
+        return text if text.endswith("\n") else text + "\n"
+
+    def write_temp(self) -> Optional[Path]:
+        """Write pending changes to a temporary file next to the hive; returns its path (None if unchanged)."""
+        if not self.dirty:
+            return None
+        tmp_path = self.path.with_name(self.path.name + ".jackify-tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8", errors="surrogateescape") as f:
+            f.write(self.render())
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp_path
+
+    def save(self) -> bool:
+        tmp_path = self.write_temp()
+        if tmp_path is None:
+            return True
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+        return True
+
+
+def _split_root(key_path: str) -> Tuple[str, str]:
+    """'HKEY_CURRENT_USER\\Software\\Wine' -> ('user.reg', 'Software\\Wine')."""
+    root, _, rest = key_path.partition("\\")
+    hive = _ROOTS.get(root.upper())
+    if hive is None:
+        raise ValueError(f"Unsupported registry root: {root}")
+    return hive, rest
+
+
+def read_values(prefix_path: PathLike, selection: Iterable[Tuple[str, Optional[Iterable[str]]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Selected values from a prefix's registry files, read without starting Wine.
+
+    ``selection`` pairs a key path (HKEY_CURRENT_USER/HKEY_LOCAL_MACHINE...)
+    with the value names wanted, or None for every value of the key. Missing
+    values are left out. Returns ``{key path: {name: value}}``.
+    """
+    prefix = resolve_prefix(prefix_path)
+    hives: Dict[str, RegistryHive] = {}
+    result: Dict[str, Dict[str, Any]] = {}
+    for key_path, names in selection:
+        hive_name, key = _split_root(key_path)
+        if hive_name not in hives:
+            hives[hive_name] = RegistryHive(prefix / hive_name)
+        values = hives[hive_name].values(key)
+        if names is not None:
+            wanted = {name.lower() for name in names}
+            values = {name: value for name, value in values.items() if name.lower() in wanted}
+        result[key_path] = values
+    return result
+
+
+def resolve_prefix(prefix_path: PathLike) -> Path:
+    """The ``pfx`` directory for either a compatdata directory or the prefix itself."""
+    prefix_path = Path(prefix_path)
+    if prefix_path.name != "pfx" and (prefix_path / "pfx").is_dir():
+        return prefix_path / "pfx"
+    return prefix_path
+
+
+class RegistryEdits:
+    """
+    A batch of registry edits for one prefix.
+
+    Edits are collected with :meth:`set` (or the helpers) and applied together
+    by :meth:`apply`: directly in ``system.reg``/``user.reg`` once the
+    prefix's wineserver is down, otherwise through ``wine reg add``.
+    """
+
+    def __init__(self, prefix_path: PathLike):
+        self.prefix = resolve_prefix(prefix_path)
+        self.edits: List[Tuple[str, str, Value]] = []
+
+    def __len__(self):
+        return len(self.edits)
+
+    def set(self, key_path: str, name: str, value: Value) -> "RegistryEdits":
+        """Queue ``key_path\\name = value`` (``key_path`` starts with HKEY_CURRENT_USER or HKEY_LOCAL_MACHINE)."""
+        _split_root(key_path)
+        self.edits.append((key_path, name, value))
+        return self
+
+    def dll_override(self, dll: str, mode: str) -> "RegistryEdits":
+        return self.set("HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides", dll, mode)
+
+    def show_dotfiles(self, enabled: bool = True) -> "RegistryEdits":
+        return self.set("HKEY_CURRENT_USER\\Software\\Wine", "ShowDotFiles", "Y" if enabled else "N")
+
+    def _hives(self) -> Dict[str, RegistryHive]:
+        hives: Dict[str, RegistryHive] = {}
+        for key_path, name, value in self.edits:
+            hive_name, key = _split_root(key_path)
+            if hive_name not in hives:
+                hives[hive_name] = RegistryHive(self.prefix / hive_name)
+            hives[hive_name].set(key, name, value)
+        return hives
+
+    def apply_offline(self) -> bool:
+        """Write every edit straight into the registry files. False if the wineserver is running."""
+        if not self.edits:
+            return True
+        if wineserver_running(self.prefix):
+            logger.debug(f"wineserver is running for {self.prefix}, cannot edit registry files directly")
+            return False
+        hives = self._hives()
+        temp_files = []
+        try:
+            # Write every hive before renaming any, so a failure leaves the prefix untouched
+            for hive in hives.values():
+                tmp_path = hive.write_temp()
+                if tmp_path:
+                    temp_files.append((tmp_path, hive))
+            for tmp_path, hive in temp_files:
+                os.replace(tmp_path, hive.path)
+                hive.dirty = False
+        except OSError as e:
+            logger.error(f"Failed to write registry files in {self.prefix}: {e}")
+            for tmp_path, _ in temp_files:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return False
+        logger.info(f"Applied {len(self.edits)} registry edit(s) directly to {', '.join(hives)} in {self.prefix}")
+        return True
+
+    def apply_with_wine(self, wine_binary: str, env: Optional[Dict[str, str]] = None) -> bool:
+        """Apply each edit with ``wine reg add`` (one Wine process per edit)."""
+        env = dict(env if env is not None else os.environ)
+        env['WINEPREFIX'] = str(self.prefix)
+        env.setdefault('WINEDEBUG', '-all')
+        success = True
+        for key_path, name, value in self.edits:
+            if isinstance(value, (bool, int)):
+                reg_type, data = 'REG_DWORD', str(int(value))
+            else:
+                reg_type, data = 'REG_SZ', str(value)
+            cmd = [wine_binary, 'reg', 'add', key_path, '/v', name, '/t', reg_type, '/d', data, '/f']
+            try:
+                result = subprocess.run(cmd, env=env, capture_output=True, text=True, errors='replace', timeout=30)
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.error(f"Failed to run wine reg add for {key_path}\\{name}: {e}")
+                success = False
+                continue
+            if result.returncode != 0:
+                logger.error(f"wine reg add failed for {key_path}\\{name}: returncode={result.returncode}, stderr={result.stderr}")
+                success = False
+        return success
+
+    def apply(self, wine_binary: Optional[str] = None, env: Optional[Dict[str, str]] = None,
+              wait: float = 10.0) -> bool:
+        """
+        Apply the batch, editing the files directly if possible.
+
+        Waits up to ``wait`` seconds for a running wineserver to exit (it
+        leaves shortly after its last client). If it is still up, the edits
+        go through ``wine_binary`` when one is given.
+        """
+        if not self.edits:
+            return True
+        if wait > 0 and wineserver_running(self.prefix):
+            server_dir = wineserver_dir(self.prefix)
+            wait_for(lambda: not wineserver_running(self.prefix),
+                     lambda: [server_dir] if server_dir else [], wait, f"wineserver for {self.prefix} to exit")
+        if self.apply_offline():
+            return True
+        if wine_binary:
+            logger.info(f"Falling back to wine reg add for {len(self.edits)} registry edit(s)")
+            return self.apply_with_wine(wine_binary, env)
+        return False
+
+    def verify(self) -> bool:
+        """True if the registry files contain every queued value."""
+        hives: Dict[str, RegistryHive] = {}
+        for key_path, name, value in self.edits:
+            hive_name, key = _split_root(key_path)
+            if hive_name not in hives:
+                hives[hive_name] = RegistryHive(self.prefix / hive_name)
+            expected = int(value) if isinstance(value, (bool, int)) else str(value)
+            if hives[hive_name].get(key, name) != expected:
+                logger.debug(f"Registry value {key_path}\\{name} is not {expected!r}")
+                return False
+        return True
@@ -15,6 +15,10 @@ from pathlib import Path
 import glob
 from typing import Optional, Tuple, List, Dict
 from .subprocess_utils import get_clean_subprocess_env
+from .modlist_tree_index import invalidate_modlist_tree_index
+from . import ownership_auditor
+from .steam_library_index import get_steam_library_index
+from .proton_inventory import get_proton_inventory
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -255,19 +259,9 @@ class WineUtils:
     def all_owned_by_user(path):
         """
         Returns True if all files and directories under 'path' are owned by the current user.
+        Stops at the first foreign-owned entry (or answers from the shared modlist tree index).
         """
-        uid = os.getuid()
-        gid = os.getgid()
-        for root, dirs, files in os.walk(path):
-            for name in dirs + files:
-                full_path = os.path.join(root, name)
-                try:
-                    stat = os.stat(full_path)
-                    if stat.st_uid != uid or stat.st_gid != gid:
-                        return False
-                except Exception:
-                    return False
-        return True
+        return ownership_auditor.all_owned_by_user(path)
 
     @staticmethod
     def chown_chmod_modlist_dir(modlist_dir):
@@ -286,28 +280,30 @@ class WineUtils:
             
             logger.debug(f"User is {user} and Group is {group}")
             
-            # Change ownership
-            result1 = subprocess.run(
-                f"sudo chown -R {user}:{group} \"{modlist_dir}\"",
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-            
-            # Change permissions
-            result2 = subprocess.run(
-                f"sudo chmod -R 755 \"{modlist_dir}\"",
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-            
-            if result1.returncode != 0 or result2.returncode != 0:
-                logger.error("Failed to change ownership/permissions")
-                logger.error(f"chown output: {result1.stderr}")
-                logger.error(f"chmod output: {result2.stderr}")
-                return False
-                
+            # Only the offending subtrees are fixed, not the whole modlist
+            for targets in ownership_auditor.ownership_fix_targets(modlist_dir):
+                # Change ownership
+                result1 = subprocess.run(
+                    ["sudo", "chown", "-R", f"{user}:{group}", "--", *targets],
+                    capture_output=True,
+                    text=True
+                )
+
+                # Change permissions
+                result2 = subprocess.run(
+                    ["sudo", "chmod", "-R", "755", "--", *targets],
+                    capture_output=True,
+                    text=True
+                )
+
+                if result1.returncode != 0 or result2.returncode != 0:
+                    logger.error("Failed to change ownership/permissions")
+                    logger.error(f"chown output: {result1.stderr}")
+                    logger.error(f"chmod output: {result2.stderr}")
+                    return False
+
+            # Ownership changed - later steps must not reuse the old scan
+            invalidate_modlist_tree_index(modlist_dir)
             return True
             
         except Exception as e:
@@ -646,77 +642,37 @@ class WineUtils:
         # Clean up the version string for directory matching
         version_patterns = [proton_version, proton_version.replace(' ', '_'), proton_version.replace(' ', '')]
 
-        # Get actual Steam library paths from libraryfolders.vdf (smart detection)
-        steam_common_paths = []
-        compatibility_paths = []
-
-        try:
-            from .path_handler import PathHandler
-            # Get root Steam library paths (without /steamapps/common suffix)
-            root_steam_libs = PathHandler.get_all_steam_library_paths()
-            for lib_path in root_steam_libs:
-                lib = Path(lib_path)
-                if lib.exists():
-                    # Valve Proton: {library}/steamapps/common
-                    common_path = lib / "steamapps/common"
-                    if common_path.exists():
-                        steam_common_paths.append(common_path)
-                    # GE-Proton: same Steam installation root + compatibilitytools.d
-                    compatibility_paths.append(lib / "compatibilitytools.d")
-        except Exception as e:
-            logger.warning(f"Could not detect Steam libraries from libraryfolders.vdf: {e}")
-
-        # Fallback locations if dynamic detection fails
-        if not steam_common_paths:
-            steam_common_paths = [
-                Path.home() / ".steam/steam/steamapps/common",
-                Path.home() / ".local/share/Steam/steamapps/common",
-                Path.home() / ".steam/root/steamapps/common"
-            ]
-
-        if not compatibility_paths:
-            compatibility_paths = [
-                Path.home() / ".steam/steam/compatibilitytools.d",
-                Path.home() / ".local/share/Steam/compatibilitytools.d"
-            ]
+        # Proton builds in the standard layout, grouped by the directory they were found in
+        # (steamapps/common first, then compatibilitytools.d)
+        tools_by_dir: Dict[Path, List[Dict[str, any]]] = {}
+        for tool in WineUtils.get_proton_inventory_tools():
+            if tool['wine_bin'] == tool['path'] / "files/bin/wine":
+                tools_by_dir.setdefault(tool['source_dir'], []).append(tool)
+        steam_common_tools = [tools for tools in tools_by_dir.values() if tools[0]['kind'] == 'steam']
 
-        # Add standard compatibility tool locations (covers edge cases like Flatpak)
-        compatibility_paths.extend([
-            Path.home() / ".steam/root/compatibilitytools.d",
-            Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/compatibilitytools.d",
-            # Flatpak GE-Proton extension paths
-            Path.home() / ".var/app/com.valvesoftware.Steam.CompatibilityTool.Proton-GE/.local/share/Steam/compatibilitytools.d",
-            Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/compatibilitytools.d/GE-Proton"
-        ])
         # Special handling for Proton 9: try all possible directory names
         if proton_version.strip().startswith("Proton 9"):
             proton9_candidates = ["Proton 9.0", "Proton 9.0 (Beta)"]
-            for base_path in steam_common_paths:
+            for tools in steam_common_tools:
                 for name in proton9_candidates:
-                    candidate = base_path / name / "files/bin/wine"
-                    if candidate.is_file():
-                        return str(candidate)
+                    for tool in tools:
+                        if tool['name'] == name:
+                            return str(tool['wine_bin'])
                 # Fallback: any Proton 9* directory
-                for subdir in base_path.glob("Proton 9*"):
-                    wine_bin = subdir / "files/bin/wine"
-                    if wine_bin.is_file():
-                        return str(wine_bin)
+                for tool in tools:
+                    if tool['name'].startswith("Proton 9"):
+                        return str(tool['wine_bin'])
         # General case: try version patterns in both steamapps and compatibilitytools.d
-        all_paths = steam_common_paths + compatibility_paths
-        for base_path in all_paths:
-            if not base_path.is_dir():
-                continue
+        for tools in tools_by_dir.values():
             for pattern in version_patterns:
                 # Try direct match for Proton directory
-                proton_dir = base_path / pattern
-                wine_bin = proton_dir / "files/bin/wine"
-                if wine_bin.is_file():
-                    return str(wine_bin)
-                # Try glob for GE/other variants
-                for subdir in base_path.glob(f"*{pattern}*"):
-                    wine_bin = subdir / "files/bin/wine"
-                    if wine_bin.is_file():
-                        return str(wine_bin)
+                for tool in tools:
+                    if tool['name'] == pattern:
+                        return str(tool['wine_bin'])
+                # Try substring match for GE/other variants
+                for tool in tools:
+                    if pattern in tool['name']:
+                        return str(tool['wine_bin'])
         # Fallback: Try user's configured Proton version
         try:
             from .config_handler import ConfigHandler
@@ -731,11 +687,11 @@ class WineUtils:
             pass
 
         # Final fallback: Try 'Proton - Experimental' if present
-        for base_path in steam_common_paths:
-            wine_bin = base_path / "Proton - Experimental" / "files/bin/wine"
-            if wine_bin.is_file():
-                logger.warning(f"Requested Proton version '{proton_version}' not found. Falling back to 'Proton - Experimental'.")
-                return str(wine_bin)
+        for tools in steam_common_tools:
+            for tool in tools:
+                if tool['name'] == "Proton - Experimental":
+                    logger.warning(f"Requested Proton version '{proton_version}' not found. Falling back to 'Proton - Experimental'.")
+                    return str(tool['wine_bin'])
         return None
     
     @staticmethod
@@ -798,24 +754,13 @@ class WineUtils:
         steam_common_paths = []
 
         try:
-            from .path_handler import PathHandler
-            # Use existing PathHandler that reads libraryfolders.vdf
-            library_paths = PathHandler.get_all_steam_library_paths()
-            logger.info(f"PathHandler found Steam libraries: {library_paths}")
-
-            # Convert to steamapps/common paths for Proton scanning
-            for lib_path in library_paths:
-                common_path = lib_path / "steamapps" / "common"
-                if common_path.exists():
-                    steam_common_paths.append(common_path)
-                    logger.debug(f"Added Steam library: {common_path}")
-                else:
-                    logger.debug(f"Steam library path doesn't exist: {common_path}")
-
+            # Shared index of libraryfolders.vdf, already parsed by earlier lookups
+            steam_common_paths = get_steam_library_index().common_dirs()
+            logger.debug(f"Steam library common directories from libraryfolders.vdf: {steam_common_paths}")
         except Exception as e:
-            logger.error(f"PathHandler failed to read libraryfolders.vdf: {e}")
+            logger.error(f"Failed to read libraryfolders.vdf: {e}")
 
-        # Always add fallback paths in case PathHandler missed something
+        # Always add fallback paths in case libraryfolders.vdf missed something
         fallback_paths = [
             Path.home() / ".steam/steam/steamapps/common",
             Path.home() / ".local/share/Steam/steamapps/common",
@@ -851,6 +796,22 @@ class WineUtils:
         # Return only existing paths
         return [path for path in compat_paths if path.exists()]
 
+    @staticmethod
+    def get_proton_inventory_tools() -> List[Dict[str, any]]:
+        """
+        All compatibility tools in Steam libraries and compatibilitytools.d directories.
+
+        Served from the persisted Proton inventory; only directories whose
+        mtime changed since the last call are listed again.
+        """
+        compat_paths = WineUtils.get_compatibility_tool_paths()
+        # Tools can also live in compatibilitytools.d next to a library's steamapps
+        for lib_path in get_steam_library_index().library_paths():
+            lib_compat_path = lib_path / "compatibilitytools.d"
+            if lib_compat_path not in compat_paths and lib_compat_path.is_dir():
+                compat_paths.append(lib_compat_path)
+        return get_proton_inventory().tools(WineUtils.get_steam_library_paths(), compat_paths)
+
     @staticmethod
     def scan_ge_proton_versions() -> List[Dict[str, any]]:
         """
@@ -862,56 +823,43 @@ class WineUtils:
         logger.info("Scanning for available GE-Proton versions...")
 
         found_versions = []
-        compat_paths = WineUtils.get_compatibility_tool_paths()
-
-        if not compat_paths:
-            logger.warning("No compatibility tool paths found")
-            return []
-
-        for compat_path in compat_paths:
-            logger.debug(f"Scanning compatibility tools: {compat_path}")
-
-            try:
-                # Look for GE-Proton directories
-                for proton_dir in compat_path.iterdir():
-                    if not proton_dir.is_dir():
-                        continue
-
-                    dir_name = proton_dir.name
-                    if not dir_name.startswith("GE-Proton"):
-                        continue
-
-                    # Check for wine binary
-                    wine_bin = proton_dir / "files" / "bin" / "wine"
-                    if not wine_bin.exists() or not wine_bin.is_file():
-                        logger.debug(f"Skipping {dir_name} - no wine binary found")
-                        continue
-
-                    # Parse version from directory name (e.g., "GE-Proton10-16")
-                    version_match = re.match(r'GE-Proton(\d+)-(\d+)', dir_name)
-                    if version_match:
-                        major_ver = int(version_match.group(1))
-                        minor_ver = int(version_match.group(2))
+        for tool in WineUtils.get_proton_inventory_tools():
+            if tool['kind'] != 'compat':
+                continue
 
-                        # Calculate priority: GE-Proton gets highest priority
-                        # Priority format: 200 (base) + major*10 + minor (e.g., 200 + 100 + 16 = 316)
-                        priority = 200 + (major_ver * 10) + minor_ver
+            dir_name = tool['name']
+            if not dir_name.startswith("GE-Proton"):
+                continue
 
-                        found_versions.append({
-                            'name': dir_name,
-                            'path': proton_dir,
-                            'wine_bin': wine_bin,
-                            'priority': priority,
-                            'major_version': major_ver,
-                            'minor_version': minor_ver,
-                            'type': 'GE-Proton'
-                        })
-                        logger.debug(f"Found {dir_name} at {proton_dir} (priority: {priority})")
-                    else:
-                        logger.debug(f"Skipping {dir_name} - unknown GE-Proton version format")
+            # Check for wine binary
+            wine_bin = tool['path'] / "files" / "bin" / "wine"
+            if tool['wine_bin'] != wine_bin:
+                logger.debug(f"Skipping {dir_name} - no wine binary found")
+                continue
 
-            except Exception as e:
-                logger.warning(f"Error scanning {compat_path}: {e}")
+            # Parse version from directory name (e.g., "GE-Proton10-16")
+            version_match = re.match(r'GE-Proton(\d+)-(\d+)', dir_name)
+            if version_match:
+                major_ver = int(version_match.group(1))
+                minor_ver = int(version_match.group(2))
+
+                # Calculate priority: GE-Proton gets highest priority, ordered by (major, minor)
+                # Priority format: 200 (base) + major*100 + minor (e.g., 200 + 1000 + 16 = 1216)
+                priority = 200 + (major_ver * 100) + minor_ver
+
+                found_versions.append({
+                    'name': dir_name,
+                    'path': tool['path'],
+                    'wine_bin': wine_bin,
+                    'priority': priority,
+                    'major_version': major_ver,
+                    'minor_version': minor_ver,
+                    'version': f"{major_ver}-{minor_ver}",
+                    'type': 'GE-Proton'
+                })
+                logger.debug(f"Found {dir_name} at {tool['path']} (priority: {priority})")
+            else:
+                logger.debug(f"Skipping {dir_name} - unknown GE-Proton version format")
 
         # Sort by priority (highest first, so newest GE-Proton versions come first)
         found_versions.sort(key=lambda x: x['priority'], reverse=True)
@@ -930,37 +878,37 @@ class WineUtils:
         logger.info("Scanning for available Valve Proton versions...")
         
         found_versions = []
-        steam_libs = WineUtils.get_steam_library_paths()
-        
-        if not steam_libs:
-            logger.warning("No Steam library paths found")
-            return []
         
         # Priority order for Valve Proton versions
         # Note: GE-Proton uses 200+ range, so Valve Proton gets 100+ range
-        preferred_versions = [
-            ("Proton - Experimental", 150),  # Higher priority than regular Valve Proton
-            ("Proton 10.0", 140),
-            ("Proton 9.0", 130),
-            ("Proton 9.0 (Beta)", 125)
-        ]
+        preferred_versions = {
+            "Proton - Experimental": 150,  # Higher priority than regular Valve Proton
+            "Proton 10.0": 140,
+            "Proton 9.0": 130,
+            "Proton 9.0 (Beta)": 125
+        }
         
-        for steam_path in steam_libs:
-            logger.debug(f"Scanning Steam library: {steam_path}")
-            
-            for version_name, priority in preferred_versions:
-                proton_path = steam_path / version_name
-                wine_bin = proton_path / "files" / "bin" / "wine"
-                
-                if wine_bin.exists() and wine_bin.is_file():
-                    found_versions.append({
-                        'name': version_name,
-                        'path': proton_path,
-                        'wine_bin': wine_bin,
-                        'priority': priority,
-                        'type': 'Valve-Proton'
-                    })
-                    logger.debug(f"Found {version_name} at {proton_path}")
+        for tool in WineUtils.get_proton_inventory_tools():
+            version_name = tool['name']
+            if tool['kind'] != 'steam' or version_name not in preferred_versions:
+                continue
+            wine_bin = tool['path'] / "files" / "bin" / "wine"
+            if tool['wine_bin'] != wine_bin:
+                continue
+            version_match = re.match(r'Proton (\d+\.\d+)', version_name)
+            found_versions.append({
+                'name': version_name,
+                'path': tool['path'],
+                'wine_bin': wine_bin,
+                'priority': preferred_versions[version_name],
+                'version': version_match.group(1) if version_match else version_name,
+                'type': 'Valve-Proton'
+            })
+            logger.debug(f"Found {version_name} at {tool['path']}")
+        
+        if not found_versions:
+            logger.warning("No Valve Proton versions found in Steam libraries")
+            return []
         
         # Sort by priority (highest first)
         found_versions.sort(key=lambda x: x['priority'], reverse=True)
@@ -982,8 +930,8 @@ class WineUtils:
         Scan for all available Proton versions (GE-Proton + Valve Proton) with unified priority.
 
         Priority Chain (highest to lowest):
-        1. GE-Proton10-16+ (priority 316+)
-        2. GE-Proton10-* (priority 200+)
+        1. GE-Proton, newest (major, minor) first (priority 200 + major*100 + minor)
+        2. Older GE-Proton majors
         3. Proton - Experimental (priority 150)
         4. Proton 10.0 (priority 140)
         5. Proton 9.0 (priority 130)
@@ -11,6 +11,8 @@ import logging
 from pathlib import Path
 from typing import Optional, List, Callable
 
+from .winetricks_scheduler import WinetricksScheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -264,6 +266,8 @@ class WinetricksHandler:
         jackify_cache_dir = get_jackify_data_dir() / 'winetricks_cache'
         jackify_cache_dir.mkdir(parents=True, exist_ok=True)
         env['WINETRICKS_CACHE'] = str(jackify_cache_dir)
+        # winetricks itself reads W_CACHE
+        env['W_CACHE'] = str(jackify_cache_dir)
 
         if specific_components is not None:
             all_components = specific_components
@@ -306,10 +310,14 @@ class WinetricksHandler:
             return self._install_components_protontricks_only(components_to_install, wineprefix, game_var, status_callback)
         # else: method == 'winetricks' (default behavior continues below)
 
-        # Install all components together with winetricks (faster)
+        # Fetch all installer files in parallel first, then install in conflict-free lanes
+        scheduler = WinetricksScheduler(self.winetricks_path, logger=self.logger)
+        scheduler.prefetch(components_to_install, env['W_CACHE'], status_callback)
+
         max_attempts = 3
         winetricks_failed = False
         last_error_details = None
+        pending_components = list(components_to_install)
 
         for attempt in range(1, max_attempts + 1):
             if attempt > 1:
@@ -317,10 +325,7 @@ class WinetricksHandler:
                 self._cleanup_wine_processes()
 
             try:
-                # Build winetricks command - using --unattended for silent installation
-                cmd = [self.winetricks_path, '--unattended'] + components_to_install
-
-                self.logger.debug(f"Running: {' '.join(cmd)}")
+                self.logger.debug(f"Components pending: {pending_components}")
 
                 # Enhanced diagnostics for bundled winetricks
                 self.logger.debug("=== Winetricks Environment Diagnostics ===")
@@ -351,21 +356,16 @@ class WinetricksHandler:
                     self.logger.debug(f"WINEPREFIX exists: False")
 
                 self.logger.debug(f"DISPLAY: {env.get('DISPLAY', 'NOT SET')}")
-                self.logger.debug(f"WINETRICKS_CACHE: {env.get('WINETRICKS_CACHE', 'NOT SET')}")
+                self.logger.debug(f"W_CACHE: {env.get('W_CACHE', 'NOT SET')}")
                 self.logger.debug(f"Components to install: {components_to_install}")
                 self.logger.debug("==========================================")
 
-                result = subprocess.run(
-                    cmd,
-                    env=env,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=600
-                )
+                lane_results = scheduler.run(pending_components, env, timeout=600)
+                failed_lanes = [lane for lane in lane_results if not lane.succeeded]
+                for lane in lane_results:
+                    self.logger.debug(f"Winetricks output for {lane.components}: {lane.stdout}")
 
-                self.logger.debug(f"Winetricks output: {result.stdout}")
-                if result.returncode == 0:
+                if not failed_lanes:
                     self.logger.info("Wine Component installation command completed.")
 
                     # Verify components were actually installed
@@ -379,8 +379,17 @@ class WinetricksHandler:
                         return True
                     else:
                         self.logger.error(f"Component verification failed (Attempt {attempt}/{max_attempts})")
+                        pending_components = list(components_to_install)
                         # Continue to retry
+                elif any(lane.timed_out for lane in failed_lanes):
+                    # Lanes that succeeded are not re-run on the next attempt
+                    pending_components = [c for lane in failed_lanes for c in lane.components]
+                    self.logger.error(f"Winetricks timed out (Attempt {attempt}/{max_attempts}) installing: {pending_components}")
+                    last_error_details = {'error': 'timeout', 'attempt': attempt}
+                    winetricks_failed = True
                 else:
+                    pending_components = [c for lane in failed_lanes for c in lane.components]
+                    result = failed_lanes[0]
                     # Store detailed error information for fallback diagnostics
                     last_error_details = {
                         'returncode': result.returncode,
@@ -389,7 +398,7 @@ class WinetricksHandler:
                         'attempt': attempt
                     }
 
-                    self.logger.error(f"Winetricks command failed (Attempt {attempt}/{max_attempts}). Return Code: {result.returncode}")
+                    self.logger.error(f"Winetricks command failed (Attempt {attempt}/{max_attempts}) for {pending_components}. Return Code: {result.returncode}")
                     self.logger.error(f"Stdout: {result.stdout.strip()}")
                     self.logger.error(f"Stderr: {result.stderr.strip()}")
 
@@ -427,10 +436,6 @@ class WinetricksHandler:
 
                     winetricks_failed = True
 
-            except subprocess.TimeoutExpired as e:
-                self.logger.error(f"Winetricks timed out (Attempt {attempt}/{max_attempts}): {e}")
-                last_error_details = {'error': 'timeout', 'attempt': attempt}
-                winetricks_failed = True
             except Exception as e:
                 self.logger.error(f"Error during winetricks run (Attempt {attempt}/{max_attempts}): {e}", exc_info=True)
                 last_error_details = {'error': str(e), 'attempt': attempt}
@@ -502,61 +507,6 @@ class WinetricksHandler:
         """
         return components
 
-    def _install_components_separately(self, components: list, wineprefix: str, wine_binary: str, base_env: dict) -> bool:
-        """
-        Install components separately for maximum compatibility.
-        """
-        self.logger.info(f"Installing {len(components)} components separately")
-
-        for i, component in enumerate(components, 1):
-            self.logger.info(f"Installing component {i}/{len(components)}: {component}")
-
-            # Prepare environment for this component
-            env = base_env.copy()
-            env['WINEPREFIX'] = wineprefix
-            env['WINE'] = wine_binary
-
-            # Install this component
-            max_attempts = 3
-            component_success = False
-
-            for attempt in range(1, max_attempts + 1):
-                if attempt > 1:
-                    self.logger.warning(f"Retrying {component} installation (attempt {attempt}/{max_attempts})")
-                    self._cleanup_wine_processes()
-
-                try:
-                    cmd = [self.winetricks_path, '--unattended', component]
-                    self.logger.debug(f"Running: {' '.join(cmd)}")
-
-                    result = subprocess.run(
-                        cmd,
-                        env=env,
-                        capture_output=True,
-                        text=True,
-                        timeout=600
-                    )
-
-                    if result.returncode == 0:
-                        self.logger.info(f"{component} installed successfully")
-                        component_success = True
-                        break
-                    else:
-                        self.logger.error(f"{component} failed (attempt {attempt}): {result.stderr.strip()}")
-                        self.logger.debug(f"Full stdout for {component}: {result.stdout.strip()}")
-
-                except Exception as e:
-                    self.logger.error(f"Error installing {component} (attempt {attempt}): {e}")
-
-            if not component_success:
-                self.logger.error(f"Failed to install {component} after {max_attempts} attempts")
-                return False
-
-        self.logger.info("All components installed successfully using separate sessions")
-        # Set Windows 10 mode after all component installation
-        self._set_windows_10_mode(wineprefix, env.get('WINE', ''))
-        return True
-
     def _prepare_winetricks_environment(self, wineprefix: str) -> Optional[dict]:
         """
         Prepare the environment for winetricks installation.
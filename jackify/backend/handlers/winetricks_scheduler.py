@@ -0,0 +1,467 @@
+"""
+Winetricks Scheduler
+
+Plans and runs the winetricks component installs for one prefix.
+
+The bundled winetricks script is parsed for what each verb downloads
+(``w_download``/``w_download_to`` with their SHA-256), which other verbs it
+pulls in, and - following every shell function it calls (``w_try_regedit``,
+``w_override_dlls``, ...) - whether it ever runs a Wine program. That is
+used to:
+
+- fetch every installer file up front, in parallel, straight into the
+  winetricks cache (checksum-verified, so winetricks finds them and skips its
+  own sequential downloads);
+- split the components into conflict lanes. Verbs that run Windows setup
+  programs, run regedit/regsvr32, set DLL overrides, change the Windows
+  version or call other verbs all share one lane and run in dependency
+  order; only verbs that never start Wine (they just download, extract or
+  copy files) get their own lane (verbs sharing a download share a lane).
+  Lanes are separate winetricks processes against the same prefix;
+- record how long each component took, so later runs start the longest
+  lanes first.
+
+Every verb in Jackify's own component lists (fontsmooth, xact, vcrun2022,
+the d3dx/d3dcompiler DLLs, dotnet) runs Wine, so those lists are planned as
+one lane and installed by a single winetricks process as before; for them
+the time saved comes from the parallel prefetch alone.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from jackify.shared.paths import get_jackify_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Lanes run at the same time against one prefix
+MAX_PARALLEL_LANES = 3
+# Installer files downloaded at the same time
+MAX_PARALLEL_DOWNLOADS = 4
+# Seconds assumed for a component that has never been timed
+DEFAULT_EXCLUSIVE_SECONDS = 60.0
+DEFAULT_CONCURRENT_SECONDS = 10.0
+
+TIMINGS_FILENAME = "winetricks_timings.json"
+
+_FUNCTION_START = re.compile(r"^(\w+)\(\)")
+_DOWNLOAD_TO = re.compile(r"\bw_download_to\s+(\S+)\s+(\S+)\s+([0-9a-fA-F]{64})(?:\s+(\S+))?")
+_DOWNLOAD = re.compile(r"\bw_download\s+(\S+)\s+([0-9a-fA-F]{64})(?:\s+(\S+))?")
+_W_CALL = re.compile(r"\bw_call\s+(\w+)")
+_HELPER_CALL = re.compile(r"(?<![\w$])(helper_\w+)\b(?!\(\))")
+_WORD = re.compile(r"(?<![\w$])[A-Za-z_]\w*")
+# Anything that starts a Windows program, waits on the wineserver or changes
+# the Windows version must not overlap with another such verb. Wine itself
+# only counts in command position ("${WINE}" regedit, $("${WINE}" ...),
+# w_try "${WINE64}" ...), not in tests or messages mentioning it.
+_EXCLUSIVE_MARKERS = re.compile(
+    r"w_try_ms_installer|w_try_msiexec64|w_set_winver|w_wineserver|w_call\b"
+    r"|(?:^|[;&|(]|\bw_try|\bexec|\b\w+=\S*)\s*\"?\$\{?(?:WINE|WINE64|WINESERVER)\}?\"?(?:\s|$)"
+)
+_EXECUTING_VERB = re.compile(r"Executing load_(\w+)")
+
+
+class VerbInfo:
+    """What one winetricks verb (or helper) does, as far as scheduling cares."""
+
+    __slots__ = ("name", "downloads", "calls", "helpers", "functions", "exclusive")
+
+    def __init__(self, name: str):
+        self.name = name
+        # (cache package, url, sha256, filename); package None means "the verb itself"
+        self.downloads: List[Tuple[Optional[str], str, str, str]] = []
+        self.calls: Set[str] = set()
+        self.helpers: Set[str] = set()
+        # Every other shell function named in the body (w_try_regedit, ...)
+        self.functions: Set[str] = set()
+        self.exclusive = False
+
+
+def _unquote(token: Optional[str]) -> Optional[str]:
+    if token is None:
+        return None
+    return token.strip("\"'")
+
+
+@lru_cache(maxsize=4)
+def _parse_winetricks(path: str, mtime: float) -> Dict[str, VerbInfo]:
+    """
+    Parse the shell functions of a winetricks script (cached per file version).
+
+    ``exclusive`` is resolved through every function a body calls, so a verb
+    is only non-exclusive if nothing it runs can start Wine.
+    """
+    functions: Dict[str, VerbInfo] = {}
+    current: Optional[VerbInfo] = None
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if current is None:
+                match = _FUNCTION_START.match(line)
+                if match:
+                    current = VerbInfo(match.group(1))
+                    functions[current.name] = current
+                continue
+            if line.startswith("}"):
+                current = None
+                continue
+
+            code = line.split("#", 1)[0] if line.lstrip().startswith("#") else line
+            if not code.strip():
+                continue
+            if _EXCLUSIVE_MARKERS.search(code):
+                current.exclusive = True
+            current.calls.update(_W_CALL.findall(code))
+            current.helpers.update(_HELPER_CALL.findall(code))
+            current.functions.update(_WORD.findall(code))
+
+            match = _DOWNLOAD_TO.search(code)
+            if match:
+                package, url, sha, filename = (_unquote(g) for g in match.groups())
+                current.downloads.append((package, url, sha.lower(), filename or os.path.basename(url)))
+                continue
+            match = _DOWNLOAD.search(code)
+            if match:
+                url, sha, filename = (_unquote(g) for g in match.groups())
+                current.downloads.append((None, url, sha.lower(), filename or os.path.basename(url)))
+
+    for info in functions.values():
+        info.functions = {name for name in info.functions
+                          if name in functions and name != info.name and not name.startswith("load_")}
+    # Propagate "runs Wine" from callees to callers until nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for info in functions.values():
+            if not info.exclusive and any(functions[called].exclusive for called in info.functions):
+                info.exclusive = True
+                changed = True
+    return functions
+
+
+class LaneResult:
+    """Outcome of one winetricks process; mirrors the fields of ``CompletedProcess``."""
+
+    def __init__(self, components: List[str]):
+        self.components = components
+        self.returncode: Optional[int] = None
+        self.stdout = ""
+        self.stderr = ""
+        self.timed_out = False
+        self.durations: Dict[str, float] = {}
+
+    @property
+    def succeeded(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+
+class WinetricksScheduler:
+    """Dependency- and conflict-aware runner for winetricks components."""
+
+    def __init__(self, winetricks_path: str, logger: Optional[logging.Logger] = None):
+        self.winetricks_path = winetricks_path
+        self.logger = logger or logging.getLogger(__name__)
+        self.timings_path = get_jackify_data_dir() / TIMINGS_FILENAME
+        self._timings = self._load_timings()
+        try:
+            self._verbs = _parse_winetricks(winetricks_path, os.path.getmtime(winetricks_path))
+        except OSError as e:
+            self.logger.warning(f"Could not parse winetricks for scheduling, installing sequentially: {e}")
+            self._verbs = {}
+
+    # ----- analysis -----
+
+    @staticmethod
+    def verb_name(component: str) -> str:
+        """``fontsmooth=rgb`` -> ``fontsmooth``."""
+        return component.split("=", 1)[0]
+
+    def _closure(self, component: str) -> Tuple[Set[str], bool, List[Tuple[str, str, str, str]]]:
+        """Verbs pulled in via ``w_call``, whether anything is exclusive, and all downloads."""
+        verb = self.verb_name(component)
+        if f"load_{verb}" not in self._verbs:
+            # Unknown to the parser: treat as exclusive and let winetricks download
+            return set(), True, []
+
+        calls: Set[str] = set()
+        exclusive = False
+        downloads = []
+        stack = [(f"load_{verb}", verb)]
+        seen = set()
+        while stack:
+            name, package = stack.pop()
+            if name in seen or name not in self._verbs:
+                continue
+            seen.add(name)
+            info = self._verbs[name]
+            exclusive = exclusive or info.exclusive
+            for dl_package, url, sha, filename in info.downloads:
+                if dl_package in ("${W_PACKAGE}", "$W_PACKAGE"):
+                    dl_package = None
+                if "$" in url or "$" in filename or (dl_package and "$" in dl_package):
+                    continue
+                downloads.append((dl_package or package, url, sha, filename))
+            for helper in info.helpers:
+                stack.append((helper, package))
+            for called in info.calls:
+                calls.add(called)
+                stack.append((f"load_{called}", called))
+        return calls, exclusive, downloads
+
+    def _estimate(self, component: str, exclusive: bool) -> float:
+        record = self._timings.get(component)
+        if record:
+            return record["seconds"]
+        return DEFAULT_EXCLUSIVE_SECONDS if exclusive else DEFAULT_CONCURRENT_SECONDS
+
+    def plan(self, components: List[str]) -> List[List[str]]:
+        """
+        Split ``components`` into lanes, longest estimated lane first.
+
+        Dependencies (a component another requested one ``w_call``s) are placed
+        before their dependents in the exclusive lane.
+        """
+        if not self._verbs:
+            return [list(components)] if components else []
+
+        closures = {c: self._closure(c) for c in components}
+        requested = {self.verb_name(c): c for c in components}
+
+        exclusive: List[str] = []
+        lanes: List[List[str]] = []
+        lane_packages: List[Set[str]] = []
+        for component in components:
+            calls, is_exclusive, downloads = closures[component]
+            if is_exclusive:
+                exclusive.append(component)
+                continue
+            packages = {package for package, _, _, _ in downloads}
+            for lane, used in zip(lanes, lane_packages):
+                if packages & used:
+                    lane.append(component)
+                    used.update(packages)
+                    break
+            else:
+                lanes.append([component])
+                lane_packages.append(set(packages))
+
+        # Stable topological order: a component waits for the requested verbs it calls
+        ordered: List[str] = []
+        placed: Set[str] = set()
+
+        def place(component: str, visiting: Set[str]):
+            if component in placed or component in visiting:
+                return
+            visiting.add(component)
+            for called in sorted(closures[component][0]):
+                dependency = requested.get(called)
+                if dependency in exclusive:
+                    place(dependency, visiting)
+            placed.add(component)
+            ordered.append(component)
+
+        for component in exclusive:
+            place(component, set())
+        if ordered:
+            lanes.append(ordered)
+
+        def lane_seconds(lane: List[str]) -> float:
+            return sum(self._estimate(c, closures[c][1]) for c in lane)
+
+        lanes.sort(key=lane_seconds, reverse=True)
+        return lanes
+
+    # ----- downloads -----
+
+    def prefetch(self, components: List[str], cache_dir: str,
+                 status_callback: Optional[Callable[[str], None]] = None) -> int:
+        """
+        Download and verify all installer files for ``components`` into ``cache_dir``.
+
+        Files already cached with the right checksum are kept. Failures are
+        logged and left to winetricks. Returns the number of files ready.
+        """
+        wanted: Dict[str, Tuple[str, str, str]] = {}
+        for component in components:
+            for package, url, sha, filename in self._closure(component)[2]:
+                relative = os.path.join(package, filename)
+                wanted[os.path.join(cache_dir, relative)] = (url, sha, relative)
+        if not wanted:
+            return 0
+
+        # Each file is hashed once: cached files here, fetched ones while downloading
+        missing = {path: src for path, src in wanted.items() if not self._has_valid_file(path, src[1])}
+        ready = len(wanted) - len(missing)
+        if missing:
+            self.logger.info(f"Prefetching {len(missing)} winetricks installer file(s) in parallel")
+            if status_callback:
+                status_callback(f"Downloading {len(missing)} Wine component installer(s)")
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS, thread_name_prefix="winetricks-dl") as pool:
+                ready += sum(pool.map(lambda item: self._fetch(item[0], *item[1]), missing.items()))
+
+        self.logger.info(f"Winetricks cache: {ready}/{len(wanted)} installer file(s) ready")
+        return ready
+
+    @staticmethod
+    def _sha256(path: str) -> Optional[str]:
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _has_valid_file(self, path: str, sha: str) -> bool:
+        return os.path.isfile(path) and self._sha256(path) == sha
+
+    def _fetch(self, path: str, url: str, sha: str, relative: str) -> bool:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Reuse a verified copy from the user's regular winetricks cache
+        legacy_cache = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "winetricks"
+        legacy = legacy_cache / relative
+        if legacy.is_file() and self._sha256(str(legacy)) == sha:
+            try:
+                shutil.copy2(legacy, path)
+                self.logger.debug(f"Reused {legacy} for {path}")
+                return True
+            except OSError as e:
+                self.logger.debug(f"Could not copy {legacy}: {e}")
+
+        tmp_path = path + ".part"
+        try:
+            import requests
+            digest = hashlib.sha256()
+            with requests.get(url, stream=True, timeout=60, verify=True) as r:
+                r.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in r.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+                        digest.update(chunk)
+            if digest.hexdigest() != sha:
+                self.logger.warning(f"Checksum mismatch for {url}; leaving the download to winetricks")
+                os.remove(tmp_path)
+                return False
+            os.replace(tmp_path, path)
+            self.logger.debug(f"Prefetched {url} -> {path}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Prefetch of {url} failed ({e}); winetricks will retry it")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    # ----- running -----
+
+    def run(self, components: List[str], env: dict, timeout: int = 600) -> List[LaneResult]:
+        """Install ``components``, running independent lanes concurrently. Records timings."""
+        lanes = self.plan(components)
+        self.logger.info(f"Winetricks lanes: {lanes}")
+        if len(lanes) <= 1:
+            results = [self._run_lane(lane, env, timeout) for lane in lanes]
+        else:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_LANES, thread_name_prefix="winetricks-lane") as pool:
+                results = list(pool.map(lambda lane: self._run_lane(lane, env, timeout), lanes))
+
+        for result in results:
+            if result.succeeded:
+                for component, seconds in result.durations.items():
+                    self._record_timing(component, seconds)
+        self._save_timings()
+        return results
+
+    def _run_lane(self, components: List[str], env: dict, timeout: int) -> LaneResult:
+        result = LaneResult(components)
+        cmd = [self.winetricks_path, "--unattended"] + components
+        self.logger.debug(f"Running: {' '.join(cmd)}")
+
+        by_verb = {self.verb_name(c): c for c in components}
+        started: Dict[str, float] = {}
+        current: Optional[str] = None
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+
+        proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, errors="replace", start_new_session=True)
+
+        def kill():
+            result.timed_out = True
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+        watchdog = threading.Timer(timeout, kill)
+        watchdog.start()
+        reader = threading.Thread(target=lambda: stdout_lines.extend(proc.stdout), daemon=True)
+        reader.start()
+        try:
+            # winetricks announces each verb on stderr ("Executing load_<verb> ...")
+            for line in proc.stderr:
+                stderr_lines.append(line)
+                match = _EXECUTING_VERB.search(line)
+                if match and match.group(1) in by_verb:
+                    now = time.monotonic()
+                    if current is not None:
+                        result.durations[current] = now - started[current]
+                    current = by_verb[match.group(1)]
+                    started[current] = now
+            result.returncode = proc.wait()
+            reader.join()
+        finally:
+            watchdog.cancel()
+
+        if current is not None:
+            result.durations[current] = time.monotonic() - started[current]
+        result.stdout = "".join(stdout_lines)
+        result.stderr = "".join(stderr_lines)
+        self.logger.debug(f"Lane {components} finished with {result.returncode} in "
+                          f"{sum(result.durations.values()):.1f}s")
+        return result
+
+    # ----- timings -----
+
+    def _load_timings(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with open(self.timings_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable winetricks timings {self.timings_path}: {e}")
+            return {}
+
+    def _record_timing(self, component: str, seconds: float):
+        record = self._timings.get(component)
+        if record:
+            # Moving average so one slow run doesn't dominate
+            record["seconds"] = round(0.7 * record["seconds"] + 0.3 * seconds, 2)
+            record["runs"] = record.get("runs", 1) + 1
+        else:
+            self._timings[component] = {"seconds": round(seconds, 2), "runs": 1}
+
+    def _save_timings(self):
+        try:
+            self.timings_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.timings_path.with_name(self.timings_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._timings, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.timings_path)
+        except OSError as e:
+            self.logger.debug(f"Could not save winetricks timings: {e}")
@@ -4,9 +4,12 @@ Data models for modlist metadata from jackify-engine JSON output.
 These models match the JSON schema documented in MODLIST_METADATA_IMPLEMENTATION.md
 """
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from .modlist_search_index import ModlistSearchIndex
+
 
 @dataclass
 class ModlistImages:
@@ -130,6 +133,8 @@ class ModlistMetadataResponse:
     timestamp: str  # ISO8601 format
     count: int
     modlists: List[ModlistMetadata]
+    # Built lazily by get_search_index(); not part of the engine schema
+    _search_index: Optional["ModlistSearchIndex"] = field(default=None, init=False, repr=False, compare=False)
 
     def get_timestamp_datetime(self) -> Optional[datetime]:
         """Parse timestamp string to datetime object"""
@@ -138,9 +143,24 @@ class ModlistMetadataResponse:
         except (ValueError, AttributeError):
             return None
 
+    def get_search_index(self) -> "ModlistSearchIndex":
+        """Return the search index, rebuilding it if the modlist list was replaced or resized"""
+        from .modlist_search_index import ModlistSearchIndex
+        index = self._search_index
+        if index is None or index.source is not self.modlists or len(index) != len(self.modlists):
+            index = ModlistSearchIndex(self.modlists)
+            index.source = self.modlists
+            self._search_index = index
+        return index
+
+    def invalidate_search_index(self):
+        """Drop the search index after modlists were edited in place"""
+        self._search_index = None
+
     def filter_by_game(self, game: str) -> List[ModlistMetadata]:
         """Filter modlists by game name"""
-        return [m for m in self.modlists if m.game.lower() == game.lower()]
+        index = self.get_search_index()
+        return index.modlists_for(index.game_key_bits(game))
 
     def filter_available_only(self) -> List[ModlistMetadata]:
         """Filter to only available (non-broken, non-forced-down) modlists"""
@@ -148,21 +168,57 @@ class ModlistMetadataResponse:
 
     def filter_by_tag(self, tag: str) -> List[ModlistMetadata]:
         """Filter modlists by tag"""
-        return [m for m in self.modlists if tag.lower() in [t.lower() for t in m.tags]]
+        index = self.get_search_index()
+        return index.modlists_for(index.raw_tag_bits(tag))
 
     def filter_official_only(self) -> List[ModlistMetadata]:
         """Filter to only official modlists"""
         return [m for m in self.modlists if m.official]
 
+    def filter_by_mod(self, mod_name: str) -> List[ModlistMetadata]:
+        """Filter modlists that include a mod (requires the search index)"""
+        index = self.get_search_index()
+        return index.modlists_for(index.mod_bits(mod_name))
+
     def search(self, query: str) -> List[ModlistMetadata]:
         """Search modlists by title, description, or author"""
-        query_lower = query.lower()
-        return [
-            m for m in self.modlists
-            if query_lower in m.title.lower()
-            or query_lower in m.description.lower()
-            or query_lower in m.author.lower()
-        ]
+        index = self.get_search_index()
+        return index.modlists_for(index.search_bits(query))
+
+
+@dataclass
+class ModlistMetadataDiff:
+    """Difference between two metadata responses, keyed by machineURL"""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _modlist_change_key(modlist: ModlistMetadata) -> Tuple:
+    """Fields whose change means a modlist's card needs refreshing"""
+    return (modlist.version, modlist.dateUpdated, modlist.validation, modlist.forceDown)
+
+
+def diff_modlist_metadata(
+    old: Optional[ModlistMetadataResponse],
+    new: Optional[ModlistMetadataResponse]
+) -> ModlistMetadataDiff:
+    """Compare two responses by version, dateUpdated and validation status"""
+    old_by_url: Dict[str, ModlistMetadata] = {m.machineURL: m for m in old.modlists} if old else {}
+    new_by_url: Dict[str, ModlistMetadata] = {m.machineURL: m for m in new.modlists} if new else {}
+    diff = ModlistMetadataDiff()
+    for url, modlist in new_by_url.items():
+        previous = old_by_url.get(url)
+        if previous is None:
+            diff.added.append(url)
+        elif _modlist_change_key(previous) != _modlist_change_key(modlist):
+            diff.changed.append(url)
+    diff.removed = [url for url in old_by_url if url not in new_by_url]
+    return diff
 
 
 def parse_modlist_metadata_from_dict(data: dict) -> ModlistMetadata:
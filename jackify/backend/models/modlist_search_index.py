@@ -0,0 +1,205 @@
+"""
+In-memory search index over modlist metadata.
+
+Built once per metadata response so the gallery filters answer from prebuilt
+postings instead of lowercasing every title, description, author and tag on
+each keystroke. Result sets are Python ints used as bitsets (bit i = the i-th
+modlist in index order), so combining filters is a handful of AND operations.
+
+Text search keeps the original substring semantics: word postings narrow the
+candidates, then the candidates are checked against the pre-lowercased text.
+"""
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from .modlist_metadata import ModlistMetadata
+
+_WORD_RE = re.compile(r'\w+')
+
+# Per-token vocabulary matches kept for incremental (keystroke-by-keystroke) queries
+_TOKEN_CACHE_LIMIT = 256
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split already-lowercased text into word tokens"""
+    return _WORD_RE.findall(text)
+
+
+def _iter_bits(bits: int) -> Iterable[int]:
+    """Yield the positions of set bits, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class ModlistSearchIndex:
+    """
+    Postings for title/description/author words, tags, games, status flags
+    and mod names (from the engine's --include-search-index output).
+    """
+
+    def __init__(
+        self,
+        modlists: Sequence[ModlistMetadata],
+        normalize_tags: Optional[Callable[[ModlistMetadata], List[str]]] = None
+    ):
+        """
+        Args:
+            modlists: Modlists to index; results are returned in this order
+            normalize_tags: Returns display tags for a modlist (defaults to its
+                cached normalized_tags_display, then its raw tags)
+        """
+        self.source = modlists
+        self.modlists: List[ModlistMetadata] = list(modlists)
+        self.all_bits = (1 << len(self.modlists)) - 1
+
+        self._search_text: List[str] = []
+        self._word_postings: Dict[str, int] = {}
+        self._tag_postings: Dict[str, int] = {}
+        self._raw_tag_postings: Dict[str, int] = {}
+        self._game_postings: Dict[str, int] = {}
+        self._game_key_postings: Dict[str, int] = {}
+        self._mod_postings: Dict[str, int] = {}
+        self.official_bits = 0
+        self.nsfw_bits = 0
+        self.available_bits = 0
+
+        self._token_cache: Dict[str, List[str]] = {}
+        self._last_query: Optional[str] = None
+        self._last_query_bits = self.all_bits
+
+        for idx, modlist in enumerate(self.modlists):
+            self._add(idx, modlist, normalize_tags)
+
+        self._words = list(self._word_postings)
+        self.mod_names: List[str] = sorted(self._mod_postings, key=str.lower)
+        self._mod_names_lower: List[str] = [name.lower() for name in self.mod_names]
+        sfw_mod_bits = self.all_bits & ~self.nsfw_bits
+        self.nsfw_only_mods = {
+            name for name, bits in self._mod_postings.items() if not bits & sfw_mod_bits
+        }
+
+    def __len__(self) -> int:
+        return len(self.modlists)
+
+    def _add(self, idx: int, modlist: ModlistMetadata, normalize_tags):
+        bit = 1 << idx
+        fields = [modlist.title or "", modlist.description or "", modlist.author or ""]
+        lowered = [text.lower() for text in fields]
+        # Separate fields so a query never matches across a field boundary
+        self._search_text.append("\x00".join(lowered))
+        for text in lowered:
+            for word in _tokenize(text):
+                self._word_postings[word] = self._word_postings.get(word, 0) | bit
+
+        display_tags = getattr(modlist, 'normalized_tags_display', None)
+        if display_tags is None:
+            display_tags = normalize_tags(modlist) if normalize_tags else (modlist.tags or [])
+        for tag in display_tags:
+            key = tag.lower()
+            self._tag_postings[key] = self._tag_postings.get(key, 0) | bit
+        for tag in modlist.tags or []:
+            key = tag.lower()
+            self._raw_tag_postings[key] = self._raw_tag_postings.get(key, 0) | bit
+
+        game = modlist.gameHumanFriendly or ""
+        self._game_postings[game] = self._game_postings.get(game, 0) | bit
+        game_key = (modlist.game or "").lower()
+        self._game_key_postings[game_key] = self._game_key_postings.get(game_key, 0) | bit
+
+        if modlist.official:
+            self.official_bits |= bit
+        if modlist.nsfw:
+            self.nsfw_bits |= bit
+        if modlist.is_available():
+            self.available_bits |= bit
+
+        for mod in modlist.mods or []:
+            self._mod_postings[mod] = self._mod_postings.get(mod, 0) | bit
+
+    def _words_containing(self, token: str) -> List[str]:
+        """Vocabulary words that contain token, reusing the shorter token's matches while typing"""
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+        candidates = self._words
+        for shorter in (token[:-1], token[1:]):
+            if shorter and shorter in self._token_cache:
+                candidates = self._token_cache[shorter]
+                break
+        matches = [word for word in candidates if token in word]
+        if len(self._token_cache) >= _TOKEN_CACHE_LIMIT:
+            self._token_cache.clear()
+        self._token_cache[token] = matches
+        return matches
+
+    def search_bits(self, query: str) -> int:
+        """Modlists whose title, description or author contains query (case-insensitive)"""
+        query_lower = query.lower()
+        if not query_lower:
+            return self.all_bits
+
+        # Typing more characters can only narrow the previous result
+        if self._last_query and self._last_query in query_lower:
+            candidates = self._last_query_bits
+        else:
+            candidates = self.all_bits
+
+        for token in _tokenize(query_lower):
+            token_bits = 0
+            for word in self._words_containing(token):
+                token_bits |= self._word_postings[word]
+            candidates &= token_bits
+            if not candidates:
+                break
+
+        search_text = self._search_text
+        bits = 0
+        for idx in _iter_bits(candidates):
+            if query_lower in search_text[idx]:
+                bits |= 1 << idx
+
+        self._last_query = query_lower
+        self._last_query_bits = bits
+        return bits
+
+    def tag_bits(self, tag_key: str) -> int:
+        """Modlists carrying a normalized (lowercase) tag"""
+        return self._tag_postings.get(tag_key.lower(), 0)
+
+    def raw_tag_bits(self, tag: str) -> int:
+        """Modlists carrying a tag exactly as published (case-insensitive)"""
+        return self._raw_tag_postings.get(tag.lower(), 0)
+
+    def game_bits(self, game_human_friendly: str) -> int:
+        """Modlists for a game by its display name"""
+        return self._game_postings.get(game_human_friendly, 0)
+
+    def game_key_bits(self, game: str) -> int:
+        """Modlists for a game by its engine name (case-insensitive)"""
+        return self._game_key_postings.get(game.lower(), 0)
+
+    def mod_bits(self, mod_name: str) -> int:
+        """Modlists that include a mod (from the search index)"""
+        return self._mod_postings.get(mod_name, 0)
+
+    def search_mods(self, query: str = "", include_nsfw_only: bool = True) -> List[str]:
+        """
+        Mod names containing query (case-insensitive), sorted.
+
+        Args:
+            query: Substring to look for; empty returns every mod
+            include_nsfw_only: Include mods that only appear in NSFW modlists
+        """
+        query_lower = query.strip().lower()
+        excluded = () if include_nsfw_only else self.nsfw_only_mods
+        return [
+            name for name, lower in zip(self.mod_names, self._mod_names_lower)
+            if query_lower in lower and name not in excluded
+        ]
+
+    def modlists_for(self, bits: int) -> List[ModlistMetadata]:
+        """Materialize a result bitset in index order"""
+        modlists = self.modlists
+        return [modlists[idx] for idx in _iter_bits(bits)]
@@ -259,33 +259,26 @@ class AutomatedPrefixService:
             True if we should proceed (no conflict or user chose to replace), False if user cancelled
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return True  # No shortcuts file, no conflict
             
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            shortcuts = shortcuts_data.get('shortcuts', {})
             conflicts = []
             
             # Look for shortcuts with the same name AND path
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                name = shortcut.get('AppName', '')
+            # Use exact name match instead of partial match to avoid false positives
+            for index, shortcut in session.find_by_name(shortcut_name):
                 shortcut_exe = shortcut.get('Exe', '').strip('"')  # Remove quotes
                 shortcut_startdir = shortcut.get('StartDir', '').strip('"')  # Remove quotes
                 
                 # Check if name matches AND (exe path matches OR startdir matches)
-                # Use exact name match instead of partial match to avoid false positives
-                name_matches = shortcut_name == name
                 exe_matches = shortcut_exe == exe_path
                 startdir_matches = shortcut_startdir == modlist_install_dir
                 
-                if (name_matches and (exe_matches or startdir_matches)):
+                if exe_matches or startdir_matches:
                     conflicts.append({
-                        'index': i,
-                        'name': name,
+                        'index': int(index),
+                        'name': shortcut.get('AppName', ''),
                         'exe': shortcut_exe,
                         'startdir': shortcut_startdir
                     })
@@ -383,6 +376,12 @@ class AutomatedPrefixService:
             logger.debug(f"Full traceback: {traceback.format_exc()}")
             return None
         
+    def _shortcuts_session(self):
+        """Shared, indexed shortcuts.vdf session for the current Steam user (None if not found)."""
+        from ..handlers.shortcuts_session import get_shortcuts_session
+        shortcuts_path = self._get_shortcuts_path()
+        return get_shortcuts_session(shortcuts_path) if shortcuts_path else None
+
     def create_temp_batch_file(self, shortcut_name: str) -> Optional[str]:
         """
         Create a temporary batch file for silent prefix creation.
@@ -458,30 +457,27 @@ exit"""
             AppID if found, None otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return None
             
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            shortcuts = shortcuts_data.get('shortcuts', {})
+            # Look for our shortcut by name (exact match first, then any name containing it)
+            match = session.find(shortcut_name)
+            if not match:
+                match = next(((index, shortcut) for index, shortcut in session.items()
+                              if shortcut_name in shortcut.get('AppName', '')), None)
             
-            # Look for our shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                name = shortcut.get('AppName', '')
+            if match:
+                shortcut = match[1]
+                appid = shortcut.get('appid')
+                exe_path = shortcut.get('Exe', '').strip('"')
                 
-                if shortcut_name in name:
-                    appid = shortcut.get('appid')
-                    exe_path = shortcut.get('Exe', '').strip('"')
-                    
-                    logger.info(f"Found shortcut: {name}")
-                    logger.info(f"  AppID: {appid}")
-                    logger.info(f"  Exe: {exe_path}")
-                    logger.info(f"  CompatTool: {shortcut.get('CompatTool', 'NOT_SET')}")
-                    
-                    return appid
+                logger.info(f"Found shortcut: {shortcut.get('AppName', '')}")
+                logger.info(f"  AppID: {appid}")
+                logger.info(f"  Exe: {exe_path}")
+                logger.info(f"  CompatTool: {shortcut.get('CompatTool', 'NOT_SET')}")
+                
+                return appid
             
             logger.error(f"Shortcut '{shortcut_name}' not found")
             return None
@@ -505,38 +501,36 @@ exit"""
         try:
             logger.info(f"Using VDF to detect actual AppID for shortcut: {shortcut_name}")
 
-            # Wait up to 30 seconds for Steam to process the shortcut
-            for i in range(30):
-                try:
-                    from ..handlers.shortcut_handler import ShortcutHandler
-                    from ..handlers.path_handler import PathHandler
-
-                    path_handler = PathHandler()
-                    shortcuts_path = path_handler._find_shortcuts_vdf()
-
-                    if shortcuts_path:
-                        from ..handlers.vdf_handler import VDFHandler
-                        shortcuts_data = VDFHandler.load(shortcuts_path, binary=True)
-
-                        if shortcuts_data and 'shortcuts' in shortcuts_data:
-                            for idx, shortcut in shortcuts_data['shortcuts'].items():
-                                app_name = shortcut.get('AppName', shortcut.get('appname', '')).strip()
-
-                                if app_name.lower() == shortcut_name.lower():
-                                    appid = shortcut.get('appid')
-                                    if appid:
-                                        actual_appid = int(appid) & 0xFFFFFFFF
-                                        logger.info(f"Found shortcut '{app_name}' in shortcuts.vdf")
-                                        logger.info(f"  Initial AppID (signed): {initial_appid}")
-                                        logger.info(f"  Actual AppID (unsigned): {actual_appid}")
-                                        return actual_appid
+            from ..handlers.path_handler import PathHandler
+            from ..handlers.prefix_watcher import wait_for
+            from ..handlers.shortcuts_session import get_shortcuts_session, shortcut_name as name_of
 
-                    logger.debug(f"Shortcut '{shortcut_name}' not found in VDF yet (attempt {i+1}/30)")
-                    time.sleep(1)
+            shortcuts_path = PathHandler()._find_shortcuts_vdf()
+            session = get_shortcuts_session(shortcuts_path) if shortcuts_path else None
 
+            def find_appid() -> Optional[int]:
+                try:
+                    if not session or not os.path.exists(shortcuts_path):
+                        return None
+                    # Re-parsed only when Steam has rewritten the file
+                    for idx, shortcut in session.find_by_name(shortcut_name, exact=False):
+                        appid = shortcut.get('appid')
+                        if appid:
+                            actual_appid = int(appid) & 0xFFFFFFFF
+                            logger.info(f"Found shortcut '{name_of(shortcut)}' in shortcuts.vdf")
+                            logger.info(f"  Initial AppID (signed): {initial_appid}")
+                            logger.info(f"  Actual AppID (unsigned): {actual_appid}")
+                            return actual_appid
+                    logger.debug(f"Shortcut '{shortcut_name}' not found in VDF yet")
                 except Exception as e:
-                    logger.warning(f"Error reading shortcuts.vdf on attempt {i+1}: {e}")
-                    time.sleep(1)
+                    logger.warning(f"Error reading shortcuts.vdf: {e}")
+                return None
+
+            # Wait up to 30 seconds for Steam to process the shortcut, re-reading on each write
+            watch_dirs = (lambda: [os.path.dirname(shortcuts_path)]) if shortcuts_path else (lambda: [])
+            actual_appid = wait_for(find_appid, watch_dirs, 30, f"shortcut '{shortcut_name}' in shortcuts.vdf")
+            if actual_appid:
+                return actual_appid
 
             logger.error(f"Shortcut '{shortcut_name}' not found in shortcuts.vdf after 30 seconds")
             return None
@@ -603,34 +597,25 @@ exit"""
             # Use subprocess.Popen to launch asynchronously (steam command returns immediately)
             process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
             
-            # Wait a moment for the process to start
-            time.sleep(1)
-            
-            # Check if the process is still running (steam command should exit quickly)
+            # The steam command hands the URL to the running client and exits quickly
             try:
-                return_code = process.poll()
-                if return_code is None:
-                    # Process is still running, wait a bit more
-                    time.sleep(2)
-                    return_code = process.poll()
-                
-                debug_print(f"[DEBUG] Steam launch process return code: {return_code}")
-                
-                # Get any output
-                stdout, stderr = process.communicate(timeout=1)
+                stdout, stderr = process.communicate(timeout=3)
+                debug_print(f"[DEBUG] Steam launch process return code: {process.returncode}")
                 if stdout:
                     debug_print(f"[DEBUG] Steam launch stdout: {stdout}")
                 if stderr:
                     debug_print(f"[DEBUG] Steam launch stderr: {stderr}")
-                    
             except subprocess.TimeoutExpired:
                 debug_print("[DEBUG] Steam launch process timed out, but that's OK")
                 process.kill()
-            
+
             logger.info(f"Launch command executed: {' '.join(cmd)}")
             
-            # Give it a moment for the shortcut to actually start
-            time.sleep(5)
+            # Return as soon as Steam starts creating the prefix (or after 5s, as before)
+            from ..handlers.prefix_watcher import wait_for_path
+            compatdata_path = self._get_compatdata_path_for_appid(unsigned_appid)
+            if compatdata_path and not wait_for_path(compatdata_path, 5):
+                logger.debug(f"Prefix directory {compatdata_path} not created yet")
             
             return True
             
@@ -658,14 +643,13 @@ exit"""
         """
         try:
             debug_print(f"[DEBUG] create_shortcut_directly called for '{shortcut_name}' - this is the fallback method")
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 debug_print("[DEBUG] No shortcuts path found")
                 return False
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = session.snapshot()
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
@@ -706,8 +690,10 @@ exit"""
             shortcuts[next_index] = new_shortcut
             
             # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            session.replace_data(shortcuts_data)
+            if not session.save():
+                session.refresh(force=True)
+                return False
             
             logger.info(f"Created shortcut directly: {shortcut_name}")
             return True
@@ -731,8 +717,8 @@ exit"""
         """
         try:
             debug_print(f"[DEBUG] create_shortcut_directly_with_proton called for '{shortcut_name}' - using temporary batch file approach")
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 debug_print("[DEBUG] No shortcuts path found")
                 return False
             
@@ -760,8 +746,7 @@ echo Prefix creation complete.
             debug_print(f"[DEBUG] Created temporary batch file: {batch_path}")
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = session.snapshot()
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
@@ -816,8 +801,10 @@ echo Prefix creation complete.
             shortcuts_data['shortcuts'] = {str(i): s for i, s in enumerate(new_shortcuts_list)}
             
             # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            session.replace_data(shortcuts_data)
+            if not session.save():
+                session.refresh(force=True)
+                return False
             
             logger.info(f"Created/updated shortcut with temporary batch file: {shortcut_name} with AppID {appid}")
             debug_print(f"[DEBUG] Shortcut created/updated with temporary batch file, AppID {appid}")
@@ -849,14 +836,13 @@ echo Prefix creation complete.
         """
         try:
             debug_print(f"[DEBUG] replace_shortcut_with_final_exe called for '{shortcut_name}'")
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 debug_print("[DEBUG] No shortcuts path found")
                 return False
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = session.snapshot()
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
@@ -889,8 +875,10 @@ echo Prefix creation complete.
             shortcuts_data['shortcuts'] = {str(i): s for i, s in enumerate(new_shortcuts_list)}
             
             # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            session.replace_data(shortcuts_data)
+            if not session.save():
+                session.refresh(force=True)
+                return False
             
             logger.info(f"Replaced shortcut with final exe: {shortcut_name}")
             debug_print(f"[DEBUG] Shortcut replaced with final ModOrganizer.exe")
@@ -1097,8 +1085,9 @@ echo Prefix creation complete.
                 timeout=30
             )
             
-            # Check if prefix was created
-            time.sleep(2)  # Give it a moment to settle
+            # Check if prefix was created (once Wine has flushed the registry)
+            from ..handlers.prefix_watcher import wait_for_prefix_ready
+            wait_for_prefix_ready(prefix_path, timeout=10, launcher_exited=True)
             
             prefix_created = prefix_path.exists()
             pfx_exists = (prefix_path / "pfx").exists()
@@ -1242,13 +1231,12 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return False
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = session.snapshot()
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
@@ -1307,8 +1295,10 @@ echo Prefix creation complete.
             logger.info(f"  CompatTool: {target_shortcut.get('CompatTool', 'NOT_SET')} (preserved)")
             
             # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            session.replace_data(shortcuts_data)
+            if not session.save():
+                session.refresh(force=True)
+                return False
             
             logger.info(" Shortcut updated successfully - no duplicates created")
             return True
@@ -1329,12 +1319,11 @@ echo Prefix creation complete.
             True if shortcut is correct, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return False
             
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = session.snapshot()
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
@@ -1383,26 +1372,12 @@ echo Prefix creation complete.
             system_reg = prefix_path / "pfx/system.reg"
             
             logger.info(f"Monitoring prefix completion: {system_reg}")
-            
-            last_size = 0
-            stable_count = 0
-            
-            for i in range(timeout):
-                if system_reg.exists():
-                    current_size = system_reg.stat().st_size
-                    logger.debug(f"system.reg size: {current_size} bytes")
-                    
-                    if current_size == last_size:
-                        stable_count += 1
-                        if stable_count >= 3:  # Stable for 3 seconds
-                            logger.info(" system.reg size stable - prefix creation complete")
-                            return True
-                    else:
-                        stable_count = 0
-                        last_size = current_size
-                
-                time.sleep(1)
-            
+
+            from ..handlers.prefix_watcher import wait_for_prefix_ready
+            if wait_for_prefix_ready(prefix_path, timeout=timeout):
+                logger.info(" Prefix registry written and wineserver exited - prefix creation complete")
+                return True
+
             logger.warning(f"Timeout waiting for prefix completion after {timeout} seconds")
             return False
             
@@ -1566,8 +1541,11 @@ echo Prefix creation complete.
             if progress_callback:
                 progress_callback(f"{self._get_progress_timestamp()} Creating Proton prefix (please wait)...")
             
-            # Wait for batch file to complete (3 seconds + buffer)
-            time.sleep(5)
+            # Wait for the prefix to be written and its wineserver to exit
+            from ..handlers.prefix_watcher import wait_for_prefix_ready
+            expected_compatdata = Path.home() / ".local/share/Steam/steamapps/compatdata" / expected_prefix_id
+            if not wait_for_prefix_ready(expected_compatdata, timeout=30):
+                logger.warning("Prefix not reported ready within 30 seconds, continuing")
             logger.info("Step 5 completed: Temporary batch file completed")
             
             # Step 6: Verify prefix was created
@@ -1642,13 +1620,12 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return False
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = session.snapshot()
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             indices_to_remove = []
@@ -1681,8 +1658,10 @@ echo Prefix creation complete.
             shortcuts_data['shortcuts'] = new_shortcuts
             
             # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            session.replace_data(shortcuts_data)
+            if not session.save():
+                session.refresh(force=True)
+                return False
             
             logger.info(f"Cleaned up {len(indices_to_remove)} old batch shortcuts for '{shortcut_name}'")
             return True
@@ -1704,38 +1683,27 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return False
             
-            # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            shortcuts = shortcuts_data.get('shortcuts', {})
-            
-            # Find the shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                name = shortcut.get('AppName', '')
+            with session.transaction():
+                # Find the shortcut by name
+                match = session.find(shortcut_name)
+                if not match:
+                    logger.error(f"Shortcut '{shortcut_name}' not found for CompatTool setting")
+                    return False
                 
-                if shortcut_name == name:
-                    # Check current CompatTool setting
-                    current_compat = shortcut.get('CompatTool', 'NOT_SET')
-                    logger.info(f"Found shortcut '{name}' with CompatTool: '{current_compat}'")
-                    
-                    # Set CompatTool to ensure batch file can create prefix
-                    shortcut['CompatTool'] = 'proton_experimental'
-                    logger.info(f" Set CompatTool=proton_experimental on shortcut: {name}")
-                    
-                    # Write back to file
-                    with open(shortcuts_path, 'wb') as f:
-                        vdf.binary_dump(shortcuts_data, f)
-                    
-                    return True
+                index, shortcut = match
+                # Check current CompatTool setting
+                current_compat = shortcut.get('CompatTool', 'NOT_SET')
+                logger.info(f"Found shortcut '{shortcut_name}' with CompatTool: '{current_compat}'")
+                
+                # Set CompatTool to ensure batch file can create prefix
+                session.update(index, CompatTool='proton_experimental')
+                logger.info(f" Set CompatTool=proton_experimental on shortcut: {shortcut_name}")
             
-            logger.error(f"Shortcut '{shortcut_name}' not found for CompatTool setting")
-            return False
+            return True
             
         except Exception as e:
             logger.error(f"Error setting CompatTool on shortcut: {e}")
@@ -1752,39 +1720,27 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return False
             
-            # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            shortcuts = shortcuts_data.get('shortcuts', {})
-            
-            # Find the shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                name = shortcut.get('AppName', '')
+            with session.transaction():
+                # Find the shortcut by name
+                match = session.find(shortcut_name)
+                if not match:
+                    logger.error(f"Shortcut '{shortcut_name}' not found for Proton setting")
+                    return False
                 
-                if shortcut_name == name:
-                    # Set CompatTool
-                    shortcut['CompatTool'] = 'proton_experimental'
-                    logger.info(f"Set CompatTool=proton_experimental on shortcut: {name}")
-                    
-                    # Write back to file
-                    with open(shortcuts_path, 'wb') as f:
-                        vdf.binary_dump(shortcuts_data, f)
-                    
-                    return True
+                # Set CompatTool
+                session.update(match[0], CompatTool='proton_experimental')
+                logger.info(f"Set CompatTool=proton_experimental on shortcut: {shortcut_name}")
             
-            logger.error(f"Shortcut '{shortcut_name}' not found for Proton setting")
-            return False
+            return True
             
         except Exception as e:
             logger.error(f"Error setting Proton on shortcut: {e}")
             return False
-
+    
     def run_working_workflow(self, shortcut_name: str, modlist_install_dir: str, 
                             final_exe_path: str, progress_callback=None, steamdeck: Optional[bool] = None) -> Tuple[bool, Optional[Path], Optional[int], Optional[str]]:
         """
@@ -2037,39 +1993,27 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return False
             
-            # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            shortcuts = shortcuts_data.get('shortcuts', {})
-            
-            # Find the shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                name = shortcut.get('AppName', '')
+            with session.transaction():
+                # Find the shortcut by name
+                match = session.find(shortcut_name)
+                if not match:
+                    logger.error(f"Shortcut '{shortcut_name}' not found for modification")
+                    return False
                 
-                if shortcut_name == name:
-                    # Update the shortcut to point to the batch file
-                    old_exe = shortcut.get('Exe', '')
-                    shortcut['Exe'] = f'"{batch_file_path}"'
-                    shortcut['StartDir'] = f'"{modlist_install_dir}"'
-                    
-                    logger.info(f"Modified shortcut '{shortcut_name}':")
-                    logger.info(f"  Exe: {old_exe} → {shortcut['Exe']}")
-                    logger.info(f"  StartDir: {shortcut['StartDir']}")
-                    
-                    # Write back to file
-                    with open(shortcuts_path, 'wb') as f:
-                        vdf.binary_dump(shortcuts_data, f)
-                    
-                    return True
+                # Update the shortcut to point to the batch file
+                index, shortcut = match
+                old_exe = shortcut.get('Exe', '')
+                session.update(index, Exe=f'"{batch_file_path}"', StartDir=f'"{modlist_install_dir}"')
+                
+                logger.info(f"Modified shortcut '{shortcut_name}':")
+                logger.info(f"  Exe: {old_exe} → {shortcut['Exe']}")
+                logger.info(f"  StartDir: {shortcut['StartDir']}")
             
-            logger.error(f"Shortcut '{shortcut_name}' not found for modification")
-            return False
+            return True
             
         except Exception as e:
             logger.error(f"Error modifying shortcut to batch file: {e}")
@@ -2087,25 +2031,16 @@ echo Prefix creation complete.
             AppID as string, or None if not found
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return None
             
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            shortcuts = shortcuts_data.get('shortcuts', {})
-            
             # Look for shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                name = shortcut.get('AppName', '')
-                
-                if shortcut_name == name:
-                    appid = shortcut.get('appid')
-                    if appid:
-                        logger.info(f"Found AppID {appid} for shortcut '{shortcut_name}' in shortcuts.vdf")
-                        return str(appid)
+            for index, shortcut in session.find_by_name(shortcut_name):
+                appid = shortcut.get('appid')
+                if appid:
+                    logger.info(f"Found AppID {appid} for shortcut '{shortcut_name}' in shortcuts.vdf")
+                    return str(appid)
             
             logger.warning(f"Shortcut '{shortcut_name}' not found in shortcuts.vdf")
             return None
@@ -2173,13 +2108,12 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 return False
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = session.snapshot()
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
@@ -2222,8 +2156,10 @@ echo Prefix creation complete.
             shortcuts[next_index] = new_shortcut
             
             # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            session.replace_data(shortcuts_data)
+            if not session.save():
+                session.refresh(force=True)
+                return False
             
             logger.info(f"Created shortcut with STL algorithm: {shortcut_name} with AppID {signed_appid} (unsigned: {predicted_appid})")
             
@@ -2552,40 +2488,25 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 logger.error("No shortcuts.vdf path found")
                 return False
             
-            # Read the current shortcuts.vdf
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            if 'shortcuts' not in shortcuts_data:
-                logger.error("No shortcuts found in shortcuts.vdf")
-                return False
-            
-            shortcuts = shortcuts_data['shortcuts']
-            shortcut_found = False
-            
-            # Find the shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                if shortcut.get('AppName', '') == shortcut_name:
-                    # Update the shortcut
-                    shortcut['Exe'] = new_exe_path
-                    shortcut['StartDir'] = new_start_dir
-                    shortcut_found = True
-                    logger.info(f"Modified shortcut '{shortcut_name}' to target: {new_exe_path}")
-                    break
-            
-            if not shortcut_found:
-                logger.error(f"Shortcut '{shortcut_name}' not found in shortcuts.vdf")
-                return False
-            
-            # Write the updated shortcuts.vdf back
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            with session.transaction():
+                if not session.shortcuts:
+                    logger.error("No shortcuts found in shortcuts.vdf")
+                    return False
+                
+                # Find the shortcut by name
+                match = session.find(shortcut_name)
+                if not match:
+                    logger.error(f"Shortcut '{shortcut_name}' not found in shortcuts.vdf")
+                    return False
+                
+                # Update the shortcut
+                session.update(match[0], Exe=new_exe_path, StartDir=new_start_dir)
+                logger.info(f"Modified shortcut '{shortcut_name}' to target: {new_exe_path}")
             
             logger.info(f"Successfully modified shortcut '{shortcut_name}'")
             return True
@@ -2646,49 +2567,35 @@ echo Prefix creation complete.
             True if successful, False otherwise
         """
         try:
-            shortcuts_path = self._get_shortcuts_path()
-            if not shortcuts_path:
+            session = self._shortcuts_session()
+            if not session:
                 logger.error("No shortcuts.vdf path found")
                 return False
             
-            # Read the current shortcuts.vdf
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            if 'shortcuts' not in shortcuts_data:
-                logger.error("No shortcuts found in shortcuts.vdf")
-                return False
-            
-            shortcuts = shortcuts_data['shortcuts']
-            shortcut_found = False
-            
-            # Find the shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                if shortcut.get('AppName', '') == shortcut_name:
-                    # Preserve existing launch options
-                    existing_launch_options = shortcut.get('LaunchOptions', '')
-
-                    # Update the shortcut EXACTLY as provided by the caller.
-                    # - For temporary prefix creation we pass a Windows path (cmd.exe)
-                    # - For final ModOrganizer.exe we pass the Linux path inside the modlist directory
-                    shortcut['Exe'] = new_exe_path
-                    shortcut['StartDir'] = new_start_dir
-                    # Preserve the launch options (including STEAM_COMPAT_MOUNTS)
-                    shortcut['LaunchOptions'] = existing_launch_options
-                    
-                    shortcut_found = True
-                    logger.info(f"Modified shortcut '{shortcut_name}' to target: {new_exe_path}")
-                    logger.info(f"Preserved launch options: {existing_launch_options}")
-                    break
-            
-            if not shortcut_found:
-                logger.error(f"Shortcut '{shortcut_name}' not found in shortcuts.vdf")
-                return False
-            
-            # Write the updated shortcuts.vdf back
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            with session.transaction():
+                if not session.shortcuts:
+                    logger.error("No shortcuts found in shortcuts.vdf")
+                    return False
+                
+                # Find the shortcut by name
+                match = session.find(shortcut_name)
+                if not match:
+                    logger.error(f"Shortcut '{shortcut_name}' not found in shortcuts.vdf")
+                    return False
+                
+                # Preserve existing launch options
+                index, shortcut = match
+                existing_launch_options = shortcut.get('LaunchOptions', '')
+                
+                # Update the shortcut EXACTLY as provided by the caller.
+                # - For temporary prefix creation we pass a Windows path (cmd.exe)
+                # - For final ModOrganizer.exe we pass the Linux path inside the modlist directory
+                # Launch options (including STEAM_COMPAT_MOUNTS) are kept as they were
+                session.update(index, Exe=new_exe_path, StartDir=new_start_dir,
+                               LaunchOptions=existing_launch_options)
+                
+                logger.info(f"Modified shortcut '{shortcut_name}' to target: {new_exe_path}")
+                logger.info(f"Preserved launch options: {existing_launch_options}")
             
             logger.info(f"Successfully modified shortcut '{shortcut_name}'")
             return True
@@ -2696,7 +2603,6 @@ echo Prefix creation complete.
         except Exception as e:
             logger.error(f"Error modifying shortcut: {e}")
             return False
-
     def create_prefix_with_proton_wrapper(self, appid: int) -> bool:
         """
         Create a Proton prefix directly using Proton's wrapper and STEAM_COMPAT_DATA_PATH.
@@ -2790,8 +2696,10 @@ echo Prefix creation complete.
             if result.stderr:
                 logger.info(f"stderr: {result.stderr.strip()[:500]}")
             
-            # Give a moment for files to land
-            time.sleep(3)
+            # Wait for Wine to flush the registry and its wineserver to exit
+            from ..handlers.prefix_watcher import wait_for_prefix_ready
+            if not wait_for_prefix_ready(compat_dir, timeout=timeout, launcher_exited=True):
+                logger.warning(f"Prefix at {compat_dir} not reported ready within {timeout}s")
             
             # Check if prefix was created
             pfx = compat_dir / 'pfx'
@@ -2975,104 +2883,23 @@ echo Prefix creation complete.
 
     def _find_steam_game(self, app_id: str, common_names: list) -> Optional[str]:
         """Find a Steam game installation path by AppID and common names"""
-        import os
-        from pathlib import Path
-
-        # Get Steam libraries from libraryfolders.vdf - check multiple possible locations
-        possible_config_paths = [
-            Path.home() / ".steam/steam/config/libraryfolders.vdf",
-            Path.home() / ".local/share/Steam/config/libraryfolders.vdf",
-            Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/config/libraryfolders.vdf"  # Flatpak
-        ]
+        from ..handlers.steam_library_index import get_steam_library_index
 
-        steam_config_path = None
-        for path in possible_config_paths:
-            if path.exists():
-                steam_config_path = path
-                break
+        index = get_steam_library_index()
 
-        if not steam_config_path:
-            return None
-            
-        steam_libraries = []
-        try:
-            with open(steam_config_path, 'r') as f:
-                content = f.read()
-                # Parse library paths from VDF
-                import re
-                library_matches = re.findall(r'"path"\s+"([^"]+)"', content)
-                steam_libraries = [Path(path) / "steamapps" / "common" for path in library_matches]
-        except Exception as e:
-            logger.warning(f"Failed to parse Steam library folders: {e}")
-            return None
-        
-        # Search for game in each library
-        for library_path in steam_libraries:
-            if not library_path.exists():
-                continue
-                
-            # Check manifest file first (more reliable)
-            manifest_path = library_path.parent / "appmanifest_{}.acf".format(app_id)
-            if manifest_path.exists():
-                try:
-                    with open(manifest_path, 'r') as f:
-                        content = f.read()
-                        install_dir_match = re.search(r'"installdir"\s+"([^"]+)"', content)
-                        if install_dir_match:
-                            game_path = library_path / install_dir_match.group(1)
-                            if game_path.exists():
-                                return str(game_path)
-                except Exception:
-                    pass
-            
-            # Fallback: check common folder names
+        # App manifest first (more reliable)
+        game_path = index.install_dir(app_id)
+        if game_path and game_path.exists():
+            return str(game_path)
+
+        # Fallback: check common folder names in each library
+        for library_path in index.common_dirs():
             for name in common_names:
                 game_path = library_path / name
                 if game_path.exists():
                     return str(game_path)
-                    
-        return None
 
-    def _update_registry_path(self, system_reg_path: str, section_name: str, path_key: str, new_path: str) -> bool:
-        """Update a specific path value in Wine registry, preserving other entries"""
-        if not os.path.exists(system_reg_path):
-            return False
-            
-        try:
-            # Read existing content
-            with open(system_reg_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            in_target_section = False
-            path_updated = False
-            wine_path = new_path.replace('/', '\\\\')
-            
-            # Update existing path if found
-            for i, line in enumerate(lines):
-                stripped_line = line.strip()
-                if stripped_line == section_name:
-                    in_target_section = True
-                elif stripped_line.startswith('[') and in_target_section:
-                    in_target_section = False
-                elif in_target_section and f'"{path_key}"' in line:
-                    lines[i] = f'"{path_key}"="Z:\\\\{wine_path}\\\\"\n'  # Add trailing backslashes
-                    path_updated = True
-                    break
-            
-            # Add new section if path wasn't updated
-            if not path_updated:
-                lines.append(f'\n{section_name}\n')
-                lines.append(f'"{path_key}"="Z:\\\\{wine_path}\\\\"\n')  # Add trailing backslashes
-            
-            # Write updated content
-            with open(system_reg_path, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
-                
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to update registry path: {e}")
-            return False
+        return None
 
     def _apply_universal_dotnet_fixes(self, modlist_compatdata_path: str):
         """Apply universal dotnet4.x compatibility registry fixes to ALL modlists"""
@@ -3084,49 +2911,27 @@ echo Prefix creation complete.
 
             logger.info("Applying universal dotnet4.x compatibility registry fixes...")
 
-            # Find the appropriate Wine binary to use for registry operations
-            wine_binary = self._find_wine_binary_for_registry(modlist_compatdata_path)
-            if not wine_binary:
-                logger.error("Could not find Wine binary for registry operations")
-                return False
-
-            # Set environment for Wine registry operations
-            env = os.environ.copy()
-            env['WINEPREFIX'] = prefix_path
-            env['WINEDEBUG'] = '-all'  # Suppress Wine debug output
+            from ..handlers.prefix_watcher import wineserver_running
+            from ..handlers.wine_registry import RegistryEdits
 
+            edits = RegistryEdits(prefix_path)
             # Registry fix 1: Set *mscoree=native DLL override (asterisk for full override)
             # This tells Wine to use native .NET runtime instead of Wine's implementation
-            logger.debug("Setting *mscoree=native DLL override...")
-            cmd1 = [
-                wine_binary, 'reg', 'add',
-                'HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides',
-                '/v', '*mscoree', '/t', 'REG_SZ', '/d', 'native', '/f'
-            ]
-
-            result1 = subprocess.run(cmd1, env=env, capture_output=True, text=True, errors='replace')
-            if result1.returncode == 0:
-                logger.info("Successfully applied *mscoree=native DLL override")
-            else:
-                logger.warning(f"Failed to set *mscoree DLL override: {result1.stderr}")
-
+            edits.dll_override('*mscoree', 'native')
             # Registry fix 2: Set OnlyUseLatestCLR=1
             # This prevents .NET version conflicts by using the latest CLR
-            logger.debug("Setting OnlyUseLatestCLR=1 registry entry...")
-            cmd2 = [
-                wine_binary, 'reg', 'add',
-                'HKEY_LOCAL_MACHINE\\Software\\Microsoft\\.NETFramework',
-                '/v', 'OnlyUseLatestCLR', '/t', 'REG_DWORD', '/d', '1', '/f'
-            ]
+            edits.set('HKEY_LOCAL_MACHINE\\Software\\Microsoft\\.NETFramework', 'OnlyUseLatestCLR', 1)
 
-            result2 = subprocess.run(cmd2, env=env, capture_output=True, text=True, errors='replace')
-            if result2.returncode == 0:
-                logger.info("Successfully applied OnlyUseLatestCLR=1 registry entry")
-            else:
-                logger.warning(f"Failed to set OnlyUseLatestCLR: {result2.stderr}")
+            # Written directly into the registry files; Wine is only needed if its wineserver stays up
+            wine_binary = None
+            if wineserver_running(prefix_path):
+                wine_binary = self._find_wine_binary_for_registry(modlist_compatdata_path)
+            env = os.environ.copy()
+            env['WINEPREFIX'] = prefix_path
+            env['WINEDEBUG'] = '-all'  # Suppress Wine debug output
 
             # Both fixes applied - this should eliminate dotnet4.x installation requirements
-            if result1.returncode == 0 and result2.returncode == 0:
+            if edits.apply(wine_binary=wine_binary, env=env):
                 logger.info("Universal dotnet4.x compatibility fixes applied successfully")
                 return True
             else:
@@ -3198,34 +3003,10 @@ echo Prefix creation complete.
         Returns:
             Path to wine binary if found, None otherwise
         """
+        # The (depth-limited) search result is kept in the Proton inventory
+        from ..handlers.proton_inventory import get_proton_inventory
         try:
-            if not proton_path.exists() or not proton_path.is_dir():
-                return None
-
-            # Search for 'wine' executable (not 'wine64' or 'wine-preloader')
-            # Limit search depth to avoid scanning entire filesystem
-            max_depth = 5
-            for root, dirs, files in os.walk(proton_path, followlinks=False):
-                # Calculate depth relative to proton_path
-                try:
-                    depth = len(Path(root).relative_to(proton_path).parts)
-                except ValueError:
-                    # Path is not relative to proton_path (shouldn't happen, but be safe)
-                    continue
-                    
-                if depth > max_depth:
-                    dirs.clear()  # Don't descend further
-                    continue
-                
-                # Check if 'wine' is in this directory
-                if 'wine' in files:
-                    wine_path = Path(root) / 'wine'
-                    # Verify it's actually an executable file
-                    if wine_path.is_file() and os.access(wine_path, os.X_OK):
-                        logger.debug(f"Found wine binary at: {wine_path}")
-                        return str(wine_path)
-
-            return None
+            return get_proton_inventory().wine_binary(proton_path)
         except Exception as e:
             logger.debug(f"Error during recursive wine search in {proton_path}: {e}")
             return None
@@ -3246,28 +3027,35 @@ echo Prefix creation complete.
             "22380": {  # Fallout New Vegas AppID
                 "name": "Fallout New Vegas",
                 "common_names": ["Fallout New Vegas", "FalloutNV"],
-                "registry_section": "[Software\\\\WOW6432Node\\\\bethesda softworks\\\\falloutnv]",
+                "registry_key": "HKEY_LOCAL_MACHINE\\Software\\WOW6432Node\\bethesda softworks\\falloutnv",
                 "path_key": "Installed Path"
             },
             "976620": {  # Enderal Special Edition AppID
                 "name": "Enderal",
                 "common_names": ["Enderal: Forgotten Stories (Special Edition)", "Enderal Special Edition", "Enderal"],
-                "registry_section": "[Software\\\\Wow6432Node\\\\SureAI\\\\Enderal SE]", 
+                "registry_key": "HKEY_LOCAL_MACHINE\\Software\\Wow6432Node\\SureAI\\Enderal SE",
                 "path_key": "installed path"
             }
         }
         
-        # Detect and inject each game
+        # Detect every game first, then write all paths to system.reg in one go
+        from ..handlers.wine_registry import RegistryEdits
+        edits = RegistryEdits(os.path.join(modlist_compatdata_path, "pfx"))
+        detected = []
         for app_id, config in games_config.items():
             game_path = self._find_steam_game(app_id, config["common_names"])
             if game_path:
                 logger.info(f"Detected {config['name']} at: {game_path}")
-                success = self._update_registry_path(
-                    system_reg_path,
-                    config["registry_section"], 
-                    config["path_key"],
-                    game_path
-                )
+                # Wine maps the Linux root to Z:, with a trailing backslash like Windows installers write
+                wine_path = "Z:" + game_path.replace('/', '\\').rstrip('\\') + '\\'
+                edits.set(config["registry_key"], config["path_key"], wine_path)
+                detected.append((app_id, config))
+            else:
+                logger.debug(f"{config['name']} not found in Steam libraries")
+
+        if detected:
+            success = edits.apply()
+            for app_id, config in detected:
                 if success:
                     logger.info(f"Updated registry entry for {config['name']}")
 
@@ -3281,8 +3069,6 @@ echo Prefix creation complete.
                             logger.warning(f"Failed to create Enderal user directory: {e}")
                 else:
                     logger.warning(f"Failed to update registry entry for {config['name']}")
-            else:
-                logger.debug(f"{config['name']} not found in Steam libraries")
                 
         logger.info("Game registry injection completed")
 
@@ -0,0 +1,268 @@
+"""
+Modlist Catalog Service
+
+One process-wide catalog of the modlists jackify-engine knows about, shared by
+the CLI menus, ModlistService and the GUI gallery.
+
+The catalog is built from ``list-modlists --json`` (fetched through
+ModlistGalleryService, which owns the engine lock and the metadata cache
+file). The cache file also stores the catalog index (game type -> machineURLs,
+tag -> machineURLs), so opening the catalog in a new process is one JSON
+read. Lookups by game type, machineURL or tag are answered from memory; when
+the data is older than ``STALE_AFTER`` a background refresh replaces it, and
+only a missing or expired catalog makes the caller wait for the engine.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from jackify.backend.models.modlist_metadata import ModlistMetadata, ModlistMetadataResponse
+
+logger = logging.getLogger(__name__)
+
+CATALOG_INDEX_VERSION = 1
+# Older than this: serve it, refresh in the background
+STALE_AFTER = 15 * 60
+# Older than this: wait for a fresh copy (fall back to it if the engine fails)
+EXPIRED_AFTER = 24 * 60 * 60
+
+# CLI game categories, matched against the human-friendly game name in this
+# order ("Oblivion Remastered" has to win over "Oblivion").
+GAME_TYPE_RULES = (
+    ("oblivion_remastered", ("oblivion remastered", "oblivionremastered")),
+    ("skyrim", ("skyrim",)),
+    ("fallout4", ("fallout 4",)),
+    ("falloutnv", ("fallout new vegas",)),
+    ("oblivion", ("oblivion",)),
+    ("starfield", ("starfield",)),
+    ("enderal", ("enderal",)),
+)
+GAME_TYPES = tuple(key for key, _ in GAME_TYPE_RULES) + ("other",)
+
+
+def game_type_for(modlist: ModlistMetadata) -> str:
+    """CLI game category key for a modlist ('skyrim', 'fallout4', ..., 'other')"""
+    names = ((modlist.gameHumanFriendly or "").lower(), (modlist.game or "").lower())
+    for key, keywords in GAME_TYPE_RULES:
+        if any(keyword in name for keyword in keywords for name in names):
+            return key
+    return "other"
+
+
+def build_catalog_index(modlists: List[ModlistMetadata]) -> Dict[str, Any]:
+    """Serializable index of modlists by game type and tag (values are machineURLs)"""
+    game_types: Dict[str, List[str]] = {}
+    tags: Dict[str, List[str]] = {}
+    for modlist in modlists:
+        game_types.setdefault(game_type_for(modlist), []).append(modlist.machineURL)
+        for tag in modlist.tags or []:
+            urls = tags.setdefault(tag.lower(), [])
+            if not urls or urls[-1] != modlist.machineURL:
+                urls.append(modlist.machineURL)
+    return {"version": CATALOG_INDEX_VERSION, "gameTypes": game_types, "tags": tags}
+
+
+def modlist_to_engine_dict(modlist: ModlistMetadata) -> Dict[str, Any]:
+    """Modlist in the dict shape the CLI used to scrape from list-modlists text output"""
+    sizes = modlist.sizes
+    return {
+        'id': modlist.title,
+        'name': modlist.title,
+        'game': modlist.gameHumanFriendly or modlist.game,
+        'download_size': sizes.downloadSizeFormatted if sizes else '',
+        'install_size': sizes.installSizeFormatted if sizes else '',
+        'total_size': sizes.totalSizeFormatted if sizes else '',
+        'machine_url': modlist.machineURL,
+        'status_down': not modlist.is_available(),
+        'status_nsfw': modlist.nsfw,
+    }
+
+
+class ModlistCatalog:
+    """Immutable lookup tables over one metadata response"""
+
+    def __init__(self, metadata: ModlistMetadataResponse, index: Optional[Dict[str, Any]] = None):
+        self.metadata = metadata
+        self.by_machine_url: Dict[str, ModlistMetadata] = {m.machineURL: m for m in metadata.modlists}
+        if not self._index_matches(index):
+            index = build_catalog_index(metadata.modlists)
+        self.by_game_type: Dict[str, List[ModlistMetadata]] = {
+            key: [self.by_machine_url[url] for url in urls]
+            for key, urls in index["gameTypes"].items()
+        }
+        self.by_tag: Dict[str, List[ModlistMetadata]] = {
+            tag: [self.by_machine_url[url] for url in urls]
+            for tag, urls in index["tags"].items()
+        }
+
+    def _index_matches(self, index: Optional[Dict[str, Any]]) -> bool:
+        """True if a stored index describes exactly these modlists"""
+        if not index or index.get("version") != CATALOG_INDEX_VERSION:
+            return False
+        try:
+            indexed = [url for urls in index["gameTypes"].values() for url in urls]
+            return (len(indexed) == len(self.by_machine_url)
+                    and set(indexed) == set(self.by_machine_url)
+                    and all(url in self.by_machine_url for urls in index["tags"].values() for url in urls))
+        except (KeyError, AttributeError, TypeError):
+            return False
+
+    def modlists(self, game_type: Optional[str] = None) -> List[ModlistMetadata]:
+        """
+        Modlists in engine order, optionally for one game.
+
+        Args:
+            game_type: A category key from GAME_TYPES, or a game's engine or
+                human-friendly name (case-insensitive)
+        """
+        if not game_type:
+            return list(self.metadata.modlists)
+        key = game_type.lower()
+        if key in GAME_TYPES:
+            return list(self.by_game_type.get(key, []))
+        return [m for m in self.metadata.modlists
+                if (m.game or "").lower() == key or (m.gameHumanFriendly or "").lower() == key]
+
+    def with_tag(self, tag: str) -> List[ModlistMetadata]:
+        return list(self.by_tag.get(tag.lower(), []))
+
+
+class ModlistCatalogService:
+    """Serves the modlist catalog from memory and keeps it fresh in the background"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._gallery_service = None
+        self._catalog: Optional[ModlistCatalog] = None
+        self._loaded_at: Optional[float] = None
+        self._disk_checked = False
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def _gallery(self):
+        # Created on first use: ModlistGalleryService() reads config and the data directory
+        if self._gallery_service is None:
+            from jackify.backend.services.modlist_gallery_service import ModlistGalleryService
+            self._gallery_service = ModlistGalleryService()
+        return self._gallery_service
+
+    def _age(self) -> Optional[float]:
+        return None if self._loaded_at is None else max(0.0, time.time() - self._loaded_at)
+
+    def _load_from_disk(self):
+        """Populate the catalog from the gallery's metadata cache (once per process)"""
+        with self._lock:
+            if self._catalog is not None or self._disk_checked:
+                return
+            self._disk_checked = True
+        gallery = self._gallery()
+        metadata, index = gallery.load_cached_metadata_with_index()
+        if metadata is None:
+            return
+        age = gallery.get_cache_age()
+        with self._lock:
+            if self._catalog is None:
+                self._catalog = ModlistCatalog(metadata, index)
+                self._loaded_at = time.time() - (age or 0.0)
+                logger.debug(f"Loaded modlist catalog from cache ({len(metadata.modlists)} modlists)")
+
+    def publish(self, metadata: ModlistMetadataResponse, index: Optional[Dict[str, Any]] = None):
+        """Replace the catalog with freshly fetched metadata"""
+        catalog = ModlistCatalog(metadata, index)
+        with self._lock:
+            self._catalog = catalog
+            self._loaded_at = time.time()
+            self._disk_checked = True
+
+    def refresh(self) -> Optional[ModlistCatalog]:
+        """Fetch from the engine now (the gallery service publishes the result here)"""
+        with self._lock:
+            previous = self._catalog.metadata if self._catalog else None
+        try:
+            metadata, _ = self._gallery().refresh_modlist_metadata(previous=previous)
+        except Exception as e:
+            logger.warning(f"Modlist catalog refresh failed: {e}")
+            return None
+        if metadata is None:
+            return None
+        with self._lock:
+            return self._catalog
+
+    def refresh_in_background(self):
+        """Start a refresh unless one is already running"""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self.refresh, name="ModlistCatalogRefresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def get_catalog(self, max_age: float = EXPIRED_AFTER) -> Optional[ModlistCatalog]:
+        """
+        Current catalog, fetching it first only if there is none or it is older than max_age.
+
+        Returns:
+            ModlistCatalog, or None if the engine failed and nothing is cached
+        """
+        self._load_from_disk()
+        with self._lock:
+            catalog = self._catalog
+            age = self._age()
+        if catalog is None or age is None or age > max_age:
+            fresh = self.refresh()
+            if fresh is not None:
+                return fresh
+            if catalog is not None:
+                logger.warning("Using outdated modlist catalog; engine fetch failed")
+            return catalog
+        if age > STALE_AFTER:
+            self.refresh_in_background()
+        return catalog
+
+    def get_cached_metadata(self) -> Optional[ModlistMetadataResponse]:
+        """Metadata currently in memory (or on disk), without contacting the engine"""
+        self._load_from_disk()
+        with self._lock:
+            return self._catalog.metadata if self._catalog else None
+
+    def list_modlists(self, game_type: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Modlists as CLI dicts ('id', 'name', 'game', sizes, 'machine_url', status flags).
+
+        Returns:
+            List of dicts, or None if no catalog could be loaded
+        """
+        catalog = self.get_catalog()
+        if catalog is None:
+            return None
+        return [modlist_to_engine_dict(m) for m in catalog.modlists(game_type)]
+
+    def group_by_game_type(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """CLI dicts grouped by every key in GAME_TYPES"""
+        catalog = self.get_catalog()
+        if catalog is None:
+            return None
+        return {key: [modlist_to_engine_dict(m) for m in catalog.modlists(key)] for key in GAME_TYPES}
+
+    def get_by_machine_url(self, machine_url: str) -> Optional[ModlistMetadata]:
+        catalog = self.get_catalog()
+        return catalog.by_machine_url.get(machine_url) if catalog else None
+
+    def modlists_with_tag(self, tag: str) -> List[ModlistMetadata]:
+        catalog = self.get_catalog()
+        return catalog.with_tag(tag) if catalog else []
+
+
+_catalog_service: Optional[ModlistCatalogService] = None
+_catalog_service_lock = threading.Lock()
+
+
+def get_modlist_catalog_service() -> ModlistCatalogService:
+    """Process-wide catalog shared by the CLI and GUI"""
+    global _catalog_service
+    with _catalog_service_lock:
+        if _catalog_service is None:
+            _catalog_service = ModlistCatalogService()
+        return _catalog_service
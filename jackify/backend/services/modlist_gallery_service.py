@@ -3,18 +3,23 @@ Service for fetching and managing modlist metadata for the gallery view.
 
 Handles jackify-engine integration, caching, and image management.
 """
+import hashlib
 import json
+import os
+import re
 import subprocess
 import time
 import threading
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
 import urllib.request
 
 from jackify.backend.models.modlist_metadata import (
     ModlistMetadataResponse,
     ModlistMetadata,
+    ModlistMetadataDiff,
+    diff_modlist_metadata,
     parse_modlist_metadata_response
 )
 from jackify.backend.core.modlist_operations import get_jackify_engine_path
@@ -25,7 +30,8 @@ from jackify.shared.paths import get_jackify_data_dir
 class ModlistGalleryService:
     """Service for fetching and caching modlist metadata from jackify-engine"""
 
-    # REMOVED: CACHE_VALIDITY_DAYS - metadata is now always fetched fresh from engine
+    # REMOVED: CACHE_VALIDITY_DAYS - the gallery renders from cache immediately and
+    # always revalidates against the engine in the background (stale-while-revalidate)
     # Images are still cached indefinitely (managed separately)
     # CRITICAL: Thread lock to prevent concurrent engine calls that could cause recursive spawning
     _engine_call_lock = threading.Lock()
@@ -37,6 +43,8 @@ class ModlistGalleryService:
         jackify_data_dir = get_jackify_data_dir()
         self.CACHE_DIR = jackify_data_dir / "modlist-cache" / "metadata"
         self.IMAGE_CACHE_DIR = jackify_data_dir / "modlist-cache" / "images"
+        # Card-sized thumbnails live under the image cache so clear_cache() drops them too
+        self.THUMBNAIL_CACHE_DIR = self.IMAGE_CACHE_DIR / "thumbnails"
         self.METADATA_CACHE_FILE = self.CACHE_DIR / "modlist_metadata.json"
         self._ensure_cache_dirs()
         # Tag metadata caches (avoid refetching per render)
@@ -44,6 +52,8 @@ class ModlistGalleryService:
         self._tag_mapping_lookup: Optional[Dict[str, str]] = None
         self._allowed_tags_cache: Optional[set] = None
         self._allowed_tags_lookup: Optional[Dict[str, str]] = None
+        # Seconds the last engine fetch took (None until known)
+        self.last_refresh_latency: Optional[float] = None
 
     def _ensure_cache_dirs(self):
         """Create cache directories if they don't exist"""
@@ -75,17 +85,7 @@ class ModlistGalleryService:
         # Always fetch fresh data from jackify-engine
         # The engine itself is fast (~1-2 seconds) and always gets latest metadata
         try:
-            metadata = self._fetch_from_engine(
-                include_validation=include_validation,
-                include_search_index=include_search_index,
-                sort_by=sort_by
-            )
-
-            # Still save to cache as a fallback for offline scenarios
-            if metadata:
-                self._save_to_cache(metadata)
-
-            return metadata
+            return self._fetch_and_cache(include_validation, include_search_index, sort_by)
 
         except Exception as e:
             print(f"Error fetching modlist metadata: {e}")
@@ -93,6 +93,133 @@ class ModlistGalleryService:
             # Fall back to cache if network/engine fails
             return self._load_from_cache()
 
+    def load_cached_metadata(self) -> Optional[ModlistMetadataResponse]:
+        """
+        Load metadata without running the engine.
+
+        Served from the shared modlist catalog, which reads modlist_metadata.json
+        at most once per process.
+
+        Returns:
+            Cached ModlistMetadataResponse, or None if there is no usable cache
+        """
+        from jackify.backend.services.modlist_catalog_service import get_modlist_catalog_service
+        return get_modlist_catalog_service().get_cached_metadata()
+
+    def load_cached_metadata_with_index(self) -> Tuple[Optional[ModlistMetadataResponse], Optional[dict]]:
+        """
+        Load metadata and the stored catalog index from modlist_metadata.json.
+
+        Returns:
+            Tuple of (cached metadata or None, catalog index or None)
+        """
+        data = self._read_cache_file()
+        if data is None:
+            return None, None
+        try:
+            return parse_modlist_metadata_response(data), data.get('catalogIndex')
+        except Exception as e:
+            print(f"Error loading cache: {e}")
+            return None, None
+
+    def get_cache_age(self) -> Optional[float]:
+        """
+        Get the age of the cached metadata.
+
+        Returns:
+            Seconds since the cache was last written, or None if there is no cache
+        """
+        try:
+            return max(0.0, time.time() - self.METADATA_CACHE_FILE.stat().st_mtime)
+        except OSError:
+            return None
+
+    def refresh_modlist_metadata(
+        self,
+        previous: Optional[ModlistMetadataResponse] = None,
+        include_validation: bool = True,
+        include_search_index: bool = False,
+        sort_by: str = "title"
+    ) -> Tuple[Optional[ModlistMetadataResponse], ModlistMetadataDiff]:
+        """
+        Revalidate metadata against the engine and report what changed.
+
+        Args:
+            previous: Metadata currently displayed (defaults to the cache)
+            include_validation: Include validation status
+            include_search_index: Include mod search index
+            sort_by: Sort order (title, size, date)
+
+        Returns:
+            Tuple of (fresh metadata or None if the engine failed, diff against previous)
+        """
+        if previous is None:
+            previous = self._load_from_cache()
+        try:
+            # No cache fallback here: on failure the caller keeps what it already shows
+            metadata = self._fetch_and_cache(include_validation, include_search_index, sort_by)
+        except Exception as e:
+            print(f"Error refreshing modlist metadata: {e}")
+            metadata = None
+        if not metadata:
+            return None, ModlistMetadataDiff()
+        return metadata, diff_modlist_metadata(previous, metadata)
+
+    def _fetch_and_cache(
+        self,
+        include_validation: bool,
+        include_search_index: bool,
+        sort_by: str
+    ) -> Optional[ModlistMetadataResponse]:
+        """Fetch from the engine, record latency and update the cache"""
+        start_time = time.monotonic()
+        metadata = self._fetch_from_engine(
+            include_validation=include_validation,
+            include_search_index=include_search_index,
+            sort_by=sort_by
+        )
+        self.last_refresh_latency = time.monotonic() - start_time
+
+        # Save to cache so the next gallery open can render immediately
+        if metadata:
+            from jackify.backend.services.modlist_catalog_service import (
+                build_catalog_index,
+                get_modlist_catalog_service
+            )
+            self._merge_cached_fields(
+                metadata,
+                keep_validation=not include_validation,
+                keep_mods=not include_search_index
+            )
+            catalog_index = build_catalog_index(metadata.modlists)
+            self._save_to_cache(metadata, catalog_index)
+            # CLI menus and other screens in this process read the shared catalog
+            get_modlist_catalog_service().publish(metadata, catalog_index)
+
+        return metadata
+
+    def _merge_cached_fields(self, metadata: ModlistMetadataResponse, keep_validation: bool, keep_mods: bool):
+        """
+        Carry optional fields over from the cache when a fetch did not request them.
+
+        Validation status is kept until the next validated fetch replaces it; mod
+        lists are only kept while the modlist version is unchanged.
+        """
+        if not (keep_validation or keep_mods):
+            return
+        cached = self._load_from_cache()
+        if not cached:
+            return
+        cached_by_url = {m.machineURL: m for m in cached.modlists}
+        for modlist in metadata.modlists:
+            previous = cached_by_url.get(modlist.machineURL)
+            if previous is None:
+                continue
+            if keep_validation and modlist.validation is None:
+                modlist.validation = previous.validation
+            if keep_mods and not modlist.mods and previous.mods and previous.version == modlist.version:
+                modlist.mods = previous.mods
+
     def _fetch_from_engine(
         self,
         include_validation: bool,
@@ -153,30 +280,50 @@ class ModlistGalleryService:
 
     def _load_from_cache(self) -> Optional[ModlistMetadataResponse]:
         """Load metadata from cache file"""
+        data = self._read_cache_file()
+        if data is None:
+            return None
+
+        try:
+            return parse_modlist_metadata_response(data)
+        except Exception as e:
+            print(f"Error loading cache: {e}")
+            return None
+
+    def _read_cache_file(self) -> Optional[dict]:
+        """Read the raw cache file (None if missing or unreadable)"""
         if not self.METADATA_CACHE_FILE.exists():
             return None
 
         try:
             with open(self.METADATA_CACHE_FILE, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            return parse_modlist_metadata_response(data)
+            if self.last_refresh_latency is None:
+                self.last_refresh_latency = data.get('refreshLatency')
+            return data
         except Exception as e:
             print(f"Error loading cache: {e}")
             return None
 
-    def _save_to_cache(self, metadata: ModlistMetadataResponse):
-        """Save metadata to cache file"""
+    def _save_to_cache(self, metadata: ModlistMetadataResponse, catalog_index: Optional[dict] = None):
+        """Save metadata (and the catalog index built from it) to cache file"""
         try:
             # Convert to dict for JSON serialization
             data = {
                 'metadataVersion': metadata.metadataVersion,
                 'timestamp': metadata.timestamp,
                 'count': metadata.count,
+                'refreshLatency': self.last_refresh_latency,
                 'modlists': [self._metadata_to_dict(m) for m in metadata.modlists]
             }
+            if catalog_index is not None:
+                data['catalogIndex'] = catalog_index
 
-            with open(self.METADATA_CACHE_FILE, 'w', encoding='utf-8') as f:
+            # Write atomically - the gallery may be reading the cache concurrently
+            tmp_file = self.METADATA_CACHE_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
+            tmp_file.replace(self.METADATA_CACHE_FILE)
 
         except Exception as e:
             print(f"Error saving cache: {e}")
@@ -317,8 +464,7 @@ class ModlistGalleryService:
         Returns:
             Path to cached image or None if not cached
         """
-        filename = f"{metadata.machineURL}_{size}.webp"
-        image_path = self.IMAGE_CACHE_DIR / metadata.repositoryName / filename
+        image_path = self.get_image_cache_path(metadata, size)
 
         if image_path.exists():
             return image_path
@@ -328,6 +474,9 @@ class ModlistGalleryService:
         """
         Get path where image should be cached (always returns path, even if file doesn't exist).
 
+        The name includes a hash of the image URL, so a modlist whose image
+        changes is downloaded again instead of showing the old one.
+
         Args:
             metadata: Modlist metadata
             size: Image size (small or large)
@@ -335,9 +484,65 @@ class ModlistGalleryService:
         Returns:
             Path where image should be cached
         """
-        filename = f"{metadata.machineURL}_{size}.webp"
+        filename = f"{metadata.machineURL}_{size}_{self._image_url_hash(metadata, size)}.webp"
         return self.IMAGE_CACHE_DIR / metadata.repositoryName / filename
 
+    def _image_url_hash(self, metadata: ModlistMetadata, size: str) -> str:
+        source_url = self.get_image_url(metadata, size) or ""
+        return hashlib.sha1(source_url.encode("utf-8")).hexdigest()[:12]
+
+    def _remove_stale_images(self, image_path: Path, metadata: ModlistMetadata, size: str):
+        """Delete cached copies of earlier images of this modlist (and the old unhashed name)."""
+        stale = re.compile(re.escape(f"{metadata.machineURL}_{size}") + r"(_[0-9a-f]{12})?\.webp")
+        try:
+            for entry in image_path.parent.iterdir():
+                if entry != image_path and stale.fullmatch(entry.name):
+                    entry.unlink()
+        except OSError:
+            pass
+
+    def store_image_bytes(self, metadata: ModlistMetadata, data: bytes, size: str = "large") -> Path:
+        """
+        Write downloaded image bytes to the image cache as-is (no re-encoding).
+
+        The write goes through a temp file so a reader never sees a partial image.
+
+        Args:
+            metadata: Modlist metadata
+            data: Raw image bytes as served by the image host
+            size: Image size (small or large)
+
+        Returns:
+            Path the image was cached at
+        """
+        image_path = self.get_image_cache_path(metadata, size)
+        image_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = image_path.with_name(image_path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, image_path)
+        self._remove_stale_images(image_path, metadata, size)
+        return image_path
+
+    def get_thumbnail_cache_path(self, metadata: ModlistMetadata, width: int, height: int,
+                                 size: str = "large") -> Path:
+        """
+        Get path of the pre-scaled thumbnail of a modlist image at an exact pixel size.
+
+        The name includes a hash of the source image URL so a modlist whose
+        image changes does not keep showing the old thumbnail.
+
+        Args:
+            metadata: Modlist metadata
+            width: Thumbnail width in pixels
+            height: Thumbnail height in pixels
+            size: Source image size (small or large)
+
+        Returns:
+            Path where the thumbnail is (or would be) cached
+        """
+        filename = f"{metadata.machineURL}_{size}_{width}x{height}_{self._image_url_hash(metadata, size)}.png"
+        return self.THUMBNAIL_CACHE_DIR / metadata.repositoryName / filename
+
     def get_image_url(self, metadata: ModlistMetadata, size: str = "large") -> Optional[str]:
         """
         Get image URL for a modlist.
@@ -67,49 +67,13 @@ class ModlistService:
         logger.info(f"Listing modlists for game_type: {game_type}")
         
         try:
-            # Use the working ModlistInstallCLI to get modlists from engine
-            from ..core.modlist_operations import ModlistInstallCLI
-            
-            # Use new SystemInfo pattern
-            modlist_cli = ModlistInstallCLI(self.system_info)
+            # The shared catalog fetches list-modlists --json once and groups it by
+            # game type, so switching categories doesn't launch the engine again
+            from .modlist_catalog_service import get_modlist_catalog_service
             
-            # Get all modlists and do client-side filtering for better control
-            raw_modlists = modlist_cli.get_all_modlists_from_engine(game_type=None)
-            
-            # Apply client-side filtering based on game_type
-            if game_type:
-                game_type_lower = game_type.lower()
-                
-                if game_type_lower == 'skyrim':
-                    # Include both "Skyrim" and "Skyrim Special Edition" and "Skyrim VR"
-                    raw_modlists = [m for m in raw_modlists if 'skyrim' in m.get('game', '').lower()]
-                    
-                elif game_type_lower == 'fallout4':
-                    raw_modlists = [m for m in raw_modlists if 'fallout 4' in m.get('game', '').lower()]
-                    
-                elif game_type_lower == 'falloutnv':
-                    raw_modlists = [m for m in raw_modlists if 'fallout new vegas' in m.get('game', '').lower()]
-                    
-                elif game_type_lower == 'oblivion':
-                    raw_modlists = [m for m in raw_modlists if 'oblivion' in m.get('game', '').lower() and 'remastered' not in m.get('game', '').lower()]
-                    
-                elif game_type_lower == 'starfield':
-                    raw_modlists = [m for m in raw_modlists if 'starfield' in m.get('game', '').lower()]
-                    
-                elif game_type_lower == 'oblivion_remastered':
-                    raw_modlists = [m for m in raw_modlists if 'oblivion remastered' in m.get('game', '').lower()]
-                    
-                elif game_type_lower == 'enderal':
-                    raw_modlists = [m for m in raw_modlists if 'enderal' in m.get('game', '').lower()]
-                    
-                elif game_type_lower == 'other':
-                    # Exclude all main category games to show only "Other" games
-                    main_category_keywords = ['skyrim', 'fallout 4', 'fallout new vegas', 'oblivion', 'starfield', 'enderal']
-                    def is_main_category(game_name):
-                        game_lower = game_name.lower()
-                        return any(keyword in game_lower for keyword in main_category_keywords)
-                    
-                    raw_modlists = [m for m in raw_modlists if not is_main_category(m.get('game', ''))]
+            raw_modlists = get_modlist_catalog_service().list_modlists(game_type=game_type)
+            if raw_modlists is None:
+                raise RuntimeError("Could not load the modlist catalog from jackify-engine")
             
             # Convert to ModlistInfo objects with enhanced metadata
             modlists = []
@@ -343,27 +307,9 @@ class ModlistService:
                 clean_env = get_clean_subprocess_env()
                 proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=False, env=clean_env, cwd=engine_dir)
                 
-                # Output processing (copied from working code)
-                buffer = b''
-                while True:
-                    chunk = proc.stdout.read(1)
-                    if not chunk:
-                        break
-                    buffer += chunk
-                    
-                    if chunk == b'\n':
-                        line = buffer.decode('utf-8', errors='replace')
-                        if output_callback:
-                            output_callback(line.rstrip())
-                        buffer = b''
-                    elif chunk == b'\r':
-                        line = buffer.decode('utf-8', errors='replace')
-                        if output_callback:
-                            output_callback(line.rstrip())
-                        buffer = b''
-                
-                if buffer:
-                    line = buffer.decode('utf-8', errors='replace')
+                # Output processing: chunked reads split on \r/\n
+                from jackify.backend.handlers.subprocess_utils import iter_output_records
+                for line, _terminator in iter_output_records(proc.stdout):
                     if output_callback:
                         output_callback(line.rstrip())
                 
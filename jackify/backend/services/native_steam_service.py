@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List
 
 from ..handlers.vdf_handler import VDFHandler
+from ..handlers.shortcuts_session import get_shortcuts_session
 
 logger = logging.getLogger(__name__)
 
@@ -201,13 +202,12 @@ class NativeSteamService:
             return {'shortcuts': {}}
         
         try:
-            if shortcuts_path.exists():
-                with open(shortcuts_path, 'rb') as f:
-                    data = vdf.binary_load(f)
-                return data
-            else:
+            # Served from the shared session; only re-parsed when the file changed
+            session = get_shortcuts_session(shortcuts_path)
+            data = session.snapshot()
+            if not session.exists:
                 logger.info("shortcuts.vdf does not exist, will create new one")
-                return {'shortcuts': {}}
+            return data
                 
         except Exception as e:
             logger.error(f"Error reading shortcuts.vdf: {e}")
@@ -220,19 +220,12 @@ class NativeSteamService:
             return False
         
         try:
-            # Create backup first
-            if shortcuts_path.exists():
-                backup_path = shortcuts_path.with_suffix(f".vdf.backup_{int(time.time())}")
-                import shutil
-                shutil.copy2(shortcuts_path, backup_path)
-                logger.info(f"Created backup: {backup_path}")
-            
-            # Ensure parent directory exists
-            shortcuts_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write the VDF file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(data, f)
+            # Atomic replace; the session keeps the previous file as a backup
+            session = get_shortcuts_session(shortcuts_path)
+            session.replace_data(data)
+            if not session.save():
+                session.refresh(force=True)
+                return False
             
             logger.info("Successfully wrote shortcuts.vdf")
             return True
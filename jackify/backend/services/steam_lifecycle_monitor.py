@@ -0,0 +1,230 @@
+"""
+Steam Lifecycle Monitor
+
+Watches Steam's processes without spawning ``pgrep``: ``/proc`` is scanned
+directly, and known PIDs are waited on through pidfds so an exit is noticed
+the moment it happens. Used by the restart service to return as soon as
+Steam has actually stopped or become ready, instead of sleeping for fixed
+intervals.
+
+Steam counts as ready once ``steamwebhelper`` is running and Steam has
+written one of its state files (``registry.vdf``, ``config/config.vdf``,
+``config/loginusers.vdf``) since the restart began, and the helper has stayed
+up for a short settle period. If no fresh write is seen, the older rule of
+20 seconds of continuous ``steamwebhelper`` presence applies.
+"""
+
+import logging
+import os
+import select
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+STEAM_HELPER_PATTERN = "steamwebhelper"
+FLATPAK_STEAM_PATTERN = "com.valvesoftware.Steam"
+
+# How long steamwebhelper must stay up after a fresh state write
+READY_SETTLE_SECONDS = 3.0
+# Fallback when no state file write is observed (previous fixed rule)
+READY_WITHOUT_WRITE_SECONDS = 20.0
+# Longest sleep between /proc rescans
+MAX_RESCAN_INTERVAL = 0.5
+PROGRESS_INTERVAL = 30.0
+
+_STATE_FILES = (
+    "~/.steam/registry.vdf",
+    "~/.steam/steam/config/config.vdf",
+    "~/.steam/steam/config/loginusers.vdf",
+    "~/.local/share/Steam/config/config.vdf",
+    "~/.local/share/Steam/config/loginusers.vdf",
+    "~/.var/app/com.valvesoftware.Steam/.steam/registry.vdf",
+    "~/.var/app/com.valvesoftware.Steam/.local/share/Steam/config/config.vdf",
+    "~/.var/app/com.valvesoftware.Steam/.local/share/Steam/config/loginusers.vdf",
+)
+
+
+def find_pids(pattern: str) -> Set[int]:
+    """PIDs whose command line contains ``pattern`` (like ``pgrep -f``)."""
+    needle = pattern.encode()
+    own_pid = os.getpid()
+    pids = set()
+    try:
+        entries = os.scandir("/proc")
+    except OSError as e:
+        logger.debug(f"Cannot scan /proc: {e}")
+        return pids
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            if pid == own_pid:
+                continue
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            if needle in cmdline:
+                pids.add(pid)
+    return pids
+
+
+class _PidWaiter:
+    """Wakes when any of a set of processes exits (pidfd-based where supported)."""
+
+    def __init__(self):
+        self._fds: Dict[int, int] = {}
+        self.supported = hasattr(os, "pidfd_open")
+
+    def track(self, pids: Set[int]):
+        if not self.supported:
+            return
+        for pid in pids - self._fds.keys():
+            try:
+                self._fds[pid] = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue
+            except OSError as e:
+                logger.debug(f"pidfd_open unavailable ({e}), polling /proc instead")
+                self.supported = False
+                return
+
+    def wait(self, timeout: float):
+        if not self._fds:
+            time.sleep(max(0.0, timeout))
+            return
+        readable, _, _ = select.select(list(self._fds.values()), [], [], max(0.0, timeout))
+        for pid, fd in list(self._fds.items()):
+            if fd in readable:
+                os.close(fd)
+                del self._fds[pid]
+
+    def close(self):
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds.clear()
+
+
+def _latest_state_write() -> float:
+    latest = 0.0
+    for path in _STATE_FILES:
+        try:
+            latest = max(latest, os.path.getmtime(os.path.expanduser(path)))
+        except OSError:
+            continue
+    return latest
+
+
+class SteamLifecycleMonitor:
+    """Waits for Steam to stop or start, returning as soon as the state changes."""
+
+    def __init__(self, pattern: str = STEAM_HELPER_PATTERN):
+        self.pattern = pattern
+
+    def is_running(self) -> bool:
+        return bool(find_pids(self.pattern))
+
+    def wait_for_exit(self, timeout: float) -> bool:
+        """True once no matching process is left; False if still running at ``timeout``."""
+        deadline = time.monotonic() + timeout
+        waiter = _PidWaiter()
+        interval = 0.05
+        try:
+            while True:
+                pids = find_pids(self.pattern)
+                if not pids:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                waiter.track(pids)
+                if waiter.supported:
+                    # Helpers can respawn children, so rescan periodically as well
+                    waiter.wait(min(remaining, MAX_RESCAN_INTERVAL))
+                else:
+                    time.sleep(min(remaining, interval))
+                    interval = min(interval * 2, MAX_RESCAN_INTERVAL)
+        finally:
+            waiter.close()
+
+    def wait_for_process(self, timeout: float) -> bool:
+        """True as soon as a matching process exists."""
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        while True:
+            if self.is_running():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, interval))
+            interval = min(interval * 2, MAX_RESCAN_INTERVAL)
+
+    def wait_for_ready(self, timeout: float, since: Optional[float] = None,
+                       progress: Optional[Callable[[float], None]] = None) -> bool:
+        """
+        Wait for Steam to be up and initialised.
+
+        ``since`` is a ``time.time()`` value; state file writes older than it
+        don't count (defaults to now). ``progress(elapsed)`` is called every
+        30 seconds while waiting.
+        """
+        since = time.time() if since is None else since
+        start = time.monotonic()
+        deadline = start + timeout
+        running_since: Optional[float] = None
+        last_progress = start
+        fresh_write_logged = False
+
+        while True:
+            now = time.monotonic()
+            if self.is_running():
+                if running_since is None:
+                    running_since = now
+                    logger.info(f"Steam process detected at {now - start:.1f}s, waiting for initialization...")
+                stable_for = now - running_since
+                fresh_write = _latest_state_write() >= since
+                if fresh_write and not fresh_write_logged:
+                    logger.debug(f"Steam wrote its state files at {now - start:.1f}s")
+                    fresh_write_logged = True
+                if (fresh_write and stable_for >= READY_SETTLE_SECONDS) or stable_for >= READY_WITHOUT_WRITE_SECONDS:
+                    logger.info(f"Steam ready after {now - start:.1f}s "
+                                f"({'state files written' if fresh_write else 'helper stable'})")
+                    return True
+            elif running_since is not None:
+                logger.warning("Steam process disappeared during initialization, continuing to wait...")
+                running_since = None
+
+            if now >= deadline:
+                return False
+            if progress and now - last_progress >= PROGRESS_INTERVAL:
+                progress(now - start)
+                last_progress = now
+            time.sleep(min(MAX_RESCAN_INTERVAL, max(0.0, deadline - now)))
+
+
+class PhaseTimer:
+    """Logs how long each named phase of an operation took."""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.phases: List[tuple] = []
+        self._start = time.monotonic()
+        self._phase_start = self._start
+
+    def mark(self, phase: str):
+        now = time.monotonic()
+        self.phases.append((phase, now - self._phase_start))
+        logger.info(f"{self.operation}: {phase} took {now - self._phase_start:.2f}s")
+        self._phase_start = now
+
+    def summary(self) -> str:
+        total = time.monotonic() - self._start
+        parts = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in self.phases)
+        return f"{self.operation} finished in {total:.1f}s ({parts})"
@@ -8,6 +8,12 @@ import sys
 import shutil
 from typing import Callable, Optional
 
+from .steam_lifecycle_monitor import (
+    FLATPAK_STEAM_PATTERN,
+    PhaseTimer,
+    SteamLifecycleMonitor,
+)
+
 logger = logging.getLogger(__name__)
 
 STRATEGY_JACKIFY = "jackify"
@@ -181,18 +187,8 @@ def get_steam_processes() -> list:
     return steam_procs
 
 def wait_for_steam_exit(timeout: int = 60, check_interval: float = 0.5) -> bool:
-    """Wait for all Steam processes to exit using pgrep (matching existing logic)."""
-    start = time.time()
-    env = _get_clean_subprocess_env()
-    while time.time() - start < timeout:
-        try:
-            result = subprocess.run(['pgrep', '-f', 'steamwebhelper'], capture_output=True, timeout=10, env=env)
-            if result.returncode != 0:
-                return True
-        except Exception as e:
-            logger.debug(f"Error checking Steam processes: {e}")
-        time.sleep(check_interval)
-    return False
+    """Wait for all steamwebhelper processes to exit (returns as soon as they have)."""
+    return SteamLifecycleMonitor().wait_for_exit(timeout)
 
 def _start_steam_nak_style(is_steamdeck_flag=False, is_flatpak_flag=False, env_override=None) -> bool:
     """
@@ -227,10 +223,8 @@ def _start_steam_nak_style(is_steamdeck_flag=False, is_flatpak_flag=False, env_o
             # This helps with GUI display access on some systems
             subprocess.Popen("steam", shell=True, env=env)
 
-        time.sleep(5)
         # Use steamwebhelper for detection (actual Steam process, not steam-powerbuttond)
-        check_result = subprocess.run(['pgrep', '-f', 'steamwebhelper'], capture_output=True, timeout=10, env=env)
-        if check_result.returncode == 0:
+        if SteamLifecycleMonitor().wait_for_process(timeout=5):
             logger.info("NaK-style restart detected running Steam process.")
             return True
 
@@ -288,10 +282,9 @@ def start_steam(is_steamdeck_flag=None, is_flatpak_flag=None, env_override=None,
                 logger.debug("Executing: flatpak run com.valvesoftware.Steam")
                 subprocess.Popen(["flatpak", "run", "com.valvesoftware.Steam"],
                                env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                time.sleep(7)  # Give Flatpak more time to start
                 # For Flatpak Steam, check for the flatpak process, not steamwebhelper
-                check_result = subprocess.run(['pgrep', '-f', 'com.valvesoftware.Steam'], capture_output=True, timeout=10, env=env)
-                if check_result.returncode == 0:
+                # (Flatpak gets more time to start)
+                if SteamLifecycleMonitor(FLATPAK_STEAM_PATTERN).wait_for_process(timeout=7):
                     logger.info("Flatpak Steam started successfully")
                     return True
                 else:
@@ -315,10 +308,8 @@ def start_steam(is_steamdeck_flag=None, is_flatpak_flag=None, env_override=None,
                 process = subprocess.Popen(method["cmd"], **method["kwargs"])
                 if process is not None:
                     logger.info(f"Initiated Steam start with {method_name}.")
-                    time.sleep(5)  # Wait 5 seconds as in existing logic
                     # Use steamwebhelper for detection (actual Steam process, not steam-powerbuttond)
-                    check_result = subprocess.run(['pgrep', '-f', 'steamwebhelper'], capture_output=True, timeout=10, env=env)
-                    if check_result.returncode == 0:
+                    if SteamLifecycleMonitor().wait_for_process(timeout=5):
                         logger.info(f"Steam process detected after using {method_name}. Proceeding to wait phase.")
                         return True
                     else:
@@ -359,6 +350,9 @@ def robust_steam_restart(progress_callback: Optional[Callable[[str], None]] = No
         if progress_callback:
             progress_callback(msg)
 
+    monitor = SteamLifecycleMonitor()
+    timer = PhaseTimer("Steam restart")
+
     report("Shutting down Steam...")
     report(f"Steam restart strategy: {_strategy_label(strategy)}")
 
@@ -368,7 +362,7 @@ def robust_steam_restart(progress_callback: Optional[Callable[[str], None]] = No
             report("Steam Deck detected - using systemctl shutdown...")
             subprocess.run(['systemctl', '--user', 'stop', 'app-steam@autostart.service'],
                          timeout=15, check=False, capture_output=True, env=shutdown_env)
-            time.sleep(2)
+            monitor.wait_for_exit(timeout=2)
         except Exception as e:
             logger.debug(f"systemctl stop failed on Steam Deck: {e}")
     # Flatpak Steam: Use flatpak kill command (only if not Steam Deck)
@@ -377,7 +371,7 @@ def robust_steam_restart(progress_callback: Optional[Callable[[str], None]] = No
             report("Flatpak Steam detected - stopping via flatpak...")
             subprocess.run(['flatpak', 'kill', 'com.valvesoftware.Steam'],
                          timeout=15, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=shutdown_env)
-            time.sleep(2)
+            monitor.wait_for_exit(timeout=2)
         except Exception as e:
             logger.debug(f"flatpak kill failed: {e}")
 
@@ -386,20 +380,16 @@ def robust_steam_restart(progress_callback: Optional[Callable[[str], None]] = No
         # Skip unreliable steam -shutdown, go straight to pkill
         pkill_result = subprocess.run(['pkill', 'steam'], timeout=15, check=False, capture_output=True, env=shutdown_env)
         logger.debug(f"pkill steam result: {pkill_result.returncode}")
-        time.sleep(2)
-        
+
         # Check if Steam is still running
-        check_result = subprocess.run(['pgrep', '-f', 'steamwebhelper'], capture_output=True, timeout=10, env=shutdown_env)
-        if check_result.returncode == 0:
+        if not monitor.wait_for_exit(timeout=2):
             # Force kill if still running
             report("Steam still running - force terminating...")
             force_result = subprocess.run(['pkill', '-9', 'steam'], timeout=15, check=False, capture_output=True, env=shutdown_env)
             logger.debug(f"pkill -9 steam result: {force_result.returncode}")
-            time.sleep(2)
-            
+
             # Final check
-            final_check = subprocess.run(['pgrep', '-f', 'steamwebhelper'], capture_output=True, timeout=10, env=shutdown_env)
-            if final_check.returncode != 0:
+            if monitor.wait_for_exit(timeout=2):
                 logger.info("Steam processes successfully force terminated.")
             else:
                 # Steam might still be running, but proceed anyway - wait phase will verify
@@ -413,9 +403,11 @@ def robust_steam_restart(progress_callback: Optional[Callable[[str], None]] = No
         report("Steam shutdown had issues, but proceeding...")
     
     report("Steam closed successfully.")
+    timer.mark("shutdown")
 
     # Start Steam using platform-specific logic
     report("Starting Steam...")
+    start_requested_at = time.time()
 
     # Steam Deck: Use systemctl restart (keep existing working approach)
     if _is_steam_deck:
@@ -440,54 +432,34 @@ def robust_steam_restart(progress_callback: Optional[Callable[[str], None]] = No
             logger.warning("start_steam() returned False, but proceeding to wait phase in case Steam is starting anyway")
             report("Steam start command issued, waiting for process...")
 
+    timer.mark("start")
+
     # Wait for Steam to fully initialize
     # CRITICAL: Use steamwebhelper (actual Steam process), not "steam" (matches steam-powerbuttond, etc.)
     report("Waiting for Steam to fully start")
-    logger.info("Waiting up to 3 minutes (180 seconds) for Steam to fully initialize...")
-    max_startup_wait = 180  # Increased from 120 to 180 seconds (3 minutes) for slower systems
-    elapsed_wait = 0
-    initial_wait_done = False
-    last_status_log = 0  # Track when we last logged status
-    
-    while elapsed_wait < max_startup_wait:
-        try:
-            # Log status every 30 seconds so user knows we're still waiting
-            if elapsed_wait - last_status_log >= 30:
-                remaining = max_startup_wait - elapsed_wait
-                logger.info(f"Still waiting for Steam... ({elapsed_wait}s elapsed, {remaining}s remaining)")
-                if progress_callback:
-                    progress_callback(f"Waiting for Steam... ({elapsed_wait}s / {max_startup_wait}s)")
-                last_status_log = elapsed_wait
-            
-            # Use steamwebhelper for detection (matches shutdown logic)
-            result = subprocess.run(['pgrep', '-f', 'steamwebhelper'], capture_output=True, timeout=10, env=start_env)
-            if result.returncode == 0:
-                if not initial_wait_done:
-                    logger.info(f"Steam process detected at {elapsed_wait}s. Waiting additional time for full initialization...")
-                    initial_wait_done = True
-                time.sleep(5)
-                elapsed_wait += 5
-                # Require at least 20 seconds of stable detection (increased from 15)
-                if initial_wait_done and elapsed_wait >= 20:
-                    final_check = subprocess.run(['pgrep', '-f', 'steamwebhelper'], capture_output=True, timeout=10, env=start_env)
-                    if final_check.returncode == 0:
-                        report("Steam started successfully.")
-                        logger.info(f"Steam confirmed running after {elapsed_wait}s wait.")
-                        return True
-                    else:
-                        logger.warning("Steam process disappeared during final initialization wait, continuing to wait...")
-                        # Don't break - continue waiting in case Steam is still starting
-                        initial_wait_done = False  # Reset to allow re-detection
-            else:
-                logger.debug(f"Steam process not yet detected. Waiting... ({elapsed_wait + 5}s)")
-                time.sleep(5)
-                elapsed_wait += 5
-        except Exception as e:
-            logger.warning(f"Error during Steam startup wait: {e}")
-            time.sleep(5)
-            elapsed_wait += 5
-    
+    max_startup_wait = 180  # 3 minutes for slower systems
+    logger.info(f"Waiting up to {max_startup_wait} seconds for Steam to fully initialize...")
+
+    def waiting(elapsed: float):
+        # Log status every 30 seconds so user knows we're still waiting
+        remaining = max_startup_wait - elapsed
+        logger.info(f"Still waiting for Steam... ({elapsed:.0f}s elapsed, {remaining:.0f}s remaining)")
+        if progress_callback:
+            progress_callback(f"Waiting for Steam... ({elapsed:.0f}s / {max_startup_wait}s)")
+
+    try:
+        ready = monitor.wait_for_ready(max_startup_wait, since=start_requested_at, progress=waiting)
+    except Exception as e:
+        logger.warning(f"Error during Steam startup wait: {e}")
+        ready = False
+    timer.mark("initialization")
+
+    if ready:
+        report("Steam started successfully.")
+        logger.info(timer.summary())
+        return True
+
     # Only reach here if we've waited the full duration
     report(f"Steam did not start within {max_startup_wait}s timeout.")
-    logger.error(f"Steam failed to start/initialize within the allowed time ({elapsed_wait}s elapsed).")
-    return False 
\ No newline at end of file
+    logger.error(f"Steam failed to start/initialize within the allowed time. {timer.summary()}")
+    return False
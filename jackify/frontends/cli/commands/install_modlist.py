@@ -238,42 +238,10 @@ class InstallModlistCommand:
             args: Parsed command-line arguments
         """
         # Import backend services
-        from jackify.backend.core.modlist_operations import ModlistInstallCLI
-        
-        # Use new SystemInfo pattern
-        modlist_cli = ModlistInstallCLI(self.system_info)
+        from jackify.backend.services.modlist_catalog_service import get_modlist_catalog_service
         
-        # Get all modlists from engine
-        raw_modlists = modlist_cli.get_all_modlists_from_engine()
-        
-        # Group by game type as in original CLI
-        game_type_map = {
-            'skyrim': ['Skyrim', 'Skyrim Special Edition'],
-            'fallout4': ['Fallout 4'],
-            'falloutnv': ['Fallout New Vegas'],
-            'oblivion': ['Oblivion'],
-            'starfield': ['Starfield'],
-            'oblivion_remastered': ['Oblivion Remastered', 'OblivionRemastered'],
-            'other': None
-        }
-        
-        grouped_modlists = {k: [] for k in game_type_map}
-
-        for m_info in raw_modlists:  # m_info is like {'id': ..., 'game': ...}
-            found_category = False
-            for cat_key, cat_keywords in game_type_map.items():
-                if cat_key == 'other':
-                    continue
-                if cat_keywords:
-                    for keyword in cat_keywords:
-                        if keyword.lower() in m_info.get('game', '').lower():
-                            grouped_modlists[cat_key].append(m_info)
-                            found_category = True
-                            break
-                if found_category:
-                    break
-            if not found_category:
-                grouped_modlists['other'].append(m_info)
+        # Modlists grouped by game type (served from the shared catalog)
+        grouped_modlists = get_modlist_catalog_service().group_by_game_type() or {}
         
         # Output modlists for the requested game type
         game_type = (getattr(args, 'game_type', '') or '').lower()
@@ -282,8 +250,8 @@ class InstallModlistCommand:
                 print(m.get('id', ''))
         else:
             # Output all modlists
-            for cat_key in ['skyrim', 'fallout4', 'falloutnv', 'oblivion', 'starfield', 'oblivion_remastered', 'other']:
-                for m in grouped_modlists[cat_key]:
+            for cat_key in ['skyrim', 'fallout4', 'falloutnv', 'oblivion', 'starfield', 'oblivion_remastered', 'enderal', 'other']:
+                for m in grouped_modlists.get(cat_key, []):
                     print(m.get('id', ''))
     
     def _execute_legacy_install(self, context: dict) -> int:
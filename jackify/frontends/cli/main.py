@@ -368,6 +368,10 @@ class JackifyCLI:
             self._debug_print('Entering update workflow')
             return self._handle_update()
         
+        if getattr(self.args, 'performance_report', None):
+            self._debug_print('Entering performance report workflow')
+            return self._handle_performance_report(self.args.performance_report)
+        
         # Handle legacy restart-steam functionality (temporary)
         if getattr(self.args, 'restart_steam', False):
             self._debug_print('Entering restart_steam workflow')
@@ -400,6 +404,8 @@ class JackifyCLI:
         parser.add_argument('--restart-steam', action='store_true', help='Restart Steam (native, for GUI integration)')
         parser.add_argument('--dev', action='store_true', help='Enable development features (show hidden menu items)')
         parser.add_argument('--update', action='store_true', help='Check for and install updates')
+        parser.add_argument('--performance-report', nargs='?', const='latest', metavar='TIMELINE',
+                            help='Summarise where an install spent its time (latest install, or a timeline file)')
         
         # Add command-specific arguments
         self.commands['install_modlist'].add_top_level_args(parser)
@@ -493,6 +499,29 @@ class JackifyCLI:
             logger.error(f"Steam restart failed with exception: {e}")
             return 1
     
+    def _handle_performance_report(self, timeline):
+        """Print the performance report for the latest (or a given) install timeline"""
+        from jackify.backend.handlers.performance_timeline import (
+            format_performance_report,
+            list_timelines,
+            load_performance_report
+        )
+        
+        if timeline == 'latest':
+            timelines = list_timelines()
+            if not timelines:
+                print(f"{COLOR_INFO}No performance timelines recorded yet. One is written for every modlist install.{COLOR_RESET}")
+                return 1
+            timeline = timelines[0]
+        
+        report = load_performance_report(timeline)
+        if not report:
+            print(f"{COLOR_ERROR}Could not read performance timeline: {timeline}{COLOR_RESET}")
+            return 1
+        print(format_performance_report(report))
+        print(f"\nTimeline: {timeline}")
+        return 0
+    
     def _handle_legacy_install_wabbajack(self):
         """Handle install-wabbajack command (legacy functionality)"""
         print("Install Wabbajack functionality not yet migrated to new structure")
@@ -28,6 +28,7 @@ from jackify.frontends.gui.services.message_service import MessageService
 from jackify.backend.utils.nexus_premium_detector import is_non_premium_indicator
 # R&D: Progress reporting components
 from jackify.backend.handlers.progress_parser import ProgressStateManager
+from jackify.backend.handlers.progress_bus import ProgressEventBus
 from jackify.frontends.gui.widgets.progress_indicator import OverallProgressIndicator
 from jackify.frontends.gui.widgets.file_progress_list import FileProgressList
 from jackify.shared.progress_models import InstallationPhase, InstallationProgress
@@ -2134,7 +2135,7 @@ class InstallModlistScreen(QWidget):
         class InstallationThread(QThread):
             output_received = Signal(str)
             progress_received = Signal(str)
-            progress_updated = Signal(object)  # R&D: Emits InstallationProgress object
+            progress_updated = Signal(object)  # R&D: Emits ProgressFrame object
             installation_finished = Signal(bool, str)
             premium_required_detected = Signal(str)
             
@@ -2161,6 +2162,73 @@ class InstallModlistScreen(QWidget):
                 self.cancelled = True
                 if self.process_manager:
                     self.process_manager.cancel()
+
+            def _log_performance_summary(self, timeline_path):
+                """Write the engine part of the performance report to the workflow log"""
+                try:
+                    from jackify.backend.handlers.performance_timeline import (
+                        format_performance_report,
+                        load_performance_report
+                    )
+                    report = load_performance_report(timeline_path)
+                    if report:
+                        for line in format_performance_report(report).splitlines():
+                            self.output_received.emit(f"[Jackify] {line}")
+                except Exception as e:
+                    debug_print(f"DEBUG: Could not build performance report: {e}")
+
+            def _log_premium_detection(self, decoded, matched_pattern):
+                """Dump auth and output diagnostics when Premium detection fires (Issue #111)."""
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning("=" * 80)
+                logger.warning("PREMIUM DETECTION TRIGGERED - DIAGNOSTIC DUMP (Issue #111)")
+                logger.warning("=" * 80)
+                logger.warning(f"Matched pattern: '{matched_pattern}'")
+                logger.warning(f"Triggering line: '{decoded.strip()}'")
+
+                # Detailed auth diagnostics
+                logger.warning("")
+                logger.warning("AUTHENTICATION DIAGNOSTICS:")
+                logger.warning(f"  Auth value present: {'YES' if self.api_key else 'NO'}")
+                if self.api_key:
+                    logger.warning(f"  Auth value length: {len(self.api_key)} chars")
+                    if len(self.api_key) >= 8:
+                        logger.warning(f"  Auth value (partial): {self.api_key[:4]}...{self.api_key[-4:]}")
+
+                    # Determine auth method and get detailed status
+                    auth_method = self.auth_service.get_auth_method()
+                    logger.warning(f"  Auth method: {auth_method or 'UNKNOWN'}")
+
+                    if auth_method == 'oauth':
+                        # Get detailed OAuth token status
+                        token_handler = self.auth_service.token_handler
+                        token_info = token_handler.get_token_info()
+
+                        logger.warning("  OAuth Token Status:")
+                        logger.warning(f"    Has token file: {token_info.get('has_token', False)}")
+                        logger.warning(f"    Has refresh token: {token_info.get('has_refresh_token', False)}")
+
+                        if 'expires_in_minutes' in token_info:
+                            logger.warning(f"    Expires in: {token_info['expires_in_minutes']:.1f} minutes")
+                            logger.warning(f"    Is expired: {token_info.get('is_expired', False)}")
+                            logger.warning(f"    Expires soon (5min): {token_info.get('expires_soon_5min', False)}")
+
+                        if 'refresh_token_age_days' in token_info:
+                            logger.warning(f"    Refresh token age: {token_info['refresh_token_age_days']:.1f} days")
+                            logger.warning(f"    Refresh token likely expired: {token_info.get('refresh_token_likely_expired', False)}")
+
+                        if token_info.get('error'):
+                            logger.warning(f"    Error: {token_info['error']}")
+
+                logger.warning("")
+                logger.warning("Previous engine output (last 10 lines):")
+                for i, buffered_line in enumerate(self._engine_output_buffer, 1):
+                    logger.warning(f"  -{len(self._engine_output_buffer) - i + 1}: {buffered_line}")
+                logger.warning("")
+                logger.warning("If user HAS Premium, this is a FALSE POSITIVE")
+                logger.warning("Report to: https://github.com/Omni-guides/Jackify/issues/111")
+                logger.warning("=" * 80)
             
             def run(self):
                 try:
@@ -2205,220 +2273,110 @@ class InstallModlistScreen(QWidget):
                         env_vars['NEXUS_OAUTH_INFO'] = self.oauth_info
                     env = get_clean_subprocess_env(env_vars)
                     self.process_manager = ProcessManager(cmd, env=env, text=False)
-                    ansi_escape = re.compile(rb'\x1b\[[0-9;?]*[ -/]*[@-~]')
-                    buffer = b''
-                    last_was_blank = False
-                    while True:
-                        if self.cancelled:
-                            self.cancel()
-                            break
-                        char = self.process_manager.read_stdout_char()
-                        if not char:
-                            break
-                        buffer += char
-                        while b'\n' in buffer or b'\r' in buffer:
-                            if b'\r' in buffer and (buffer.index(b'\r') < buffer.index(b'\n') if b'\n' in buffer else True):
-                                line, buffer = buffer.split(b'\r', 1)
-                                line = ansi_escape.sub(b'', line)
-                                decoded = line.decode('utf-8', errors='replace')
-
-                                # Notify when Nexus requires Premium before continuing
-                                from jackify.backend.handlers.config_handler import ConfigHandler
-                                config_handler = ConfigHandler()
-                                debug_mode = config_handler.get('debug_mode', False)
-
-                                # Check for Premium detection
-                                is_premium_error, matched_pattern = is_non_premium_indicator(decoded)
-                                if not self._premium_signal_sent and is_premium_error:
-                                    self._premium_signal_sent = True
-
-                                    # DIAGNOSTIC LOGGING: Capture false positive details
-                                    import logging
-                                    logger = logging.getLogger(__name__)
-                                    logger.warning("=" * 80)
-                                    logger.warning("PREMIUM DETECTION TRIGGERED - DIAGNOSTIC DUMP (Issue #111)")
-                                    logger.warning("=" * 80)
-                                    logger.warning(f"Matched pattern: '{matched_pattern}'")
-                                    logger.warning(f"Triggering line: '{decoded.strip()}'")
-
-                                    # Detailed auth diagnostics
-                                    logger.warning("")
-                                    logger.warning("AUTHENTICATION DIAGNOSTICS:")
-                                    logger.warning(f"  Auth value present: {'YES' if self.api_key else 'NO'}")
-                                    if self.api_key:
-                                        logger.warning(f"  Auth value length: {len(self.api_key)} chars")
-                                        if len(self.api_key) >= 8:
-                                            logger.warning(f"  Auth value (partial): {self.api_key[:4]}...{self.api_key[-4:]}")
-
-                                        # Determine auth method and get detailed status
-                                        auth_method = self.auth_service.get_auth_method()
-                                        logger.warning(f"  Auth method: {auth_method or 'UNKNOWN'}")
-
-                                        if auth_method == 'oauth':
-                                            # Get detailed OAuth token status
-                                            token_handler = self.auth_service.token_handler
-                                            token_info = token_handler.get_token_info()
-
-                                            logger.warning("  OAuth Token Status:")
-                                            logger.warning(f"    Has token file: {token_info.get('has_token', False)}")
-                                            logger.warning(f"    Has refresh token: {token_info.get('has_refresh_token', False)}")
-
-                                            if 'expires_in_minutes' in token_info:
-                                                logger.warning(f"    Expires in: {token_info['expires_in_minutes']:.1f} minutes")
-                                                logger.warning(f"    Is expired: {token_info.get('is_expired', False)}")
-                                                logger.warning(f"    Expires soon (5min): {token_info.get('expires_soon_5min', False)}")
-
-                                            if 'refresh_token_age_days' in token_info:
-                                                logger.warning(f"    Refresh token age: {token_info['refresh_token_age_days']:.1f} days")
-                                                logger.warning(f"    Refresh token likely expired: {token_info.get('refresh_token_likely_expired', False)}")
-
-                                            if token_info.get('error'):
-                                                logger.warning(f"    Error: {token_info['error']}")
-
-                                    logger.warning("")
-                                    logger.warning("Previous engine output (last 10 lines):")
-                                    for i, buffered_line in enumerate(self._engine_output_buffer, 1):
-                                        logger.warning(f"  -{len(self._engine_output_buffer) - i + 1}: {buffered_line}")
-                                    logger.warning("")
-                                    logger.warning("If user HAS Premium, this is a FALSE POSITIVE")
-                                    logger.warning("Report to: https://github.com/Omni-guides/Jackify/issues/111")
-                                    logger.warning("=" * 80)
-
-                                    self.premium_required_detected.emit(decoded.strip() or "Nexus Premium required")
-
-                                # Maintain rolling buffer of engine output for diagnostics
-                                self._engine_output_buffer.append(decoded.strip())
-                                if len(self._engine_output_buffer) > self._buffer_size:
-                                    self._engine_output_buffer.pop(0)
-
-                                # R&D: Process through progress parser
-                                if self.progress_state_manager:
-                                    updated = self.progress_state_manager.process_line(decoded)
-                                    if updated:
-                                        progress_state = self.progress_state_manager.get_state()
-                                        # Debug: Log when we detect file progress
-                                        if progress_state.active_files and debug_mode:
-                                            debug_print(f"DEBUG: Parser detected {len(progress_state.active_files)} active files from line: {decoded[:80]}")
-                                        self.progress_updated.emit(progress_state)
-                                # Filter FILE_PROGRESS spam but keep the status line before it
+                    progress_bus = None
+                    if self.progress_state_manager:
+                        # Parse every line, but only hand the UI thread at most 20 frames per second
+                        progress_bus = ProgressEventBus(self.progress_state_manager)
+                        progress_bus.subscribe(self.progress_updated.emit)
+
+                    # Performance timeline: engine samples plus phase/speed changes from the bus
+                    from jackify.backend.handlers.performance_timeline import (
+                        start_performance_timeline,
+                        close_active_timeline
+                    )
+                    from jackify.backend.handlers.engine_monitor import EnginePerformanceMonitor
+                    timeline = start_performance_timeline(self.modlist_name, "gui")
+                    timeline_bus = progress_bus or ProgressEventBus(max_fps=1.0)
+                    timeline_bus.subscribe(timeline.record_frame)
+                    performance_monitor = EnginePerformanceMonitor(sample_interval=10.0)
+                    performance_monitor.add_callback(timeline.record_metrics)
+                    monitoring_started = performance_monitor.start_monitoring(self.process_manager.proc.pid)
+                    returncode = None
+                    try:
+                        last_was_blank = False
+                        for decoded, terminator in self.process_manager.iter_stdout_records(strip_ansi=True):
+                            if self.cancelled:
+                                self.cancel()
+                                break
+
+                            if not terminator:
+                                # Unterminated output left when the stream closed
+                                # Filter FILE_PROGRESS from final buffer flush too
                                 if '[FILE_PROGRESS]' in decoded:
                                     parts = decoded.split('[FILE_PROGRESS]', 1)
                                     if parts[0].strip():
-                                        self.progress_received.emit(parts[0].rstrip())
+                                        self.output_received.emit(parts[0].rstrip())
                                 else:
-                                    # Preserve \r line ending for progress updates
-                                    self.progress_received.emit(decoded + '\r')
-                            elif b'\n' in buffer:
-                                line, buffer = buffer.split(b'\n', 1)
-                                line = ansi_escape.sub(b'', line)
-                                decoded = line.decode('utf-8', errors='replace')
-
-                                # Notify when Nexus requires Premium before continuing
-                                is_premium_error, matched_pattern = is_non_premium_indicator(decoded)
-                                if not self._premium_signal_sent and is_premium_error:
-                                    self._premium_signal_sent = True
-
-                                    # DIAGNOSTIC LOGGING: Capture false positive details
-                                    import logging
-                                    logger = logging.getLogger(__name__)
-                                    logger.warning("=" * 80)
-                                    logger.warning("PREMIUM DETECTION TRIGGERED - DIAGNOSTIC DUMP (Issue #111)")
-                                    logger.warning("=" * 80)
-                                    logger.warning(f"Matched pattern: '{matched_pattern}'")
-                                    logger.warning(f"Triggering line: '{decoded.strip()}'")
-
-                                    # Detailed auth diagnostics
-                                    logger.warning("")
-                                    logger.warning("AUTHENTICATION DIAGNOSTICS:")
-                                    logger.warning(f"  Auth value present: {'YES' if self.api_key else 'NO'}")
-                                    if self.api_key:
-                                        logger.warning(f"  Auth value length: {len(self.api_key)} chars")
-                                        if len(self.api_key) >= 8:
-                                            logger.warning(f"  Auth value (partial): {self.api_key[:4]}...{self.api_key[-4:]}")
-
-                                        # Determine auth method and get detailed status
-                                        auth_method = self.auth_service.get_auth_method()
-                                        logger.warning(f"  Auth method: {auth_method or 'UNKNOWN'}")
-
-                                        if auth_method == 'oauth':
-                                            # Get detailed OAuth token status
-                                            token_handler = self.auth_service.token_handler
-                                            token_info = token_handler.get_token_info()
-
-                                            logger.warning("  OAuth Token Status:")
-                                            logger.warning(f"    Has token file: {token_info.get('has_token', False)}")
-                                            logger.warning(f"    Has refresh token: {token_info.get('has_refresh_token', False)}")
-
-                                            if 'expires_in_minutes' in token_info:
-                                                logger.warning(f"    Expires in: {token_info['expires_in_minutes']:.1f} minutes")
-                                                logger.warning(f"    Is expired: {token_info.get('is_expired', False)}")
-                                                logger.warning(f"    Expires soon (5min): {token_info.get('expires_soon_5min', False)}")
-
-                                            if 'refresh_token_age_days' in token_info:
-                                                logger.warning(f"    Refresh token age: {token_info['refresh_token_age_days']:.1f} days")
-                                                logger.warning(f"    Refresh token likely expired: {token_info.get('refresh_token_likely_expired', False)}")
-
-                                            if token_info.get('error'):
-                                                logger.warning(f"    Error: {token_info['error']}")
-
-                                    logger.warning("")
-                                    logger.warning("Previous engine output (last 10 lines):")
-                                    for i, buffered_line in enumerate(self._engine_output_buffer, 1):
-                                        logger.warning(f"  -{len(self._engine_output_buffer) - i + 1}: {buffered_line}")
-                                    logger.warning("")
-                                    logger.warning("If user HAS Premium, this is a FALSE POSITIVE")
-                                    logger.warning("Report to: https://github.com/Omni-guides/Jackify/issues/111")
-                                    logger.warning("=" * 80)
-
-                                    self.premium_required_detected.emit(decoded.strip() or "Nexus Premium required")
-
-                                # Maintain rolling buffer of engine output for diagnostics
-                                self._engine_output_buffer.append(decoded.strip())
-                                if len(self._engine_output_buffer) > self._buffer_size:
-                                    self._engine_output_buffer.pop(0)
-
-                                # R&D: Process through progress parser
-                                from jackify.backend.handlers.config_handler import ConfigHandler
-                                config_handler = ConfigHandler()
-                                debug_mode = config_handler.get('debug_mode', False)
-                                if self.progress_state_manager:
-                                    updated = self.progress_state_manager.process_line(decoded)
-                                    if updated:
-                                        progress_state = self.progress_state_manager.get_state()
-                                        # Debug: Log when we detect file progress
-                                        if progress_state.active_files and debug_mode:
-                                            debug_print(f"DEBUG: Parser detected {len(progress_state.active_files)} active files from line: {decoded[:80]}")
-                                        self.progress_updated.emit(progress_state)
+                                    self.output_received.emit(decoded)
+                                break
+
+                            # Notify when Nexus requires Premium before continuing
+                            # (debug_mode is resolved once above, not per output line)
+                            is_premium_error, matched_pattern = is_non_premium_indicator(decoded)
+                            if not self._premium_signal_sent and is_premium_error:
+                                self._premium_signal_sent = True
+                                self._log_premium_detection(decoded, matched_pattern)
+                                self.premium_required_detected.emit(decoded.strip() or "Nexus Premium required")
+
+                            # Maintain rolling buffer of engine output for diagnostics
+                            self._engine_output_buffer.append(decoded.strip())
+                            if len(self._engine_output_buffer) > self._buffer_size:
+                                self._engine_output_buffer.pop(0)
+
+                            # R&D: Process through progress parser; the bus publishes coalesced frames
+                            updated = timeline_bus.process_line(decoded)
+                            if progress_bus:
+                                if updated and debug_mode:
+                                    progress_state = progress_bus.get_state()
+                                    # Debug: Log when we detect file progress
+                                    if progress_state.active_files:
+                                        debug_print(f"DEBUG: Parser detected {len(progress_state.active_files)} active files from line: {decoded[:80]}")
+
+                            if terminator == '\r':
                                 # Filter FILE_PROGRESS spam but keep the status line before it
                                 if '[FILE_PROGRESS]' in decoded:
                                     parts = decoded.split('[FILE_PROGRESS]', 1)
                                     if parts[0].strip():
-                                        self.output_received.emit(parts[0].rstrip())
-                                    last_was_blank = False
-                                    continue
-
-                                # Collapse multiple blank lines to one
-                                if decoded.strip() == '':
-                                    if not last_was_blank:
-                                        self.output_received.emit('\n')
-                                    last_was_blank = True
+                                        self.progress_received.emit(parts[0].rstrip())
                                 else:
-                                    # Preserve \n line ending for normal output
-                                    self.output_received.emit(decoded + '\n')
-                                    last_was_blank = False
-                    if buffer:
-                        line = ansi_escape.sub(b'', buffer)
-                        decoded = line.decode('utf-8', errors='replace')
-                        # Filter FILE_PROGRESS from final buffer flush too
-                        if '[FILE_PROGRESS]' in decoded:
-                            parts = decoded.split('[FILE_PROGRESS]', 1)
-                            if parts[0].strip():
-                                self.output_received.emit(parts[0].rstrip())
-                        else:
-                            self.output_received.emit(decoded)
-                    
-                    # Wait for process to complete
-                    returncode = self.process_manager.wait()
+                                    # Preserve \r line ending for progress updates
+                                    self.progress_received.emit(decoded + '\r')
+                                continue
+
+                            # Filter FILE_PROGRESS spam but keep the status line before it
+                            if '[FILE_PROGRESS]' in decoded:
+                                parts = decoded.split('[FILE_PROGRESS]', 1)
+                                if parts[0].strip():
+                                    self.output_received.emit(parts[0].rstrip())
+                                last_was_blank = False
+                                continue
+
+                            # Collapse multiple blank lines to one
+                            if decoded.strip() == '':
+                                if not last_was_blank:
+                                    self.output_received.emit('\n')
+                                last_was_blank = True
+                            else:
+                                # Preserve \n line ending for normal output
+                                self.output_received.emit(decoded + '\n')
+                                last_was_blank = False
+
+                        # Wait for process to complete
+                        returncode = self.process_manager.wait()
+                    finally:
+                        # Also on errors: stop the sampler thread and the bus, and mark the engine end
+                        timeline_bus.close()
+                        if monitoring_started:
+                            performance_monitor.stop_monitoring()
+                        timeline.engine_finished(returncode)
+                    if progress_bus:
+                        stats = progress_bus.get_stats()
+                        debug_print(f"DEBUG: Progress bus published {stats['frames_published']} frames "
+                                    f"for {stats['updates_received']} updates ({stats['dropped_frames']} coalesced)")
+                    self._log_performance_summary(timeline.path)
+                    if self.cancelled or returncode != 0:
+                        # No configuration steps follow a failed or cancelled install
+                        close_active_timeline()
                     
                     # Capture any remaining output after process ends
                     if self.process_manager.proc and self.process_manager.proc.stdout:
@@ -2450,6 +2408,8 @@ class InstallModlistScreen(QWidget):
                             debug_print(f"DEBUG: Process stderr/stdout may contain error details")
                         self.installation_finished.emit(False, error_msg)
                 except Exception as e:
+                    from jackify.backend.handlers.performance_timeline import close_active_timeline
+                    close_active_timeline()
                     self.installation_finished.emit(False, f"Installation error: {str(e)}")
                 finally:
                     if self.cancelled and self.process_manager:
@@ -2535,8 +2495,10 @@ class InstallModlistScreen(QWidget):
         if hasattr(self, 'install_thread') and self.install_thread:
             self.install_thread.cancel()
     
-    def on_progress_updated(self, progress_state):
-        """R&D: Handle structured progress updates from parser"""
+    def on_progress_updated(self, frame):
+        """R&D: Handle a rate-limited progress frame from the installation thread"""
+        # Frames carry a private snapshot, so adjusting it here cannot race the parser
+        progress_state = frame.state
         # Calculate proper overall progress during BSA building
         # During BSA building, file installation is at 100% but BSAs are still being built
         # Override overall_percent to show BSA building progress instead
@@ -2683,6 +2645,9 @@ class InstallModlistScreen(QWidget):
             self.file_progress_list.update_files([], current_phase=phase_display_name, summary_info=summary_info)
             return
         elif progress_state.active_files:
+            if not frame.has_file_changes and not frame.phase_changed:
+                # Nothing in the file list changed since the last frame
+                return
             if self.debug:
                 debug_print(f"DEBUG: Updating file progress list with {len(progress_state.active_files)} files")
                 for fp in progress_state.active_files:
@@ -6,357 +6,448 @@ rich metadata from jackify-engine.
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QComboBox, QCheckBox, QScrollArea, QGridLayout,
-    QFrame, QSizePolicy, QDialog, QTextEdit, QTextBrowser, QMessageBox, QListWidget
+    QLineEdit, QComboBox, QCheckBox, QFrame, QSizePolicy, QDialog,
+    QTextEdit, QTextBrowser, QMessageBox, QListWidget, QListView, QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QSize, QThread, QUrl, QTimer, QObject
-from PySide6.QtGui import QPixmap, QFont, QPainter, QColor, QTextOption, QPalette
+from PySide6.QtCore import (
+    Qt, Signal, QSize, QThread, QUrl, QTimer, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QRect, QPoint
+)
+from PySide6.QtGui import QPixmap, QImage, QFont, QPainter, QColor, QTextOption, QPalette
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from pathlib import Path
 from typing import List, Optional, Dict
-from collections import deque
+from collections import deque, OrderedDict
+import os
 import random
 
 from jackify.backend.services.modlist_gallery_service import ModlistGalleryService
 from jackify.backend.models.modlist_metadata import ModlistMetadata, ModlistMetadataResponse
+from jackify.backend.models.modlist_search_index import ModlistSearchIndex
 from ..shared_theme import JACKIFY_COLOR_BLUE
 from ..utils import get_screen_geometry, set_responsive_minimum
 
 
+def scale_image_to_fill(image: QImage, width: int, height: int) -> QImage:
+    """Scale to an exact size - stretch if the aspect is close, otherwise crop (centered)"""
+    target_aspect = width / height  # 16:9 = ~1.778
+    image_aspect = image.width() / image.height() if image.height() > 0 else target_aspect
+    if abs(image_aspect - target_aspect) / target_aspect < 0.05:  # Within 5% of 16:9
+        return image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    expanded = image.scaled(width, height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    return expanded.copy(
+        (expanded.width() - width) // 2,
+        (expanded.height() - height) // 2,
+        width,
+        height
+    )
+
+
+class _ImageTask(QRunnable):
+    """
+    Worker-thread half of an image request: disk lookup, decode and scale.
+
+    Without data the task only looks at the disk caches (thumbnail first, then
+    the raw image) and reports a miss so the manager can download it. With data
+    (a finished download) it stores the raw bytes unchanged before decoding.
+    Results go back through ImageManager.image_decoded, which Qt queues onto
+    the GUI thread; only QImage is touched here since QPixmap is GUI-thread only.
+    """
+
+    def __init__(self, manager: "ImageManager", key: str, metadata: ModlistMetadata, size: str,
+                 target: Optional[QSize], data: Optional[bytes] = None):
+        super().__init__()
+        self.manager = manager
+        self.key = key
+        self.metadata = metadata
+        self.size = size
+        self.target = target
+        self.data = data
+
+    def run(self):
+        try:
+            image = self._load()
+        except Exception:
+            image = QImage()
+        if image is None:
+            self.manager.image_decoded.emit(self.key, None, True)
+        else:
+            self.manager.image_decoded.emit(self.key, image, False)
+
+    def _load(self) -> Optional[QImage]:
+        """Decoded (and scaled) image, or None if nothing is on disk yet"""
+        service = self.manager.gallery_service
+        thumb_path = None
+        if self.target is not None:
+            thumb_path = service.get_thumbnail_cache_path(
+                self.metadata, self.target.width(), self.target.height(), self.size
+            )
+            if self.data is None and thumb_path.exists():
+                thumbnail = QImage(str(thumb_path))
+                if not thumbnail.isNull():
+                    return thumbnail
+
+        data = self.data
+        if data is None:
+            raw_path = service.get_cached_image_path(self.metadata, self.size)
+            if raw_path is None:
+                return None
+            data = raw_path.read_bytes()
+        else:
+            try:
+                service.store_image_bytes(self.metadata, data, self.size)
+            except OSError:
+                pass  # Not critical - the decoded image is still used
+
+        # Decode by content: cached files keep the host's format whatever their suffix
+        image = QImage.fromData(data)
+        if image.isNull():
+            # Unreadable cache entry - report a miss so it gets downloaded again
+            return None if self.data is None else image
+        if thumb_path is not None:
+            image = scale_image_to_fill(image, self.target.width(), self.target.height())
+            try:
+                thumb_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = thumb_path.with_name(thumb_path.name + ".tmp")
+                if image.save(str(tmp_path), "PNG"):
+                    os.replace(tmp_path, thumb_path)
+            except OSError:
+                pass
+        return image
+
+
 class ImageManager(QObject):
-    """Centralized image loading and caching manager"""
-    
+    """
+    Centralized image loading and caching manager.
+
+    Disk lookups, decoding and scaling run in a QThreadPool; downloads use a
+    bounded number of concurrent network requests and their bytes are cached
+    as served. Requests with a target size are scaled to exactly that size and
+    persisted as thumbnails, so a warm gallery never decodes full-size banners.
+    Pixmaps are kept in an LRU bounded by their total size in bytes.
+    """
+    image_decoded = Signal(str, object, bool)  # key, QImage (None on miss), needs download
+
+    MAX_CONCURRENT_DOWNLOADS = 6
+    MEMORY_CACHE_BYTES = 256 * 1024 * 1024
+
     def __init__(self, gallery_service: ModlistGalleryService):
         super().__init__()
         self.gallery_service = gallery_service
-        self.pixmap_cache: Dict[str, QPixmap] = {}
-        self.network_manager = QNetworkAccessManager()
+        self.pixmap_cache: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self._cache_bytes = 0
+        self.network_manager = QNetworkAccessManager(self)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max(2, min(4, QThreadPool.globalInstance().maxThreadCount())))
         self.download_queue = deque()
         self.downloading: set = set()
-        self.max_concurrent = 2  # Start with 2 concurrent downloads to reduce UI lag
-        self.save_queue = deque()  # Queue for deferred disk saves
-        self._save_timer = None
-        
-    def get_image(self, metadata: ModlistMetadata, callback, size: str = "small") -> Optional[QPixmap]:
+        # key -> (metadata, size, target, callbacks) for requests in flight
+        self._pending: Dict[str, tuple] = {}
+        self._failed: set = set()  # keys that could not be fetched or decoded
+        self.image_decoded.connect(self._on_image_decoded)
+
+    @staticmethod
+    def _cache_key(metadata: ModlistMetadata, size: str, target: Optional[QSize]) -> str:
+        key = f"{metadata.machineURL}_{size}"
+        if target is not None:
+            key += f"_{target.width()}x{target.height()}"
+        return key
+
+    def get_image(self, metadata: ModlistMetadata, callback, size: str = "small",
+                  target: Optional[QSize] = None) -> Optional[QPixmap]:
         """
-        Get image for modlist - returns cached pixmap or None if needs download
-        
+        Get image for modlist - returns cached pixmap or None if it is being loaded
+
         Args:
             metadata: Modlist metadata
             callback: Callback function when image is loaded
             size: Image size to use ("small" for cards, "large" for detail view)
+            target: Exact pixel size to scale (and crop) to; None keeps the full image
         """
-        cache_key = f"{metadata.machineURL}_{size}"
-        
-        # Check memory cache first (should be preloaded)
-        if cache_key in self.pixmap_cache:
-            return self.pixmap_cache[cache_key]
-        
-        # Only check disk cache if not in memory (fallback for images that weren't preloaded)
-        # This should rarely happen if preload worked correctly
-        cached_path = self.gallery_service.get_cached_image_path(metadata, size)
-        if cached_path and cached_path.exists():
-            try:
-                pixmap = QPixmap(str(cached_path))
-                if not pixmap.isNull():
-                    self.pixmap_cache[cache_key] = pixmap
-                    return pixmap
-            except Exception:
-                pass
-        
-        # Queue for download if not cached
-        if cache_key not in self.downloading:
-            self.download_queue.append((metadata, callback, size))
-            self._process_queue()
-        
+        key = self._cache_key(metadata, size, target)
+        pixmap = self.pixmap_cache.get(key)
+        if pixmap is not None:
+            self.pixmap_cache.move_to_end(key)
+            return pixmap
+        if key in self._failed:
+            return None
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            if callback:
+                pending[3].append(callback)
+            return None
+
+        self._pending[key] = (metadata, size, target, [callback] if callback else [])
+        self.thread_pool.start(_ImageTask(self, key, metadata, size, target))
         return None
-    
+
+    def forget(self, machine_url: str):
+        """Drop in-memory images and failure marks for a modlist (removed or changed)"""
+        prefix = f"{machine_url}_"
+        for key in [k for k in self.pixmap_cache if k.startswith(prefix)]:
+            self._cache_bytes -= self._pixmap_bytes(self.pixmap_cache.pop(key))
+        self._failed = {k for k in self._failed if not k.startswith(prefix)}
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def _remember(self, key: str, pixmap: QPixmap):
+        """Insert into the LRU, evicting least recently used pixmaps over the byte budget"""
+        self.pixmap_cache[key] = pixmap
+        self._cache_bytes += self._pixmap_bytes(pixmap)
+        while self._cache_bytes > self.MEMORY_CACHE_BYTES and len(self.pixmap_cache) > 1:
+            _, evicted = self.pixmap_cache.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(evicted)
+
+    def _on_image_decoded(self, key: str, image, needs_download: bool):
+        """Turn a worker result into a pixmap on the GUI thread, or start the download"""
+        pending = self._pending.get(key)
+        if pending is None:
+            return
+        if needs_download:
+            self.download_queue.append(key)
+            self._process_queue()
+            return
+
+        del self._pending[key]
+        if image is None or image.isNull():
+            self._failed.add(key)
+            return
+        pixmap = QPixmap.fromImage(image)
+        self._remember(key, pixmap)
+        for callback in pending[3]:
+            callback(pixmap)
+
     def _process_queue(self):
-        """Process download queue up to max_concurrent"""
-        # Process one at a time with small delays to keep UI responsive
-        if len(self.downloading) < self.max_concurrent and self.download_queue:
-            metadata, callback, size = self.download_queue.popleft()
-            cache_key = f"{metadata.machineURL}_{size}"
-            
-            if cache_key not in self.downloading:
-                self.downloading.add(cache_key)
-                self._download_image(metadata, callback, size)
-                
-                # Schedule next download with small delay to yield to UI
-                if self.download_queue:
-                    QTimer.singleShot(100, self._process_queue)
-    
-    def _download_image(self, metadata: ModlistMetadata, callback, size: str = "small"):
+        """Start queued downloads up to MAX_CONCURRENT_DOWNLOADS"""
+        while len(self.downloading) < self.MAX_CONCURRENT_DOWNLOADS and self.download_queue:
+            key = self.download_queue.popleft()
+            if key in self.downloading or key not in self._pending:
+                continue
+            self._download_image(key)
+
+    def _download_image(self, key: str):
         """Download image from network"""
+        metadata, size, target, _ = self._pending[key]
         image_url = self.gallery_service.get_image_url(metadata, size)
         if not image_url:
-            cache_key = f"{metadata.machineURL}_{size}"
-            self.downloading.discard(cache_key)
-            self._process_queue()
+            del self._pending[key]
+            self._failed.add(key)
             return
-        
-        url = QUrl(image_url)
-        request = QNetworkRequest(url)
+
+        self.downloading.add(key)
+        request = QNetworkRequest(QUrl(image_url))
         request.setRawHeader(b"User-Agent", b"Jackify/0.1.8")
-        
         reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self._on_download_finished(reply, metadata, callback, size))
-    
-    def _on_download_finished(self, reply: QNetworkReply, metadata: ModlistMetadata, callback, size: str = "small"):
-        """Handle download completion"""
-        from PySide6.QtWidgets import QApplication
-        
-        cache_key = f"{metadata.machineURL}_{size}"
-        self.downloading.discard(cache_key)
-        
-        if reply.error() == QNetworkReply.NoError:
-            image_data = reply.readAll()
-            pixmap = QPixmap()
-            if pixmap.loadFromData(image_data) and not pixmap.isNull():
-                # Store in memory cache immediately
-                self.pixmap_cache[cache_key] = pixmap
-                
-                # Defer disk save to avoid blocking UI - queue it for later
-                cached_path = self.gallery_service.get_image_cache_path(metadata, size)
-                self.save_queue.append((pixmap, cached_path))
-                self._start_save_timer()
-                
-                # Call callback with pixmap (update UI immediately)
-                if callback:
-                    callback(pixmap)
-                
-                # Process events to keep UI responsive
-                QApplication.processEvents()
-        
+        reply.finished.connect(lambda: self._on_download_finished(reply, key))
+
+    def _on_download_finished(self, reply: QNetworkReply, key: str):
+        """Hand the downloaded bytes to a worker to store and decode"""
+        self.downloading.discard(key)
+        pending = self._pending.get(key)
+        if pending is not None:
+            if reply.error() == QNetworkReply.NoError:
+                metadata, size, target, _ = pending
+                data = bytes(reply.readAll().data())
+                self.thread_pool.start(_ImageTask(self, key, metadata, size, target, data))
+            else:
+                del self._pending[key]
+                self._failed.add(key)
         reply.deleteLater()
-        
-        # Process next in queue (with small delay to yield to UI)
-        QTimer.singleShot(50, self._process_queue)
-    
-    def _start_save_timer(self):
-        """Start timer for deferred disk saves if not already running"""
-        if self._save_timer is None:
-            self._save_timer = QTimer()
-            self._save_timer.timeout.connect(self._save_next_image)
-            self._save_timer.setSingleShot(False)
-            self._save_timer.start(200)  # Save one image every 200ms
-    
-    def _save_next_image(self):
-        """Save next image from queue to disk (non-blocking)"""
-        if self.save_queue:
-            pixmap, cached_path = self.save_queue.popleft()
-            try:
-                cached_path.parent.mkdir(parents=True, exist_ok=True)
-                pixmap.save(str(cached_path), "WEBP")
-            except Exception:
-                pass  # Save failed - not critical, image is in memory cache
-        
-        # Stop timer if queue is empty
-        if not self.save_queue and self._save_timer:
-            self._save_timer.stop()
-            self._save_timer = None
+        self._process_queue()
 
 
-class ModlistCard(QFrame):
-    """Visual card representing a single modlist"""
-    clicked = Signal(ModlistMetadata)
+class ModlistGalleryModel(QAbstractListModel):
+    """List model of the modlists currently shown in the gallery (already filtered)"""
+    MetadataRole = Qt.UserRole + 1
 
-    def __init__(self, metadata: ModlistMetadata, image_manager: ImageManager, is_steamdeck: bool = False):
-        super().__init__()
-        self.metadata = metadata
-        self.image_manager = image_manager
-        self.is_steamdeck = is_steamdeck
-        self._setup_ui()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._modlists: List[ModlistMetadata] = []
+        self._rows: Dict[str, int] = {}  # machineURL -> row
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._modlists)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._modlists):
+            return None
+        modlist = self._modlists[index.row()]
+        if role == self.MetadataRole:
+            return modlist
+        if role in (Qt.DisplayRole, Qt.AccessibleTextRole):
+            return modlist.title
+        if role == Qt.ToolTipRole:
+            return f"{modlist.title} by {modlist.author}"
+        return None
 
-    def _setup_ui(self):
-        """Set up the card UI"""
-        self.setFrameShape(QFrame.StyledPanel)
-        self.setFrameShadow(QFrame.Raised)
-        self.setCursor(Qt.PointingHandCursor)
-        
-        # Steam Deck-specific sizing (1280x800 screen)
-        if self.is_steamdeck:
-            self.setFixedSize(250, 270)  # Smaller cards for Steam Deck
-            image_width, image_height = 230, 130  # Smaller images, maintaining 16:9 ratio
-        else:
-            self.setFixedSize(300, 320)  # Standard size
-            image_width, image_height = 280, 158  # Standard image size
-        
-        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+    def set_modlists(self, modlists: List[ModlistMetadata]):
+        """Replace the visible modlists (one reset, no per-item widgets)"""
+        self.beginResetModel()
+        self._modlists = list(modlists)
+        self._rows = {m.machineURL: row for row, m in enumerate(self._modlists)}
+        self.endResetModel()
 
-        layout = QVBoxLayout()
-        layout.setContentsMargins(10, 8, 10, 8)  # Reduced vertical margins
-        layout.setSpacing(6)  # Reduced spacing between elements
+    def refresh_modlist(self, machine_url: str):
+        """Repaint one modlist's card (e.g. when its image arrives)"""
+        row = self._rows.get(machine_url)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
 
-        # Image (widescreen aspect ratio like Wabbajack)
-        self.image_label = QLabel()
-        self.image_label.setFixedSize(image_width, image_height)  # 16:9 aspect ratio
-        self.image_label.setStyleSheet("background: #333; border-radius: 4px;")
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setScaledContents(True)  # Use Qt's automatic scaling - this works best
-        self.image_label.setText("")
-        layout.addWidget(self.image_label)
-
-        # Title row with badges (Official, NSFW, UNAVAILABLE)
-        title_row = QHBoxLayout()
-        title_row.setSpacing(4)
 
-        title = QLabel(self.metadata.title)
-        title.setWordWrap(True)
-        title.setFont(QFont("Sans", 12, QFont.Bold))
-        title.setStyleSheet(f"color: {JACKIFY_COLOR_BLUE};")
-        title.setMaximumHeight(40)  # Reduced from 50 to 40
-        title_row.addWidget(title, stretch=1)
+class ModlistCardDelegate(QStyledItemDelegate):
+    """
+    Paints a modlist card for each visible row of the gallery view.
 
-        # Store reference to unavailable badge for dynamic updates
-        self.unavailable_badge = None
-        if not self.metadata.is_available():
-            self.unavailable_badge = QLabel("UNAVAILABLE")
-            self.unavailable_badge.setStyleSheet("background: #666; color: white; padding: 2px 6px; font-size: 9px; border-radius: 3px;")
-            self.unavailable_badge.setFixedHeight(20)
-            title_row.addWidget(self.unavailable_badge, alignment=Qt.AlignTop | Qt.AlignRight)
+    Nothing is created per modlist: the view only asks for the rows in the
+    viewport, and card images are requested at the exact card image size the
+    first time a row is painted (ImageManager scales and caches them).
+    """
+    image_ready = Signal(str)  # machineURL whose image finished loading
 
-        if self.metadata.official:
-            official_badge = QLabel("OFFICIAL")
-            official_badge.setStyleSheet("background: #2a5; color: white; padding: 2px 6px; font-size: 9px; border-radius: 3px;")
-            official_badge.setFixedHeight(20)
-            title_row.addWidget(official_badge, alignment=Qt.AlignTop | Qt.AlignRight)
+    BADGE_COLORS = {"UNAVAILABLE": "#666", "OFFICIAL": "#2a5", "NSFW": "#d44"}
+    # Alignment and text flags are separate enum types in PySide6, so combine them as ints
+    _WRAPPED_TEXT = int(Qt.AlignLeft | Qt.AlignTop) | int(Qt.TextWordWrap)
 
-        if self.metadata.nsfw:
-            nsfw_badge = QLabel("NSFW")
-            nsfw_badge.setStyleSheet("background: #d44; color: white; padding: 2px 6px; font-size: 9px; border-radius: 3px;")
-            nsfw_badge.setFixedHeight(20)
-            title_row.addWidget(nsfw_badge, alignment=Qt.AlignTop | Qt.AlignRight)
+    def __init__(self, image_manager: ImageManager, is_steamdeck: bool = False, parent=None):
+        super().__init__(parent)
+        self.image_manager = image_manager
+        # Steam Deck-specific sizing (1280x800 screen)
+        if is_steamdeck:
+            self.card_size = QSize(250, 270)  # Smaller cards for Steam Deck
+            self.image_size = QSize(230, 130)  # Smaller images, maintaining 16:9 ratio
+        else:
+            self.card_size = QSize(300, 320)  # Standard size
+            self.image_size = QSize(280, 158)  # Standard image size
+        self._placeholder: Optional[QPixmap] = None
+
+        self._title_font = QFont("Sans", 12, QFont.Bold)
+        self._author_font = QFont()
+        self._author_font.setPixelSize(11)
+        self._small_font = QFont()
+        self._small_font.setPixelSize(10)
+        self._badge_font = QFont()
+        self._badge_font.setPixelSize(9)
+
+    def sizeHint(self, option, index) -> QSize:
+        return self.card_size
+
+    def forget(self, machine_url: str):
+        """Drop the cached card image for a modlist (removed or changed)"""
+        self.image_manager.forget(machine_url)
+
+    def _get_placeholder(self) -> QPixmap:
+        """Create a placeholder pixmap for cards without images"""
+        if self._placeholder is None:
+            placeholder = QPixmap(self.image_size)
+            placeholder.fill(QColor("#333"))
+            painter = QPainter(placeholder)
+            painter.setPen(QColor("#666"))
+            painter.setFont(QFont("Sans", 10))
+            painter.drawText(placeholder.rect(), Qt.AlignCenter, "No Image")
+            painter.end()
+            self._placeholder = placeholder
+        return self._placeholder
+
+    def _card_image(self, metadata: ModlistMetadata) -> Optional[QPixmap]:
+        """Card-sized image for a modlist, loading it lazily on first paint"""
+        # Use large images and scale down for better quality than small images
+        return self.image_manager.get_image(
+            metadata,
+            lambda _pixmap, url=metadata.machineURL: self.image_ready.emit(url),
+            size="large",
+            target=self.image_size
+        )
+
+    def _badges(self, metadata: ModlistMetadata) -> List[str]:
+        badges = []
+        if not metadata.is_available():
+            badges.append("UNAVAILABLE")
+        if metadata.official:
+            badges.append("OFFICIAL")
+        if metadata.nsfw:
+            badges.append("NSFW")
+        return badges
+
+    def paint(self, painter: QPainter, option, index):
+        metadata = index.data(ModlistGalleryModel.MetadataRole)
+        if metadata is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
 
-        layout.addLayout(title_row)
+        card = QRect(QPoint(0, 0), self.card_size)
+        card.moveCenter(option.rect.center())
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(QColor(JACKIFY_COLOR_BLUE if hovered else "#444"))
+        painter.setBrush(QColor("#222"))
+        painter.drawRoundedRect(card.adjusted(0, 0, -1, -1), 4, 4)
+
+        # Image (widescreen aspect ratio like Wabbajack)
+        left, top = card.left() + 10, card.top() + 8
+        content_width = card.width() - 20
+        image_rect = QRect(QPoint(left, top), self.image_size)
+        image = self._card_image(metadata) or self._get_placeholder()
+        painter.drawPixmap(image_rect, image)
+        y = image_rect.bottom() + 1 + 6
+
+        # Title row with badges (UNAVAILABLE, OFFICIAL, NSFW)
+        painter.setFont(self._badge_font)
+        badge_metrics = painter.fontMetrics()
+        badge_x = left + content_width
+        for badge in reversed(self._badges(metadata)):
+            badge_width = badge_metrics.horizontalAdvance(badge) + 12
+            badge_x -= badge_width
+            badge_rect = QRect(badge_x, y, badge_width, 20)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(self.BADGE_COLORS[badge]))
+            painter.drawRoundedRect(badge_rect, 3, 3)
+            painter.setPen(QColor("white"))
+            painter.drawText(badge_rect, Qt.AlignCenter, badge)
+            badge_x -= 4
+
+        painter.setFont(self._title_font)
+        painter.setPen(QColor(JACKIFY_COLOR_BLUE))
+        title_rect = QRect(left, y, badge_x - left, 40)
+        title_bounds = painter.boundingRect(title_rect, self._WRAPPED_TEXT, metadata.title)
+        painter.setClipRect(title_rect)
+        painter.drawText(title_rect, self._WRAPPED_TEXT, metadata.title)
+        painter.setClipping(False)
+        y += max(20, min(40, title_bounds.height())) + 6
 
         # Author
-        author = QLabel(f"by {self.metadata.author}")
-        author.setStyleSheet("color: #aaa; font-size: 11px;")
-        layout.addWidget(author)
+        painter.setFont(self._author_font)
+        painter.setPen(QColor("#aaa"))
+        line_height = painter.fontMetrics().height()
+        author = painter.fontMetrics().elidedText(f"by {metadata.author}", Qt.ElideRight, content_width)
+        painter.drawText(QRect(left, y, content_width, line_height), Qt.AlignLeft | Qt.AlignVCenter, author)
+        y += line_height + 6
 
         # Game
-        game = QLabel(self.metadata.gameHumanFriendly)
-        game.setStyleSheet("color: #ccc; font-size: 10px;")
-        layout.addWidget(game)
+        painter.setFont(self._small_font)
+        painter.setPen(QColor("#ccc"))
+        line_height = painter.fontMetrics().height()
+        painter.drawText(QRect(left, y, content_width, line_height), Qt.AlignLeft | Qt.AlignVCenter,
+                         metadata.gameHumanFriendly)
+        y += line_height + 6
 
         # Sizes (Download, Install, Total)
-        if self.metadata.sizes:
-            size_info = QLabel(
-                f"Download: {self.metadata.sizes.downloadSizeFormatted} | "
-                f"Install: {self.metadata.sizes.installSizeFormatted} | "
-                f"Total: {self.metadata.sizes.totalSizeFormatted}"
+        if metadata.sizes:
+            painter.setPen(QColor("#999"))
+            size_text = (
+                f"Download: {metadata.sizes.downloadSizeFormatted} | "
+                f"Install: {metadata.sizes.installSizeFormatted} | "
+                f"Total: {metadata.sizes.totalSizeFormatted}"
             )
-            size_info.setStyleSheet("color: #999; font-size: 10px;")
-            size_info.setWordWrap(True)  # Allow wrapping if text is too long
-            layout.addWidget(size_info)
-
-        # Removed addStretch() to eliminate wasted space
-        self.setLayout(layout)
+            size_rect = QRect(left, y, content_width, card.bottom() - 8 - y)
+            painter.setClipRect(size_rect)
+            painter.drawText(size_rect, self._WRAPPED_TEXT, size_text)
 
-        # Load image
-        self._load_image()
-
-    def _create_placeholder(self):
-        """Create a placeholder pixmap for cards without images"""
-        # Create placeholder matching the image label size (Steam Deck or standard)
-        image_size = self.image_label.size()
-        placeholder = QPixmap(image_size)
-        placeholder.fill(QColor("#333"))
-        
-        # Draw a simple icon/text on the placeholder
-        painter = QPainter(placeholder)
-        painter.setPen(QColor("#666"))
-        painter.setFont(QFont("Sans", 10))
-        painter.drawText(placeholder.rect(), Qt.AlignCenter, "No Image")
-        painter.end()
-        
-        # Show placeholder immediately
-        self.image_label.setPixmap(placeholder)
-
-    def _load_image(self):
-        """Load image using centralized image manager - use large images and scale down for quality"""
-        # Get large image for card - scale down for better quality than small images
-        pixmap = self.image_manager.get_image(self.metadata, self._on_image_loaded, size="large")
-        
-        if pixmap and not pixmap.isNull():
-            # Image was in cache - display immediately (should be instant)
-            self._display_image(pixmap)
-        else:
-            # Image needs to be downloaded - show placeholder
-            self._create_placeholder()
-    
-    def _on_image_loaded(self, pixmap: QPixmap):
-        """Callback when image is loaded from network"""
-        if pixmap and not pixmap.isNull():
-            self._display_image(pixmap)
-    
-    def _display_image(self, pixmap: QPixmap):
-        """Display image - use best method based on aspect ratio"""
-        if pixmap.isNull():
-            return
-        
-        label_size = self.image_label.size()
-        label_aspect = label_size.width() / label_size.height()  # 16:9 = ~1.778
-        
-        # Calculate image aspect ratio
-        image_aspect = pixmap.width() / pixmap.height() if pixmap.height() > 0 else label_aspect
-        
-        # If aspect ratios are close (within 5%), use Qt's automatic scaling for best quality
-        # Otherwise, manually scale with cropping to avoid stretching
-        aspect_diff = abs(image_aspect - label_aspect) / label_aspect
-        
-        if aspect_diff < 0.05:  # Within 5% of 16:9
-            # Close to correct aspect - use Qt's automatic scaling (best quality)
-            self.image_label.setScaledContents(True)
-            self.image_label.setPixmap(pixmap)
-        else:
-            # Different aspect - manually scale with cropping (no stretching)
-            self.image_label.setScaledContents(False)
-            scaled_pixmap = pixmap.scaled(
-                label_size.width(),
-                label_size.height(),
-                Qt.KeepAspectRatioByExpanding,  # Crop instead of stretch
-                Qt.SmoothTransformation  # High quality
-            )
-            self.image_label.setPixmap(scaled_pixmap)
-    
-    def _update_availability_badge(self):
-        """Update unavailable badge visibility based on current availability status"""
-        is_unavailable = not self.metadata.is_available()
-        
-        # Find title row layout (it's the 2nd layout item: image at 0, title_row at 1)
-        main_layout = self.layout()
-        if main_layout and main_layout.count() >= 2:
-            title_row = main_layout.itemAt(1).layout()
-            if title_row:
-                if is_unavailable and self.unavailable_badge is None:
-                    # Need to add badge to title row (before Official/NSFW badges)
-                    self.unavailable_badge = QLabel("UNAVAILABLE")
-                    self.unavailable_badge.setStyleSheet("background: #666; color: white; padding: 2px 6px; font-size: 9px; border-radius: 3px;")
-                    self.unavailable_badge.setFixedHeight(20)
-                    # Insert after title (index 1) but before other badges
-                    # Find first badge position (if any exist)
-                    insert_index = 1  # After title widget
-                    for i in range(title_row.count()):
-                        item = title_row.itemAt(i)
-                        if item and item.widget() and isinstance(item.widget(), QLabel):
-                            widget_text = item.widget().text()
-                            if widget_text in ("OFFICIAL", "NSFW"):
-                                insert_index = i
-                                break
-                    title_row.insertWidget(insert_index, self.unavailable_badge, alignment=Qt.AlignTop | Qt.AlignRight)
-                elif not is_unavailable and self.unavailable_badge is not None:
-                    # Need to remove badge from title row
-                    title_row.removeWidget(self.unavailable_badge)
-                    self.unavailable_badge.setParent(None)
-                    self.unavailable_badge = None
-
-    def mousePressEvent(self, event):
-        """Handle click on card"""
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.metadata)
-        super().mousePressEvent(event)
+        painter.restore()
 
 
 class ModlistDetailDialog(QDialog):
@@ -829,8 +920,11 @@ class ModlistGalleryDialog(QDialog):
         self.filtered_modlists: List[ModlistMetadata] = []
         self.game_filter = game_filter
         self.selected_metadata: Optional[ModlistMetadata] = None
-        self.all_cards: Dict[str, ModlistCard] = {}  # Dict keyed by machineURL for quick lookup
         self._validation_update_timer = None  # Timer for background validation updates
+        self._metadata_response = None  # Response currently displayed (baseline for refresh diffs)
+        self._freshness_text = ""  # Cache age / refresh latency shown in the status label
+        self._search_index: Optional[ModlistSearchIndex] = None  # Postings over all_modlists
+        self._selected_mods = set()  # Mod filter selection (survives mod list re-filtering)
 
         self._setup_ui()
         # Disable filter controls during initial load to prevent race conditions
@@ -895,7 +989,12 @@ class ModlistGalleryDialog(QDialog):
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search modlists...")
         self.search_box.setStyleSheet("QLineEdit { background: #2a2a2a; color: #fff; border: 1px solid #555; padding: 4px; }")
-        self.search_box.textChanged.connect(self._apply_filters)
+        # Debounce typing so filters run once per pause, not once per keystroke
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(self._apply_filters)
+        self.search_box.textChanged.connect(self._search_debounce.start)
         layout.addWidget(self.search_box)
 
         # Game filter (label removed - combo box is self-explanatory)
@@ -933,28 +1032,29 @@ class ModlistGalleryDialog(QDialog):
         # Add spacing between Tags and Mods sections
         layout.addSpacing(8)
 
-        # Mod filter - TEMPORARILY DISABLED (not working correctly in v0.2.0.8)
-        # TODO: Re-enable once mod search index issue is resolved
-        # mods_label = QLabel("Mods:")
-        # layout.addWidget(mods_label)
-        #
-        # self.mod_search = QLineEdit()
-        # self.mod_search.setPlaceholderText("Search mods...")
-        # self.mod_search.setStyleSheet("QLineEdit { background: #2a2a2a; color: #fff; border: 1px solid #555; padding: 4px; }")
-        # self.mod_search.textChanged.connect(self._filter_mods_list)
-        # # Prevent Enter from triggering default button (which would close dialog)
-        # self.mod_search.returnPressed.connect(lambda: self.mod_search.clearFocus())
-        # layout.addWidget(self.mod_search)
-        #
-        # self.mods_list = QListWidget()
-        # self.mods_list.setSelectionMode(QListWidget.MultiSelection)
-        # self.mods_list.setMaximumHeight(150)
-        # self.mods_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)  # Remove horizontal scrollbar
-        # self.mods_list.setStyleSheet("QListWidget { background: #2a2a2a; color: #fff; border: 1px solid #555; }")
-        # self.mods_list.itemSelectionChanged.connect(self._apply_filters)
-        # layout.addWidget(self.mods_list)
-        #
-        # self.all_mods_list = []  # Store all mods for filtering
+        # Mod filter (answered from the search index's mod postings)
+        mods_label = QLabel("Mods:")
+        layout.addWidget(mods_label)
+
+        self.mod_search = QLineEdit()
+        self.mod_search.setPlaceholderText("Search mods...")
+        self.mod_search.setStyleSheet("QLineEdit { background: #2a2a2a; color: #fff; border: 1px solid #555; padding: 4px; }")
+        self._mod_search_debounce = QTimer(self)
+        self._mod_search_debounce.setSingleShot(True)
+        self._mod_search_debounce.setInterval(150)
+        self._mod_search_debounce.timeout.connect(self._filter_mods_list)
+        self.mod_search.textChanged.connect(self._mod_search_debounce.start)
+        # Prevent Enter from triggering default button (which would close dialog)
+        self.mod_search.returnPressed.connect(lambda: self.mod_search.clearFocus())
+        layout.addWidget(self.mod_search)
+
+        self.mods_list = QListWidget()
+        self.mods_list.setSelectionMode(QListWidget.MultiSelection)
+        self.mods_list.setMaximumHeight(150)
+        self.mods_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)  # Remove horizontal scrollbar
+        self.mods_list.setStyleSheet("QListWidget { background: #2a2a2a; color: #fff; border: 1px solid #555; }")
+        self.mods_list.itemSelectionChanged.connect(self._on_mod_selection_changed)
+        layout.addWidget(self.mods_list)
 
         layout.addStretch()
 
@@ -981,22 +1081,37 @@ class ModlistGalleryDialog(QDialog):
         self.status_label.setAlignment(Qt.AlignRight | Qt.AlignTop)
         layout.addWidget(self.status_label)
 
-        # Scroll area for modlist cards
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-        # Grid container for cards
-        self.grid_widget = QWidget()
-        # Don't use WA_StaticContents - we need resize events to recalculate columns
-        self.grid_layout = QGridLayout()
-        self.grid_layout.setSpacing(8)  # Reduced from 12 to 8 for tighter card spacing
-        self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        self.grid_widget.setLayout(self.grid_layout)
-
-        self.scroll_area.setWidget(self.grid_widget)
-        layout.addWidget(self.scroll_area)
+        # Virtualized card grid: the view only paints cards inside the viewport,
+        # and re-wraps columns itself on resize
+        self.gallery_model = ModlistGalleryModel(self)
+        self.card_delegate = ModlistCardDelegate(self.image_manager, is_steamdeck=self.is_steamdeck, parent=self)
+        self.card_delegate.image_ready.connect(self.gallery_model.refresh_modlist)
+
+        self.grid_view = QListView()
+        self.grid_view.setViewMode(QListView.IconMode)
+        self.grid_view.setFlow(QListView.LeftToRight)
+        self.grid_view.setWrapping(True)
+        self.grid_view.setResizeMode(QListView.Adjust)
+        self.grid_view.setMovement(QListView.Static)
+        self.grid_view.setUniformItemSizes(True)
+        card_size = self.card_delegate.card_size
+        self.grid_view.setGridSize(QSize(card_size.width() + 8, card_size.height() + 8))  # 8px card spacing
+        self.grid_view.setSelectionMode(QListView.NoSelection)
+        self.grid_view.setFocusPolicy(Qt.NoFocus)
+        self.grid_view.setMouseTracking(True)  # Hover highlight
+        self.grid_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.grid_view.verticalScrollBar().setSingleStep(24)
+        self.grid_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.grid_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.grid_view.setFrameShape(QFrame.NoFrame)
+        self.grid_view.setStyleSheet("QListView { background: transparent; }")
+        self.grid_view.viewport().setCursor(Qt.PointingHandCursor)
+        self.grid_view.setModel(self.gallery_model)
+        self.grid_view.setItemDelegate(self.card_delegate)
+        self.grid_view.clicked.connect(
+            lambda index: self._on_modlist_clicked(index.data(ModlistGalleryModel.MetadataRole))
+        )
+        layout.addWidget(self.grid_view)
 
         container.setLayout(layout)
         return container
@@ -1063,27 +1178,29 @@ class ModlistGalleryDialog(QDialog):
             def __init__(self, gallery_service):
                 super().__init__()
                 self.gallery_service = gallery_service
+                self.loaded_from_cache = False
 
             def run(self):
                 try:
                     import time
-                    start_time = time.time()
-
-                    # Fetch metadata (CPU-intensive work happens here in background)
-                    # Skip search index initially for faster loading - can be loaded later if user searches
-                    metadata_response = self.gallery_service.fetch_modlist_metadata(
-                        include_validation=False,
-                        include_search_index=False,  # Skip for faster initial load
-                        sort_by="title"
-                    )
-
-                    elapsed = time.time() - start_time
                     import logging
                     logger = logging.getLogger(__name__)
-                    if elapsed < 0.5:
-                        logger.debug(f"Gallery metadata loaded from cache in {elapsed:.2f}s")
+                    start_time = time.time()
+
+                    # Render from the on-disk cache straight away; the engine refresh
+                    # runs afterwards in the background (stale-while-revalidate)
+                    metadata_response = self.gallery_service.load_cached_metadata()
+                    if metadata_response:
+                        self.loaded_from_cache = True
+                        logger.debug(f"Gallery metadata loaded from cache in {time.time() - start_time:.2f}s")
                     else:
-                        logger.info(f"Gallery metadata fetched from engine in {elapsed:.2f}s")
+                        # No cache yet - fetch without validation/search index for a faster first load
+                        metadata_response = self.gallery_service.fetch_modlist_metadata(
+                            include_validation=False,
+                            include_search_index=False,
+                            sort_by="title"
+                        )
+                        logger.info(f"Gallery metadata fetched from engine in {time.time() - start_time:.2f}s")
 
                     self.finished.emit(metadata_response, None)
                 except Exception as e:
@@ -1131,6 +1248,11 @@ class ModlistGalleryDialog(QDialog):
         try:
             # Get all modlists
             all_modlists = metadata_response.modlists
+            self._metadata_response = metadata_response
+            if getattr(getattr(self, '_loader_thread', None), 'loaded_from_cache', False):
+                cache_age = self.gallery_service.get_cache_age()
+                if cache_age is not None:
+                    self._freshness_text = f"cached {self._format_age(cache_age)} ago, refreshing..."
 
             # RANDOMIZE the order each time gallery opens (like Wabbajack)
             random.shuffle(all_modlists)
@@ -1157,16 +1279,10 @@ class ModlistGalleryDialog(QDialog):
                 if index >= 0:
                     self.game_combo.setCurrentIndex(index)
 
-            # Populate tag filter (mod filter temporarily disabled)
+            # Build the search index, then populate tag and mod filters from it
+            self._rebuild_search_index()
             self._populate_tag_filter()
-            # self._populate_mod_filter()  # TEMPORARILY DISABLED
-
-            # Create cards immediately (will show placeholders for images not in cache)
-            self._create_all_cards()
-
-            # Preload cached images in background (non-blocking)
-            self.status_label.setText("Loading images...")
-            QTimer.singleShot(0, self._preload_cached_images_async)
+            self._populate_mod_filter()
 
             # Reconnect filter handler
             self.game_combo.currentIndexChanged.connect(self._apply_filters)
@@ -1177,8 +1293,8 @@ class ModlistGalleryDialog(QDialog):
             # Apply filters (will show all modlists for selected game initially)
             self._apply_filters()
 
-            # Start background validation update (non-blocking)
-            self._start_validation_update()
+            # Revalidate against the engine in the background (non-blocking)
+            self._start_background_refresh()
 
         except Exception as e:
             self.status_label.setText(f"Error processing modlists: {str(e)}")
@@ -1229,17 +1345,10 @@ class ModlistGalleryDialog(QDialog):
                     if index >= 0:
                         self.game_combo.setCurrentIndex(index)
 
-                # Populate tag filter (mod filter temporarily disabled)
+                # Build the search index, then populate tag and mod filters from it
+                self._rebuild_search_index()
                 self._populate_tag_filter()
-                # self._populate_mod_filter()  # TEMPORARILY DISABLED
-
-                # Create cards immediately (will show placeholders for images not in cache)
-                self._create_all_cards()
-                
-                # Preload cached images in background (non-blocking)
-                # Images will appear as they're loaded
-                self.status_label.setText("Loading images...")
-                QTimer.singleShot(0, self._preload_cached_images_async)
+                self._populate_mod_filter()
 
                 # Reconnect filter handler
                 self.game_combo.currentIndexChanged.connect(self._apply_filters)
@@ -1247,55 +1356,13 @@ class ModlistGalleryDialog(QDialog):
                 # Apply filters (will show all modlists for selected game initially)
                 self._apply_filters()
                 
-                # Start background validation update (non-blocking)
-                self._start_validation_update()
+                # Revalidate against the engine in the background (non-blocking)
+                self._start_background_refresh()
             else:
                 self.status_label.setText("Failed to load modlists")
         except Exception as e:
             self.status_label.setText(f"Error loading modlists: {str(e)}")
 
-    def _preload_cached_images_async(self):
-        """Preload cached images asynchronously - images appear as they load"""
-        from PySide6.QtWidgets import QApplication
-        
-        preloaded = 0
-        total = len(self.all_modlists)
-        
-        for idx, modlist in enumerate(self.all_modlists):
-            cache_key = modlist.machineURL
-            
-            # Skip if already in cache
-            if cache_key in self.image_manager.pixmap_cache:
-                continue
-            
-            # Preload large images for cards (scale down for better quality)
-            cached_path = self.gallery_service.get_cached_image_path(modlist, "large")
-            if cached_path and cached_path.exists():
-                try:
-                    pixmap = QPixmap(str(cached_path))
-                    if not pixmap.isNull():
-                        cache_key_large = f"{cache_key}_large"
-                        self.image_manager.pixmap_cache[cache_key_large] = pixmap
-                        preloaded += 1
-                        
-                        # Update card immediately if it exists
-                        card = self.all_cards.get(cache_key)
-                        if card:
-                            card._display_image(pixmap)
-                except Exception:
-                    pass
-            
-            # Process events every 10 images to keep UI responsive
-            if idx % 10 == 0 and idx > 0:
-                QApplication.processEvents()
-        
-        # Update status (subtle, user-friendly)
-        modlist_count = len(self.filtered_modlists)
-        if modlist_count == 1:
-            self.status_label.setText("1 modlist")
-        else:
-            self.status_label.setText(f"{modlist_count} modlists")
-
     def _populate_tag_filter(self):
         """Populate tag filter with normalized tags (like Wabbajack)"""
         normalized_tags = set()
@@ -1325,80 +1392,56 @@ class ModlistGalleryDialog(QDialog):
             modlist.normalized_tags_keys = [tag.lower() for tag in display_tags]
         return display_tags
 
-    def _get_normalized_tag_keys(self, modlist: ModlistMetadata) -> List[str]:
-        """Return (and cache) lowercase normalized tags for filtering."""
-        keys = getattr(modlist, 'normalized_tags_keys', None)
-        if keys is None:
-            display_tags = self._get_normalized_tag_display(modlist)
-            keys = [tag.lower() for tag in display_tags]
-            modlist.normalized_tags_keys = keys
-        return keys
-
-    def _tag_in_modlist(self, modlist: ModlistMetadata, normalized_tag_key: str) -> bool:
-        """Check if a normalized (lowercase) tag is present on a modlist."""
-        keys = self._get_normalized_tag_keys(modlist)
-        return any(key == normalized_tag_key for key in keys)
-    
+    def _rebuild_search_index(self):
+        """Rebuild the search/tag/mod postings after all_modlists changed"""
+        self._search_index = ModlistSearchIndex(self.all_modlists, normalize_tags=self._get_normalized_tag_display)
+
     def _populate_mod_filter(self):
         """Populate mod filter with all available mods from search index"""
-        # TEMPORARILY DISABLED - mod filter feature removed in v0.2.0.8
-        return
-
-        # all_mods = set()
-        # # Track which mods come from NSFW modlists only
-        # mods_from_nsfw_only = set()
-        # mods_from_sfw = set()
-        # modlists_with_mods = 0
-        #
-        # for modlist in self.all_modlists:
-        #     if hasattr(modlist, 'mods') and modlist.mods:
-        #         modlists_with_mods += 1
-        #         for mod in modlist.mods:
-        #             all_mods.add(mod)
-        #             if modlist.nsfw:
-        #                 mods_from_nsfw_only.add(mod)
-        #             else:
-        #                 mods_from_sfw.add(mod)
-        #
-        # # Mods that are ONLY in NSFW modlists (not in any SFW modlists)
-        # self.nsfw_only_mods = mods_from_nsfw_only - mods_from_sfw
-        #
-        # self.all_mods_list = sorted(all_mods)
-        #
-        # self._filter_mods_list("")  # Populate with all mods initially
-    
-    def _filter_mods_list(self, search_text: str = ""):
+        if self._search_index is not None:
+            # Drop selections for mods no longer in any modlist
+            self._selected_mods &= set(self._search_index.mod_names)
+        self._filter_mods_list()
+
+    def _filter_mods_list(self):
         """Filter the mods list based on search text and NSFW checkbox"""
-        # TEMPORARILY DISABLED - mod filter feature removed in v0.2.0.8
-        return
-
-        # Get search text from the widget if not provided
-        # if not search_text and hasattr(self, 'mod_search'):
-        #     search_text = self.mod_search.text()
-        #
-        # self.mods_list.clear()
-        # search_lower = search_text.lower().strip()
-        #
-        # # Start with all mods or filtered by search
-        # if search_lower:
-        #     filtered_mods = [m for m in self.all_mods_list if search_lower in m.lower()]
-        # else:
-        #     filtered_mods = self.all_mods_list
-        #
-        # # Filter out NSFW-only mods if NSFW checkbox is not checked
-        # if not self.show_nsfw.isChecked():
-        #     filtered_mods = [m for m in filtered_mods if m not in getattr(self, 'nsfw_only_mods', set())]
-        #
-        # # Limit to first 500 results for performance
-        # for mod in filtered_mods[:500]:
-        #     self.mods_list.addItem(mod)
-        #
-        # if len(filtered_mods) > 500:
-        #     self.mods_list.addItem(f"... and {len(filtered_mods) - 500} more (refine search)")
-    
+        index = self._search_index
+        self.mods_list.blockSignals(True)
+        try:
+            self.mods_list.clear()
+            if index is None:
+                return
+            filtered_mods = index.search_mods(
+                self.mod_search.text(),
+                include_nsfw_only=self.show_nsfw.isChecked()
+            )
+            # Limit to first 500 results for performance
+            for mod in filtered_mods[:500]:
+                self.mods_list.addItem(mod)
+                if mod in self._selected_mods:
+                    self.mods_list.item(self.mods_list.count() - 1).setSelected(True)
+
+            if len(filtered_mods) > 500:
+                self.mods_list.addItem(f"... and {len(filtered_mods) - 500} more (refine search)")
+                self.mods_list.item(self.mods_list.count() - 1).setFlags(Qt.NoItemFlags)
+        finally:
+            self.mods_list.blockSignals(False)
+
+    def _on_mod_selection_changed(self):
+        """Track mod selection across re-filtering of the visible mods list"""
+        for i in range(self.mods_list.count()):
+            item = self.mods_list.item(i)
+            if not item.flags() & Qt.ItemIsSelectable:
+                continue
+            if item.isSelected():
+                self._selected_mods.add(item.text())
+            else:
+                self._selected_mods.discard(item.text())
+        self._apply_filters()
+
     def _on_nsfw_toggled(self, checked: bool):
         """Handle NSFW checkbox toggle - refresh mod list and apply filters"""
-        # self._filter_mods_list()  # TEMPORARILY DISABLED - Refresh mod list based on NSFW state
+        self._filter_mods_list()  # Refresh mod list based on NSFW state
         self._apply_filters()  # Apply all filters
     
     def _set_filter_controls_enabled(self, enabled: bool):
@@ -1409,199 +1452,64 @@ class ModlistGalleryDialog(QDialog):
         self.show_nsfw.setEnabled(enabled)
         self.hide_unavailable.setEnabled(enabled)
         self.tags_list.setEnabled(enabled)
-        # self.mod_search.setEnabled(enabled)  # TEMPORARILY DISABLED
-        # self.mods_list.setEnabled(enabled)  # TEMPORARILY DISABLED
+        self.mod_search.setEnabled(enabled)
+        self.mods_list.setEnabled(enabled)
     
     def _apply_filters(self):
         """Apply current filters to modlist display"""
         # CRITICAL: Guard against race condition - don't filter if modlists aren't loaded yet
         if not self.all_modlists:
             return
-        
-        filtered = self.all_modlists
+        self._search_debounce.stop()
+        if self._search_index is None:
+            self._rebuild_search_index()
+        index = self._search_index
+
+        bits = index.all_bits
 
         # Search filter
         search_text = self.search_box.text().strip()
         if search_text:
-            filtered = [m for m in filtered if self._matches_search(m, search_text)]
+            bits &= index.search_bits(search_text)
 
         # Game filter
         game = self.game_combo.currentData()
         if game:
-            filtered = [m for m in filtered if m.gameHumanFriendly == game]
+            bits &= index.game_bits(game)
 
         # Status filters
         if self.show_official_only.isChecked():
-            filtered = [m for m in filtered if m.official]
+            bits &= index.official_bits
 
         if not self.show_nsfw.isChecked():
-            filtered = [m for m in filtered if not m.nsfw]
+            bits &= ~index.nsfw_bits
 
         if self.hide_unavailable.isChecked():
-            filtered = [m for m in filtered if m.is_available()]
+            bits &= index.available_bits
 
         # Tag filter - modlist must have ALL selected tags (normalized like Wabbajack)
-        selected_tags = [item.text() for item in self.tags_list.selectedItems()]
-        if selected_tags:
-            special_selected = {tag for tag in selected_tags if tag in ("NSFW", "Featured", "Unavailable")}
-            normalized_selected = [
-                self.gallery_service.normalize_tag_value(tag).lower()
-                for tag in selected_tags
-                if tag not in special_selected
-            ]
-
-            if "NSFW" in special_selected:
-                filtered = [m for m in filtered if m.nsfw]
-            if "Featured" in special_selected:
-                filtered = [m for m in filtered if m.official]
-            if "Unavailable" in special_selected:
-                filtered = [m for m in filtered if not m.is_available()]
-
-            if normalized_selected:
-                filtered = [
-                    m for m in filtered
-                    if all(
-                        self._tag_in_modlist(m, normalized_tag)
-                        for normalized_tag in normalized_selected
-                    )
-                ]
+        for item in self.tags_list.selectedItems():
+            tag = item.text()
+            if tag == "NSFW":
+                bits &= index.nsfw_bits
+            elif tag == "Featured":
+                bits &= index.official_bits
+            elif tag == "Unavailable":
+                bits &= ~index.available_bits
+            else:
+                bits &= index.tag_bits(self.gallery_service.normalize_tag_value(tag))
 
-        # Mod filter - TEMPORARILY DISABLED (not working correctly in v0.2.0.8)
-        # selected_mods = [item.text() for item in self.mods_list.selectedItems()]
-        # if selected_mods:
-        #     filtered = [m for m in filtered if m.mods and all(mod in m.mods for mod in selected_mods)]
+        # Mod filter - modlist must include ALL selected mods
+        for mod in self._selected_mods:
+            bits &= index.mod_bits(mod)
 
-        self.filtered_modlists = filtered
+        self.filtered_modlists = index.modlists_for(bits)
         self._update_grid()
 
-    def _matches_search(self, modlist: ModlistMetadata, query: str) -> bool:
-        """Check if modlist matches search query"""
-        query_lower = query.lower()
-        return (
-            query_lower in modlist.title.lower() or
-            query_lower in modlist.description.lower() or
-            query_lower in modlist.author.lower()
-        )
-
-    def _create_all_cards(self):
-        """Create cards for all modlists and store in dict"""
-        # Clear existing cards
-        self.all_cards.clear()
-        
-        # Disable updates during card creation to prevent individual renders
-        self.grid_widget.setUpdatesEnabled(False)
-        self.setUpdatesEnabled(False)
-        
-        try:
-            # Create all cards - images should be in memory cache from preload
-            # so _load_image() will find them instantly
-            for modlist in self.all_modlists:
-                card = ModlistCard(modlist, self.image_manager, is_steamdeck=self.is_steamdeck)
-                card.clicked.connect(self._on_modlist_clicked)
-                self.all_cards[modlist.machineURL] = card
-        finally:
-            # Re-enable updates - single render for all cards
-            self.setUpdatesEnabled(True)
-            self.grid_widget.setUpdatesEnabled(True)
-            self.grid_widget.update()
-
     def _update_grid(self):
-        """Update grid by removing all cards and re-adding only visible ones"""
-        # CRITICAL: Guard against race condition - don't update if cards aren't ready yet
-        if not self.all_cards:
-            return
-        
-        # Disable updates during grid update
-        self.grid_widget.setUpdatesEnabled(False)
-        
-        try:
-            # Remove all cards from layout
-            # CRITICAL FIX: Properly remove all widgets to prevent overlapping
-            # Iterate backwards to avoid index shifting issues
-            for i in range(self.grid_layout.count() - 1, -1, -1):
-                item = self.grid_layout.takeAt(i)
-                widget = item.widget() if item else None
-                if widget:
-                    # Hide widget during removal to prevent visual artifacts
-                    widget.hide()
-                del item
-            
-            # Force layout update to ensure all widgets are removed
-            self.grid_layout.update()
-
-            # Calculate number of columns based on available width
-            # Get the scroll area width (accounting for filter panel ~280px + margins)
-            scroll_area = self.grid_widget.parent()
-            if scroll_area and hasattr(scroll_area, 'viewport'):
-                available_width = scroll_area.viewport().width()
-            else:
-                # Fallback: estimate based on dialog width minus filter panel
-                available_width = self.width() - 280 - 32  # Filter panel + margins
-            
-            if available_width <= 0:
-                # Fallback if width not yet calculated
-                available_width = 900 if not self.is_steamdeck else 700
-            
-            # Card width + spacing between cards
-            if self.is_steamdeck:
-                card_width = 250
-            else:
-                card_width = 300
-            
-            card_spacing = 8
-            # Calculate how many columns fit
-            columns = max(1, int((available_width + card_spacing) / (card_width + card_spacing)))
-            
-            # Limit to reasonable max (4 columns on large screens, 3 on Steam Deck)
-            if not self.is_steamdeck:
-                columns = min(columns, 4)
-            else:
-                columns = min(columns, 3)
-
-            # Preserve randomized order (already shuffled in _load_modlists)
-            # Add visible cards to grid in order
-            for idx, modlist in enumerate(self.filtered_modlists):
-                row = idx // columns
-                col = idx % columns
-                
-                card = self.all_cards.get(modlist.machineURL)
-                if card:
-                    # Safety check: ensure widget is not already in the layout
-                    # (shouldn't happen after proper removal above, but defensive programming)
-                    already_in_layout = False
-                    for i in range(self.grid_layout.count()):
-                        item = self.grid_layout.itemAt(i)
-                        if item and item.widget() == card:
-                            # Widget is already in layout - this shouldn't happen, but handle it
-                            already_in_layout = True
-                            self.grid_layout.removeWidget(card)
-                            break
-                    
-                    # Ensure widget is visible and add to grid
-                    if not already_in_layout or card.isHidden():
-                        card.show()
-                    self.grid_layout.addWidget(card, row, col)
-            
-            # Set column stretch - don't stretch card columns, but add a spacer column
-            for col in range(columns):
-                self.grid_layout.setColumnStretch(col, 0)  # Cards are fixed width
-            # Add a stretch column after cards to fill remaining space (centers the grid)
-            if columns < 4:
-                self.grid_layout.setColumnStretch(columns, 1)
-        finally:
-            # Re-enable updates
-            self.grid_widget.setUpdatesEnabled(True)
-            self.grid_widget.update()
-
-        # Update status
-        self.status_label.setText(f"Showing {len(self.filtered_modlists)} modlists")
-
-    def resizeEvent(self, event):
-        """Handle dialog resize to recalculate grid columns"""
-        super().resizeEvent(event)
-        # Recalculate columns when dialog is resized
-        if hasattr(self, 'filtered_modlists') and self.filtered_modlists:
-            self._update_grid()
+        """Show the filtered modlists - only the model is reset, cards are painted on demand"""
+        self.gallery_model.set_modlists(self.filtered_modlists)
+        self._update_status_only()
 
     def _on_modlist_clicked(self, metadata: ModlistMetadata):
         """Handle modlist card click - show detail dialog"""
@@ -1621,56 +1529,125 @@ class ModlistGalleryDialog(QDialog):
         self.gallery_service.clear_cache()
         self._load_modlists()
     
-    def _start_validation_update(self):
-        """Start background validation update to get availability status"""
-        # Update validation in background thread to avoid blocking UI
-        class ValidationUpdateThread(QThread):
-            finished_signal = Signal(object)  # Emits updated metadata response
+    def _start_background_refresh(self):
+        """Revalidate metadata against the engine without blocking the gallery"""
+        # Fetch with validation in a background thread; only changed modlists are updated
+        class MetadataRefreshThread(QThread):
+            finished_signal = Signal(object, object)  # Emits (metadata response, ModlistMetadataDiff)
             
-            def __init__(self, gallery_service):
+            def __init__(self, gallery_service, previous):
                 super().__init__()
                 self.gallery_service = gallery_service
+                self.previous = previous
             
             def run(self):
                 try:
-                    # Fetch with validation (slower, but in background)
-                    metadata_response = self.gallery_service.fetch_modlist_metadata(
+                    metadata_response, diff = self.gallery_service.refresh_modlist_metadata(
+                        previous=self.previous,
                         include_validation=True,
-                        include_search_index=False,
+                        include_search_index=True,
                         sort_by="title"
                     )
-                    self.finished_signal.emit(metadata_response)
+                    self.finished_signal.emit(metadata_response, diff)
                 except Exception:
-                    self.finished_signal.emit(None)
+                    self.finished_signal.emit(None, None)
         
-        self._validation_thread = ValidationUpdateThread(self.gallery_service)
-        self._validation_thread.finished_signal.connect(self._on_validation_updated)
-        self._validation_thread.start()
+        self._refresh_thread = MetadataRefreshThread(self.gallery_service, self._metadata_response)
+        self._refresh_thread.finished_signal.connect(self._on_metadata_refreshed)
+        self._refresh_thread.start()
     
-    def _on_validation_updated(self, metadata_response):
-        """Update modlists with validation data when background fetch completes"""
-        if not metadata_response:
+    def _on_metadata_refreshed(self, metadata_response, diff):
+        """Apply a background refresh, touching only modlists that changed"""
+        if not metadata_response or diff is None:
+            cache_age = self.gallery_service.get_cache_age()
+            if cache_age is not None:
+                self._freshness_text = f"cached {self._format_age(cache_age)} ago, refresh failed"
+            self._update_status_only()
             return
         
-        # Create lookup dict for validation data
-        validation_map = {}
-        for modlist in metadata_response.modlists:
-            if modlist.validation:
-                validation_map[modlist.machineURL] = modlist.validation
+        latency = self.gallery_service.last_refresh_latency
+        self._freshness_text = f"refreshed in {latency:.1f}s" if latency is not None else "up to date"
+        self._metadata_response = metadata_response
+        fresh_by_url = {m.machineURL: m for m in metadata_response.modlists}
         
-        # Update existing modlists with validation data
-        updated_count = 0
+        # The refresh carries the mod search index; unchanged modlists pick it up in place
+        mods_changed = False
         for modlist in self.all_modlists:
-            if modlist.machineURL in validation_map:
-                modlist.validation = validation_map[modlist.machineURL]
-                updated_count += 1
-                
-                # Update card if it exists
-                card = self.all_cards.get(modlist.machineURL)
-                if card:
-                    # Update unavailable badge visibility
-                    card._update_availability_badge()
+            fresh = fresh_by_url.get(modlist.machineURL)
+            if fresh is not None and fresh.mods and fresh.mods != modlist.mods:
+                modlist.mods = fresh.mods
+                mods_changed = True
+        
+        if not diff.has_changes:
+            if mods_changed:
+                self._rebuild_search_index()
+                self._populate_mod_filter()
+                self._apply_filters()
+            else:
+                self._update_status_only()
+            return
         
-        # Re-apply filters to update availability filtering
-        if updated_count > 0:
-            self._apply_filters()
+        import random
+        
+        # Removed modlists
+        removed = set(diff.removed)
+        if removed:
+            self.all_modlists = [m for m in self.all_modlists if m.machineURL not in removed]
+            for url in removed:
+                self.card_delegate.forget(url)
+        
+        # Changed modlists keep their (randomized) position; the view repaints them from the model
+        changed = set(diff.changed)
+        for idx, modlist in enumerate(self.all_modlists):
+            if modlist.machineURL in changed:
+                fresh = fresh_by_url[modlist.machineURL]
+                self._get_normalized_tag_display(fresh)
+                self.all_modlists[idx] = fresh
+                # Reload from the thumbnail cache, which is keyed by image URL
+                self.card_delegate.forget(modlist.machineURL)
+        
+        # New modlists are inserted at random positions, like the initial shuffle
+        for url in diff.added:
+            fresh = fresh_by_url[url]
+            self._get_normalized_tag_display(fresh)
+            self.all_modlists.insert(random.randint(0, len(self.all_modlists)), fresh)
+            if self.game_combo.findData(fresh.gameHumanFriendly) < 0:
+                self.game_combo.addItem(fresh.gameHumanFriendly, fresh.gameHumanFriendly)
+        
+        self._rebuild_search_index()
+        if diff.added or diff.changed:
+            self._refresh_tag_filter_preserving_selection()
+        self._populate_mod_filter()
+        
+        self._apply_filters()
+    
+    def _refresh_tag_filter_preserving_selection(self):
+        """Repopulate the tag list after a refresh without losing the user's selection"""
+        selected = {item.text() for item in self.tags_list.selectedItems()}
+        self.tags_list.blockSignals(True)
+        try:
+            self._populate_tag_filter()
+            for i in range(self.tags_list.count()):
+                item = self.tags_list.item(i)
+                if item.text() in selected:
+                    item.setSelected(True)
+        finally:
+            self.tags_list.blockSignals(False)
+    
+    def _update_status_only(self):
+        """Refresh the status label without rebuilding the grid"""
+        status = f"Showing {len(self.filtered_modlists)} modlists"
+        if self._freshness_text:
+            status += f" ({self._freshness_text})"
+        self.status_label.setText(status)
+    
+    @staticmethod
+    def _format_age(seconds: float) -> str:
+        """Format a cache age like '5m' or '3h'"""
+        if seconds < 60:
+            return f"{int(seconds)}s"
+        if seconds < 3600:
+            return f"{int(seconds // 60)}m"
+        if seconds < 86400:
+            return f"{int(seconds // 3600)}h"
+        return f"{int(seconds // 86400)}d"
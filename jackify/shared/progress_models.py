@@ -6,8 +6,10 @@ Used by both parser and GUI components.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
+import copy
+import heapq
 import time
 
 
@@ -41,6 +43,14 @@ class FileProgress:
     total_size: int = 0  # Total bytes (0 if unknown)
     speed: float = -1.0  # Bytes per second (-1 = not provided by engine)
     last_update: float = field(default_factory=time.time)
+    # Parser/UI annotations, declared up front so every instance has them
+    _file_counter: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    _texture_counter: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    _bsa_counter: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    _hidden: bool = field(default=False, init=False, repr=False, compare=False)
+    _synthetic_wabbajack: bool = field(default=False, init=False, repr=False, compare=False)
+    _no_progress_bar: bool = field(default=False, init=False, repr=False, compare=False)
+    _is_summary: bool = field(default=False, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Ensure percent is in valid range."""
@@ -88,7 +98,8 @@ class InstallationProgress:
     overall_percent: float = 0.0  # 0-100 overall progress
     data_processed: int = 0  # Bytes processed
     data_total: int = 0  # Total bytes (0 if unknown)
-    active_files: List[FileProgress] = field(default_factory=list)
+    # Active files keyed by filename (insertion ordered); exposed as the active_files list
+    _files: Dict[str, FileProgress] = field(default_factory=dict, repr=False)
     speeds: Dict[str, float] = field(default_factory=dict)  # Speed by operation type
     speed_timestamps: Dict[str, float] = field(default_factory=dict)  # Last time each speed updated
     timestamp: float = field(default_factory=time.time)
@@ -97,11 +108,75 @@ class InstallationProgress:
     texture_conversion_total: int = 0  # Total textures to convert
     bsa_building_current: int = 0  # Current BSA being built
     bsa_building_total: int = 0  # Total BSAs to build
+    # Min-heap of (earliest possible expiry, generation, filename) for stale-entry eviction.
+    # Entries are invalidated lazily: only the latest generation per filename counts.
+    _expiry_heap: List[Tuple[float, int, str]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _expiry_gen: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    # Defaults used when keying the expiry heap (see remove_completed_files)
+    STALE_COMPLETE_SECONDS = 0.5
+    STALE_INCOMPLETE_SECONDS = 30.0
     
     def __post_init__(self):
         """Ensure percent is in valid range."""
         self.overall_percent = max(0.0, min(100.0, self.overall_percent))
     
+    @property
+    def active_files(self) -> List[FileProgress]:
+        """Active file entries in the order they were first seen."""
+        return list(self._files.values())
+    
+    @active_files.setter
+    def active_files(self, files: List[FileProgress]):
+        self._files = {}
+        self._expiry_heap = []
+        self._expiry_gen = {}
+        for f in files:
+            self._files[f.filename] = f
+            self._schedule_expiry(f)
+    
+    @property
+    def active_file_count(self) -> int:
+        """Number of active file entries."""
+        return len(self._files)
+    
+    def get_file(self, filename: str) -> Optional[FileProgress]:
+        """Return the active entry for filename, or None."""
+        return self._files.get(filename)
+    
+    def remove_file(self, filename: str) -> Optional[FileProgress]:
+        """Remove and return the active entry for filename, if any."""
+        self._expiry_gen.pop(filename, None)
+        return self._files.pop(filename, None)
+    
+    def touch_file(self, file_progress: FileProgress):
+        """
+        Re-arm expiry for an entry that was modified in place.
+
+        Call this after changing percent/last_update on an entry obtained from
+        get_file() or active_files, otherwise it may be evicted on its old schedule.
+        """
+        if self._files.get(file_progress.filename) is file_progress:
+            self._schedule_expiry(file_progress)
+    
+    def _schedule_expiry(self, file_progress: FileProgress, deadline: Optional[float] = None):
+        """Push a new heap entry for file_progress, superseding earlier ones."""
+        if deadline is None:
+            # Earliest moment the entry could go stale: completing only ever shortens
+            # the timeout to STALE_COMPLETE_SECONDS, and every completion re-arms here.
+            deadline = file_progress.last_update + self.STALE_COMPLETE_SECONDS
+        gen = self._expiry_gen.get(file_progress.filename, 0) + 1
+        self._expiry_gen[file_progress.filename] = gen
+        heapq.heappush(self._expiry_heap, (deadline, gen, file_progress.filename))
+        # Compact when superseded entries dominate the heap
+        if len(self._expiry_heap) > 4 * len(self._files) + 64:
+            self._expiry_heap = []
+            for name, f in self._files.items():
+                gen = self._expiry_gen.get(name, 0) + 1
+                self._expiry_gen[name] = gen
+                self._expiry_heap.append((f.last_update + self.STALE_COMPLETE_SECONDS, gen, name))
+            heapq.heapify(self._expiry_heap)
+    
     @property
     def phase_progress_text(self) -> str:
         """Get phase progress text like '[12/14]'."""
@@ -242,30 +317,18 @@ class InstallationProgress:
     
     def add_file(self, file_progress: FileProgress):
         """Add or update a file in active files list."""
+        existing = self._files.get(file_progress.filename)
+
         # Don't re-add files that are already at 100% unless they're being actively updated
         # This prevents completed files from cluttering the list
-        if file_progress.percent >= 100.0:
-            # Check if this file already exists at 100%
-            existing = None
-            for f in self.active_files:
-                if f.filename == file_progress.filename:
-                    existing = f
-                    break
-            
-            if existing and existing.percent >= 100.0:
-                # File is already at 100% - only update if it's very recent (within 0.5s)
-                # This allows the completion notification to refresh the timestamp
-                if time.time() - existing.last_update < 0.5:
-                    existing.last_update = time.time()
-                # Otherwise, don't re-add it - let remove_completed_files handle cleanup
-                return
-        
-        # Remove existing entry for same filename if present
-        existing = None
-        for f in self.active_files:
-            if f.filename == file_progress.filename:
-                existing = f
-                break
+        if file_progress.percent >= 100.0 and existing and existing.percent >= 100.0:
+            # File is already at 100% - only update if it's very recent (within 0.5s)
+            # This allows the completion notification to refresh the timestamp
+            if time.time() - existing.last_update < 0.5:
+                existing.last_update = time.time()
+                self._schedule_expiry(existing)
+            # Otherwise, don't re-add it - let remove_completed_files handle cleanup
+            return
         
         if existing:
             # Update existing entry (preserve original add time for minimum display)
@@ -275,36 +338,55 @@ class InstallationProgress:
             existing.total_size = file_progress.total_size
             existing.speed = file_progress.speed
             existing.last_update = time.time()
-            # If file just reached 100%, ensure we keep it visible for minimum time
-            if file_progress.percent >= 100.0 and existing.percent < 100.0:
-                # File just completed - ensure it stays visible
-                existing.last_update = time.time()
+            self._schedule_expiry(existing)
         else:
             # Add new entry - set initial timestamp
             file_progress.last_update = time.time()
-            self.active_files.append(file_progress)
+            self._files[file_progress.filename] = file_progress
+            self._schedule_expiry(file_progress)
         
         # Update timestamp
         self.timestamp = time.time()
     
-    def remove_completed_files(self, stale_seconds: float = 0.5, stale_incomplete_seconds: float = 30.0):
+    def remove_completed_files(self, stale_seconds: float = STALE_COMPLETE_SECONDS,
+                               stale_incomplete_seconds: float = STALE_INCOMPLETE_SECONDS):
         """
         Remove files that are marked as complete, or files that haven't been updated in a while.
         
+        Only entries whose expiry is due are inspected, so this is cheap to call on every update.
+        
         Args:
             stale_seconds: Keep completed files for this many seconds before removing (allows brief display at 100%)
                           Reduced to 0.5s so tiny files that complete instantly still appear briefly
             stale_incomplete_seconds: Remove incomplete files that haven't been updated in this many seconds (handles stuck files)
         """
         current_time = time.time()
-        self.active_files = [
-            f for f in self.active_files 
+        
+        def _is_stale(f: FileProgress) -> bool:
             # Keep files that are:
             # 1. Not complete AND updated recently (active files)
             # 2. Complete AND updated very recently (show at 100% briefly so users can see all files, even tiny ones)
-            if (not f.is_complete and (current_time - f.last_update) < stale_incomplete_seconds) or \
-               (f.is_complete and (current_time - f.last_update) < stale_seconds)
-        ]
+            if f.is_complete:
+                return (current_time - f.last_update) >= stale_seconds
+            return (current_time - f.last_update) >= stale_incomplete_seconds
+        
+        if stale_seconds < self.STALE_COMPLETE_SECONDS:
+            # Heap is keyed on the default timeout; a shorter one needs a full pass
+            for name in [name for name, f in self._files.items() if _is_stale(f)]:
+                self.remove_file(name)
+            return
+        
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= current_time:
+            _deadline, gen, name = heapq.heappop(heap)
+            f = self._files.get(name)
+            if f is None or self._expiry_gen.get(name) != gen:
+                continue  # Superseded or already removed
+            if _is_stale(f):
+                self.remove_file(name)
+            else:
+                timeout = stale_seconds if f.is_complete else stale_incomplete_seconds
+                self._schedule_expiry(f, f.last_update + timeout)
     
     def update_speed(self, operation: str, speed: float):
         """Update speed for an operation type."""
@@ -313,3 +395,43 @@ class InstallationProgress:
         self.speed_timestamps[op_key] = time.time()
         self.timestamp = time.time()
 
+    def snapshot(self) -> 'InstallationProgress':
+        """
+        Return a copy that is safe to hand to another thread.
+
+        The file entries and speed dicts are copied so later parser updates
+        do not mutate a state that a subscriber is still rendering.
+        """
+        snap = copy.copy(self)
+        snap._files = {name: copy.copy(f) for name, f in self._files.items()}
+        snap._expiry_heap = list(self._expiry_heap)
+        snap._expiry_gen = dict(self._expiry_gen)
+        snap.speeds = dict(self.speeds)
+        snap.speed_timestamps = dict(self.speed_timestamps)
+        return snap
+
+
+@dataclass(frozen=True)
+class ProgressFrame:
+    """
+    One published progress update.
+
+    Frames are produced at a bounded rate by ProgressEventBus. Each frame carries
+    a private snapshot of the full state plus what changed since the previous
+    frame, so subscribers can either redraw everything or apply the diff.
+    """
+    sequence: int  # Monotonic frame number, starting at 1
+    state: InstallationProgress  # Snapshot, owned by the subscriber
+    files_added: Tuple[str, ...] = ()  # Filenames that appeared since the last frame
+    files_updated: Tuple[str, ...] = ()  # Filenames whose percent/size/speed changed
+    files_removed: Tuple[str, ...] = ()  # Filenames no longer active
+    phase_changed: bool = False  # Phase or phase name differs from the last frame
+    speed_changed: bool = False  # Aggregate speeds differ from the last frame
+    coalesced_updates: int = 0  # Parser updates folded into this frame
+    dropped_frames: int = 0  # Total updates coalesced away so far in this run
+
+    @property
+    def has_file_changes(self) -> bool:
+        """True if the active file list changed in any way."""
+        return bool(self.files_added or self.files_updated or self.files_removed)
+
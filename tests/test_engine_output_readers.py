@@ -0,0 +1,66 @@
+"""Chunked engine stdout splitting against the original byte-at-a-time loop."""
+
+import io
+import time
+from pathlib import Path
+
+import pytest
+
+from jackify.backend.handlers.subprocess_utils import ANSI_ESCAPE_RE, iter_output_records
+
+ENGINE_OUTPUT = Path(__file__).parent / "data" / "engine_output.log"
+# Multi-byte UTF-8, a \r\n pair and an unterminated, coloured tail on top of the recording
+EXTRA_OUTPUT = "Installing Ünïcödé Mod ✓ (3/4)\r\n\x1b[1mStill running".encode("utf-8")
+
+
+def legacy_bytewise_records(stream):
+    """Reference implementation: the original read(1) + buffer += loop."""
+    records = []
+    buffer = b''
+    while True:
+        char = stream.read(1)
+        if not char:
+            break
+        buffer += char
+        if char in (b'\n', b'\r'):
+            records.append((ANSI_ESCAPE_RE.sub(b'', buffer[:-1]).decode('utf-8', errors='replace'),
+                            char.decode()))
+            buffer = b''
+    if buffer:
+        records.append((ANSI_ESCAPE_RE.sub(b'', buffer).decode('utf-8', errors='replace'), ''))
+    return records
+
+
+@pytest.fixture(scope="module")
+def output():
+    return ENGINE_OUTPUT.read_bytes() + EXTRA_OUTPUT
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096, 65536])
+def test_chunked_records_match_the_bytewise_reader(output, chunk_size):
+    expected = legacy_bytewise_records(io.BufferedReader(io.BytesIO(output)))
+    records = list(iter_output_records(io.BufferedReader(io.BytesIO(output)), strip_ansi=True,
+                                       chunk_size=chunk_size))
+    assert records == expected
+    assert records[-1] == ("Still running", "")
+
+
+def _best_seconds(read_all, data, repeat=3):
+    best = None
+    for _ in range(repeat):
+        stream = io.BufferedReader(io.BytesIO(data))
+        start = time.perf_counter()
+        read_all(stream)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_chunked_reader_is_faster_than_the_bytewise_reader(output):
+    data = output * 20
+    legacy_seconds = _best_seconds(legacy_bytewise_records, data)
+    chunked_seconds = _best_seconds(lambda stream: list(iter_output_records(stream, strip_ansi=True)), data)
+    # Measured at roughly 8x; the margin keeps slow CI machines green
+    assert chunked_seconds * 3 < legacy_seconds, (
+        f"chunked reader took {chunked_seconds:.3f}s vs {legacy_seconds:.3f}s byte by byte"
+    )
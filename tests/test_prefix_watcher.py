@@ -0,0 +1,51 @@
+"""When a freshly created Proton prefix counts as ready."""
+
+import threading
+
+import pytest
+
+from jackify.backend.handlers import prefix_watcher
+from jackify.backend.handlers.prefix_watcher import prefix_ready, wait_for_prefix_ready
+
+
+@pytest.fixture
+def compatdata(tmp_path):
+    """A prefix as it looks mid-copy of default_pfx: both registry files, no version file."""
+    path = tmp_path / "compatdata" / "1234"
+    (path / "pfx").mkdir(parents=True)
+    (path / "pfx" / "system.reg").write_text("WINE REGISTRY Version 2\n")
+    (path / "pfx" / "user.reg").write_text("WINE REGISTRY Version 2\n")
+    (path / "tracked_files").write_text("drive_c\n")
+    return path
+
+
+def test_registry_files_alone_are_not_enough(compatdata):
+    assert not prefix_ready(compatdata)
+    assert not wait_for_prefix_ready(compatdata, timeout=0.2)
+
+
+def test_proton_version_file_marks_setup_done(compatdata):
+    (compatdata / "version").write_text("GE-Proton9-20\n")
+    assert prefix_ready(compatdata)
+
+
+def test_exited_launcher_counts_as_evidence(compatdata):
+    assert wait_for_prefix_ready(compatdata, timeout=0.2, launcher_exited=True)
+
+
+def test_registry_save_in_progress_is_not_ready(compatdata):
+    (compatdata / "pfx" / "reg1a2b.tmp").write_text("")
+    assert not prefix_ready(compatdata, wine_finished=True)
+
+
+def test_empty_registry_file_is_not_ready(compatdata):
+    (compatdata / "pfx" / "user.reg").write_text("")
+    assert not prefix_ready(compatdata, wine_finished=True)
+
+
+def test_wineserver_seen_then_gone(compatdata, monkeypatch):
+    running = threading.Event()
+    running.set()
+    monkeypatch.setattr(prefix_watcher, "wineserver_running", lambda pfx: running.is_set())
+    threading.Timer(0.2, running.clear).start()
+    assert wait_for_prefix_ready(compatdata, timeout=5)
@@ -0,0 +1,62 @@
+"""CPU accounting of the /proc tree sampler against the kernel's own totals."""
+
+import os
+import resource
+import subprocess
+import time
+
+import pytest
+
+from jackify.backend.handlers import proc_sampler
+from jackify.backend.handlers.proc_sampler import ProcessTreeSampler
+
+pytestmark = pytest.mark.skipif(not ProcessTreeSampler.available(), reason="needs Linux /proc")
+
+BUSY = "i=0; while [ $i -lt {n} ]; do i=$((i+1)); done"
+
+# Nested subtrees (bash -> subshell/timeout -> sh) that run across several
+# ticks and then exit together between two samples, plus short-lived
+# children that never get sampled at all
+SCRIPT = f"""
+( sh -c '{BUSY.format(n=150000)}' & sh -c '{BUSY.format(n=150000)}' & wait )
+timeout 30 bash -c '( sh -c "$0" ); eval "$0"' '{BUSY.format(n=100000)}'
+for j in 1 2 3 4 5; do sh -c '{BUSY.format(n=5000)}'; done
+{BUSY.format(n=50000)}
+sleep 0.5
+"""
+
+
+def _children_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def test_sampled_cpu_matches_rusage_children():
+    before = _children_cpu_seconds()
+    process = subprocess.Popen(["bash", "-c", SCRIPT])
+    sampler = ProcessTreeSampler(process.pid)
+    sampled = 0.0
+    last_time = None
+    try:
+        while process.poll() is None:
+            try:
+                sample = sampler.sample()
+            except ProcessLookupError:
+                break
+            if last_time is not None:
+                sampled += sample.tree_cpu_percent / 100 * (sampler._last_time - last_time)
+            last_time = sampler._last_time
+            time.sleep(0.05)
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+    measured = _children_cpu_seconds() - before
+
+    assert measured > 0.2, "workload too small to compare"
+    # The root's own work after the final sample (exiting from `sleep`) is
+    # not seen; allow a few clock ticks per sample edge on top
+    tick = 1 / proc_sampler._CLK_TCK
+    assert sampled == pytest.approx(measured, abs=10 * tick, rel=0.05)
+    # Double counting an exited subtree would push the sample over the total
+    assert sampled <= measured + 10 * tick
@@ -0,0 +1,72 @@
+"""ProgressParser against the pre-optimisation parser, on recorded engine output."""
+
+import io
+import time
+from pathlib import Path
+
+import pytest
+
+import legacy_progress_parser
+from jackify.backend.handlers.progress_parser import ProgressParser
+from jackify.backend.handlers.subprocess_utils import iter_output_records
+
+ENGINE_OUTPUT = Path(__file__).parent / "data" / "engine_output.log"
+
+# Annotations the parser attaches to FileProgress for the state manager
+FILE_PROGRESS_ANNOTATIONS = ("_texture_counter", "_bsa_counter", "_hidden")
+
+
+def _engine_lines():
+    with open(ENGINE_OUTPUT, "rb") as f:
+        return [text for text, _terminator in iter_output_records(f, strip_ansi=True)]
+
+
+def _comparable(parsed):
+    """ParsedLine as plain data, without FileProgress.last_update (a timestamp)."""
+    file_progress = parsed.file_progress
+    if file_progress is not None:
+        file_progress = (
+            file_progress.filename, file_progress.operation, file_progress.percent,
+            file_progress.current_size, file_progress.total_size, file_progress.speed,
+        ) + tuple(getattr(file_progress, name, None) for name in FILE_PROGRESS_ANNOTATIONS)
+    return (
+        parsed.has_progress, parsed.phase, parsed.phase_name, file_progress, parsed.completed_filename,
+        parsed.overall_percent, parsed.step_info, parsed.data_info, parsed.speed_info,
+        parsed.file_counter, parsed.message,
+    )
+
+
+@pytest.fixture(scope="module")
+def lines():
+    lines = _engine_lines()
+    # Case variants exercise the lower-cased dispatch of the new parser
+    return lines + [line.upper() for line in lines] + [line.lower() for line in lines]
+
+
+def test_recorded_output_parses_like_the_legacy_parser(lines):
+    legacy = legacy_progress_parser.ProgressParser()
+    current = ProgressParser()
+    mismatches = [line for line in lines
+                  if _comparable(current.parse_line(line)) != _comparable(legacy.parse_line(line))]
+    assert not mismatches, f"{len(mismatches)} line(s) parse differently, e.g. {mismatches[0]!r}"
+    assert sum(1 for line in lines if current.parse_line(line).has_progress) > len(lines) // 2
+
+
+def _best_seconds(parse_line, lines, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            parse_line(line)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_parser_is_faster_than_the_legacy_parser(lines):
+    legacy_seconds = _best_seconds(legacy_progress_parser.ProgressParser().parse_line, lines)
+    current_seconds = _best_seconds(ProgressParser().parse_line, lines)
+    # Measured at several times faster; the margin keeps slow CI machines green
+    assert current_seconds * 1.5 < legacy_seconds, (
+        f"parse_line took {current_seconds:.3f}s vs {legacy_seconds:.3f}s for the legacy parser"
+    )
@@ -0,0 +1,20 @@
+"""Re-probing rules of the persisted Proton inventory."""
+
+import os
+
+from jackify.backend.handlers.proton_inventory import ProtonInventory
+
+
+def test_tool_without_wine_is_probed_again(tmp_path):
+    compat_dir = tmp_path / "compatibilitytools.d"
+    bin_dir = compat_dir / "GE-Proton9-1" / "files" / "bin"
+    bin_dir.mkdir(parents=True)
+    inventory_path = tmp_path / "proton_inventory.json"
+
+    assert ProtonInventory(inventory_path).tools([], [compat_dir])[0]["wine_bin"] is None
+
+    # Extraction finishing inside files/bin leaves the tool directory's mtime alone
+    wine = bin_dir / "wine"
+    wine.write_text("")
+    os.chmod(wine, 0o755)
+    assert ProtonInventory(inventory_path).tools([], [compat_dir])[0]["wine_bin"] == wine
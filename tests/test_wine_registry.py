@@ -0,0 +1,158 @@
+"""Offline parser/writer for Wine's registry files."""
+
+import pytest
+
+from jackify.backend.handlers import wine_registry
+from jackify.backend.handlers.wine_registry import RegistryEdits, RegistryHive, read_values
+
+USER_REG = r'''WINE REGISTRY Version 2
+;; All keys relative to \\User\\S-1-5-21-0-0-0-1000
+
+#arch=win64
+
+[Control Panel\\Desktop] 1700000000
+#time=1da1b2c3d4e5f60
+"FontSmoothing"="2"
+"FontSmoothingGamma"=dword:00000578
+"UserPreferencesMask"=hex:9e,1e,07,80,12,00,00,00,01,00,00,00,00,00,00,00,00,\
+  00,00,00,00,00,00,00,00,00,00,00,00,00,00,00
+"WheelScrollLines"="3"
+
+[Software\\Wine] 1700000001
+#time=1da1b2c3d4e5f61
+"ShowDotFiles"="N"
+"Path"="C:\\windows\\system32;\"quoted\""
+
+[Software\\Wine\\DllOverrides] 1700000002
+#time=1da1b2c3d4e5f62
+@="default"
+"d3dcompiler_47"="native,builtin"
+"\x00e9t\x00e9"="builtin"
+'''
+
+SYSTEM_REG = r'''WINE REGISTRY Version 2
+;; All keys relative to \\Machine
+
+#arch=win64
+
+[Software\\Microsoft\\Windows NT\\CurrentVersion] 1700000000
+#time=1da1b2c3d4e5f60
+"CurrentBuild"="19045"
+"ProductName"="Windows 10 Pro"
+'''
+
+
+@pytest.fixture
+def prefix(tmp_path):
+    pfx = tmp_path / "pfx"
+    pfx.mkdir()
+    (pfx / "user.reg").write_text(USER_REG, encoding="utf-8")
+    (pfx / "system.reg").write_text(SYSTEM_REG, encoding="utf-8")
+    return pfx
+
+
+@pytest.fixture(autouse=True)
+def no_wineserver(monkeypatch):
+    monkeypatch.setattr(wine_registry, "wineserver_running", lambda pfx: False)
+
+
+@pytest.mark.parametrize("name, text", [("user.reg", USER_REG), ("system.reg", SYSTEM_REG)])
+def test_unchanged_hive_renders_byte_for_byte(prefix, name, text):
+    assert RegistryHive(prefix / name).render() == text
+
+
+def test_values_are_decoded(prefix):
+    hive = RegistryHive(prefix / "user.reg")
+    assert hive.get("Control Panel\\Desktop", "FontSmoothingGamma") == 0x578
+    assert hive.get("Software\\Wine", "Path") == 'C:\\windows\\system32;"quoted"'
+    assert hive.get("Software\\Wine\\DllOverrides", "") == "default"
+    assert hive.get("Software\\Wine\\DllOverrides", "\u00e9t\u00e9") == "builtin"
+    # Multi-line hex values stay one entry and don't hide the value after them
+    assert hive.get("Control Panel\\Desktop", "WheelScrollLines") == "3"
+    assert hive.get("Control Panel\\Desktop", "UserPreferencesMask").startswith("hex:9e,1e")
+
+
+def test_lookups_ignore_case_and_stray_backslashes(prefix):
+    hive = RegistryHive(prefix / "user.reg")
+    assert hive.has_key("\\software\\WINE\\dlloverrides")
+    assert hive.get("SOFTWARE\\Wine", "showdotfiles") == "N"
+    assert hive.values("software\\wine") == {"ShowDotFiles": "N", "Path": 'C:\\windows\\system32;"quoted"'}
+
+
+def test_replacing_a_value_changes_only_its_line(prefix):
+    hive = RegistryHive(prefix / "user.reg")
+    hive.set("Software\\Wine", "ShowDotFiles", "Y")
+    assert hive.render() == USER_REG.replace('"ShowDotFiles"="N"', '"ShowDotFiles"="Y"')
+
+
+def test_setting_the_current_value_is_not_a_change(prefix):
+    hive = RegistryHive(prefix / "user.reg")
+    hive.set("Software\\Wine", "ShowDotFiles", "N")
+    assert not hive.dirty
+
+
+def test_new_value_goes_before_the_key_separator(prefix):
+    hive = RegistryHive(prefix / "user.reg")
+    hive.set("Software\\Wine", "Version", "win10")
+    assert '"Path"="C:\\\\windows\\\\system32;\\"quoted\\""\n"Version"="win10"\n\n[Software\\\\Wine\\\\DllOverrides]' \
+        in hive.render()
+
+
+def test_new_key_and_values_survive_a_reload(prefix):
+    hive = RegistryHive(prefix / "system.reg")
+    hive.set("Software\\Microsoft\\.NETFramework", "OnlyUseLatestCLR", 1)
+    hive.set("Software\\Bethesda Softworks\\FalloutNV", "Installed Path", "Z:\\games\\FNV [GOTY]\\")
+    assert hive.save()
+
+    text = (prefix / "system.reg").read_text(encoding="utf-8")
+    assert text.startswith(SYSTEM_REG + "\n[Software\\\\Microsoft\\\\.NETFramework] ")
+    assert '"OnlyUseLatestCLR"=dword:00000001\n' in text
+    assert '"Installed Path"="Z:\\\\games\\\\FNV [GOTY]\\\\"\n' in text
+
+    reloaded = RegistryHive(prefix / "system.reg")
+    assert reloaded.get("software\\microsoft\\.netframework", "OnlyUseLatestCLR") == 1
+    assert reloaded.get("Software\\Bethesda Softworks\\FalloutNV", "Installed Path") == "Z:\\games\\FNV [GOTY]\\"
+    assert reloaded.render() == text
+
+
+def test_delete_removes_the_value(prefix):
+    hive = RegistryHive(prefix / "user.reg")
+    hive.delete("Control Panel\\Desktop", "UserPreferencesMask")
+    assert hive.get("Control Panel\\Desktop", "UserPreferencesMask") is None
+    assert hive.get("Control Panel\\Desktop", "WheelScrollLines") == "3"
+    assert "hex:" not in hive.render()
+
+
+def test_missing_hive_starts_from_a_fresh_header(tmp_path):
+    hive = RegistryHive(tmp_path / "user.reg")
+    hive.set("Software\\Wine", "ShowDotFiles", "Y")
+    assert hive.render().startswith("WINE REGISTRY Version 2\n;; All keys relative to \\\\User\\\\")
+    assert RegistryHive(tmp_path / "user.reg").get("Software\\Wine", "ShowDotFiles") is None
+
+
+def test_edits_batch_both_hives(prefix):
+    edits = (RegistryEdits(prefix.parent)
+             .dll_override("*mscoree", "native")
+             .show_dotfiles()
+             .set("HKEY_LOCAL_MACHINE\\Software\\Microsoft\\.NETFramework", "OnlyUseLatestCLR", 1))
+    assert not edits.verify()
+    assert edits.apply(wait=0)
+    assert edits.verify()
+    assert sorted(path.name for path in prefix.iterdir()) == ["system.reg", "user.reg"]
+    assert read_values(prefix, [("HKCU\\Software\\Wine\\DllOverrides", ("*mscoree",)),
+                                ("HKLM\\Software\\Microsoft\\.NETFramework", None)]) == {
+        "HKCU\\Software\\Wine\\DllOverrides": {"*mscoree": "native"},
+        "HKLM\\Software\\Microsoft\\.NETFramework": {"OnlyUseLatestCLR": 1},
+    }
+
+
+def test_edits_leave_files_alone_while_wineserver_runs(prefix, monkeypatch):
+    monkeypatch.setattr(wine_registry, "wineserver_running", lambda pfx: True)
+    edits = RegistryEdits(prefix).show_dotfiles()
+    assert not edits.apply(wait=0)
+    assert (prefix / "user.reg").read_text(encoding="utf-8") == USER_REG
+
+
+def test_unsupported_root_is_rejected(prefix):
+    with pytest.raises(ValueError):
+        RegistryEdits(prefix).set("HKEY_CLASSES_ROOT\\.txt", "", "txtfile")
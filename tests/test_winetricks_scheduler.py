@@ -0,0 +1,63 @@
+"""Conflict lanes planned from the bundled winetricks script."""
+
+from pathlib import Path
+
+import pytest
+
+from jackify.backend.handlers import winetricks_scheduler
+from jackify.backend.handlers.winetricks_scheduler import WinetricksScheduler
+
+BUNDLED_WINETRICKS = Path(__file__).resolve().parents[1] / "jackify" / "tools" / "winetricks"
+
+# The lists ModlistHandler.get_modlist_wine_components() produces
+DEFAULT_COMPONENTS = ["fontsmooth=rgb", "xact", "xact_x64", "vcrun2022"]
+BETHESDA_COMPONENTS = DEFAULT_COMPONENTS + ["d3dcompiler_47", "d3dx11_43", "d3dcompiler_43", "dotnet6", "dotnet7"]
+FNV_OBLIVION_COMPONENTS = DEFAULT_COMPONENTS + ["d3dx9_43", "d3dx9"]
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    monkeypatch.setattr(winetricks_scheduler, "get_jackify_data_dir", lambda: tmp_path)
+    return WinetricksScheduler(str(BUNDLED_WINETRICKS))
+
+
+@pytest.mark.parametrize("helper", [
+    "w_try_regsvr32", "w_try_regsvr64", "w_try_regedit", "w_override_dlls",
+    "w_override_app_dlls", "w_set_app_winver", "w_set_winver",
+])
+def test_helpers_that_run_wine_are_exclusive(scheduler, helper):
+    assert scheduler._verbs[helper].exclusive
+
+
+@pytest.mark.parametrize("verb", ["fontsmooth", "xact", "xact_x64", "vcrun2022", "d3dcompiler_47", "d3dx9_43"])
+def test_verbs_that_run_wine_are_exclusive(scheduler, verb):
+    assert scheduler._verbs[f"load_{verb}"].exclusive
+
+
+def test_file_copy_only_verb_gets_its_own_lane(scheduler):
+    # mfc140 only extracts and copies DLLs
+    assert not scheduler._verbs["load_mfc140"].exclusive
+    assert sorted(scheduler.plan(["vcrun2022", "mfc140"])) == [["mfc140"], ["vcrun2022"]]
+
+
+@pytest.mark.parametrize("components", [DEFAULT_COMPONENTS, BETHESDA_COMPONENTS, FNV_OBLIVION_COMPONENTS])
+def test_jackify_component_lists_run_in_one_lane(scheduler, components):
+    assert scheduler.plan(components) == [components]
+
+
+def test_prefetch_hashes_each_file_once(scheduler, tmp_path, monkeypatch):
+    # vcrun2022 downloads vc_redist.x86.exe and vc_redist.x64.exe; the first is already cached
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "vcrun2022").mkdir(parents=True)
+    (cache_dir / "vcrun2022" / "vc_redist.x86.exe").write_bytes(b"cached")
+    x86_sha = scheduler._closure("vcrun2022")[2][0][2]
+
+    hashed = []
+    monkeypatch.setattr(WinetricksScheduler, "_sha256",
+                        staticmethod(lambda path: hashed.append(path) or x86_sha))
+    fetched = []
+    monkeypatch.setattr(scheduler, "_fetch", lambda path, url, sha, relative: fetched.append(relative) or True)
+
+    assert scheduler.prefetch(["vcrun2022"], str(cache_dir)) == 2
+    assert hashed == [str(cache_dir / "vcrun2022" / "vc_redist.x86.exe")]
+    assert fetched == [str(Path("vcrun2022") / "vc_redist.x64.exe")]